@@ -0,0 +1,116 @@
+"""
+The base of the analyzers that follow CXL.cache/CXL.mem messages over decoded protocol flits.
+
+A FlitAnalyzer takes flits in three forms:
+
+    analyzer.process(slots, timestamp)                      # the 4 (SlotFormat, field values) pairs of
+                                                            # FlitParser.parse, DecodedFlit.slots or ProtocolFlit.slots
+    analyzer.process_flit(direction, flit, offset, timestamp)   # one raw 66 byte flit
+    analyzer.run(trace.flits())                             # a stream of (timestamp, direction, flit) tuples
+
+Subclasses supply the handling of one flit in process and describe the messages they follow in _plan_message. The
+plan of a slot format, one entry per followed message, is built once per SlotFormat and cached, so per flit work is a
+dict lookup per slot followed by the subclass's own handling of the messages whose Valid bit is set.
+"""
+# Python imports
+from abc import ABC, abstractmethod
+
+# Package imports
+from pyCXL.structs.flitparser import DIRECTIONS, FlitParser
+
+VALID_FIELD = "Valid"
+
+
+class FlitAnalyzer(ABC):
+    """
+    Brief:
+        Parses flits travelling in both directions and caches a message plan per SlotFormat for its subclasses
+    """
+
+    def __init__(self):
+        self.__parsers = {direction: FlitParser(direction) for direction in DIRECTIONS}
+        self.__plans = {}
+
+    @abstractmethod
+    def _plan_message(self, struct_name: str, fields: dict):
+        """
+        Brief:
+            The plan entry of one message of a slot format
+
+        Params:
+            struct_name:    the message's struct name, e.g. "D2H_Request"
+            fields:         field name -> index of the field's value in the slot's values
+
+        Returns:
+            a tuple for the plan, or None when the analyzer does not follow the message
+        """
+        raise NotImplementedError
+
+    def _plan(self, slot_format) -> tuple:
+        """
+        Brief:
+            (Valid value index, *plan entry) of every followed message of a slot format, in slot order
+        """
+        plan = self.__plans.get(slot_format)
+        if plan is None:
+            messages = {}
+            for idx, key in enumerate(slot_format.keys):
+                struct_key, field = key.rsplit(".", 1)
+                messages.setdefault(struct_key, {})[field] = idx
+            plan = []
+            for struct_key, fields in messages.items():
+                if VALID_FIELD not in fields:
+                    continue
+                entry = self._plan_message(struct_key.split("[")[0], fields)
+                if entry is not None:
+                    plan.append((fields[VALID_FIELD], *entry))
+            plan = self.__plans[slot_format] = tuple(plan)
+        return plan
+
+    @abstractmethod
+    def process(self, slots, timestamp=None):
+        """
+        Brief:
+            Feeds one decoded flit to the analyzer
+
+        Params:
+            slots:      the 4 (SlotFormat, field values) pairs of FlitParser.parse, DecodedFlit.slots or
+                        ProtocolFlit.slots. None or an empty tuple for control flits
+            timestamp:  the flit's timestamp, its stream position if not given. Must not decrease
+        """
+        raise NotImplementedError
+
+    def _parse(self, direction: int, flit, offset: int = 0):
+        """
+        Brief:
+            The decoded slots of a raw flit travelling in direction, None for control flits
+        """
+        return self.__parsers[direction].parse(flit, offset)
+
+    def process_flit(self, direction: int, flit, offset: int = 0, timestamp=None):
+        """
+        Brief:
+            Feeds one raw 66 byte flit travelling in direction to the analyzer
+        """
+        return self.process(self.__parsers[direction].parse(flit, offset), timestamp)
+
+    def _feed(self, flits):
+        """
+        Brief:
+            Feeds a stream of (timestamp, direction, flit) tuples to the analyzer, yielding what each flit returned
+        """
+        process_flit = self.process_flit
+        for timestamp, direction, flit in flits:
+            yield process_flit(direction, flit, 0, timestamp)
+
+    def run(self, flits):
+        """
+        Brief:
+            Feeds a stream of (timestamp, direction, flit) tuples, such as TraceReader.flits(), to the analyzer
+
+        Yields:
+            everything found by process, flit by flit. Analyzers whose process returns a count rather than what it
+            found, such as HotAddressProfiler, override run to return a summary instead
+        """
+        for found in self._feed(flits):
+            yield from found
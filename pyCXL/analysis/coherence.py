@@ -0,0 +1,457 @@
+"""
+The MESI state of every cacheline of a CXL.cache device, followed over captured flit streams.
+
+The device's view of a line changes when:
+
+    the host answers a D2H Request (found by Command Queue ID) with a GO, whose Response Data is the state granted, or
+    with one of the GO_WritePull flavours, which leave the line invalid
+    the device answers an H2D Request snoop (found by Unique Queue ID) with a D2H Response, whose opcode names the
+    state the line is left in
+
+    tracker = CoherenceTracker()
+    with TraceReader("link0.pcxl") as trace:
+        for violation in tracker.run(trace.flits()):
+            print(violation)
+    tracker.state(address)          # "M", "E", "S", "I" or None before the line was seen
+    tracker.hot(10)                 # the 10 lines requested and snooped the most
+
+Request and snoop Address fields hold Addr[51:6], so every address here is a cacheline address.
+
+Lines live in AddressTable, an open addressing hash table of three parallel arrays (line, state, count) rather than a
+dict of objects, and the requests waiting for their response live in arrays indexed by their 12 bit CQID or UQID.
+Nothing is allocated per flit unless a violation is found.
+"""
+# Python imports
+import heapq
+from array import array
+
+# Package imports
+from pyCXL.analysis.analyzer import FlitAnalyzer
+from pyCXL.structs import flitsubstructures as subs
+
+# states of a line in the device cache, UNKNOWN until the trace shows one
+UNKNOWN = 0
+INVALID = 1
+SHARED = 2
+EXCLUSIVE = 3
+MODIFIED = 4
+STATES = (None, "I", "S", "E", "M")
+
+# D2H Request opcodes
+RD_CURR = 0x01
+RD_OWN = 0x02
+RD_SHARED = 0x03
+RD_ANY = 0x04
+RD_OWN_NO_DATA = 0x05
+ITOM_WR = 0x06
+MEM_WR = 0x07
+CL_FLUSH = 0x08
+CLEAN_EVICT = 0x09
+DIRTY_EVICT = 0x0A
+CLEAN_EVICT_NO_DATA = 0x0B
+WOWR_INV = 0x0C
+WOWR_INVF = 0x0D
+WR_INV = 0x0E
+CACHE_FLUSHED = 0x10
+
+# H2D Response opcodes
+WRITE_PULL = 0b0001
+GO = 0b0100
+GO_WRITE_PULL = 0b0101
+EXT_CMP = 0b0110
+GO_WRITE_PULL_DROP = 0b1000
+FAST_GO_WRITE_PULL = 0b1101
+GO_ERR_WRITE_PULL = 0b1111
+# the GO flavours after which the device holds the line invalid
+_GO_INVALIDATES = frozenset((GO_WRITE_PULL, GO_WRITE_PULL_DROP, FAST_GO_WRITE_PULL, GO_ERR_WRITE_PULL))
+
+# cache state encodings in the Response Data of a GO
+GO_STATES = {0b0011: INVALID, 0b0001: SHARED, 0b0010: EXCLUSIVE, 0b0110: MODIFIED}
+GO_ERROR = 0b0100
+
+# H2D Request snoop opcodes
+SNP_DATA = 0b001
+SNP_INV = 0b010
+SNP_CUR = 0b011
+
+# D2H Response snoop response opcodes -> (states the line may have been in, state it is left in, None leaves it)
+RSP_I_HIT_I = 0b00100
+RSP_V_HIT_V = 0b00110
+RSP_I_HIT_SE = 0b00101
+RSP_S_HIT_SE = 0b00001
+RSP_S_FWD_M = 0b00111
+RSP_I_FWD_M = 0b01111
+RSP_V_FWD_V = 0b10110
+SNOOP_RESPONSES = {
+    RSP_I_HIT_I:    ((INVALID,), INVALID),
+    RSP_V_HIT_V:    ((SHARED, EXCLUSIVE, MODIFIED), None),
+    RSP_I_HIT_SE:   ((SHARED, EXCLUSIVE), INVALID),
+    RSP_S_HIT_SE:   ((SHARED, EXCLUSIVE), SHARED),
+    RSP_S_FWD_M:    ((MODIFIED,), SHARED),
+    RSP_I_FWD_M:    ((MODIFIED,), INVALID),
+    RSP_V_FWD_V:    ((MODIFIED,), None),
+}
+# snoop responses a snoop may be answered with
+SNOOP_ALLOWED = {
+    SNP_DATA: frozenset((RSP_I_HIT_I, RSP_I_HIT_SE, RSP_S_HIT_SE, RSP_S_FWD_M, RSP_I_FWD_M)),
+    SNP_INV: frozenset((RSP_I_HIT_I, RSP_I_HIT_SE, RSP_I_FWD_M)),
+    SNP_CUR: frozenset((RSP_I_HIT_I, RSP_V_HIT_V, RSP_I_HIT_SE, RSP_S_HIT_SE, RSP_V_FWD_V)),
+}
+
+# states a line may be in when the device sends each request
+REQUEST_STATES = {
+    RD_SHARED:              (INVALID,),
+    RD_ANY:                 (INVALID,),
+    RD_OWN:                 (INVALID, SHARED),
+    RD_OWN_NO_DATA:         (INVALID, SHARED),
+    CLEAN_EVICT:            (SHARED, EXCLUSIVE),
+    CLEAN_EVICT_NO_DATA:    (SHARED, EXCLUSIVE),
+    DIRTY_EVICT:            (MODIFIED,),
+}
+
+# violation kinds
+BAD_REQUEST = "request in wrong state"
+BAD_SNOOP_RESPONSE = "snoop response in wrong state"
+DISALLOWED_SNOOP_RESPONSE = "snoop response not allowed for snoop"
+GO_ERR = "GO error"
+UNKNOWN_GO_STATE = "unknown GO state"
+UNMATCHED_RESPONSE = "response to no outstanding request"
+VIOLATIONS = (BAD_REQUEST, BAD_SNOOP_RESPONSE, DISALLOWED_SNOOP_RESPONSE, GO_ERR, UNKNOWN_GO_STATE, UNMATCHED_RESPONSE)
+
+QUEUE_IDS = 1 << 12
+DEFAULT_CAPACITY = 1 << 16
+_MAX_LOAD = 0.7
+_GOLDEN = 0x9E3779B97F4A7C15
+_MASK64 = (1 << 64) - 1
+
+# message kinds of a plan
+_D2H_REQUEST = 0
+_H2D_RESPONSE = 1
+_H2D_REQUEST = 2
+_D2H_RESPONSE = 3
+# struct name -> (message kind, fields read in order)
+_MESSAGES = {
+    subs.D2H_REQ:   (_D2H_REQUEST, ("Opcode", "Command Queue ID", "Address")),
+    subs.H2D_RESP:  (_H2D_RESPONSE, ("OpCode", "Command Queue ID", "Response Data")),
+    subs.H2D_REQ:   (_H2D_REQUEST, ("OpCode", "Unique Queue ID", "Address")),
+    subs.D2H_RESP:  (_D2H_RESPONSE, ("Opcode", "Unique Queue ID", None)),
+}
+
+
+class AddressTable:
+    """
+    Brief:
+        An open addressing (linear probing) table of cachelines to a state and a hit count, in three parallel arrays
+
+    Params:
+        capacity:   initial number of slots, rounded up to a power of 2. The table doubles when 70% full
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        if capacity < 1:
+            raise ValueError(f"Address table capacity must be at least 1, was {capacity}")
+        self.__allocate(1 << (capacity - 1).bit_length())
+
+    def __allocate(self, capacity: int):
+        self.__bits = capacity.bit_length() - 1
+        self.__mask = capacity - 1
+        # lines are stored + 1 so 0 marks an empty slot
+        self.__lines = array('Q', bytes(8 * capacity))
+        self.__states = array('B', bytes(capacity))
+        self.__counts = array('Q', bytes(8 * capacity))
+        self.__used = 0
+        self.__limit = int(capacity * _MAX_LOAD)
+
+    def __len__(self):
+        return self.__used
+
+    def __contains__(self, line: int) -> bool:
+        return self.find(line) >= 0
+
+    @property
+    def capacity(self) -> int:
+        return self.__mask + 1
+
+    @capacity.setter
+    def capacity(self, new_value):
+        raise AttributeError("Cannot modify AddressTable's capacity")
+
+    @property
+    def states(self) -> array:
+        return self.__states
+
+    @states.setter
+    def states(self, new_value):
+        raise AttributeError("Cannot modify AddressTable's states")
+
+    @property
+    def counts(self) -> array:
+        return self.__counts
+
+    @counts.setter
+    def counts(self, new_value):
+        raise AttributeError("Cannot modify AddressTable's counts")
+
+    def find(self, line: int) -> int:
+        """
+        Brief:
+            The slot of a line, -1 if it is not in the table
+        """
+        lines = self.__lines
+        mask = self.__mask
+        stored = line + 1
+        slot = ((line * _GOLDEN) & _MASK64) >> (64 - self.__bits) if self.__bits else 0
+        while True:
+            held = lines[slot]
+            if held == stored:
+                return slot
+            if not held:
+                return -1
+            slot = (slot + 1) & mask
+
+    def insert(self, line: int) -> int:
+        """
+        Brief:
+            The slot of a line, added with state UNKNOWN and count 0 if it is not in the table. Slots move when the
+            table grows, so slots are only good until the next insert.
+        """
+        lines = self.__lines
+        mask = self.__mask
+        stored = line + 1
+        slot = ((line * _GOLDEN) & _MASK64) >> (64 - self.__bits) if self.__bits else 0
+        while True:
+            held = lines[slot]
+            if held == stored:
+                return slot
+            if not held:
+                break
+            slot = (slot + 1) & mask
+        if self.__used >= self.__limit:
+            self.__grow()
+            return self.insert(line)
+        lines[slot] = stored
+        self.__used += 1
+        return slot
+
+    def __grow(self):
+        old = zip(self.__lines, self.__states, self.__counts)
+        self.__allocate(2 * self.capacity)
+        for stored, state, count in old:
+            if stored:
+                slot = self.insert(stored - 1)
+                self.__states[slot] = state
+                self.__counts[slot] = count
+
+    def line(self, slot: int) -> int:
+        return self.__lines[slot] - 1
+
+    def items(self):
+        """
+        Brief:
+            Yields (line, state, count) of every line in the table
+        """
+        for stored, state, count in zip(self.__lines, self.__states, self.__counts):
+            if stored:
+                yield stored - 1, state, count
+
+
+class CoherenceViolation:
+    """
+    Brief:
+        A message the device cache could not have sent or received in the state the line was in
+
+    Attributes:
+        kind:       one of VIOLATIONS
+        timestamp:  timestamp of the flit carrying the message
+        address:    the cacheline, None when the message matched no request
+        state:      the line's state before the message, one of STATES
+        opcode:     the opcode of the message
+    """
+    __slots__ = ("kind", "timestamp", "address", "state", "opcode")
+
+    def __init__(self, kind: str, timestamp, address, state, opcode: int):
+        self.kind = kind
+        self.timestamp = timestamp
+        self.address = address
+        self.state = state
+        self.opcode = opcode
+
+    def __repr__(self):
+        address = "?" if self.address is None else f"{self.address:#x}"
+        return (
+            f"<CoherenceViolation {self.kind} at {self.timestamp}: line {address} in {self.state}, "
+            f"opcode {self.opcode:#x}>"
+        )
+
+
+class CoherenceTracker(FlitAnalyzer):
+    """
+    Brief:
+        Follows the MESI state of the device cache over flits travelling in both directions
+
+    Params:
+        capacity:   initial capacity of the AddressTable
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        super().__init__()
+        self.__table = AddressTable(capacity)
+        # requests and snoops waiting for their response by queue ID: line + 1 (0 when none) and opcode
+        self.__requests = array('Q', bytes(8 * QUEUE_IDS))
+        self.__request_opcodes = array('B', bytes(QUEUE_IDS))
+        self.__snoops = array('Q', bytes(8 * QUEUE_IDS))
+        self.__snoop_opcodes = array('B', bytes(QUEUE_IDS))
+        self.__index = 0
+        self.__stats = dict.fromkeys(VIOLATIONS, 0)
+        self.__stats.update({"requests": 0, "snoops": 0, "responses": 0})
+
+    def __len__(self):
+        return len(self.__table)
+
+    @property
+    def table(self) -> AddressTable:
+        return self.__table
+
+    @table.setter
+    def table(self, new_value):
+        raise AttributeError("Cannot modify CoherenceTracker's table")
+
+    @property
+    def stats(self) -> dict:
+        """
+        Brief:
+            Counts of requests, snoops, responses and of each kind of violation
+        """
+        return dict(self.__stats)
+
+    def state(self, address: int):
+        """
+        Brief:
+            "M", "E", "S" or "I" for a cacheline, None if its state is not known
+        """
+        slot = self.__table.find(address)
+        return None if slot < 0 else STATES[self.__table.states[slot]]
+
+    def census(self) -> dict:
+        """
+        Brief:
+            The number of lines in each state
+        """
+        found = dict.fromkeys(STATES, 0)
+        for _, state, _ in self.__table.items():
+            found[STATES[state]] += 1
+        return found
+
+    def hot(self, count: int = 10) -> list[tuple[int, int]]:
+        """
+        Brief:
+            The count most requested and snooped lines as (address, requests + snoops), most first
+        """
+        return heapq.nlargest(count, ((line, hits) for line, _, hits in self.__table.items()), key=lambda item: item[1])
+
+    def _plan_message(self, struct_name: str, fields: dict):
+        """
+        Brief:
+            (message kind, field indices) of a message the tracker follows
+        """
+        message = _MESSAGES.get(struct_name)
+        if message is None:
+            return None
+        kind, names = message
+        return (kind, *(fields[name] if name else None for name in names))
+
+    def process(self, slots, timestamp=None) -> list[CoherenceViolation]:
+        """
+        Brief:
+            Feeds one decoded flit to the tracker, see FlitAnalyzer.process
+
+        Returns:
+            the violations found in the flit
+        """
+        timestamp = self.__index if timestamp is None else timestamp
+        self.__index += 1
+        found = []
+        if not slots:
+            return found
+        table = self.__table
+        stats = self.__stats
+        for slot_format, values in slots:
+            for valid, kind, opcode, queue_id, extra in self._plan(slot_format):
+                if not values[valid]:
+                    continue
+                opcode = values[opcode]
+                queue_id = values[queue_id]
+                if kind == _D2H_REQUEST:
+                    stats["requests"] += 1
+                    line = values[extra]
+                    slot = table.insert(line)
+                    table.counts[slot] += 1
+                    state = table.states[slot]
+                    allowed = REQUEST_STATES.get(opcode)
+                    if state and allowed is not None and state not in allowed:
+                        found.append(CoherenceViolation(BAD_REQUEST, timestamp, line, STATES[state], opcode))
+                    self.__requests[queue_id] = line + 1
+                    self.__request_opcodes[queue_id] = opcode
+                elif kind == _H2D_REQUEST:
+                    stats["snoops"] += 1
+                    line = values[extra]
+                    table.counts[table.insert(line)] += 1
+                    self.__snoops[queue_id] = line + 1
+                    self.__snoop_opcodes[queue_id] = opcode
+                elif kind == _H2D_RESPONSE:
+                    stats["responses"] += 1
+                    self.__complete_request(opcode, queue_id, values[extra], timestamp, found)
+                else:
+                    stats["responses"] += 1
+                    self.__complete_snoop(opcode, queue_id, timestamp, found)
+        for violation in found:
+            stats[violation.kind] += 1
+        return found
+
+    def __complete_request(self, opcode: int, queue_id: int, response_data: int, timestamp, found: list):
+        if opcode != GO and opcode not in _GO_INVALIDATES:
+            # WritePull and ExtCmp leave the state alone, the GO follows
+            return
+        stored = self.__requests[queue_id]
+        if not stored:
+            found.append(CoherenceViolation(UNMATCHED_RESPONSE, timestamp, None, None, opcode))
+            return
+        self.__requests[queue_id] = 0
+        line = stored - 1
+        slot = self.__table.insert(line)
+        states = self.__table.states
+        if opcode != GO:
+            states[slot] = INVALID
+            return
+        if response_data == GO_ERROR:
+            found.append(CoherenceViolation(GO_ERR, timestamp, line, STATES[states[slot]], opcode))
+            states[slot] = INVALID
+            return
+        granted = GO_STATES.get(response_data)
+        if granted is None:
+            found.append(CoherenceViolation(UNKNOWN_GO_STATE, timestamp, line, STATES[states[slot]], opcode))
+            states[slot] = UNKNOWN
+            return
+        states[slot] = granted
+
+    def __complete_snoop(self, opcode: int, queue_id: int, timestamp, found: list):
+        stored = self.__snoops[queue_id]
+        if not stored:
+            found.append(CoherenceViolation(UNMATCHED_RESPONSE, timestamp, None, None, opcode))
+            return
+        self.__snoops[queue_id] = 0
+        line = stored - 1
+        slot = self.__table.insert(line)
+        states = self.__table.states
+        state = states[slot]
+        allowed = SNOOP_ALLOWED.get(self.__snoop_opcodes[queue_id])
+        if allowed is not None and opcode not in allowed:
+            found.append(CoherenceViolation(DISALLOWED_SNOOP_RESPONSE, timestamp, line, STATES[state], opcode))
+        response = SNOOP_RESPONSES.get(opcode)
+        if response is None:
+            return
+        before, after = response
+        if state and state not in before:
+            found.append(CoherenceViolation(BAD_SNOOP_RESPONSE, timestamp, line, STATES[state], opcode))
+        if after is not None:
+            states[slot] = after
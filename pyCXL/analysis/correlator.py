@@ -0,0 +1,236 @@
+"""
+Matching of CXL.cache/CXL.mem requests to their completions.
+
+Three kinds of transaction are followed, each matched by the ID its messages carry:
+
+    DEVICE_REQUESTS     D2H Request                     -> H2D Response / H2D Data Header      by Command Queue ID
+    HOST_SNOOPS         H2D Request                     -> D2H Response / D2H Data Header      by Unique Queue ID
+    MEM_REQUESTS        M2S Request / M2S RwD Header    -> S2M NDR / S2M DRS                   by Tag and LD-ID
+
+    correlator = TransactionCorrelator(timeout=1_000_000)
+    with TraceReader("link0.pcxl") as trace:
+        for record in correlator.run(trace.flits()):
+            record.latency
+
+Outstanding requests are kept in one OrderedDict per correlator keyed by a single int packing the transaction kind,
+LD-ID and ID, so a lookup is one dict probe. A Transaction record is emitted when the first completion arrives; later
+completions of the same transaction (e.g. the data after a GO) are counted on it until the ID is reused or the entry
+times out. Requests that never complete are evicted timeout timestamp units after they were issued and emitted as
+records without a completion, so memory stays bounded however long the stream runs.
+"""
+# Python imports
+from collections import OrderedDict
+
+# Package imports
+from pyCXL.analysis.analyzer import FlitAnalyzer
+from pyCXL.structs import flitsubstructures as subs
+
+DEVICE_REQUESTS = "D2H Request"
+HOST_SNOOPS = "H2D Request"
+MEM_REQUESTS = "M2S Request"
+KINDS = (DEVICE_REQUESTS, HOST_SNOOPS, MEM_REQUESTS)
+
+REQUEST = 0
+COMPLETION = 1
+
+LDID_FIELD = "Logical Device Identifier"
+
+# struct name -> (transaction kind, REQUEST or COMPLETION, ID field, opcode field, address field)
+MESSAGES = {
+    subs.D2H_REQ:   (DEVICE_REQUESTS, REQUEST, "Command Queue ID", "Opcode", "Address"),
+    subs.H2D_RESP:  (DEVICE_REQUESTS, COMPLETION, "Command Queue ID", "OpCode", None),
+    subs.H2D_HEAD:  (DEVICE_REQUESTS, COMPLETION, "Command Queue ID", None, None),
+    subs.H2D_REQ:   (HOST_SNOOPS, REQUEST, "Unique Queue ID", "OpCode", "Address"),
+    subs.D2H_RESP:  (HOST_SNOOPS, COMPLETION, "Unique Queue ID", "Opcode", None),
+    subs.D2H_HEAD:  (HOST_SNOOPS, COMPLETION, "Unique Queue ID", None, None),
+    subs.M2S_REQ:   (MEM_REQUESTS, REQUEST, "Tag", "MemOpcode", "Address"),
+    subs.M2S_HEAD:  (MEM_REQUESTS, REQUEST, "Tag", "MemOpcode", "Address"),
+    subs.S2M_NDR:   (MEM_REQUESTS, COMPLETION, "Tag", "MemOpcode", None),
+    subs.S2M_DRS:   (MEM_REQUESTS, COMPLETION, "Tag", "MemOpcode", None),
+}
+
+_KIND_SHIFT = 24
+_LDID_SHIFT = 16
+
+
+def transaction_key(kind: str, ident: int, ldid: int = 0) -> int:
+    """
+    Brief:
+        The int an outstanding transaction is stored under
+    """
+    return (KINDS.index(kind) << _KIND_SHIFT) | (ldid << _LDID_SHIFT) | ident
+
+
+class Transaction:
+    """
+    Brief:
+        One request and what is known about its completion
+
+    Attributes:
+        kind:           one of KINDS
+        ident:          the CQID, UQID or Tag
+        ldid:           the LD-ID of CXL.mem transactions, 0 otherwise
+        opcode:         the request's opcode
+        address:        the request's address
+        issued:         timestamp of the request
+        completed:      timestamp of the first completion, None if the request timed out
+        completions:    number of completion messages matched so far
+        response:       opcode of the first completion, None when it carried none (data headers)
+    """
+    __slots__ = ("kind", "ident", "ldid", "opcode", "address", "issued", "completed", "completions", "response")
+
+    def __init__(self, kind: str, ident: int, ldid: int, opcode: int, address: int, issued):
+        self.kind = kind
+        self.ident = ident
+        self.ldid = ldid
+        self.opcode = opcode
+        self.address = address
+        self.issued = issued
+        self.completed = None
+        self.completions = 0
+        self.response = None
+
+    def __repr__(self):
+        state = "timed out" if self.completed is None else f"latency {self.latency}"
+        return f"<Transaction {self.kind} {self.ident:#x}: {state}>"
+
+    @property
+    def latency(self):
+        """
+        Brief:
+            Timestamp units from the request to its first completion, None if it never completed
+        """
+        return None if self.completed is None else self.completed - self.issued
+
+
+class TransactionCorrelator(FlitAnalyzer):
+    """
+    Brief:
+        Matches requests to completions over a stream of flits in both directions
+
+    Params:
+        timeout:    evict requests this many timestamp units after they were issued. None keeps them until their ID
+                    is reused
+    """
+
+    def __init__(self, timeout=None):
+        super().__init__()
+        self.__timeout = timeout
+        self.__outstanding = OrderedDict()
+        self.__index = 0
+        self.__stats = {"requests": 0, "matched": 0, "completions": 0, "unmatched": 0, "timed out": 0, "reused": 0}
+
+    def __len__(self):
+        return len(self.__outstanding)
+
+    @property
+    def timeout(self):
+        return self.__timeout
+
+    @timeout.setter
+    def timeout(self, new_value):
+        raise AttributeError("Cannot modify TransactionCorrelator's timeout")
+
+    @property
+    def stats(self) -> dict:
+        """
+        Brief:
+            Counts of requests, requests matched, completion messages, completions matching no request, requests
+            timed out and requests whose ID was reused before they completed
+        """
+        return dict(self.__stats)
+
+    def outstanding(self) -> list[Transaction]:
+        """
+        Brief:
+            The requests still held, oldest first, including completed ones kept for their later completions
+        """
+        return list(self.__outstanding.values())
+
+    def _plan_message(self, struct_name: str, fields: dict):
+        """
+        Brief:
+            (ID, LD-ID, opcode, address value indices, kind index, REQUEST or COMPLETION) of a message. Missing fields
+            have the index None.
+        """
+        message = MESSAGES.get(struct_name)
+        if message is None:
+            return None
+        kind, role, ident, opcode, address = message
+        return (
+            fields[ident],
+            fields.get(LDID_FIELD),
+            fields.get(opcode) if opcode else None,
+            fields.get(address) if address else None,
+            KINDS.index(kind),
+            role
+        )
+
+    def process(self, slots, timestamp=None) -> list[Transaction]:
+        """
+        Brief:
+            Feeds one decoded flit to the correlator, see FlitAnalyzer.process
+
+        Returns:
+            the transactions completed or timed out by the flit
+        """
+        timestamp = self.__index if timestamp is None else timestamp
+        self.__index += 1
+        emitted = []
+        if self.__timeout is not None:
+            self.__evict(timestamp - self.__timeout, emitted)
+        if not slots:
+            return emitted
+        outstanding = self.__outstanding
+        stats = self.__stats
+        for slot_format, values in slots:
+            for valid, ident, ldid, opcode, address, kind, role in self._plan(slot_format):
+                if not values[valid]:
+                    continue
+                ldid_value = values[ldid] if ldid is not None else 0
+                key = (kind << _KIND_SHIFT) | (ldid_value << _LDID_SHIFT) | values[ident]
+                if role == REQUEST:
+                    stats["requests"] += 1
+                    previous = outstanding.pop(key, None)
+                    if previous is not None and previous.completed is None:
+                        stats["reused"] += 1
+                    outstanding[key] = Transaction(
+                        KINDS[kind], values[ident], ldid_value,
+                        values[opcode] if opcode is not None else None,
+                        values[address] if address is not None else None,
+                        timestamp
+                    )
+                    continue
+                stats["completions"] += 1
+                transaction = outstanding.get(key)
+                if transaction is None:
+                    stats["unmatched"] += 1
+                    continue
+                transaction.completions += 1
+                if transaction.completed is None:
+                    transaction.completed = timestamp
+                    transaction.response = values[opcode] if opcode is not None else None
+                    stats["matched"] += 1
+                    emitted.append(transaction)
+        return emitted
+
+    def flush(self) -> list[Transaction]:
+        """
+        Brief:
+            Ends the stream: every request still waiting for its first completion is emitted as timed out and the
+            correlator is emptied
+        """
+        emitted = []
+        self.__evict(None, emitted)
+        return emitted
+
+    def __evict(self, before, emitted: list):
+        outstanding = self.__outstanding
+        while outstanding:
+            key, transaction = next(iter(outstanding.items()))
+            if before is not None and transaction.issued > before:
+                break
+            del outstanding[key]
+            if transaction.completed is None:
+                self.__stats["timed out"] += 1
+                emitted.append(transaction)
@@ -0,0 +1,310 @@
+"""
+Link layer credit accounting over captured flit streams.
+
+A sender may only send a CXL.cache/CXL.mem message while it holds a credit for the message's channel. Credits come
+back in the Response Credit, Request Credit and Data Credit fields of the FlitHeader (and of LLCRD control flits) of
+the flits travelling the other way. Each field is a 4 bit code: bit 3 selects CXL.mem over CXL.cache and bits 2:0
+return 0, 1, 2, 4, 8, 16, 32 or 64 credits (CREDIT_AMOUNTS).
+
+CreditTracker follows the credit balances of the sender of one direction:
+
+    tracker = CreditTracker(HOST_TO_DEVICE)
+    with TraceReader("link0.pcxl") as trace:
+        for window in tracker.run(trace.flits()):
+            print(window)
+    tracker.balances                    # {"cache request": 12, ...}
+    tracker.windows                     # CreditWindows where a channel had no credits left
+    tracker.series()                    # timestamps and balances, one sample per flit that changed a balance
+
+Every valid message sent in the modelled direction spends one credit of its channel and every credit field received
+returns credits, so balances start at 0 and are built up by the credits returned after link up. The per slot format
+work (which fields are credits, which messages sit in which slot) is worked out once per SlotFormat.
+"""
+# Python imports
+from array import array
+
+# Package imports
+from pyCXL.analysis.analyzer import FlitAnalyzer
+from pyCXL.analysis.retry import LLCTRL_LLCRD, LLCTRL_SHIFT, TYPE_SHIFT
+from pyCXL.structs import flitsubstructures as subs
+from pyCXL.structs.flitparser import DIRECTIONS, SLOT_BITS
+from pyCXL.structs.slotregistry import HEADER, slot_format
+
+CREDIT_AMOUNTS = (0, 1, 2, 4, 8, 16, 32, 64)
+_MEM_CREDIT = 0x8
+
+CACHE_REQUEST = "cache request"
+CACHE_RESPONSE = "cache response"
+CACHE_DATA = "cache data"
+MEM_REQUEST = "mem request"
+MEM_RESPONSE = "mem response"
+MEM_DATA = "mem data"
+CHANNELS = (CACHE_REQUEST, CACHE_RESPONSE, CACHE_DATA, MEM_REQUEST, MEM_RESPONSE, MEM_DATA)
+
+# the channel each message struct spends a credit of
+MESSAGE_CHANNELS = {
+    subs.H2D_REQ:   CACHE_REQUEST,
+    subs.H2D_RESP:  CACHE_RESPONSE,
+    subs.H2D_HEAD:  CACHE_DATA,
+    subs.M2S_REQ:   MEM_REQUEST,
+    subs.M2S_HEAD:  MEM_DATA,
+    subs.D2H_REQ:   CACHE_REQUEST,
+    subs.D2H_RESP:  CACHE_RESPONSE,
+    subs.D2H_HEAD:  CACHE_DATA,
+    subs.S2M_NDR:   MEM_RESPONSE,
+    subs.S2M_DRS:   MEM_DATA,
+}
+
+# the credit fields in the order of CREDIT_FIELDS, with the channels they return for CXL.cache and CXL.mem
+CREDIT_FIELDS = ("Flit Header.Response Credit", "Flit Header.Request Credit", "Flit Header.Data Credit")
+_CREDIT_CHANNELS = (
+    (CHANNELS.index(CACHE_RESPONSE), CHANNELS.index(MEM_RESPONSE)),
+    (CHANNELS.index(CACHE_REQUEST), CHANNELS.index(MEM_REQUEST)),
+    (CHANNELS.index(CACHE_DATA), CHANNELS.index(MEM_DATA)),
+)
+
+_HEADER_SLOT = slot_format(0, HEADER, 0)
+# shifts of the credit fields within the first slot of a flit, the same for protocol and LLCRD flits
+CREDIT_SHIFTS = tuple(
+    SLOT_BITS - _HEADER_SLOT.offsets[_HEADER_SLOT.keys.index(key)] - 4 for key in CREDIT_FIELDS
+)
+# every header slot starts with the FlitHeader, so the credit fields have the same value indices in all of them
+_CREDIT_INDICES = tuple(_HEADER_SLOT.keys.index(key) for key in CREDIT_FIELDS)
+
+
+def decode_credit(code: int) -> tuple[bool, int]:
+    """
+    Brief:
+        Splits a 4 bit credit return code into (CXL.mem, number of credits)
+    """
+    return bool(code & _MEM_CREDIT), CREDIT_AMOUNTS[code & 0x7]
+
+
+class CreditWindow:
+    """
+    Brief:
+        A stretch of the stream during which a channel's balance was at or below the starvation threshold
+
+    Attributes:
+        channel:        one of CHANNELS
+        start, stop:    timestamps of the flit that starved the channel and of the flit that returned credits to it.
+                        stop is None while the window is still open
+        start_index:    stream position of the flit that starved the channel
+        stop_index:     stream position of the flit that ended the window
+        lowest:         the lowest balance seen during the window, negative if the sender overspent
+    """
+    __slots__ = ("channel", "start", "stop", "start_index", "stop_index", "lowest")
+
+    def __init__(self, channel: str, start, start_index: int, lowest: int):
+        self.channel = channel
+        self.start = start
+        self.stop = None
+        self.start_index = start_index
+        self.stop_index = None
+        self.lowest = lowest
+
+    def __repr__(self):
+        return f"<CreditWindow {self.channel}: {self.start} - {self.stop}, lowest {self.lowest}>"
+
+    @property
+    def flits(self):
+        """
+        Brief:
+            Number of flits the window lasted, None while it is open
+        """
+        return None if self.stop_index is None else self.stop_index - self.start_index
+
+
+class CreditTracker(FlitAnalyzer):
+    """
+    Brief:
+        Follows the credit balances of the sender of one direction over a stream of flits in both directions
+
+    Params:
+        direction:  the direction whose sender is modelled, HOST_TO_DEVICE or DEVICE_TO_HOST
+        threshold:  a channel is starved while its balance is at or below threshold
+        initial:    starting balance of each channel, a dict from CHANNELS to credits. 0 for channels not given
+    """
+
+    def __init__(self, direction: int, threshold: int = 0, initial: dict = None):
+        if direction not in DIRECTIONS:
+            raise ValueError(f"Unknown flit direction: {direction}")
+        unknown = set(initial or ()).difference(CHANNELS)
+        if unknown:
+            raise ValueError(f"Unknown credit channels: {sorted(unknown)}")
+        super().__init__()
+        self.__direction = direction
+        self.__threshold = threshold
+        self.__balances = [(initial or {}).get(channel, 0) for channel in CHANNELS]
+        self.__open = [None] * len(CHANNELS)
+        self.__windows = []
+        self.__index = 0
+        self.__timestamps = array("q")
+        self.__samples = tuple(array("q") for _ in CHANNELS)
+        self.__spent = [0] * len(CHANNELS)
+        self.__returned = [0] * len(CHANNELS)
+
+    @property
+    def direction(self):
+        return self.__direction
+
+    @direction.setter
+    def direction(self, new_value):
+        raise AttributeError("Cannot modify CreditTracker's direction")
+
+    @property
+    def balances(self) -> dict:
+        return dict(zip(CHANNELS, self.__balances))
+
+    @property
+    def spent(self) -> dict:
+        return dict(zip(CHANNELS, self.__spent))
+
+    @property
+    def returned(self) -> dict:
+        return dict(zip(CHANNELS, self.__returned))
+
+    @property
+    def windows(self) -> list[CreditWindow]:
+        """
+        Brief:
+            Every starvation window so far in the order they opened, the last ones may still be open
+        """
+        return list(self.__windows)
+
+    def series(self) -> dict:
+        """
+        Brief:
+            The balances after every flit that changed them
+
+        Returns:
+            a dict of array('q') columns: "timestamp" and one per channel
+        """
+        series = {"timestamp": array("q", self.__timestamps)}
+        for channel, samples in zip(CHANNELS, self.__samples):
+            series[channel] = array("q", samples)
+        return series
+
+    def _plan_message(self, struct_name: str, fields: dict):
+        """
+        Brief:
+            (channel index,) of a message spending a credit
+        """
+        channel = MESSAGE_CHANNELS.get(struct_name)
+        return None if channel is None else (CHANNELS.index(channel),)
+
+    def process(self, slots, timestamp=None) -> bool:
+        """
+        Brief:
+            Feeds one decoded flit to the tracker, see FlitAnalyzer.process. The flit's direction is that of its
+            SlotFormats. Control flits are counted without changing any balance.
+
+        Returns:
+            whether any balance changed
+        """
+        delta = [0] * len(CHANNELS)
+        changed = False
+        if slots:
+            outgoing = slots[0][0].direction == self.__direction
+            for slot_format, values in slots:
+                if outgoing:
+                    for valid, channel in self._plan(slot_format):
+                        if values[valid]:
+                            delta[channel] -= 1
+                            changed = True
+                elif slot_format.header:
+                    changed |= self.__credit(delta, [values[idx] for idx in _CREDIT_INDICES])
+        return self.__apply(delta, changed, timestamp)
+
+    def process_flit(self, direction: int, flit, offset: int = 0, timestamp=None) -> bool:
+        """
+        Brief:
+            Feeds one raw 66 byte flit to the tracker. Credits returned by LLCRD control flits are counted too.
+        """
+        head = int.from_bytes(flit[offset:offset + SLOT_BITS // 8], 'big')
+        if head >> TYPE_SHIFT & 1:
+            if direction == self.__direction or (head >> LLCTRL_SHIFT) & 0xF != LLCTRL_LLCRD:
+                return self.__apply(None, False, timestamp)
+            delta = [0] * len(CHANNELS)
+            changed = self.__credit(delta, [(head >> shift) & 0xF for shift in CREDIT_SHIFTS])
+            return self.__apply(delta, changed, timestamp)
+        return self.process(self._parse(direction, flit, offset), timestamp)
+
+    def run(self, flits):
+        """
+        Brief:
+            Feeds a stream of (timestamp, direction, flit) tuples, such as TraceReader.flits(), to the tracker
+
+        Yields:
+            the starvation windows opened by the stream, as they open
+        """
+        windows = self.__windows
+        before = len(windows)
+        for _ in self._feed(flits):
+            if len(windows) > before:
+                yield from windows[before:]
+                before = len(windows)
+
+    def process_columns(self, direction: int, columns: dict, timestamps=None) -> int:
+        """
+        Brief:
+            Feeds the credit fields of many flits at once, e.g. columns of a header slot decoded by decode_batch or a
+            FlitTable. Only the credits returned are counted, the messages the flits carry are not.
+
+        Params:
+            direction:  the direction the flits travelled in, the opposite of the tracker's
+            columns:    a mapping holding the three CREDIT_FIELDS columns
+            timestamps: one timestamp per row, stream positions if not given
+
+        Returns:
+            the number of rows that changed a balance
+        """
+        if direction == self.__direction:
+            raise ValueError("Credits are returned by the flits travelling the other way")
+        fields = [columns[key] for key in CREDIT_FIELDS]
+        changed_rows = 0
+        for row, codes in enumerate(zip(*fields)):
+            delta = [0] * len(CHANNELS)
+            changed = self.__credit(delta, [int(code) for code in codes])
+            changed_rows += self.__apply(delta, changed, None if timestamps is None else int(timestamps[row]))
+        return changed_rows
+
+    def __credit(self, delta: list, codes) -> bool:
+        changed = False
+        for code, channels in zip(codes, _CREDIT_CHANNELS):
+            amount = CREDIT_AMOUNTS[code & 0x7]
+            if amount:
+                delta[channels[1 if code & _MEM_CREDIT else 0]] += amount
+                changed = True
+        return changed
+
+    def __apply(self, delta, changed: bool, timestamp) -> bool:
+        index = self.__index
+        self.__index += 1
+        if not changed:
+            return False
+        timestamp = index if timestamp is None else timestamp
+        balances = self.__balances
+        threshold = self.__threshold
+        for channel, amount in enumerate(delta):
+            if not amount:
+                continue
+            if amount < 0:
+                self.__spent[channel] -= amount
+            else:
+                self.__returned[channel] += amount
+            balance = balances[channel] = balances[channel] + amount
+            window = self.__open[channel]
+            if balance <= threshold:
+                if window is None:
+                    window = self.__open[channel] = CreditWindow(CHANNELS[channel], timestamp, index, balance)
+                    self.__windows.append(window)
+                window.lowest = min(window.lowest, balance)
+            elif window is not None:
+                window.stop = timestamp
+                window.stop_index = index
+                self.__open[channel] = None
+        self.__timestamps.append(timestamp)
+        for samples, balance in zip(self.__samples, balances):
+            samples.append(balance)
+        return True
@@ -0,0 +1,295 @@
+"""
+The most requested 64 byte cachelines of a capture, found in fixed memory.
+
+HotAddressProfiler counts the cacheline of every valid H2D Request, D2H Request, M2S Request and M2S RwD header in a
+CountMinSketch and keeps the k lines with the highest estimates in a small heap:
+
+    profiler = HotAddressProfiler(k=20)
+    with TraceReader("link0.pcxl") as trace:
+        profiler.run(trace.flits())
+    profiler.top()                      # [(cacheline, estimated requests), ...], most first
+    profiler.top()[0][0] * CACHELINE_BYTES
+
+A count-min sketch never under counts: each estimate is the true count plus at most 2 / width of all the requests
+counted, with probability 1 - 2 ** -depth. Memory is width * depth counters plus k candidates, whatever the size of
+the address space. Sketches and profilers built with the same width, depth and seed merge, so shards of a capture can
+be profiled by separate workers and combined.
+
+The H2D/D2H Request and M2S RwD Address fields hold Addr[51:6], already a cacheline, while the M2S Request Address
+holds Addr[51:5] and is shifted down one more bit.
+"""
+# Python imports
+import heapq
+import random
+from array import array
+
+# Package imports
+from pyCXL.analysis.analyzer import FlitAnalyzer
+from pyCXL.structs import flitsubstructures as subs
+
+CACHELINE_BYTES = 64
+DEFAULT_WIDTH = 1 << 14
+DEFAULT_DEPTH = 4
+DEFAULT_K = 10
+
+# struct name -> bits to drop from its Address field to get the cacheline
+ADDRESS_SHIFTS = {
+    subs.H2D_REQ: 0,
+    subs.D2H_REQ: 0,
+    subs.M2S_REQ: 1,
+    subs.M2S_HEAD: 0,
+}
+
+_MASK64 = (1 << 64) - 1
+# the heap is rebuilt from the candidates once it holds this many times k stale entries
+_HEAP_SLACK = 4
+
+
+class CountMinSketch:
+    """
+    Brief:
+        Approximate counts of ints in depth rows of width counters
+
+    Params:
+        width:  counters per row, rounded up to a power of 2
+        depth:  rows, each with its own hash
+        seed:   seeds the row hashes. Only sketches with the same width, depth and seed can merge
+    """
+
+    def __init__(self, width: int = DEFAULT_WIDTH, depth: int = DEFAULT_DEPTH, seed: int = 0):
+        if width < 1 or depth < 1:
+            raise ValueError(f"Sketch width and depth must be at least 1, were {width} and {depth}")
+        self.__bits = (width - 1).bit_length()
+        self.__width = 1 << self.__bits
+        self.__depth = depth
+        self.__seed = seed
+        generator = random.Random(seed)
+        # multiply-shift hashing: odd multipliers and offsets, the top bits index the row
+        self.__hashes = tuple(
+            (generator.getrandbits(64) | 1, generator.getrandbits(64), row * self.__width) for row in range(depth)
+        )
+        self.__counts = array('Q', bytes(8 * self.__width * depth))
+        self.__total = 0
+
+    def __len__(self):
+        return self.__total
+
+    def __eq__(self, other):
+        if not isinstance(other, CountMinSketch):
+            return NotImplemented
+        return self.__shape() == other.__shape() and self.__counts == other.__counts
+
+    def __shape(self):
+        return self.__width, self.__depth, self.__seed
+
+    @property
+    def width(self) -> int:
+        return self.__width
+
+    @width.setter
+    def width(self, new_value):
+        raise AttributeError("Cannot modify CountMinSketch's width")
+
+    @property
+    def depth(self) -> int:
+        return self.__depth
+
+    @depth.setter
+    def depth(self, new_value):
+        raise AttributeError("Cannot modify CountMinSketch's depth")
+
+    @property
+    def seed(self) -> int:
+        return self.__seed
+
+    @seed.setter
+    def seed(self, new_value):
+        raise AttributeError("Cannot modify CountMinSketch's seed")
+
+    def __columns(self, item: int):
+        shift = 64 - self.__bits
+        return [
+            base + ((((item * multiplier) + offset) & _MASK64) >> shift if self.__bits else 0)
+            for multiplier, offset, base in self.__hashes
+        ]
+
+    def add(self, item: int, count: int = 1) -> int:
+        """
+        Brief:
+            Counts item count times
+
+        Returns:
+            the new estimate of item
+        """
+        counts = self.__counts
+        estimate = None
+        for column in self.__columns(item):
+            value = counts[column] + count
+            counts[column] = value
+            if estimate is None or value < estimate:
+                estimate = value
+        self.__total += count
+        return estimate
+
+    def estimate(self, item: int) -> int:
+        """
+        Brief:
+            The estimated count of item, never less than its true count
+        """
+        counts = self.__counts
+        return min(counts[column] for column in self.__columns(item))
+
+    def merge(self, other: "CountMinSketch"):
+        """
+        Brief:
+            Adds the counts of another sketch of the same width, depth and seed to this one
+        """
+        if self.__shape() != other.__shape():
+            raise ValueError(f"Cannot merge sketches of (width, depth, seed) {self.__shape()} and {other.__shape()}")
+        counts = self.__counts
+        for index, count in enumerate(other.__counts):
+            if count:
+                counts[index] += count
+        self.__total += other.__total
+
+
+class HotAddressProfiler(FlitAnalyzer):
+    """
+    Brief:
+        The top k cachelines of the requests carried by a stream of flits in either direction
+
+    Params:
+        k:          number of cachelines to keep
+        width:      width of the CountMinSketch
+        depth:      depth of the CountMinSketch
+        seed:       seed of the CountMinSketch
+        structs:    the request struct names counted, every one of ADDRESS_SHIFTS by default
+    """
+
+    def __init__(self, k: int = DEFAULT_K, width: int = DEFAULT_WIDTH, depth: int = DEFAULT_DEPTH, seed: int = 0,
+                 structs=None):
+        if k < 1:
+            raise ValueError(f"k must be at least 1, was {k}")
+        structs = tuple(ADDRESS_SHIFTS) if structs is None else tuple(structs)
+        unknown = [struct for struct in structs if struct not in ADDRESS_SHIFTS]
+        if unknown:
+            raise ValueError(f"Structs without a request Address: {unknown}")
+        super().__init__()
+        self.__k = k
+        self.__structs = structs
+        self.__sketch = CountMinSketch(width, depth, seed)
+        self.__candidates = {}
+        self.__heap = []
+
+    def __len__(self):
+        return len(self.__sketch)
+
+    @property
+    def k(self) -> int:
+        return self.__k
+
+    @k.setter
+    def k(self, new_value):
+        raise AttributeError("Cannot modify HotAddressProfiler's k")
+
+    @property
+    def sketch(self) -> CountMinSketch:
+        return self.__sketch
+
+    @sketch.setter
+    def sketch(self, new_value):
+        raise AttributeError("Cannot modify HotAddressProfiler's sketch")
+
+    def add(self, line: int, count: int = 1):
+        """
+        Brief:
+            Counts a request to a cacheline
+        """
+        self.__offer(line, self.__sketch.add(line, count))
+
+    def __offer(self, line: int, estimate: int):
+        candidates = self.__candidates
+        heap = self.__heap
+        if line in candidates:
+            candidates[line] = estimate
+            heapq.heappush(heap, (estimate, line))
+        elif len(candidates) < self.__k:
+            candidates[line] = estimate
+            heapq.heappush(heap, (estimate, line))
+        else:
+            # drop heap entries whose candidate has since been counted again or evicted
+            while heap[0][0] != candidates.get(heap[0][1]):
+                heapq.heappop(heap)
+            if estimate <= heap[0][0]:
+                return
+            del candidates[heapq.heappop(heap)[1]]
+            candidates[line] = estimate
+            heapq.heappush(heap, (estimate, line))
+        if len(heap) > _HEAP_SLACK * self.__k:
+            self.__heap = [(count, line) for line, count in candidates.items()]
+            heapq.heapify(self.__heap)
+
+    def top(self, count: int = None) -> list[tuple[int, int]]:
+        """
+        Brief:
+            The count (k by default) hottest cachelines as (cacheline, estimated requests), most first
+        """
+        ranked = sorted(self.__candidates.items(), key=lambda item: (-item[1], item[0]))
+        return ranked if count is None else ranked[:count]
+
+    def merge(self, other: "HotAddressProfiler"):
+        """
+        Brief:
+            Adds the counts of a profiler built over another shard of a capture to this one. The candidates of both are
+            estimated again from the merged sketch.
+        """
+        self.__sketch.merge(other.__sketch)
+        lines = set(self.__candidates) | set(other.__candidates)
+        ranked = sorted(((self.__sketch.estimate(line), line) for line in lines), reverse=True)[:self.__k]
+        self.__candidates = {line: estimate for estimate, line in ranked}
+        self.__heap = ranked
+        heapq.heapify(self.__heap)
+
+    def _plan_message(self, struct_name: str, fields: dict):
+        """
+        Brief:
+            (Address index, shift) of a counted request
+        """
+        if struct_name not in self.__structs:
+            return None
+        return fields["Address"], ADDRESS_SHIFTS[struct_name]
+
+    def process(self, slots, timestamp=None) -> int:
+        """
+        Brief:
+            Counts the requests of one decoded flit, see FlitAnalyzer.process. The timestamp is not used.
+
+        Returns:
+            the number of requests counted
+        """
+        if not slots:
+            return 0
+        counted = 0
+        add = self.__sketch.add
+        offer = self.__offer
+        for slot_format, values in slots:
+            for valid, address, shift in self._plan(slot_format):
+                if values[valid]:
+                    line = values[address] >> shift
+                    offer(line, add(line))
+                    counted += 1
+        return counted
+
+    def run(self, flits) -> list[tuple[int, int]]:
+        """
+        Brief:
+            Counts the requests of a stream of (timestamp, direction, flit) tuples, such as TraceReader.flits().
+            Requests are counts rather than findings, so unlike FlitAnalyzer.run this is not a generator: the whole
+            stream is consumed before it returns
+
+        Returns:
+            the top k cachelines
+        """
+        for _ in self._feed(flits):
+            pass
+        return self.top()
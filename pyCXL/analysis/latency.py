@@ -0,0 +1,390 @@
+"""
+Fixed memory latency histograms over correlated transactions.
+
+LatencyHistogram is an HDR style log-linear histogram: values below 2 ** precision each get a bucket of their own, and
+above that every power of two range is split into 2 ** (precision - 1) equal buckets, so any recorded value is known
+to within 1 part in 2 ** (precision - 1) whatever its size. The counts live in one preallocated array, so memory is
+fixed by precision and max_bits and not by the number of samples.
+
+    profile = LatencyProfile()
+    correlator = TransactionCorrelator(timeout=1_000_000)
+    with TraceReader("link0.pcxl") as trace:
+        profile.run(correlator.run(trace.flits()))
+    profile.percentiles((50, 99, 99.9), by=("kind", "opcode"))
+    profile.histogram(ldid=2).percentile(99)
+
+Histograms and profiles built over separate shards, in separate processes, pickle and merge into the totals of the
+whole capture.
+"""
+# Python imports
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, record_values falls back to a loop without it
+    np = None
+
+DEFAULT_PRECISION = 8
+DEFAULT_MAX_BITS = 48
+PERCENTILES = (50, 99, 99.9)
+
+# what a LatencyProfile groups its histograms by
+GROUPS = ("kind", "opcode", "ldid")
+
+
+class LatencyHistogram:
+    """
+    Brief:
+        Counts of latencies in log-linear buckets
+
+    Params:
+        precision:  bits of each value kept exactly, buckets are at most 1 / 2 ** (precision - 1) of their value wide
+        max_bits:   largest value tracked is 2 ** max_bits - 1, larger values are counted in the last bucket
+    """
+
+    def __init__(self, precision: int = DEFAULT_PRECISION, max_bits: int = DEFAULT_MAX_BITS):
+        if not 1 <= precision <= max_bits:
+            raise ValueError(f"Histogram precision must be 1 - {max_bits} bits, was {precision}")
+        self.__precision = precision
+        self.__max_bits = max_bits
+        self.__half = 1 << (precision - 1)
+        self.__counts = array('Q', bytes(8 * self.bucket_index((1 << max_bits) - 1) + 8))
+        self.__total = 0
+        self.__sum = 0
+        self.__min = None
+        self.__max = None
+
+    def __repr__(self):
+        return f"<LatencyHistogram {self.__total} values, p50 {self.percentile(50)}, max {self.__max}>"
+
+    def __len__(self):
+        return self.__total
+
+    def __eq__(self, other):
+        if not isinstance(other, LatencyHistogram):
+            return NotImplemented
+        return self.__shape() == other.__shape() and self.__counts == other.__counts
+
+    def __iadd__(self, other):
+        self.merge(other)
+        return self
+
+    def __add__(self, other):
+        merged = LatencyHistogram(self.__precision, self.__max_bits)
+        merged.merge(self)
+        merged.merge(other)
+        return merged
+
+    def __shape(self):
+        return self.__precision, self.__max_bits
+
+    @property
+    def precision(self):
+        return self.__precision
+
+    @precision.setter
+    def precision(self, new_value):
+        raise AttributeError("Cannot modify LatencyHistogram's precision")
+
+    @property
+    def max_bits(self):
+        return self.__max_bits
+
+    @max_bits.setter
+    def max_bits(self, new_value):
+        raise AttributeError("Cannot modify LatencyHistogram's max bits")
+
+    @property
+    def counts(self) -> array:
+        return self.__counts
+
+    @counts.setter
+    def counts(self, new_value):
+        raise AttributeError("Cannot modify LatencyHistogram's counts")
+
+    @property
+    def min(self):
+        return self.__min
+
+    @min.setter
+    def min(self, new_value):
+        raise AttributeError("Cannot modify LatencyHistogram's min")
+
+    @property
+    def max(self):
+        return self.__max
+
+    @max.setter
+    def max(self, new_value):
+        raise AttributeError("Cannot modify LatencyHistogram's max")
+
+    @property
+    def mean(self):
+        return self.__sum / self.__total if self.__total else None
+
+    @mean.setter
+    def mean(self, new_value):
+        raise AttributeError("Cannot modify LatencyHistogram's mean")
+
+    def bucket_index(self, value: int) -> int:
+        """
+        Brief:
+            The bucket counting value
+        """
+        size = value.bit_length() - self.__precision
+        if size <= 0:
+            return value
+        return (1 << self.__precision) + (size - 1) * self.__half + (value >> size) - self.__half
+
+    def bucket_range(self, index: int) -> tuple[int, int]:
+        """
+        Brief:
+            The lowest and highest value counted in a bucket
+        """
+        if index < (1 << self.__precision):
+            return index, index
+        size, mantissa = divmod(index - (1 << self.__precision), self.__half)
+        size += 1
+        low = (mantissa + self.__half) << size
+        return low, low + (1 << size) - 1
+
+    def __highest(self, index: int) -> int:
+        """
+        Brief:
+            The highest value counted in a bucket that was recorded. The last bucket also counts every value too
+            large for the histogram.
+        """
+        if index == len(self.__counts) - 1:
+            return self.__max
+        return min(self.bucket_range(index)[1], self.__max)
+
+    def record(self, value: int, count: int = 1):
+        """
+        Brief:
+            Counts value count times
+        """
+        value = int(value)
+        if value < 0:
+            raise ValueError(f"Latencies cannot be negative, was {value}")
+        index = self.bucket_index(value)
+        counts = self.__counts
+        counts[index if index < len(counts) else -1] += count
+        self.__total += count
+        self.__sum += value * count
+        if self.__min is None or value < self.__min:
+            self.__min = value
+        if self.__max is None or value > self.__max:
+            self.__max = value
+
+    def record_values(self, values):
+        """
+        Brief:
+            Counts every value of a sequence, vectorised with NumPy when it is installed
+        """
+        if np is None:
+            for value in values:
+                self.record(value)
+            return
+        values = np.asarray(values, dtype=np.int64)
+        if not values.size:
+            return
+        if values.min() < 0:
+            raise ValueError(f"Latencies cannot be negative, was {int(values.min())}")
+        # frexp's exponent is the bit length of each value, exact below 2 ** 53
+        sizes = np.frexp(values.astype(np.float64))[1].astype(np.int64) - self.__precision
+        shifted = np.maximum(sizes, 1)
+        indices = np.where(
+            sizes <= 0,
+            values,
+            (1 << self.__precision) + (shifted - 1) * self.__half + (values >> shifted) - self.__half
+        )
+        indices = np.minimum(indices, len(self.__counts) - 1)
+        counts = np.frombuffer(self.__counts, dtype=np.uint64)
+        np.add.at(counts, indices, 1)
+        self.__total += int(values.size)
+        self.__sum += int(values.sum())
+        low, high = int(values.min()), int(values.max())
+        self.__min = low if self.__min is None else min(self.__min, low)
+        self.__max = high if self.__max is None else max(self.__max, high)
+
+    def merge(self, other: "LatencyHistogram"):
+        """
+        Brief:
+            Adds the counts of another histogram of the same precision and max bits to this one
+        """
+        if self.__shape() != other.__shape():
+            raise ValueError(f"Cannot merge histograms of (precision, max bits) {self.__shape()} and {other.__shape()}")
+        counts = self.__counts
+        for index, count in enumerate(other.__counts):
+            if count:
+                counts[index] += count
+        self.__total += other.__total
+        self.__sum += other.__sum
+        for value in (other.__min, other.__max):
+            if value is not None:
+                self.__min = value if self.__min is None else min(self.__min, value)
+                self.__max = value if self.__max is None else max(self.__max, value)
+
+    def percentile(self, percentile: float):
+        """
+        Brief:
+            The value below which percentile % of the values fall, to the precision of the histogram. None when the
+            histogram is empty
+
+        Returns:
+            the highest value of the bucket holding the percentile, never more than the largest value recorded
+        """
+        if not 0 <= percentile <= 100:
+            raise ValueError(f"Percentiles must be 0 - 100, was {percentile}")
+        if not self.__total:
+            return None
+        # rank of the value, 1 based, rounded up so p100 is the largest value
+        rank = max(1, -(-self.__total * percentile // 100))
+        seen = 0
+        for index, count in enumerate(self.__counts):
+            seen += count
+            if seen >= rank:
+                return self.__highest(index)
+        return self.__max
+
+    def percentiles(self, percentiles=PERCENTILES) -> dict:
+        """
+        Brief:
+            {percentile: value} in one pass over the buckets
+        """
+        for percentile in percentiles:
+            if not 0 <= percentile <= 100:
+                raise ValueError(f"Percentiles must be 0 - 100, was {percentile}")
+        if not self.__total:
+            return {percentile: None for percentile in percentiles}
+        ranks = sorted((max(1, -(-self.__total * percentile // 100)), percentile) for percentile in percentiles)
+        found = {}
+        seen = 0
+        position = 0
+        for index, count in enumerate(self.__counts):
+            if not count:
+                continue
+            seen += count
+            while position < len(ranks) and seen >= ranks[position][0]:
+                found[ranks[position][1]] = self.__highest(index)
+                position += 1
+            if position == len(ranks):
+                break
+        return {percentile: found.get(percentile, self.__max) for percentile in percentiles}
+
+
+class LatencyProfile:
+    """
+    Brief:
+        One LatencyHistogram per (transaction kind, request opcode, LD-ID), fed with the Transactions emitted by a
+        TransactionCorrelator. Transactions that timed out are counted but not recorded.
+
+    Params:
+        precision:  precision of every histogram
+        max_bits:   max bits of every histogram
+    """
+
+    def __init__(self, precision: int = DEFAULT_PRECISION, max_bits: int = DEFAULT_MAX_BITS):
+        # checks the arguments once, up front
+        LatencyHistogram(precision, max_bits)
+        self.__precision = precision
+        self.__max_bits = max_bits
+        self.__histograms = {}
+        self.__timed_out = 0
+
+    def __len__(self):
+        return sum(len(histogram) for histogram in self.__histograms.values())
+
+    def __iadd__(self, other):
+        self.merge(other)
+        return self
+
+    @property
+    def timed_out(self) -> int:
+        return self.__timed_out
+
+    @timed_out.setter
+    def timed_out(self, new_value):
+        raise AttributeError("Cannot modify LatencyProfile's timed out count")
+
+    @property
+    def histograms(self) -> dict:
+        """
+        Brief:
+            {(kind, opcode, ldid): LatencyHistogram}
+        """
+        return dict(self.__histograms)
+
+    def add(self, transaction):
+        """
+        Brief:
+            Records the latency of one correlated Transaction
+        """
+        latency = transaction.latency
+        if latency is None:
+            self.__timed_out += 1
+            return
+        key = (transaction.kind, transaction.opcode, transaction.ldid)
+        histogram = self.__histograms.get(key)
+        if histogram is None:
+            histogram = self.__histograms[key] = LatencyHistogram(self.__precision, self.__max_bits)
+        histogram.record(latency)
+
+    def run(self, transactions):
+        """
+        Brief:
+            Records every Transaction of an iterable, such as TransactionCorrelator.run
+        """
+        add = self.add
+        for transaction in transactions:
+            add(transaction)
+        return self
+
+    def merge(self, other: "LatencyProfile"):
+        """
+        Brief:
+            Adds the histograms of a profile built over another shard of a capture to this one
+        """
+        for key, histogram in other.__histograms.items():
+            mine = self.__histograms.get(key)
+            if mine is None:
+                mine = self.__histograms[key] = LatencyHistogram(self.__precision, self.__max_bits)
+            mine.merge(histogram)
+        self.__timed_out += other.__timed_out
+
+    def histogram(self, kind: str = None, opcode: int = None, ldid: int = None) -> LatencyHistogram:
+        """
+        Brief:
+            The merged histogram of every transaction matching the given kind, opcode and LD-ID, None matching any
+        """
+        wanted = (kind, opcode, ldid)
+        merged = LatencyHistogram(self.__precision, self.__max_bits)
+        for key, histogram in self.__histograms.items():
+            if all(want is None or want == have for want, have in zip(wanted, key)):
+                merged.merge(histogram)
+        return merged
+
+    def percentiles(self, percentiles=PERCENTILES, by=GROUPS) -> dict:
+        """
+        Brief:
+            Percentiles of the latencies grouped by some of GROUPS
+
+        Params:
+            percentiles:    the percentiles wanted
+            by:             the GROUPS to keep apart, e.g. ("ldid",) for one entry per LD-ID
+
+        Returns:
+            {group values: {percentile: value}}, the group values in the order of by
+        """
+        unknown = [group for group in by if group not in GROUPS]
+        if unknown:
+            raise ValueError(f"Unknown latency groups: {unknown}")
+        positions = [GROUPS.index(group) for group in by]
+        grouped = {}
+        for key, histogram in self.__histograms.items():
+            group = tuple(key[position] for position in positions)
+            merged = grouped.get(group)
+            if merged is None:
+                merged = grouped[group] = LatencyHistogram(self.__precision, self.__max_bits)
+            merged.merge(histogram)
+        return {group: histogram.percentiles(percentiles) for group, histogram in grouped.items()}
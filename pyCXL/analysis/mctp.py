@@ -0,0 +1,261 @@
+"""
+Reassembly of MCTP messages split over several MCTP over PCIe VDM packets.
+
+A message starts with a Start Of Message packet, continues with packets whose 2 bit Packet Sequence counts up by one
+and ends with an End Of Message packet. Packets of different messages may interleave; a message is told apart by its
+(source endpoint ID, message tag, tag owner).
+
+    reassembler = MCTPReassembler(timeout=100_000_000)
+    for message in reassembler.run((timestamp, tlp) for timestamp, tlp in capture):
+        if message.message_type == CXL_FM_API:
+            header = message.cci_header()
+
+Each message in flight is written into a bytearray of max_message_bytes taken from a pool and given back when the
+message completes or is dropped, so reassembly does not allocate per packet however long the capture. Packets out of
+sequence, continuations without a start, restarts and messages growing past max_message_bytes drop the message and
+are counted in stats; messages not finished within timeout timestamp units of their first packet are dropped too.
+"""
+# Python imports
+from collections import OrderedDict
+
+# Package imports
+from pyCXL.structs.MCTP import (
+    CCI_HEADER_BYTES,
+    CXL_CCI,
+    CXL_FM_API,
+    CCIMessageHeader,
+    MCTPMessageHeader,
+    decode_packet
+)
+
+DEFAULT_MAX_MESSAGE_BYTES = 1 << 16
+SEQUENCE_NUMBERS = 4
+
+# kinds of dropped packets and messages
+NOT_MCTP = "not an MCTP packet"
+OUT_OF_SEQUENCE = "out of sequence"
+NO_START = "continuation without a start"
+RESTARTED = "restarted before its end"
+TOO_LONG = "message too long"
+TIMED_OUT = "timed out"
+DROPS = (NOT_MCTP, OUT_OF_SEQUENCE, NO_START, RESTARTED, TOO_LONG, TIMED_OUT)
+
+
+class MCTPMessage:
+    """
+    Brief:
+        A reassembled MCTP message
+
+    Attributes:
+        source:             source endpoint ID
+        destination:        destination endpoint ID
+        tag:                message tag
+        tag_owner:          tag owner bit
+        data:               the message, starting with the MCTP message header byte
+        packets:            number of packets it arrived in
+        started:            timestamp of its first packet
+        finished:           timestamp of its last packet
+    """
+    __slots__ = ("source", "destination", "tag", "tag_owner", "data", "packets", "started", "finished")
+
+    def __init__(self, source: int, destination: int, tag: int, tag_owner: int, data: bytes, packets: int, started,
+                 finished):
+        self.source = source
+        self.destination = destination
+        self.tag = tag
+        self.tag_owner = tag_owner
+        self.data = data
+        self.packets = packets
+        self.started = started
+        self.finished = finished
+
+    def __repr__(self):
+        return (
+            f"<MCTPMessage {self.source} -> {self.destination} tag {self.tag}: type {self.message_type:#04x}, "
+            f"{len(self.data)} bytes in {self.packets} packets>"
+        )
+
+    @property
+    def message_type(self) -> int:
+        return self.data[0] & 0x7F
+
+    @property
+    def integrity_check(self) -> int:
+        return self.data[0] >> 7
+
+    @property
+    def body(self) -> bytes:
+        """
+        Brief:
+            The message after its MCTP message header byte
+        """
+        return self.data[1:]
+
+    def header(self) -> MCTPMessageHeader:
+        header = MCTPMessageHeader()
+        header.from_bytes(self.data[:1])
+        return header
+
+    def cci_header(self) -> CCIMessageHeader:
+        """
+        Brief:
+            The CXL CCI message header of a CXL FM API or CXL CCI message
+        """
+        if self.message_type not in (CXL_FM_API, CXL_CCI):
+            raise ValueError(f"MCTP message type {self.message_type:#04x} is not a CXL FM API or CCI message")
+        header = CCIMessageHeader()
+        header.from_bytes(self.body[:CCI_HEADER_BYTES])
+        return header
+
+
+class _Assembly:
+    """
+    Brief:
+        A message in flight: the pooled buffer it is written into and where it has got to
+    """
+    __slots__ = ("buffer", "length", "destination", "expected", "packets", "started")
+
+    def __init__(self, buffer: bytearray, destination: int, expected: int, started):
+        self.buffer = buffer
+        self.length = 0
+        self.destination = destination
+        self.expected = expected
+        self.packets = 0
+        self.started = started
+
+
+class MCTPReassembler:
+    """
+    Brief:
+        Stitches MCTP over PCIe VDM packets back into messages
+
+    Params:
+        max_message_bytes:  the largest message accepted, the size of each pooled buffer
+        timeout:            drop messages this many timestamp units after their first packet. None never drops them
+        strict:             raise a ValueError on TLPs that are not MCTP packets rather than counting them
+    """
+
+    def __init__(self, max_message_bytes: int = DEFAULT_MAX_MESSAGE_BYTES, timeout=None, strict: bool = False):
+        if max_message_bytes < 1:
+            raise ValueError(f"max_message_bytes must be at least 1, was {max_message_bytes}")
+        self.__max_bytes = max_message_bytes
+        self.__timeout = timeout
+        self.__strict = strict
+        self.__assemblies = OrderedDict()
+        self.__pool = []
+        self.__index = 0
+        self.__stats = dict.fromkeys(DROPS, 0)
+        self.__stats.update({"packets": 0, "messages": 0})
+
+    def __len__(self):
+        return len(self.__assemblies)
+
+    @property
+    def max_message_bytes(self) -> int:
+        return self.__max_bytes
+
+    @max_message_bytes.setter
+    def max_message_bytes(self, new_value):
+        raise AttributeError("Cannot modify MCTPReassembler's max message bytes")
+
+    @property
+    def timeout(self):
+        return self.__timeout
+
+    @timeout.setter
+    def timeout(self, new_value):
+        raise AttributeError("Cannot modify MCTPReassembler's timeout")
+
+    @property
+    def stats(self) -> dict:
+        """
+        Brief:
+            Counts of packets, messages completed and of each kind of drop in DROPS
+        """
+        return dict(self.__stats)
+
+    def __drop(self, key, kind: str):
+        self.__pool.append(self.__assemblies.pop(key).buffer)
+        self.__stats[kind] += 1
+
+    def __evict(self, before):
+        assemblies = self.__assemblies
+        while assemblies:
+            key, assembly = next(iter(assemblies.items()))
+            if assembly.started > before:
+                break
+            self.__drop(key, TIMED_OUT)
+
+    def process(self, tlp, timestamp=None, offset: int = 0):
+        """
+        Brief:
+            Feeds one TLP to the reassembler
+
+        Params:
+            tlp:        a buffer holding an MCTP over PCIe VDM TLP from offset
+            timestamp:  the TLP's timestamp, its stream position if not given. Must not decrease
+            offset:     byte offset of the TLP within the buffer
+
+        Returns:
+            the MCTPMessage the packet completed, None otherwise
+        """
+        timestamp = self.__index if timestamp is None else timestamp
+        self.__index += 1
+        if self.__timeout is not None:
+            self.__evict(timestamp - self.__timeout)
+        try:
+            packet = decode_packet(tlp, offset)
+        except ValueError:
+            if self.__strict:
+                raise
+            self.__stats[NOT_MCTP] += 1
+            return None
+        stats = self.__stats
+        stats["packets"] += 1
+        assemblies = self.__assemblies
+        key = (packet.source, packet.tag, packet.tag_owner)
+        assembly = assemblies.get(key)
+        if packet.som:
+            if assembly is not None:
+                self.__drop(key, RESTARTED)
+            buffer = self.__pool.pop() if self.__pool else bytearray(self.__max_bytes)
+            assembly = assemblies[key] = _Assembly(buffer, packet.destination, packet.sequence, timestamp)
+        elif assembly is None:
+            stats[NO_START] += 1
+            return None
+        if packet.sequence != assembly.expected:
+            self.__drop(key, OUT_OF_SEQUENCE)
+            return None
+        payload = packet.payload
+        length = assembly.length + len(payload)
+        if length > self.__max_bytes:
+            self.__drop(key, TOO_LONG)
+            return None
+        assembly.buffer[assembly.length:length] = payload
+        assembly.length = length
+        assembly.packets += 1
+        assembly.expected = (packet.sequence + 1) % SEQUENCE_NUMBERS
+        if not packet.eom:
+            return None
+        del assemblies[key]
+        self.__pool.append(assembly.buffer)
+        stats["messages"] += 1
+        data = bytes(memoryview(assembly.buffer)[:length])
+        return MCTPMessage(
+            packet.source, assembly.destination, packet.tag, packet.tag_owner, data, assembly.packets, assembly.started,
+            timestamp
+        )
+
+    def run(self, tlps):
+        """
+        Brief:
+            Feeds a stream of (timestamp, TLP) tuples to the reassembler
+
+        Yields:
+            MCTPMessages as they complete
+        """
+        process = self.process
+        for timestamp, tlp in tlps:
+            message = process(tlp, timestamp)
+            if message is not None:
+                yield message
@@ -0,0 +1,384 @@
+"""
+Link layer retry simulation over captured flit streams.
+
+The CXL.cache/CXL.mem link layer keeps every protocol flit it sends in a retry buffer until the other side acknowledges
+it. Flits carry an implicit 8 bit sequence number. The receiver acknowledges flits with the Acknowledge bit of the
+flits it sends back (each Ack releases ACK_FLITS flits) and, after a CRC error, asks for a replay with a RETRY.Req
+control flit naming the sequence number it expects next. The sender answers with a RETRY.Ack and replays the buffer
+from that sequence number.
+
+RetrySimulator models the sender of one direction:
+
+    simulator = RetrySimulator(HOST_TO_DEVICE)
+    with TraceReader("link0.pcxl") as trace:
+        for event in simulator.run(trace.flits()):
+            print(event)
+
+Flits travelling in the modelled direction are transmitted, flits travelling the other way are received. Only the
+first 16 bytes of a received flit are decoded and transmitted flits are copied into a preallocated ring buffer, so the
+simulation keeps up with decoding. Control flits are not retried in this model.
+"""
+# Python imports
+from collections import deque
+
+# Package imports
+from pyCXL.structs.flitparser import DIRECTIONS, FLIT_BYTES, SLOT_BITS
+from pyCXL.structs.slotregistry import CONTROL_LAYOUTS, HEADER, slot_format
+
+SEQUENCE_BITS = 8
+SEQUENCE_NUMBERS = 1 << SEQUENCE_BITS
+DEFAULT_RETRY_ENTRIES = 128
+ACK_FLITS = 8
+
+# LLCTRL encodings of control flits and the SubTypes of RETRY control flits
+LLCTRL_LLCRD = 0x0
+LLCTRL_RETRY = 0x1
+LLCTRL_IDE = 0x2
+RETRY_IDLE = 0x0
+RETRY_REQ = 0x1
+RETRY_ACK = 0x2
+RETRY_FRAME = 0x3
+
+# event kinds
+REPLAY = "replay"
+REPLAY_MISMATCH = "replay mismatch"
+INVALID_RETRY = "invalid retry"
+RETRY_ACK_MISMATCH = "retry ack mismatch"
+MISSED_ACK = "missed ack"
+SPURIOUS_ACK = "spurious ack"
+OVERFLOW = "overflow"
+RETRY_STORM = "retry storm"
+
+
+def _slot_shift(layout, key: str, base: int = 0) -> int:
+    """
+    Brief:
+        The shift of a field of a layout placed base bits into the first slot, within that slot's integer value
+    """
+    idx = layout.keys.index(key)
+    return SLOT_BITS - base - layout.size + layout.shifts[idx]
+
+
+_HEADER_SLOT = slot_format(0, HEADER, 0)
+_RETRY = CONTROL_LAYOUTS["RETRY"]
+_RETRY_REQ = CONTROL_LAYOUTS["RETRY Req Payload"]
+_RETRY_ACK = CONTROL_LAYOUTS["RETRY Ack Payload"]
+
+TYPE_SHIFT = SLOT_BITS - 1 - _HEADER_SLOT.offsets[_HEADER_SLOT.keys.index("Flit Header.Type")]
+ACK_SHIFT = SLOT_BITS - 1 - _HEADER_SLOT.offsets[_HEADER_SLOT.keys.index("Flit Header.Acknowledge")]
+LLCTRL_SHIFT = _slot_shift(_RETRY, "LLCTRL.LLCTRL")
+SUBTYPE_SHIFT = _slot_shift(_RETRY, "SubType.SubType")
+REQ_SEQUENCE_SHIFT = _slot_shift(_RETRY_REQ, "Payload.SequenceNumber", base=_RETRY.size)
+ACK_WRPTR_SHIFT = _slot_shift(_RETRY_ACK, "Payload.WrPtr", base=_RETRY.size)
+ACK_FREE_SHIFT = _slot_shift(_RETRY_ACK, "Payload.NumFreeBuf", base=_RETRY.size)
+
+
+class RetryEvent:
+    """
+    Brief:
+        Something the retry simulation flagged
+
+    Attributes:
+        kind:       one of REPLAY, REPLAY_MISMATCH, INVALID_RETRY, RETRY_ACK_MISMATCH, MISSED_ACK, SPURIOUS_ACK,
+                    OVERFLOW or RETRY_STORM
+        index:      position of the flit that raised the event in the simulated stream
+        timestamp:  timestamp of that flit, None when not given
+        sequence:   sequence number the event concerns
+        count:      number of flits involved, e.g. the flits replayed or the flits left unacknowledged
+    """
+    __slots__ = ("kind", "index", "timestamp", "sequence", "count")
+
+    def __init__(self, kind: str, index: int, timestamp, sequence: int, count: int = 0):
+        self.kind = kind
+        self.index = index
+        self.timestamp = timestamp
+        self.sequence = sequence
+        self.count = count
+
+    def __repr__(self):
+        return f"<RetryEvent {self.kind} at flit {self.index}: sequence {self.sequence}, {self.count} flits>"
+
+
+class RetryBuffer:
+    """
+    Brief:
+        A fixed size ring buffer of transmitted flits indexed by sequence number. Storage for every entry is allocated
+        up front and flits are copied into it, nothing is allocated per flit.
+
+    Params:
+        entries: number of flits the buffer holds, at most 255 so that sequence numbers stay unambiguous
+    """
+
+    def __init__(self, entries: int = DEFAULT_RETRY_ENTRIES):
+        if not 0 < entries < SEQUENCE_NUMBERS:
+            raise ValueError(f"A retry buffer holds 1 to {SEQUENCE_NUMBERS - 1} flits, was {entries}")
+        self.__entries = entries
+        self.__storage = bytearray(entries * FLIT_BYTES)
+        self.__view = memoryview(self.__storage)
+        self.__wrptr = 0        # sequence number of the next flit pushed
+        self.__count = 0        # flits waiting for an Ack
+        self.__pushed = 0       # flits pushed so far, entries are placed by this rather than the wrapping wrptr
+
+    def __len__(self):
+        return self.__count
+
+    @property
+    def entries(self):
+        return self.__entries
+
+    @entries.setter
+    def entries(self, new_value):
+        raise AttributeError("Cannot modify RetryBuffer's entries")
+
+    @property
+    def wrptr(self):
+        return self.__wrptr
+
+    @wrptr.setter
+    def wrptr(self, new_value):
+        raise AttributeError("Cannot modify RetryBuffer's wrptr")
+
+    @property
+    def oldest(self) -> int:
+        """
+        Brief:
+            Sequence number of the oldest unacknowledged flit
+        """
+        return (self.__wrptr - self.__count) % SEQUENCE_NUMBERS
+
+    @property
+    def free(self) -> int:
+        return self.__entries - self.__count
+
+    def __slot(self, sequence: int) -> int:
+        pushed = self.__pushed - (self.__wrptr - sequence) % SEQUENCE_NUMBERS
+        return pushed % self.__entries * FLIT_BYTES
+
+    def push(self, flit, offset: int = 0) -> int:
+        """
+        Brief:
+            Stores a transmitted flit, dropping the oldest unacknowledged flit if the buffer is full
+
+        Returns:
+            the flit's sequence number
+        """
+        sequence = self.__wrptr
+        start = self.__pushed % self.__entries * FLIT_BYTES
+        self.__view[start:start + FLIT_BYTES] = flit[offset:offset + FLIT_BYTES]
+        self.__pushed += 1
+        self.__wrptr = (sequence + 1) % SEQUENCE_NUMBERS
+        self.__count = min(self.__count + 1, self.__entries)
+        return sequence
+
+    def release(self, count: int) -> int:
+        """
+        Brief:
+            Frees the count oldest flits after an Ack
+
+        Returns:
+            the number of flits actually freed, smaller than count when fewer were waiting
+        """
+        freed = min(count, self.__count)
+        self.__count -= freed
+        return freed
+
+    def holds(self, sequence: int) -> bool:
+        """
+        Brief:
+            Whether the flit with a sequence number is still waiting for an Ack
+        """
+        return (sequence - self.oldest) % SEQUENCE_NUMBERS < self.__count
+
+    def outstanding_from(self, sequence: int) -> int:
+        """
+        Brief:
+            Number of flits from sequence up to the last flit pushed
+        """
+        return (self.__wrptr - sequence) % SEQUENCE_NUMBERS
+
+    def get(self, sequence: int) -> memoryview:
+        """
+        Brief:
+            The stored flit with a sequence number, a view of the buffer that is overwritten as flits are pushed
+        """
+        if not self.holds(sequence):
+            raise ValueError(f"Sequence number {sequence} is not in the retry buffer")
+        start = self.__slot(sequence)
+        return self.__view[start:start + FLIT_BYTES]
+
+
+class RetrySimulator:
+    """
+    Brief:
+        Follows the retry state of the sender of one direction over a stream of flits in both directions
+
+    Params:
+        direction:      the direction whose sender is modelled, HOST_TO_DEVICE or DEVICE_TO_HOST
+        entries:        size of the sender's retry buffer
+        ack_timeout:    flag a MISSED_ACK once this many flits are waiting for an Ack, the buffer size if not given
+        storm_retries:  flag a RETRY_STORM when this many RETRY.Reqs arrive ...
+        storm_window:   ... within this many flits of the stream
+    """
+
+    def __init__(self, direction: int, entries: int = DEFAULT_RETRY_ENTRIES, ack_timeout: int = None,
+                 storm_retries: int = 4, storm_window: int = 1024):
+        if direction not in DIRECTIONS:
+            raise ValueError(f"Unknown flit direction: {direction}")
+        self.__direction = direction
+        self.__buffer = RetryBuffer(entries)
+        self.__ack_timeout = entries if ack_timeout is None else ack_timeout
+        self.__storm_retries = storm_retries
+        self.__storm_window = storm_window
+        self.__events = []
+        self.__index = 0
+        self.__retries = deque()    # stream indices of recent RETRY.Reqs
+        self.__storming = False
+        self.__waiting = False      # a MISSED_ACK was flagged and no Ack has arrived since
+        self.__replay = None        # sequence number of the next flit expected to be replayed
+        self.__replay_left = 0
+        self.__stats = {"transmitted": 0, "received": 0, "acked": 0, "retry requests": 0, "replayed": 0}
+
+    @property
+    def direction(self):
+        return self.__direction
+
+    @direction.setter
+    def direction(self, new_value):
+        raise AttributeError("Cannot modify RetrySimulator's direction")
+
+    @property
+    def buffer(self) -> RetryBuffer:
+        return self.__buffer
+
+    @buffer.setter
+    def buffer(self, new_value):
+        raise AttributeError("Cannot modify RetrySimulator's buffer")
+
+    @property
+    def events(self) -> list[RetryEvent]:
+        return self.__events
+
+    @events.setter
+    def events(self, new_value):
+        raise AttributeError("Cannot modify RetrySimulator's events")
+
+    @property
+    def stats(self) -> dict:
+        """
+        Brief:
+            Counts of transmitted and received flits, flits acknowledged, retry requests and flits replayed
+        """
+        return dict(self.__stats)
+
+    @property
+    def replaying(self) -> bool:
+        return self.__replay_left > 0
+
+    def __flag(self, kind: str, timestamp, sequence: int, count: int = 0) -> RetryEvent:
+        event = RetryEvent(kind, self.__index, timestamp, sequence, count)
+        self.__events.append(event)
+        return event
+
+    def process(self, direction: int, flit, offset: int = 0, timestamp=None) -> int:
+        """
+        Brief:
+            Feeds one 66 byte flit travelling in direction to the simulation
+
+        Returns:
+            the number of events raised by the flit
+        """
+        before = len(self.__events)
+        if direction == self.__direction:
+            self.__transmit(flit, offset, timestamp)
+        else:
+            self.__receive(flit, offset, timestamp)
+        self.__index += 1
+        return len(self.__events) - before
+
+    def run(self, flits) -> list[RetryEvent]:
+        """
+        Brief:
+            Feeds a stream of (timestamp, direction, flit) tuples, such as TraceReader.flits(), to the simulation
+
+        Returns:
+            the events raised by the stream
+        """
+        before = len(self.__events)
+        process = self.process
+        for timestamp, direction, flit in flits:
+            process(direction, flit, 0, timestamp)
+        return self.__events[before:]
+
+    def __transmit(self, flit, offset: int, timestamp):
+        self.__stats["transmitted"] += 1
+        head = int.from_bytes(flit[offset:offset + SLOT_BITS // 8], 'big')
+        buffer = self.__buffer
+        if head >> TYPE_SHIFT & 1:
+            if (head >> LLCTRL_SHIFT) & 0xF == LLCTRL_RETRY and (head >> SUBTYPE_SHIFT) & 0xF == RETRY_ACK:
+                wrptr = (head >> ACK_WRPTR_SHIFT) & 0xFF
+                free = (head >> ACK_FREE_SHIFT) & 0xFF
+                if wrptr != buffer.wrptr or free != buffer.free:
+                    self.__flag(RETRY_ACK_MISMATCH, timestamp, wrptr, free)
+            return
+
+        if self.__replay_left:
+            sequence = self.__replay
+            # an Ack received since the RETRY.Req may have freed the flits still to be replayed
+            if buffer.holds(sequence) and buffer.get(sequence) == flit[offset:offset + FLIT_BYTES]:
+                self.__stats["replayed"] += 1
+                self.__replay = (sequence + 1) % SEQUENCE_NUMBERS
+                self.__replay_left -= 1
+                return
+            self.__flag(REPLAY_MISMATCH, timestamp, sequence, self.__replay_left)
+            self.__replay_left = 0
+
+        if buffer.free == 0:
+            self.__flag(OVERFLOW, timestamp, buffer.oldest, len(buffer))
+        buffer.push(flit, offset)
+        if len(buffer) >= self.__ack_timeout and not self.__waiting:
+            self.__waiting = True
+            self.__flag(MISSED_ACK, timestamp, buffer.oldest, len(buffer))
+
+    def __receive(self, flit, offset: int, timestamp):
+        self.__stats["received"] += 1
+        head = int.from_bytes(flit[offset:offset + SLOT_BITS // 8], 'big')
+        buffer = self.__buffer
+        control = head >> TYPE_SHIFT & 1
+        llctrl = (head >> LLCTRL_SHIFT) & 0xF
+
+        # protocol flits and LLCRD control flits carry the Acknowledge bit in the same place
+        if (head >> ACK_SHIFT) & 1 and (not control or llctrl == LLCTRL_LLCRD):
+            freed = buffer.release(ACK_FLITS)
+            self.__stats["acked"] += freed
+            self.__waiting = False
+            if freed < ACK_FLITS:
+                self.__flag(SPURIOUS_ACK, timestamp, buffer.wrptr, ACK_FLITS - freed)
+
+        if control and llctrl == LLCTRL_RETRY and (head >> SUBTYPE_SHIFT) & 0xF == RETRY_REQ:
+            self.__retry_request((head >> REQ_SEQUENCE_SHIFT) & 0xFF, timestamp)
+
+    def __retry_request(self, sequence: int, timestamp):
+        self.__stats["retry requests"] += 1
+        buffer = self.__buffer
+        if buffer.holds(sequence):
+            # flits before the expected sequence number arrived intact and are implicitly acknowledged
+            self.__stats["acked"] += buffer.release((sequence - buffer.oldest) % SEQUENCE_NUMBERS)
+            self.__replay = sequence
+            self.__replay_left = buffer.outstanding_from(sequence)
+            self.__flag(REPLAY, timestamp, sequence, self.__replay_left)
+        elif sequence == buffer.wrptr:
+            # everything sent was received, there is nothing to replay
+            self.__stats["acked"] += buffer.release(len(buffer))
+        else:
+            self.__flag(INVALID_RETRY, timestamp, sequence, buffer.outstanding_from(sequence))
+
+        retries = self.__retries
+        retries.append(self.__index)
+        while retries and retries[0] <= self.__index - self.__storm_window:
+            retries.popleft()
+        if len(retries) >= self.__storm_retries:
+            if not self.__storming:
+                self.__storming = True
+                self.__flag(RETRY_STORM, timestamp, sequence, len(retries))
+        else:
+            self.__storming = False
@@ -0,0 +1,218 @@
+"""
+Random access to raw link captures without loading them into memory.
+
+A raw capture is a file of back to back records with no framing, either 16 byte slots or 66 byte (528 bit) protocol
+flits. CaptureReader memory maps the file so that reading record i is a constant time slice of the mapping and memory
+use does not grow with the size of the file:
+
+    with CaptureReader("link0.bin", record_bytes=FLIT_BYTES) as reader:
+        flit = H_SLOT_TABLE[HOST_TO_DEVICE][0].build()
+        flit.from_bytes(reader[10])                     # existing BitCollection/FlitStruct code keeps working
+        view = reader.view(10, layout=flit.layout)      # zero copy StructView
+        table = reader.table(0, 1000, layout=G_SLOT_TABLE[HOST_TO_DEVICE][4].layout, offset=16)   # slot 1 of each flit
+
+Records are handed out as memoryviews of the mapping. Release them (or let them go out of scope) before closing the
+reader, mmap refuses to close while views of it are alive.
+"""
+# Python imports
+import mmap
+import os
+
+# Package imports
+from pyCXL.structs.bitviews import StructView
+from pyCXL.structs.flitparser import SLOT_BITS
+from pyCXL.structs.flittable import FlitTable
+
+SLOT_BYTES = SLOT_BITS // 8
+
+
+class CaptureReader:
+    """
+    Brief:
+        A memory mapped capture of fixed size records
+
+    Params:
+        path:           the capture file
+        record_bytes:   size of one record, 16 for slot captures and 66 (FLIT_BYTES) for flit captures. Taken from
+                        layout if not given
+        layout:         default layout for view() and table(), optional
+        writable:       map the file for writing so that views can modify records in place
+        strict:         raise if the file ends with a partial record instead of ignoring it
+    """
+
+    def __init__(self, path, record_bytes: int = None, layout=None, writable: bool = False, strict: bool = True):
+        self.__layout = getattr(layout, "layout", layout)
+        if record_bytes is None:
+            record_bytes = self.__layout.byte_size if self.__layout is not None else SLOT_BYTES
+        if record_bytes <= 0:
+            raise ValueError(f"Invalid record size: {record_bytes}")
+        self.__record_bytes = record_bytes
+        self.__path = os.fspath(path)
+        self.__writable = writable
+
+        self.__file = open(self.__path, "r+b" if writable else "rb")
+        file_size = os.fstat(self.__file.fileno()).st_size
+        count, partial = divmod(file_size, record_bytes)
+        if partial and strict:
+            self.__file.close()
+            raise ValueError(f"Capture does not hold a whole number of {record_bytes} byte records")
+        self.__length = count
+        if file_size:
+            self.__mmap = mmap.mmap(
+                self.__file.fileno(), 0, access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ
+            )
+            self.__buffer = memoryview(self.__mmap)
+        else:
+            # an empty file cannot be mapped
+            self.__mmap = None
+            self.__buffer = memoryview(bytearray() if writable else b"")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self):
+        return self.__length
+
+    def __repr__(self):
+        return f"<CaptureReader {self.__path}: {self.__length} x {self.__record_bytes} byte records>"
+
+    def __getitem__(self, item):
+        """
+        Brief:
+            reader[i] is the memoryview of record i, reader[a:b] the memoryview of records a to b
+        """
+        if isinstance(item, slice):
+            start, stop, step = item.indices(self.__length)
+            if step != 1:
+                raise ValueError("CaptureReader slices must be contiguous")
+            return self.__buffer[start * self.__record_bytes:max(start, stop) * self.__record_bytes]
+        start = self.__record_offset(item)
+        return self.__buffer[start:start + self.__record_bytes]
+
+    def __iter__(self):
+        record_bytes = self.__record_bytes
+        buffer = self.__buffer
+        for start in range(0, self.__length * record_bytes, record_bytes):
+            yield buffer[start:start + record_bytes]
+
+    @property
+    def path(self):
+        return self.__path
+
+    @path.setter
+    def path(self, new_value):
+        raise AttributeError("Cannot modify CaptureReader's path")
+
+    @property
+    def record_bytes(self):
+        return self.__record_bytes
+
+    @record_bytes.setter
+    def record_bytes(self, new_value):
+        raise AttributeError("Cannot modify CaptureReader's record_bytes")
+
+    @property
+    def layout(self):
+        return self.__layout
+
+    @layout.setter
+    def layout(self, new_value):
+        raise AttributeError("Cannot modify CaptureReader's layout")
+
+    @property
+    def buffer(self):
+        """
+        Brief:
+            memoryview of the whole mapping
+        """
+        return self.__buffer
+
+    @buffer.setter
+    def buffer(self, new_value):
+        raise AttributeError("Cannot modify CaptureReader's buffer")
+
+    @property
+    def closed(self):
+        return self.__file.closed
+
+    def __record_offset(self, index: int) -> int:
+        if index < 0:
+            index += self.__length
+        if not 0 <= index < self.__length:
+            raise IndexError("CaptureReader index out of range")
+        return index * self.__record_bytes
+
+    def __layout_for(self, layout):
+        layout = getattr(layout, "layout", layout) if layout is not None else self.__layout
+        if layout is None:
+            raise ValueError("A layout is required, pass one here or to the CaptureReader")
+        return layout
+
+    def read(self, index: int) -> bytes:
+        """
+        Brief:
+            A copy of record index
+        """
+        return bytes(self[index])
+
+    def view(self, index: int, layout=None, offset: int = 0) -> StructView:
+        """
+        Brief:
+            A zero copy StructView of record index. Rebind it with rebind(reader.offset_of(j)) to walk the capture.
+
+        Params:
+            index:  the record
+            layout: layout of the view, the reader's layout if not given
+            offset: byte offset of the struct within the record, e.g. 16 * position for a slot of a flit
+        """
+        return StructView(self.__layout_for(layout), self.__buffer, self.__record_offset(index) + offset)
+
+    def offset_of(self, index: int) -> int:
+        """
+        Brief:
+            Byte offset of record index within the capture
+        """
+        return self.__record_offset(index)
+
+    def table(self, start: int = 0, stop: int = None, layout=None, offset: int = 0, backend: str = None) -> FlitTable:
+        """
+        Brief:
+            Batch decodes records start to stop into a FlitTable
+
+        Params:
+            layout:     layout to decode, the reader's layout if not given
+            offset:     byte offset of the struct within each record
+            backend:    FlitTable backend
+        """
+        layout = self.__layout_for(layout)
+        start, stop, _ = slice(start, stop).indices(self.__length)
+        stop = max(start, stop)
+        if offset < 0 or offset + layout.byte_size > self.__record_bytes:
+            raise ValueError(f"{layout.name} does not fit in a {self.__record_bytes} byte record at offset {offset}")
+        chunk = self.__buffer[start * self.__record_bytes:stop * self.__record_bytes]
+        return FlitTable.from_bytes(chunk, layout, stride=self.__record_bytes, offset=offset, backend=backend)
+
+    def tables(self, rows: int, layout=None, offset: int = 0, backend: str = None):
+        """
+        Brief:
+            Iterates over the whole capture as FlitTables of at most rows records each
+        """
+        if rows <= 0:
+            raise ValueError("rows must be positive")
+        for start in range(0, self.__length, rows):
+            yield self.table(start, start + rows, layout=layout, offset=offset, backend=backend)
+
+    def close(self):
+        """
+        Brief:
+            Unmaps and closes the capture. Every memoryview handed out must have been released first.
+        """
+        if self.__file.closed:
+            return
+        self.__buffer.release()
+        if self.__mmap is not None:
+            self.__mmap.close()
+        self.__file.close()
@@ -0,0 +1,130 @@
+"""
+asyncio decoding of live flit feeds, e.g. an analyzer pushing raw 66 byte flits over a socket or pipe.
+
+    reader, writer = await asyncio.open_connection(host, port)
+    async for flit in FlitStreamReader(reader, HOST_TO_DEVICE):
+        flit.get("M2S Request.Address")
+
+Flits are decoded straight out of the chunks returned by StreamReader.read. Only a flit split across two chunks is
+reassembled, in a 66 byte carry buffer, so whole flits are never copied.
+
+Backpressure comes from reading on demand: the next chunk is only read once the consumer has taken every flit of the
+previous one. While the consumer is busy the StreamReader's buffer fills up to its limit and asyncio pauses the
+transport, so a slow consumer slows the sender down instead of growing memory. After each chunk the reader yields to the
+event loop so one event loop can serve several links fairly, even when their data is already buffered.
+"""
+# Python imports
+import asyncio
+
+# Package imports
+from pyCXL.capture.pipeline import DecodedFlit
+from pyCXL.structs.flitparser import FLIT_BYTES, HOST_TO_DEVICE, FlitParser
+
+DEFAULT_READ_BYTES = FLIT_BYTES * 992   # just under asyncio's default 64 KiB StreamReader limit
+
+
+class FlitStreamReader:
+    """
+    Brief:
+        Asynchronously iterates over the protocol flits arriving on an asyncio.StreamReader
+
+    Params:
+        reader:         an asyncio.StreamReader, or anything with an async read(n) returning b"" at the end of the feed
+        direction:      HOST_TO_DEVICE or DEVICE_TO_HOST, selects the slot format tables
+        skip_control:   drop control flits. When False they are yielded as DecodedFlits with no slots (or None)
+        structs:        yield the list of 4 FlitStructs built by FlitParser.parse_structs instead of DecodedFlits
+        read_bytes:     most bytes requested from the reader at once
+        strict:         raise if the feed ends with a partial flit instead of dropping it
+    """
+
+    def __init__(self, reader, direction: int = HOST_TO_DEVICE, skip_control: bool = True, structs: bool = False,
+                 read_bytes: int = DEFAULT_READ_BYTES, strict: bool = True):
+        if read_bytes <= 0:
+            raise ValueError("read_bytes must be positive")
+        self.__reader = reader
+        self.__parser = FlitParser(direction)
+        self.__skip_control = skip_control
+        self.__structs = structs
+        self.__read_bytes = read_bytes
+        self.__strict = strict
+        self.__carry = bytearray()
+        self.__index = 0
+        self.__bytes_read = 0
+        self.__flits = None
+
+    def __repr__(self):
+        return f"<FlitStreamReader {self.__index} flits, {self.__bytes_read} bytes>"
+
+    def __aiter__(self):
+        if self.__flits is None:
+            self.__flits = self.__decode_stream()
+        return self.__flits
+
+    @property
+    def direction(self):
+        return self.__parser.direction
+
+    @direction.setter
+    def direction(self, new_value):
+        raise AttributeError("Cannot modify FlitStreamReader's direction")
+
+    @property
+    def index(self):
+        """
+        Brief:
+            Number of flits received so far, control flits included
+        """
+        return self.__index
+
+    @index.setter
+    def index(self, new_value):
+        raise AttributeError("Cannot modify FlitStreamReader's index")
+
+    @property
+    def bytes_read(self):
+        return self.__bytes_read
+
+    @bytes_read.setter
+    def bytes_read(self, new_value):
+        raise AttributeError("Cannot modify FlitStreamReader's bytes_read")
+
+    def __decode(self, buffer, offset: int):
+        index = self.__index
+        self.__index += 1
+        if self.__structs:
+            structs = self.__parser.parse_structs(buffer, offset)
+            if structs is None and self.__skip_control:
+                return ()
+            return (structs,)
+        slots = self.__parser.parse(buffer, offset)
+        if slots is None:
+            return () if self.__skip_control else (DecodedFlit(index, ()),)
+        return (DecodedFlit(index, slots),)
+
+    async def __decode_stream(self):
+        carry = self.__carry
+        while True:
+            chunk = await self.__reader.read(self.__read_bytes)
+            if not chunk:
+                break
+            self.__bytes_read += len(chunk)
+            data = memoryview(chunk)
+            start = 0
+            if carry:
+                # the flit split across the previous chunk and this one
+                start = min(FLIT_BYTES - len(carry), len(data))
+                carry += data[:start]
+                if len(carry) < FLIT_BYTES:
+                    continue
+                for flit in self.__decode(carry, 0):
+                    yield flit
+                del carry[:]
+            stop = start + (len(data) - start) // FLIT_BYTES * FLIT_BYTES
+            for offset in range(start, stop, FLIT_BYTES):
+                for flit in self.__decode(data, offset):
+                    yield flit
+            carry += data[stop:]
+            data.release()
+            await asyncio.sleep(0)
+        if carry and self.__strict:
+            raise ValueError(f"Stream ended with a partial {FLIT_BYTES} byte record")
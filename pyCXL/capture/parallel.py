@@ -0,0 +1,144 @@
+"""
+Decoding of large captures across several processes.
+
+    table = parallel_decode("link0.bin", G_SLOT_TABLE[HOST_TO_DEVICE][4].layout, workers=32, record_bytes=FLIT_BYTES,
+                            offset=16)
+
+The capture is split into shards of whole records, so every shard starts on a flit (or slot) boundary, and each
+shard is decoded with bitbatch.decode_batch in a ProcessPoolExecutor. Decoded values never travel back through pickle:
+the parent allocates one multiprocessing.shared_memory block per field, every worker memory maps the capture and writes
+its shard's values straight into the rows of those blocks it owns. Since each shard knows its row range up front the
+columns are in capture order as soon as every shard is done, and merging them is a single copy per column.
+
+Like bitbatch this needs NumPy.
+"""
+# Python imports
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+# Package imports
+from pyCXL.structs.flittable import NUMPY, FlitTable
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, parallel_decode is unavailable without it
+    np = None
+
+if np is not None:
+    from pyCXL.structs.bitbatch import decode_batch, field_dtype
+
+SHARDS_PER_WORKER = 4
+
+# set in each worker by _start_worker
+_LAYOUT = None
+
+
+def _start_worker(layout):
+    global _LAYOUT
+    _LAYOUT = layout
+
+
+def shard_ranges(count: int, shards: int) -> list[tuple[int, int]]:
+    """
+    Brief:
+        Splits count records into at most shards contiguous (start, stop) ranges of near equal size
+    """
+    shards = max(1, min(shards, count))
+    size, extra = divmod(count, shards)
+    ranges = []
+    start = 0
+    for shard in range(shards):
+        stop = start + size + (shard < extra)
+        if stop > start:
+            ranges.append((start, stop))
+        start = stop
+    return ranges
+
+
+def _decode_shard(path, record_bytes: int, offset: int, start: int, stop: int, columns: dict) -> int:
+    """
+    Brief:
+        Decodes records [start, stop) of the capture into rows [start, stop) of the shared memory columns
+
+    Params:
+        columns: field key -> shared memory block name, in the layout's key order
+    """
+    layout = _LAYOUT
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+        shard = memoryview(mapping)[start * record_bytes:stop * record_bytes]
+        decoded = decode_batch(shard, layout, stride=record_bytes, offset=offset)
+        for key, size in zip(layout.keys, layout.sizes):
+            block = shared_memory.SharedMemory(name=columns[key])
+            try:
+                column = np.ndarray((stop,), dtype=field_dtype(size), buffer=block.buf)
+                column[start:stop] = decoded[key]
+                del column
+            finally:
+                block.close()
+        del decoded
+        shard.release()
+    return stop - start
+
+
+def parallel_decode(path, layout, workers: int = None, record_bytes: int = None, offset: int = 0,
+                    shards: int = None, strict: bool = True, mp_context=None) -> FlitTable:
+    """
+    Brief:
+        Decodes every record of a capture file into a FlitTable using a pool of processes
+
+    Params:
+        path:           the capture file
+        layout:         a BitLayout or CollectionLayout, or a BitStruct/BitCollection whose layout to use
+        workers:        number of processes, os.cpu_count() if not given
+        record_bytes:   size of one record in the file, the layout's size if not given. Use FLIT_BYTES with offset to
+                        decode one slot out of every flit
+        offset:         byte offset of the layout within each record
+        shards:         number of pieces the capture is split into, SHARDS_PER_WORKER per worker if not given. Extra
+                        shards keep every worker busy when some shards decode slower than others
+        strict:         raise if the file ends with a partial record instead of ignoring it
+        mp_context:     the multiprocessing context the workers are started with, the platform default if not given.
+                        The layout is pickled to the workers, specialized layouts compile their codecs again there
+
+    Returns:
+        a FlitTable with the numpy backend, rows in capture order
+    """
+    if np is None:
+        raise ImportError("parallel_decode requires NumPy")
+    layout = getattr(layout, "layout", layout)
+    record_bytes = layout.byte_size if record_bytes is None else record_bytes
+    if offset < 0 or offset + layout.byte_size > record_bytes:
+        raise ValueError(f"A {layout.byte_size} byte layout at offset {offset} does not fit a {record_bytes} byte record")
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    if workers <= 0:
+        raise ValueError("workers must be positive")
+
+    count, partial = divmod(os.path.getsize(path), record_bytes)
+    if partial and strict:
+        raise ValueError(f"{path} does not hold a whole number of {record_bytes} byte records")
+    if count == 0:
+        return FlitTable(layout, {key: [] for key in layout.keys}, backend=NUMPY)
+
+    dtypes = [field_dtype(size) for size in layout.sizes]
+    blocks = {}
+    try:
+        for key, dtype in zip(layout.keys, dtypes):
+            blocks[key] = shared_memory.SharedMemory(create=True, size=max(count * dtype.itemsize, 1))
+        names = {key: block.name for key, block in blocks.items()}
+        ranges = shard_ranges(count, shards or workers * SHARDS_PER_WORKER)
+        with ProcessPoolExecutor(max_workers=min(workers, len(ranges)), mp_context=mp_context,
+                                 initializer=_start_worker, initargs=(layout,)) as pool:
+            futures = [pool.submit(_decode_shard, path, record_bytes, offset, start, stop, names)
+                       for start, stop in ranges]
+            decoded = sum(future.result() for future in futures)
+        if decoded != count:
+            raise ValueError(f"Decoded {decoded} of the {count} records in {path}")
+        # copied out so the shared memory can be released
+        columns = {key: np.ndarray((count,), dtype=dtype, buffer=blocks[key].buf).copy()
+                   for key, dtype in zip(layout.keys, dtypes)}
+    finally:
+        for block in blocks.values():
+            block.close()
+            block.unlink()
+    return FlitTable(layout, columns, backend=NUMPY)
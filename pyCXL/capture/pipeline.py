@@ -0,0 +1,261 @@
+"""
+Composable generator pipelines for decoding flit streams in constant memory.
+
+    pipeline = read_slots("link0.bin") | parse_flits(HOST_TO_DEVICE) | where("M2S Request.MemOpcode", 0) | \
+        project(["M2S Request.Address", "M2S Request.Tag"])
+    for row in pipeline:
+        ...
+
+Every stage is a generator over chunks of up to chunk_flits records rather than single flits, so the Python overhead of
+each stage is paid once per chunk. Only one chunk per stage is alive at a time, whatever the size of the stream.
+Flits are decoded with FlitParser, which dispatches on the slot format tables built from H2D_M2S_formats and
+D2H_S2M_formats.
+
+A pipeline is iterated once. Iterating it yields items, Pipeline.chunks() yields the chunks themselves. A pipeline
+without stages has no items, iterating it yields the source's chunks.
+"""
+# Python imports
+import os
+
+# Package imports
+from pyCXL.capture.capturereader import CaptureReader
+from pyCXL.structs.flitparser import FLIT_BYTES, HOST_TO_DEVICE, FlitParser, ParsedSlots
+
+DEFAULT_CHUNK_FLITS = 1024
+
+
+class DecodedFlit(ParsedSlots):
+    """
+    Brief:
+        One parsed protocol flit
+
+    Attributes:
+        index:  position of the flit in the stream
+        slots:  the 4 (SlotFormat, field values) pairs returned by FlitParser.parse
+    """
+    __slots__ = ("index", "slots")
+
+    def __init__(self, index: int, slots):
+        self.index = index
+        self.slots = slots
+
+    def __repr__(self):
+        return f"<DecodedFlit {self.index}: {' '.join(self.slot_formats)}>"
+
+    @property
+    def slot_formats(self) -> tuple[str, ...]:
+        return tuple(slot_format.name for slot_format, _ in self.slots)
+
+
+class Stage:
+    """
+    Brief:
+        One step of a pipeline, wrapping a function from an iterator of chunks to an iterator of chunks
+    """
+
+    def __init__(self, function, name: str):
+        self.__function = function
+        self.__name = name
+
+    def __repr__(self):
+        return f"<Stage {self.__name}>"
+
+    def __call__(self, chunks):
+        return self.__function(chunks)
+
+    @property
+    def name(self):
+        return self.__name
+
+    @name.setter
+    def name(self, new_value):
+        raise AttributeError("Cannot modify Stage's name")
+
+
+class Pipeline:
+    """
+    Brief:
+        A source of chunks followed by any number of stages. Combine with | to add stages.
+    """
+
+    def __init__(self, chunks, stages: tuple = ()):
+        self.__chunks = chunks
+        self.__stages = stages
+
+    def __repr__(self):
+        return f"<Pipeline {' | '.join(stage.name for stage in self.__stages) or 'source'}>"
+
+    def __or__(self, stage):
+        if not isinstance(stage, Stage):
+            return NotImplemented
+        return Pipeline(self.__chunks, self.__stages + (stage,))
+
+    def __iter__(self):
+        if not self.__stages:
+            # the source's chunks are raw bytes, not lists of items
+            yield from self.__chunks
+            return
+        for chunk in self.chunks():
+            yield from chunk
+
+    def chunks(self):
+        chunks = self.__chunks
+        for stage in self.__stages:
+            chunks = stage(chunks)
+        return chunks
+
+
+# ============================== Sources ==============================
+def _read_stream(stream, record_bytes: int, chunk_bytes: int, strict: bool):
+    pending = b""
+    while True:
+        data = stream.read(chunk_bytes - len(pending))
+        if not data:
+            break
+        pending += data
+        # live streams may return short reads, only whole records are passed on
+        whole = len(pending) - len(pending) % record_bytes
+        if whole:
+            yield pending[:whole]
+            pending = pending[whole:]
+    if pending and strict:
+        raise ValueError(f"Stream ended with a partial {record_bytes} byte record")
+
+
+def _read_path(path, record_bytes: int, chunk_bytes: int, strict: bool):
+    with open(path, "rb") as stream:
+        yield from _read_stream(stream, record_bytes, chunk_bytes, strict)
+
+
+def _read_capture(reader: CaptureReader, chunk_flits: int):
+    for start in range(0, len(reader), chunk_flits):
+        chunk = reader[start:start + chunk_flits]
+        yield chunk
+        chunk.release()
+
+
+def read_slots(source, record_bytes: int = FLIT_BYTES, chunk_flits: int = DEFAULT_CHUNK_FLITS,
+               strict: bool = True) -> Pipeline:
+    """
+    Brief:
+        Starts a pipeline from raw back to back records
+
+    Params:
+        source:         a path, a binary file like object (including pipes and sockets' makefile) or a CaptureReader
+        record_bytes:   bytes per record, 66 for flits (default) or 16 for bare slots. Ignored for CaptureReaders
+        chunk_flits:    records per chunk
+        strict:         raise if the stream ends with a partial record instead of dropping it
+
+    Returns:
+        a Pipeline of bytes-like chunks holding whole records
+    """
+    if chunk_flits <= 0:
+        raise ValueError("chunk_flits must be positive")
+    if isinstance(source, CaptureReader):
+        return Pipeline(_read_capture(source, chunk_flits))
+    chunk_bytes = record_bytes * chunk_flits
+    if isinstance(source, (str, bytes, os.PathLike)):
+        return Pipeline(_read_path(source, record_bytes, chunk_bytes, strict))
+    return Pipeline(_read_stream(source, record_bytes, chunk_bytes, strict))
+
+
+# ============================== Stages ==============================
+def parse_flits(direction: int = HOST_TO_DEVICE, skip_control: bool = True) -> Stage:
+    """
+    Brief:
+        Decodes chunks of raw 66 byte flits into lists of DecodedFlits
+
+    Params:
+        direction:      HOST_TO_DEVICE or DEVICE_TO_HOST, selects the slot format tables
+        skip_control:   drop control flits. When False they are kept as DecodedFlits with no slots
+    """
+    parser = FlitParser(direction)
+
+    def parse(chunks):
+        index = 0
+        parse_flit = parser.parse
+        for chunk in chunks:
+            decoded = []
+            for offset in range(0, len(chunk), FLIT_BYTES):
+                slots = parse_flit(chunk, offset)
+                if slots is not None:
+                    decoded.append(DecodedFlit(index, slots))
+                elif not skip_control:
+                    decoded.append(DecodedFlit(index, ()))
+                index += 1
+            yield decoded
+
+    return Stage(parse, "parse_flits")
+
+
+def filter(predicate) -> Stage:
+    """
+    Brief:
+        Keeps the items for which predicate(item) is true
+    """
+    def keep(chunks):
+        for chunk in chunks:
+            kept = [item for item in chunk if predicate(item)]
+            if kept:
+                yield kept
+
+    return Stage(keep, "filter")
+
+
+def where(key: str, *values) -> Stage:
+    """
+    Brief:
+        Keeps the DecodedFlits where any slot holds field key with one of values
+    """
+    wanted = set(values)
+
+    def keep(chunks):
+        for chunk in chunks:
+            kept = [flit for flit in chunk if not wanted.isdisjoint(flit.values(key))]
+            if kept:
+                yield kept
+
+    return Stage(keep, "where")
+
+
+def with_slot_format(*names) -> Stage:
+    """
+    Brief:
+        Keeps the DecodedFlits using any of the named slot formats, e.g. with_slot_format("H4", "G6")
+    """
+    wanted = set(names)
+
+    def keep(chunks):
+        for chunk in chunks:
+            kept = [flit for flit in chunk if not wanted.isdisjoint(flit.slot_formats)]
+            if kept:
+                yield kept
+
+    return Stage(keep, "with_slot_format")
+
+
+def project(fields) -> Stage:
+    """
+    Brief:
+        Turns DecodedFlits into dicts of the requested fields plus the flit's "index". Fields a flit does not carry are
+        None, fields carried by more than one slot take the first.
+    """
+    fields = tuple(fields)
+
+    def select(chunks):
+        for chunk in chunks:
+            yield [{"index": flit.index, **{field: flit.get(field) for field in fields}} for flit in chunk]
+
+    return Stage(select, "project")
+
+
+def chunk_map(function, name: str = None) -> Stage:
+    """
+    Brief:
+        Applies function to whole chunks, for stages working on chunks at once such as batch decoding
+    """
+    def apply(chunks):
+        for chunk in chunks:
+            yield function(chunk)
+
+    return Stage(apply, name or getattr(function, "__name__", "chunk_map"))
@@ -0,0 +1,468 @@
+"""
+The pyCXL binary trace format.
+
+Raw captures have no framing, timestamps or direction, so every analysis has to rescan them from the first byte. A
+pyCXL trace stores 66 byte protocol flits in blocks, each block summarized by a footer, and ends with an index of the
+blocks so readers can go straight to a time window or to the blocks holding a given slot format:
+
+    file header     magic, version, flit size, flits per block
+    block           block header (magic, flit count)
+                    one u64 timestamp per flit
+                    the flits, back to back
+                    block footer (magic, flit count, direction, min/max timestamp, control flit count,
+                                  histogram of H slot codes, histogram of G slot codes)
+    ...
+    index           u64 file offset of every block
+    trailer         index offset, block count, magic
+
+Every block holds flits of a single direction. All integers are little endian. A trace whose writer was not closed has
+no index and trailer, TraceReader rebuilds the index by walking the block headers.
+
+    with TraceWriter("link0.pcxl") as writer:
+        writer.write(flit, timestamp=ns, direction=HOST_TO_DEVICE)
+
+    with TraceReader("link0.pcxl") as reader:
+        for block in reader.blocks_with("H4", direction=HOST_TO_DEVICE):
+            timestamps, flits = reader.read_block(block)
+"""
+# Python imports
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+# Package imports
+from pyCXL.structs.flitparser import (
+    DIRECTIONS,
+    FLIT_BITS,
+    FLIT_BYTES,
+    SLOT_BITS,
+    SLOT_SHIFTS,
+    SLOTS_PER_FLIT,
+    TYPE_SHIFT
+)
+from pyCXL.structs.flittable import FlitTable
+
+TRACE_MAGIC = b"PYCXLTRC"
+TRACE_VERSION = 1
+DEFAULT_FLITS_PER_BLOCK = 4096
+
+FILE_HEADER = struct.Struct("<8sHHI16x")
+BLOCK_HEADER = struct.Struct("<4sI")
+BLOCK_FOOTER = struct.Struct("<4sIB3xQQI8I8I")
+TRAILER = struct.Struct("<QI4s")
+TIMESTAMP = struct.Struct("<Q")
+OFFSET = struct.Struct("<Q")
+
+BLOCK_MAGIC = b"PCXB"
+FOOTER_MAGIC = b"PCXF"
+INDEX_MAGIC = b"PCXI"
+
+SLOT_CODES = 8
+
+# the FlitHeader sits in the first 4 bytes of a flit, so its fields are read from those bytes alone
+_HEADER_BYTES = 4
+_HEADER_BASE = FLIT_BITS - _HEADER_BYTES * 8
+_TYPE_SHIFT = TYPE_SHIFT - _HEADER_BASE
+_SLOT_SHIFTS = tuple(shift - _HEADER_BASE for shift in SLOT_SHIFTS)
+
+
+def slot_codes(flit) -> tuple[int, ...]:
+    """
+    Brief:
+        The 4 slot format codes of a protocol flit's FlitHeader, or None for control flits
+    """
+    header = int.from_bytes(flit[:_HEADER_BYTES], 'big')
+    if (header >> _TYPE_SHIFT) & 1:
+        return None
+    return tuple([(header >> shift) & 0x7 for shift in _SLOT_SHIFTS])
+
+
+class BlockInfo:
+    """
+    Brief:
+        The summary of one block, read from its footer
+
+    Attributes:
+        index:          position of the block in the trace
+        offset:         file offset of the block header
+        count:          number of flits
+        direction:      HOST_TO_DEVICE or DEVICE_TO_HOST
+        min_timestamp:  smallest flit timestamp
+        max_timestamp:  largest flit timestamp
+        control:        number of control flits
+        h_codes:        number of flits using each H slot format code in slot 0
+        g_codes:        number of generic slots using each G slot format code in slots 1 to 3
+    """
+    __slots__ = ("index", "offset", "count", "direction", "min_timestamp", "max_timestamp", "control", "h_codes",
+                 "g_codes")
+
+    def __init__(self, index: int, offset: int, count: int, direction: int, min_timestamp: int, max_timestamp: int,
+                 control: int, h_codes, g_codes):
+        self.index = index
+        self.offset = offset
+        self.count = count
+        self.direction = direction
+        self.min_timestamp = min_timestamp
+        self.max_timestamp = max_timestamp
+        self.control = control
+        self.h_codes = tuple(h_codes)
+        self.g_codes = tuple(g_codes)
+
+    def __repr__(self):
+        return (f"<BlockInfo {self.index} {DIRECTIONS[self.direction]}: {self.count} flits, "
+                f"{self.min_timestamp}-{self.max_timestamp}>")
+
+    @property
+    def timestamps_offset(self) -> int:
+        return self.offset + BLOCK_HEADER.size
+
+    @property
+    def flits_offset(self) -> int:
+        return self.timestamps_offset + self.count * TIMESTAMP.size
+
+    @property
+    def footer_offset(self) -> int:
+        return self.flits_offset + self.count * FLIT_BYTES
+
+    @property
+    def end(self) -> int:
+        return self.footer_offset + BLOCK_FOOTER.size
+
+    def overlaps(self, start: int = None, stop: int = None) -> bool:
+        """
+        Brief:
+            Whether any flit of the block may fall in the time window start <= timestamp < stop
+        """
+        if start is not None and self.max_timestamp < start:
+            return False
+        if stop is not None and self.min_timestamp >= stop:
+            return False
+        return True
+
+    def uses(self, slot_format: str) -> bool:
+        """
+        Brief:
+            Whether any flit of the block uses a slot format, given by name such as "H4" or "G2"
+        """
+        kind, code = _parse_slot_format(slot_format)
+        return (self.h_codes if kind == "H" else self.g_codes)[code] > 0
+
+
+def _parse_slot_format(slot_format) -> tuple[str, int]:
+    name = getattr(slot_format, "name", slot_format)
+    if len(name) != 2 or name[0] not in "HG" or not name[1].isdigit() or int(name[1]) >= SLOT_CODES:
+        raise ValueError(f"Unknown slot format: {name}")
+    return name[0], int(name[1])
+
+
+class TraceWriter:
+    """
+    Brief:
+        Writes flits into a pyCXL trace
+
+    Params:
+        path:               the trace file, overwritten if it exists
+        flits_per_block:    flits per block. Blocks are also cut short whenever the direction changes
+    """
+
+    def __init__(self, path, flits_per_block: int = DEFAULT_FLITS_PER_BLOCK):
+        if flits_per_block <= 0:
+            raise ValueError("flits_per_block must be positive")
+        self.__flits_per_block = flits_per_block
+        self.__file = open(path, "wb")
+        self.__file.write(FILE_HEADER.pack(TRACE_MAGIC, TRACE_VERSION, FLIT_BYTES, flits_per_block))
+        self.__offsets = []
+        self.__timestamps = array("Q")
+        self.__flits = bytearray()
+        self.__direction = None
+        self.__control = 0
+        self.__h_codes = [0] * SLOT_CODES
+        self.__g_codes = [0] * SLOT_CODES
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def blocks(self):
+        """
+        Brief:
+            Number of blocks written so far
+        """
+        return len(self.__offsets)
+
+    @blocks.setter
+    def blocks(self, new_value):
+        raise AttributeError("Cannot modify TraceWriter's blocks")
+
+    @property
+    def closed(self):
+        return self.__file.closed
+
+    def write(self, flit, timestamp: int, direction: int):
+        """
+        Brief:
+            Appends one 66 byte flit
+        """
+        if len(flit) != FLIT_BYTES:
+            raise ValueError(f"Flits must be {FLIT_BYTES} bytes, got {len(flit)}")
+        if direction not in DIRECTIONS:
+            raise ValueError(f"Unknown flit direction: {direction}")
+        if self.__timestamps and (direction != self.__direction or len(self.__timestamps) >= self.__flits_per_block):
+            self.flush()
+        self.__direction = direction
+        self.__timestamps.append(timestamp)
+        self.__flits += flit
+        codes = slot_codes(flit)
+        if codes is None:
+            self.__control += 1
+            return
+        self.__h_codes[codes[0]] += 1
+        for code in codes[1:]:
+            self.__g_codes[code] += 1
+
+    def write_many(self, flits, timestamps, direction: int):
+        """
+        Brief:
+            Appends back to back flits, one timestamp per flit
+        """
+        view = memoryview(flits)
+        if len(view) != len(timestamps) * FLIT_BYTES:
+            raise ValueError("write_many needs exactly one timestamp per flit")
+        for idx, timestamp in enumerate(timestamps):
+            self.write(view[idx * FLIT_BYTES:(idx + 1) * FLIT_BYTES], timestamp, direction)
+
+    def flush(self):
+        """
+        Brief:
+            Writes out the pending block, if any. Readers of a trace that is still being written see every flushed block
+        """
+        count = len(self.__timestamps)
+        if not count:
+            return
+        self.__offsets.append(self.__file.tell())
+        if self.__timestamps.itemsize != TIMESTAMP.size or sys.byteorder != "little":
+            timestamps = b"".join(TIMESTAMP.pack(timestamp) for timestamp in self.__timestamps)
+        else:
+            timestamps = self.__timestamps.tobytes()
+        self.__file.write(BLOCK_HEADER.pack(BLOCK_MAGIC, count))
+        self.__file.write(timestamps)
+        self.__file.write(self.__flits)
+        self.__file.write(BLOCK_FOOTER.pack(
+            FOOTER_MAGIC, count, self.__direction, min(self.__timestamps), max(self.__timestamps), self.__control,
+            *self.__h_codes, *self.__g_codes
+        ))
+        self.__file.flush()
+        self.__timestamps = array("Q")
+        self.__flits = bytearray()
+        self.__control = 0
+        self.__h_codes = [0] * SLOT_CODES
+        self.__g_codes = [0] * SLOT_CODES
+
+    def close(self):
+        """
+        Brief:
+            Writes the last block, the block index and the trailer
+        """
+        if self.__file.closed:
+            return
+        self.flush()
+        index_offset = self.__file.tell()
+        self.__file.write(b"".join(OFFSET.pack(offset) for offset in self.__offsets))
+        self.__file.write(TRAILER.pack(index_offset, len(self.__offsets), INDEX_MAGIC))
+        self.__file.close()
+
+
+class TraceReader:
+    """
+    Brief:
+        Reads a pyCXL trace through a memory mapping, using the block index to skip blocks
+    """
+
+    def __init__(self, path):
+        self.__file = open(path, "rb")
+        size = os.fstat(self.__file.fileno()).st_size
+        if size < FILE_HEADER.size:
+            self.__file.close()
+            raise ValueError("Not a pyCXL trace")
+        self.__mmap = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.__buffer = memoryview(self.__mmap)
+        magic, version, flit_bytes, flits_per_block = FILE_HEADER.unpack_from(self.__buffer, 0)
+        if magic != TRACE_MAGIC:
+            self.close()
+            raise ValueError("Not a pyCXL trace")
+        if version != TRACE_VERSION or flit_bytes != FLIT_BYTES:
+            self.close()
+            raise ValueError(f"Unsupported pyCXL trace version {version}")
+        self.__flits_per_block = flits_per_block
+        self.__indexed = True
+        try:
+            self.__blocks = self.__read_index(size)
+            if self.__blocks is None:
+                self.__indexed = False
+                self.__blocks = self.__scan(size)
+        except ValueError:
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self):
+        return sum(block.count for block in self.__blocks)
+
+    @property
+    def blocks(self) -> tuple[BlockInfo, ...]:
+        return self.__blocks
+
+    @blocks.setter
+    def blocks(self, new_value):
+        raise AttributeError("Cannot modify TraceReader's blocks")
+
+    @property
+    def flits_per_block(self):
+        return self.__flits_per_block
+
+    @flits_per_block.setter
+    def flits_per_block(self, new_value):
+        raise AttributeError("Cannot modify TraceReader's flits_per_block")
+
+    @property
+    def indexed(self):
+        """
+        Brief:
+            False when the trace had no index and the blocks were found by scanning
+        """
+        return self.__indexed
+
+    @indexed.setter
+    def indexed(self, new_value):
+        raise AttributeError("Cannot modify TraceReader's indexed")
+
+    def __block_at(self, index: int, offset: int) -> BlockInfo:
+        magic, count = BLOCK_HEADER.unpack_from(self.__buffer, offset)
+        if magic != BLOCK_MAGIC:
+            raise ValueError(f"Corrupt pyCXL trace, no block at offset {offset}")
+        footer = offset + BLOCK_HEADER.size + count * (TIMESTAMP.size + FLIT_BYTES)
+        fields = BLOCK_FOOTER.unpack_from(self.__buffer, footer)
+        if fields[0] != FOOTER_MAGIC or fields[1] != count:
+            raise ValueError(f"Corrupt pyCXL trace, bad footer for the block at offset {offset}")
+        _, count, direction, min_timestamp, max_timestamp, control = fields[:6]
+        return BlockInfo(index, offset, count, direction, min_timestamp, max_timestamp, control,
+                         fields[6:6 + SLOT_CODES], fields[6 + SLOT_CODES:])
+
+    def __read_index(self, size: int):
+        if size < FILE_HEADER.size + TRAILER.size:
+            return None
+        index_offset, count, magic = TRAILER.unpack_from(self.__buffer, size - TRAILER.size)
+        if magic != INDEX_MAGIC or index_offset + count * OFFSET.size != size - TRAILER.size:
+            return None
+        offsets = struct.unpack_from(f"<{count}Q", self.__buffer, index_offset)
+        return tuple(self.__block_at(idx, offset) for idx, offset in enumerate(offsets))
+
+    def __scan(self, size: int):
+        blocks = []
+        offset = FILE_HEADER.size
+        while offset + BLOCK_HEADER.size <= size and bytes(self.__buffer[offset:offset + 4]) == BLOCK_MAGIC:
+            _, count = BLOCK_HEADER.unpack_from(self.__buffer, offset)
+            if offset + BLOCK_HEADER.size + count * (TIMESTAMP.size + FLIT_BYTES) + BLOCK_FOOTER.size > size:
+                # a block cut short by a writer that never finished
+                break
+            block = self.__block_at(len(blocks), offset)
+            blocks.append(block)
+            offset = block.end
+        return tuple(blocks)
+
+    def blocks_in(self, start: int = None, stop: int = None, direction: int = None) -> list[BlockInfo]:
+        """
+        Brief:
+            The blocks which may hold flits with start <= timestamp < stop
+        """
+        return [
+            block for block in self.__blocks
+            if block.overlaps(start, stop) and (direction is None or block.direction == direction)
+        ]
+
+    def blocks_with(self, slot_format, direction: int = None) -> list[BlockInfo]:
+        """
+        Brief:
+            The blocks holding at least one flit using a slot format
+
+        Params:
+            slot_format:    a slot format name such as "H4" or "G0", or a flitparser.SlotFormat. A SlotFormat also
+                            restricts the direction
+            direction:      only blocks of this direction
+        """
+        if direction is None:
+            direction = getattr(slot_format, "direction", None)
+        kind, code = _parse_slot_format(slot_format)
+        return [
+            block for block in self.__blocks
+            if (block.h_codes if kind == "H" else block.g_codes)[code] and
+            (direction is None or block.direction == direction)
+        ]
+
+    def read_block(self, block) -> tuple[array, memoryview]:
+        """
+        Brief:
+            The timestamps and flits of a block
+
+        Params:
+            block: a BlockInfo or block index
+
+        Returns:
+            (array of timestamps, memoryview of the back to back flits)
+        """
+        if not isinstance(block, BlockInfo):
+            block = self.__blocks[block]
+        timestamps = array("Q")
+        if timestamps.itemsize == TIMESTAMP.size and sys.byteorder == "little":
+            timestamps.frombytes(self.__buffer[block.timestamps_offset:block.flits_offset])
+        else:
+            timestamps.extend(struct.unpack_from(f"<{block.count}Q", self.__buffer, block.timestamps_offset))
+        return timestamps, self.__buffer[block.flits_offset:block.footer_offset]
+
+    def block_table(self, block, layout, position: int = 0, backend: str = None) -> FlitTable:
+        """
+        Brief:
+            Batch decodes one slot position of every flit in a block
+
+        Params:
+            block:      a BlockInfo or block index
+            layout:     layout of the slot, e.g. a SlotFormat's layout
+            position:   slot position 0 - 3
+        """
+        if not 0 <= position < SLOTS_PER_FLIT:
+            raise ValueError(f"Invalid slot position: {position}")
+        _, flits = self.read_block(block)
+        return FlitTable.from_bytes(flits, layout, stride=FLIT_BYTES, offset=position * SLOT_BITS // 8,
+                                    backend=backend)
+
+    def flits(self, start: int = None, stop: int = None, direction: int = None):
+        """
+        Brief:
+            Iterates over the flits with start <= timestamp < stop, reading only the blocks which may hold them
+
+        Yields:
+            (timestamp, direction, memoryview of the flit). Like read_block the memoryviews are views of the mapping
+            and must be released before the reader is closed
+        """
+        for block in self.blocks_in(start, stop, direction):
+            timestamps, flits = self.read_block(block)
+            for idx, timestamp in enumerate(timestamps):
+                if (start is None or timestamp >= start) and (stop is None or timestamp < stop):
+                    yield timestamp, block.direction, flits[idx * FLIT_BYTES:(idx + 1) * FLIT_BYTES]
+
+    def close(self):
+        if self.__file.closed:
+            return
+        self.__buffer.release()
+        self.__mmap.close()
+        self.__file.close()
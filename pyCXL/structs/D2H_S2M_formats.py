@@ -1,112 +1,157 @@
+"""
+Device to Host (D2H) CXL.cache and Subordinate to Master (S2M) CXL.mem slot formats.
+
+Each slot format is the ordered list of substructs filling one 16 byte slot. Entries are callables returning a new
+BitStruct so a slot format can be turned into a FlitStruct with:
+
+    FlitStruct(bitstructs=[struct() for struct in H0_slot_format], name="H0")
+"""
+# Python imports
+from functools import partial
+
 # Package Imports
 from pyCXL.structs.flitsubstructures import (
-    flit_header_fields,
-    D2H_request_fields,
-    D2H_response_fields,
-    D2H_data_header_fields,
-    S2M_NDR_fields,
-    S2M_DRS_fields,
-    S2M_NDR_fields_minus_devload,
-    S2M_NDR_devload_array_fields,
-
-    # Constants
-    FLIT_HEAD,
-    D2H_REQ,
-    D2H_RESP,
-    D2H_HEAD,
-    S2M_NDR,
-    S2M_DRS,
-    DEVLOAD
+    FlitHeader,
+    D2HRequest,
+    D2HResponse,
+    D2HHeader,
+    S2MNDR,
+    S2MDRS,
+    S2MNDR_MinusDevload,
+    S2MNDR_Devload,
+    RsvdStruct,
+    Data,
+    ByteEnable,
+    MAC
 )
 
 H0_slot_format = [
-    [FLIT_HEAD,     [flit_header_fields()]],
-    [D2H_HEAD,      [D2H_data_header_fields()]],
-    [D2H_RESP,      [D2H_response_fields()] * 2],
-    [S2M_NDR,       [S2M_NDR_fields()]],
-    ["RSVD",        [[("RSVD",      9)]]]
+    FlitHeader,
+    D2HHeader,
+    D2HResponse,
+    D2HResponse,
+    S2MNDR,
+    partial(RsvdStruct, size=9)
 ]
 
 
 H1_slot_format = [
-    [FLIT_HEAD,     [flit_header_fields()]],
-    [D2H_REQ,       [D2H_request_fields()]],
-    [D2H_HEAD,      [D2H_data_header_fields()]],
+    FlitHeader,
+    D2HRequest,
+    D2HHeader
 ]
 
 H2_slot_format = [
-    [FLIT_HEAD,     [flit_header_fields()]],
-    [D2H_HEAD,      [D2H_data_header_fields()] * 4],
-    [D2H_RESP,      [D2H_response_fields()]],
-    ["RSVD",        [[("RSVD",         8)]]]
+    FlitHeader,
+    D2HHeader,
+    D2HHeader,
+    D2HHeader,
+    D2HHeader,
+    D2HResponse,
+    partial(RsvdStruct, size=8)
 ]
 
 H3_slot_format = [
-    [FLIT_HEAD,     [flit_header_fields()]],
-    [S2M_DRS,       [S2M_DRS_fields()]],
-    [S2M_NDR,       [S2M_NDR_fields()]],
-    ["RSVD",        [[("RSVD",      26)]]]
+    FlitHeader,
+    S2MDRS,
+    S2MNDR,
+    partial(RsvdStruct, size=26)
 ]
 
 H4_slot_format = [
-    [FLIT_HEAD,     [flit_header_fields()]],
-    [S2M_NDR,       [S2M_NDR_fields_minus_devload()] * 2],
-    [DEVLOAD,       [S2M_NDR_devload_array_fields()] * 2],
-    ["RSVD",        [[("RSVD",          36)]]]
+    FlitHeader,
+    S2MNDR_MinusDevload,
+    S2MNDR_MinusDevload,
+    S2MNDR_Devload,
+    S2MNDR_Devload,
+    partial(RsvdStruct, size=36)
 ]
 
 H5_slot_format = [
-    [FLIT_HEAD,     [flit_header_fields()]],
-    [S2M_DRS,       [S2M_DRS_fields()] * 2],
-    ["RSVD",        [[("RSVD",        16)]]]
+    FlitHeader,
+    S2MDRS,
+    S2MDRS,
+    partial(RsvdStruct, size=16)
 ]
 
 H6_slot_format = [
-    [FLIT_HEAD,     [flit_header_fields()]],
-    ["MAC",         [[("MAC",          96)]]]
+    FlitHeader,
+    MAC
 ]
 
 G0_Data_slot_format = [
-    ["DATA",        [[("DATA",        128)]]]
+    Data
 ]
 
 G0_Byte_Enable_slot_format = [
-    ["ByteEnable",  [[("ByteEnable",    64)]]],
-    ["RSVD",        [[("RSVD",          64)]]],
+    ByteEnable
 ]
 
 G1_slot_format = [
-    [D2H_REQ,       [D2H_request_fields()]],
-    [D2H_RESP,      [D2H_response_fields()] * 2],
-    ["RSVD",        [[("RSVD",          9)]]],
+    D2HRequest,
+    D2HResponse,
+    D2HResponse,
+    partial(RsvdStruct, size=9)
 ]
 
 G2_slot_format = [
-    [D2H_REQ,       [D2H_request_fields()]],
-    [D2H_HEAD,      [D2H_data_header_fields()]],
-    [D2H_RESP,      [D2H_response_fields()]],
-    ["RSVD",        [[("RSVD",          12)]]],
+    D2HRequest,
+    D2HHeader,
+    D2HResponse,
+    partial(RsvdStruct, size=12)
 ]
 
 G3_slot_format = [
-    [D2H_HEAD,      [D2H_data_header_fields()] * 4],
-    ["RSVD",        [[("RSVD",          60)]]],
+    D2HHeader,
+    D2HHeader,
+    D2HHeader,
+    D2HHeader,
+    partial(RsvdStruct, size=60)
 ]
 
 G4_slot_format = [
-    [S2M_DRS,       [S2M_DRS_fields()]],
-    [S2M_NDR,       [S2M_NDR_fields_minus_devload()] * 2],
-    [DEVLOAD,       [S2M_NDR_devload_array_fields()] * 2],
-    ["RSVD",        [[("RSVD",          28)]]],
+    S2MDRS,
+    S2MNDR_MinusDevload,
+    S2MNDR_MinusDevload,
+    S2MNDR_Devload,
+    S2MNDR_Devload,
+    partial(RsvdStruct, size=28)
 ]
 
 G5_slot_format = [
-    [S2M_NDR,       [S2M_NDR_fields_minus_devload()] * 2],
-    [DEVLOAD,       [S2M_NDR_devload_array_fields()] * 2],
-    ["RSVD",        [[("RSVD",          68)]]],
+    S2MNDR_MinusDevload,
+    S2MNDR_MinusDevload,
+    S2MNDR_Devload,
+    S2MNDR_Devload,
+    partial(RsvdStruct, size=68)
 ]
 
 G6_slot_format = [
-    [S2M_DRS,       [S2M_DRS_fields()] * 3],
-    ["RSVD",        [[("RSVD",          8)]]],
+    S2MDRS,
+    S2MDRS,
+    S2MDRS,
+    partial(RsvdStruct, size=8)
+]
+
+# indexed by the 3 bit Slot fields of the FlitHeader, None marks a reserved encoding
+H_slot_formats = [
+    H0_slot_format,
+    H1_slot_format,
+    H2_slot_format,
+    H3_slot_format,
+    H4_slot_format,
+    H5_slot_format,
+    H6_slot_format,
+    None
+]
+
+G_slot_formats = [
+    G0_Data_slot_format,
+    G1_slot_format,
+    G2_slot_format,
+    G3_slot_format,
+    G4_slot_format,
+    G5_slot_format,
+    G6_slot_format,
+    None
 ]
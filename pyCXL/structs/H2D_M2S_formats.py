@@ -1,104 +1,143 @@
+"""
+Host to Device (H2D) CXL.cache and Master to Subordinate (M2S) CXL.mem slot formats.
+
+Each slot format is the ordered list of substructs filling one 16 byte slot. Entries are callables returning a new
+BitStruct so a slot format can be turned into a FlitStruct with:
+
+    FlitStruct(bitstructs=[struct() for struct in H0_slot_format], name="H0")
+"""
+# Python imports
+from functools import partial
+
 # Package Imports
 from pyCXL.structs.flitsubstructures import (
-    flit_header_fields,
-    H2D_request_fields,
-    H2D_response_fields,
-    H2D_data_header_fields,
-    M2S_RwD_header_fields,
-    M2S_request_fields,
-
-    # Constants
-    FLIT_HEAD,
-    H2D_REQ,
-    H2D_RESP,
-    H2D_HEAD,
-    M2S_RWD_HEAD,
-    M2S_RWD_REQ,
+    FlitHeader,
+    H2DRequest,
+    H2DResponse,
+    H2DDataHeader,
+    M2SHeader,
+    M2SRequest,
+    RsvdStruct,
+    Data,
+    ByteEnable,
+    MAC
 )
 
 
 H0_slot_format = [
-    [FLIT_HEAD, [flit_header_fields()]],
-    [H2D_REQ,   [H2D_request_fields()]],
-    [H2D_RESP,  [H2D_response_fields()]]
+    FlitHeader,
+    H2DRequest,
+    H2DResponse
 ]
 
 
 H1_slot_format = [
-    [FLIT_HEAD, [flit_header_fields()]],
-    [H2D_HEAD,  [H2D_data_header_fields()]],
-    [H2D_RESP,  [H2D_response_fields()] * 2],
-    ["RSVD",    [[("RSVD",          8)]]],
+    FlitHeader,
+    H2DDataHeader,
+    H2DResponse,
+    H2DResponse,
+    partial(RsvdStruct, size=8)
 ]
 
 
 H2_slot_format = [
-    [FLIT_HEAD, [flit_header_fields()]],
-    [H2D_REQ,   [H2D_request_fields()]],
-    [H2D_HEAD,  [H2D_data_header_fields()]],
-    ["RSVD",    [[("RSVD",          8)]]],
+    FlitHeader,
+    H2DRequest,
+    H2DDataHeader,
+    partial(RsvdStruct, size=8)
 ]
 
 
 H3_slot_format = [
-    [FLIT_HEAD, [flit_header_fields()]],
-    [H2D_HEAD,  [H2D_data_header_fields()] * 4],
+    FlitHeader,
+    H2DDataHeader,
+    H2DDataHeader,
+    H2DDataHeader,
+    H2DDataHeader
 ]
 
 
 H4_slot_format = [
-    [FLIT_HEAD,     [flit_header_fields()]],
-    [M2S_RWD_HEAD,  [M2S_RwD_header_fields()]],
-    ["RSVD",    [[("RSVD",          9)]]],
+    FlitHeader,
+    M2SHeader,
+    partial(RsvdStruct, size=9)
 ]
 
 
 H5_slot_format = [
-    [FLIT_HEAD,     [flit_header_fields()]],
-    [M2S_RWD_REQ,   [M2S_request_fields()]],
-    ["RSVD",    [[("RSVD",          9)]]],
+    FlitHeader,
+    M2SRequest,
+    partial(RsvdStruct, size=9)
 ]
 
 H6_slot_format = [
-    [FLIT_HEAD,     [flit_header_fields()]],
-    ["MAC",         [[("MAC",          96)]]]
+    FlitHeader,
+    MAC
 ]
 
 G0_Data_slot_format = [
-    ["DATA",        [[("DATA",        128)]]]
+    Data
 ]
 
 G0_Byte_Enable_slot_format = [
-    ["ByteEnable",  [[("ByteEnable",    64)]]],
-    ["RSVD",        [[("RSVD",          64)]]],
+    ByteEnable
 ]
 
 G1_slot_format = [
-    [H2D_RESP,      [(H2D_response_fields())] * 4]
+    H2DResponse,
+    H2DResponse,
+    H2DResponse,
+    H2DResponse
 ]
 
 G2_slot_format = [
-    [H2D_REQ,       [H2D_request_fields()]],
-    [H2D_HEAD,      [H2D_data_header_fields()]],
-    [H2D_RESP,      [H2D_response_fields()]],
-    ["RSVD",        [[("RSVD",          8)]]],
+    H2DRequest,
+    H2DDataHeader,
+    H2DResponse,
+    partial(RsvdStruct, size=8)
 ]
 
 G3_slot_format = [
-    [H2D_HEAD,      [H2D_data_header_fields()] * 4],
-    [H2D_RESP,      [H2D_response_fields()]],
+    H2DDataHeader,
+    H2DDataHeader,
+    H2DDataHeader,
+    H2DDataHeader,
+    H2DResponse
 ]
 
 G4_slot_format = [
-    [M2S_RWD_REQ,   [M2S_request_fields()]],
-    ["RSVD",        [[("RSVD",          1)]]],
-    [H2D_HEAD,      [H2D_data_header_fields()]],
-    ["RSVD",        [[("RSVD",          16)]]],
+    M2SRequest,
+    partial(RsvdStruct, size=1),
+    H2DDataHeader,
+    partial(RsvdStruct, size=16)
 ]
 
 G5_slot_format = [
-    [M2S_RWD_HEAD,  [M2S_RwD_header_fields()]],
-    ["RSVD",        [[("RSVD",          1)]]],
-    [H2D_RESP,      [H2D_response_fields()]],
-    ["RSVD",        [[("RSVD",          8)]]],
+    M2SHeader,
+    partial(RsvdStruct, size=1),
+    H2DResponse,
+    partial(RsvdStruct, size=8)
+]
+
+# indexed by the 3 bit Slot fields of the FlitHeader, None marks a reserved encoding
+H_slot_formats = [
+    H0_slot_format,
+    H1_slot_format,
+    H2_slot_format,
+    H3_slot_format,
+    H4_slot_format,
+    H5_slot_format,
+    H6_slot_format,
+    None
+]
+
+G_slot_formats = [
+    G0_Data_slot_format,
+    G1_slot_format,
+    G2_slot_format,
+    G3_slot_format,
+    G4_slot_format,
+    G5_slot_format,
+    None,
+    None
 ]
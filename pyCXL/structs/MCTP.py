@@ -1,170 +1,428 @@
+"""
+MCTP over PCIe VDM (DMTF DSP0238), the transport of the CXL FM API and CXL CCI messages carried by CXL.io.
+
+An MCTP packet is a Type 1 vendor defined message TLP: a 16 byte header, the last 4 bytes of which are the MCTP
+transport header, followed by Length DWords of payload of which the last Pad Length bytes are padding. The first
+payload byte of the first packet of a message (Start Of Message set) is the MCTP message header.
+
+    header = PCIeVDMHeader()
+    header.from_bytes(tlp[:12])
+    packet = decode_packet(tlp)         # MCTPPacket, payload a memoryview into tlp
+
+The structs are BigEndianBitStructs, whose fields are listed from the least significant bit of each byte upwards. The
+PCIe header's multi byte fields (Length, Requester ID, Target ID, Vendor ID) are sent most significant byte first, so
+they are split into one field per byte and put back together by decode_packet. The fields of a CXL CCI message header
+are little endian and are read whole.
+"""
 # Package Imports
-from bitfields import BitField
+from pyCXL.structs.bitfields import BitField
+from pyCXL.structs.bitstructs import BigEndianBitStruct
+
+PCIE_VDM_HEADER = "PCIe VDM Header"
+MCTP_TRANSPORT_HEADER = "MCTP Transport Header"
+MCTP_MESSAGE_HEADER = "MCTP Message Header"
+CCI_MESSAGE_HEADER = "CXL CCI Message Header"
+
+PCIE_HEADER_BYTES = 12
+TRANSPORT_HEADER_BYTES = 4
+PACKET_HEADER_BYTES = PCIE_HEADER_BYTES + TRANSPORT_HEADER_BYTES
+CCI_HEADER_BYTES = 12
+DWORD_BYTES = 4
+# a TLP Length of 0 means 1024 DWords
+MAX_LENGTH_DWORDS = 1024
+
+FORMAT_4DW_WITH_DATA = 0b011
+MESSAGE_CODE_VDM_TYPE_1 = 0x7F
+MCTP_VDM_CODE = 0x0
+DMTF_VENDOR_ID = 0x1AB4
+MCTP_HEADER_VERSION = 0x1
+
+# the message routing of a message TLP is in the low 3 bits of Type, the upper 2 bits are 0b10
+MESSAGE_ROUTING = {
+    0: "Route to Root Complex",
+    2: "Route by ID",
+    3: "Broadcast from Root Complex"
+}
+TYPE_ENUMS = {0b10000 | routing: name for routing, name in MESSAGE_ROUTING.items()}
+
+FORMAT_ENUMS = {
+    0b001: "4 DW header, no data",
+    0b011: "4 DW header, with data"
+}
+
+# MCTP message types, DSP0239
+MCTP_CONTROL = 0x00
+PLDM = 0x01
+NC_SI = 0x02
+ETHERNET = 0x03
+NVME_MI = 0x04
+SPDM = 0x05
+SECURED_MESSAGE = 0x06
+CXL_FM_API = 0x07
+CXL_CCI = 0x08
+VENDOR_DEFINED_PCI = 0x7E
+VENDOR_DEFINED_IANA = 0x7F
+MESSAGE_TYPE_ENUMS = {
+    MCTP_CONTROL: "MCTP Control",
+    PLDM: "PLDM",
+    NC_SI: "NC-SI",
+    ETHERNET: "Ethernet",
+    NVME_MI: "NVMe-MI",
+    SPDM: "SPDM",
+    SECURED_MESSAGE: "Secured Messages",
+    CXL_FM_API: "CXL FM API",
+    CXL_CCI: "CXL CCI",
+    VENDOR_DEFINED_PCI: "Vendor Defined - PCI",
+    VENDOR_DEFINED_IANA: "Vendor Defined - IANA",
+}
+
+INTEGRITY_CHECK_ENUMS = {
+    0: "No MCTP message integrity check",
+    1: "MCTP integrity check is present"
+}
+
+CCI_CATEGORY_ENUMS = {
+    0: "Request",
+    1: "Response"
+}
 
 
 # ======================= BitFields =======================
 class Type(BitField):
+    __slots__ = ()
 
     def __init__(self):
-        super().__init__(size=5, name="Type")
+        super().__init__(size=5, name="Type", enums=TYPE_ENUMS)
 
 
 class Format(BitField):
+    __slots__ = ()
 
     def __init__(self):
-        super().__init__(size=3, name="Format")
+        super().__init__(size=3, name="Format", enums=FORMAT_ENUMS)
 
 
-# TODO what does TH stand for?
+# TLP Processing Hints present
 class TH(BitField):
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(size=1, name="TH")
 
 
-# TODO make this more identifying
+# Attr[2], ID based ordering. Attr[1:0] are the Relaxed Ordering and No Snoop fields
 class Attr(BitField):
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(size=1, name="Attr")
 
 
-# TODO what does T8 stand for?
+# bit 8 of a 10 bit Tag
 class T8(BitField):
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(size=1, name="T8")
 
 
 class TrafficClass(BitField):
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(size=3, name="Traffic Class")
 
 
-# TODO what does T9 stand for?
+# bit 9 of a 10 bit Tag
 class T9(BitField):
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(size=1, name="T9")
 
 
+class Rsvd(BitField):
+    __slots__ = ()
 
+    def __init__(self, size: int):
+        super().__init__(size=size, name="Rsvd", rsvd=True)
 
 
+# ======================= BitStructs =======================
+class PCIeVDMHeader(BigEndianBitStruct):
+    """
+    The first 3 DWords of the TLP, DW0 - DW2
+    """
 
+    def __init__(self):
+        super().__init__(
+            bitfields=[
+                # Byte 0
+                Type(),
+                Format(),
+                # Byte 1
+                TH(),
+                Rsvd(size=1),
+                Attr(),
+                T8(),
+                TrafficClass(),
+                T9(),
+                # Byte 2
+                BitField(size=2,    name="Length High"),
+                BitField(size=2,    name="Address Type"),
+                BitField(size=1,    name="No Snoop"),
+                BitField(size=1,    name="Relaxed Ordering"),
+                BitField(size=1,    name="Error Poisoned"),
+                BitField(size=1,    name="TLP Digest"),
+                # Byte 3
+                BitField(size=8,    name="Length Low"),
+                # Byte 4 - 5
+                BitField(size=8,    name="Requester Bus"),
+                BitField(size=3,    name="Requester Function"),
+                BitField(size=5,    name="Requester Device"),
+                # Byte 6, the PCIe Tag field
+                BitField(size=4,    name="MCTP VDM Code"),
+                BitField(size=2,    name="Pad Length"),
+                Rsvd(size=2),
+                # Byte 7
+                BitField(size=8,    name="Message Code"),
+                # Byte 8 - 9
+                BitField(size=8,    name="Target Bus"),
+                BitField(size=3,    name="Target Function"),
+                BitField(size=5,    name="Target Device"),
+                # Byte 10 - 11
+                BitField(size=8,    name="Vendor ID High"),
+                BitField(size=8,    name="Vendor ID Low"),
+            ],
+            name=PCIE_VDM_HEADER
+        )
+
+
+class MCTPTransportHeader(BigEndianBitStruct):
+    """
+    DW3 of the TLP
+    """
 
-"""
-from ctypes import (
-    BigEndianStructure,
-    c_uint8,
-    c_uint16
-)
+    def __init__(self):
+        super().__init__(
+            bitfields=[
+                # Byte 0
+                BitField(size=4,    name="Header Version"),
+                Rsvd(size=4),
+                # Byte 1 - 2
+                BitField(size=8,    name="Destination Endpoint ID"),
+                BitField(size=8,    name="Source Endpoint ID"),
+                # Byte 3
+                BitField(size=3,    name="Message Tag"),
+                BitField(size=1,    name="Tag Owner"),
+                BitField(size=2,    name="Packet Sequence"),
+                BitField(size=1,    name="End Of Message"),
+                BitField(size=1,    name="Start Of Message"),
+            ],
+            name=MCTP_TRANSPORT_HEADER
+        )
+
+
+class MCTPMessageHeader(BigEndianBitStruct):
+    """
+    The first byte of a message, in the payload of its Start Of Message packet
+    """
+
+    def __init__(self):
+        super().__init__(
+            bitfields=[
+                BitField(size=7,    name="Message Type", enums=MESSAGE_TYPE_ENUMS),
+                BitField(size=1,    name="Integrity Check", enums=INTEGRITY_CHECK_ENUMS),
+            ],
+            name=MCTP_MESSAGE_HEADER
+        )
 
-MESSAGE_ROUTING = {
-    0: "Route to Root Complex",
-    2: "Route by ID",
-    3: "Broadcast from Root Complex"
-}
 
+class CCIMessageHeader(BigEndianBitStruct):
+    """
+    The header of a CXL FM API or CXL CCI message, following the MCTP message header
+    """
 
-class pcie_medium_specific_header(BigEndianStructure):
-    _pack_ = 1
-    _fields_ = [
-        # DWord[0]
-        #   Byte[0]
-        ("messageRouting",              c_uint8, 3),
-        ("type",                        c_uint8, 2),
-        ("format",                      c_uint8, 2),
-        ("rsvd7",                       c_uint8, 1),
-
-        #   Byte[1]
-        ("TH",                          c_uint8, 1),
-        ("rsvd1_2",                     c_uint8, 1),
-        ("attr_2",                      c_uint8, 1),
-        ("rsvd11",                      c_uint8, 1),
-        ("trafficClass",                c_uint8, 3),
-        ("rsvd8",                       c_uint8, 1),
-
-        #   Byte[2:3]
-        ("length",                      c_uint16, 10),
-        ("addrType",                    c_uint16, 2),
-        ("attr",                        c_uint16, 2),
-        ("errorPresent",                c_uint16, 1),
-        ("tlpDigest",                   c_uint16, 1),
-
-        # DWord[1]
-        #   Byte[0:1]
-        ("requestor",                   c_uint16),
-
-        #   Byte[2]
-        ("messageCode",                 c_uint8),
-
-        #   Byte[3]
-        ("mctpVDMCode",                 c_uint8, 4),
-        ("pad",                         c_uint8, 2),
-        ("rsvd48_49",                   c_uint8, 2),
-
-        # DWord[2]
-        #   Byte[0:1]
-        ("target",                      c_uint16),
-
-        #   Byte[2:3]
-        ("vendorID",                    c_uint16)
-    ]
-
-
-class mctp_transport_header(BigEndian_TWIDL_Structure):
-    _pack_ = 1
-    _fields_ = [
-        # Byte[0]
-        ("headerVersion",               c_uint8, 4),
-        TWIDL_Tuple("rsvd0_3",          c_uint8, 4).addAttributes(display=False),
-
-        # For some reason not defined
-        # Byte[1]
-        ("destination",                 c_uint8),
-
-        # Byte[2]
-        ("sourceEndpoint",              c_uint8),
-
-        # Byte[3]
-        ("messageTag",                  c_uint8, 3),
-        ("tagOwner",                    c_uint8, 1),
-        ("pktseq",                      c_uint8, 2),
-        ("endOfMessage",                c_uint8, 1),
-        ("startOfMessage",              c_uint8, 1)
-    ]
-
-
-class pcie_vdm_header(BigEndian_TWIDL_Structure):
-    _pack_ = 1
-    _fields_ = [
-        ("mediumSpecificHeader",        pcie_medium_specific_header),
-        ("mctpTransportHeader",         mctp_transport_header)
-    ]
-
-
-class mctp_message_header(BigEndian_TWIDL_Structure):
-    _pack_ = 1
-    _fields_ = [
-        ("messageType",                 c_uint8, 7),
-        TWIDL_Tuple("integrityCheck",   c_uint8, 1).addAttributes(
-            enumDict={
-                0: "No MCTP message integrity check",
-                1: "MCTP integrity check is present"
-            }
-        ),
-        # break
-        ("messageHeader",               c_uint8), # * M number of bytes. unclear where M comes from
-        ("messageData",                 c_uint8), # * N number of bytes. Unclear where N comes from
-    ]
-
-
-class mctp_vdm_packet(BigEndian_TWIDL_Structure):
-    _pack_ = 1
-    _fields_ = [
-        ("transportHeader",             pcie_vdm_header),
-        ("packetPayload",               mctp_message_header)
-    ]
-"""
\ No newline at end of file
+    def __init__(self):
+        super().__init__(
+            bitfields=[
+                # Byte 0
+                BitField(size=4,    name="Message Category", enums=CCI_CATEGORY_ENUMS),
+                Rsvd(size=4),
+                # Byte 1 - 2
+                BitField(size=8,    name="Message Tag"),
+                Rsvd(size=8),
+                # Byte 3 - 4
+                BitField(size=16,   name="Command Opcode"),
+                # Byte 5 - 7
+                BitField(size=20,   name="Message Payload Length"),
+                Rsvd(size=3),
+                BitField(size=1,    name="Background Operation"),
+                # Byte 8 - 11
+                BitField(size=16,   name="Return Code"),
+                BitField(size=16,   name="Vendor Specific Extended Status"),
+            ],
+            name=CCI_MESSAGE_HEADER
+        )
+
+
+# ======================= Packets =======================
+_PCIE_LAYOUT = PCIeVDMHeader().layout
+_TRANSPORT_LAYOUT = MCTPTransportHeader().layout
+
+
+def _field(layout, key: str) -> int:
+    return layout.keys.index(key)
+
+
+_FORMAT = _field(_PCIE_LAYOUT, "Format")
+_TYPE = _field(_PCIE_LAYOUT, "Type")
+_LENGTH_HIGH = _field(_PCIE_LAYOUT, "Length High")
+_LENGTH_LOW = _field(_PCIE_LAYOUT, "Length Low")
+_REQUESTER = tuple(_field(_PCIE_LAYOUT, f"Requester {part}") for part in ("Bus", "Device", "Function"))
+_TARGET = tuple(_field(_PCIE_LAYOUT, f"Target {part}") for part in ("Bus", "Device", "Function"))
+_VDM_CODE = _field(_PCIE_LAYOUT, "MCTP VDM Code")
+_PAD = _field(_PCIE_LAYOUT, "Pad Length")
+_MESSAGE_CODE = _field(_PCIE_LAYOUT, "Message Code")
+_VENDOR_HIGH = _field(_PCIE_LAYOUT, "Vendor ID High")
+_VENDOR_LOW = _field(_PCIE_LAYOUT, "Vendor ID Low")
+_VERSION = _field(_TRANSPORT_LAYOUT, "Header Version")
+_DESTINATION = _field(_TRANSPORT_LAYOUT, "Destination Endpoint ID")
+_SOURCE = _field(_TRANSPORT_LAYOUT, "Source Endpoint ID")
+_TAG = _field(_TRANSPORT_LAYOUT, "Message Tag")
+_TAG_OWNER = _field(_TRANSPORT_LAYOUT, "Tag Owner")
+_SEQUENCE = _field(_TRANSPORT_LAYOUT, "Packet Sequence")
+_EOM = _field(_TRANSPORT_LAYOUT, "End Of Message")
+_SOM = _field(_TRANSPORT_LAYOUT, "Start Of Message")
+
+
+def _routing_id(values, parts) -> int:
+    bus, device, function = (values[part] for part in parts)
+    return (bus << 8) | (device << 3) | function
+
+
+class MCTPPacket:
+    """
+    Brief:
+        One decoded MCTP over PCIe VDM packet
+
+    Attributes:
+        routing:        message routing, one of MESSAGE_ROUTING
+        requester:      PCIe Requester ID, bus << 8 | device << 3 | function
+        target:         PCIe Target ID when routed by ID
+        destination:    destination endpoint ID
+        source:         source endpoint ID
+        tag:            message tag
+        tag_owner:      1 if the source endpoint allocated the tag
+        sequence:       2 bit packet sequence number
+        som:            Start Of Message
+        eom:            End Of Message
+        payload:        the packet's payload without padding, a memoryview into the decoded buffer
+    """
+    __slots__ = (
+        "routing", "requester", "target", "destination", "source", "tag", "tag_owner", "sequence", "som", "eom",
+        "payload"
+    )
+
+    def __init__(self, routing, requester, target, destination, source, tag, tag_owner, sequence, som, eom, payload):
+        self.routing = routing
+        self.requester = requester
+        self.target = target
+        self.destination = destination
+        self.source = source
+        self.tag = tag
+        self.tag_owner = tag_owner
+        self.sequence = sequence
+        self.som = som
+        self.eom = eom
+        self.payload = payload
+
+    def __repr__(self):
+        return (
+            f"<MCTPPacket {self.source} -> {self.destination} tag {self.tag} seq {self.sequence}"
+            f"{' SOM' if self.som else ''}{' EOM' if self.eom else ''}: {len(self.payload)} bytes>"
+        )
+
+
+def decode_packet(packet, offset: int = 0) -> MCTPPacket:
+    """
+    Brief:
+        Decodes an MCTP over PCIe VDM TLP without copying its payload
+
+    Params:
+        packet:     a buffer holding the TLP from offset, header and payload
+        offset:     byte offset of the TLP within the buffer
+
+    Returns:
+        the MCTPPacket. Raises a ValueError if the TLP is not an MCTP packet or is cut short
+    """
+    view = memoryview(packet)
+    if len(view) - offset < PACKET_HEADER_BYTES:
+        raise ValueError(f"An MCTP packet needs at least {PACKET_HEADER_BYTES} bytes, was {len(view) - offset}")
+    pcie = _PCIE_LAYOUT.decoder(view[offset:offset + PCIE_HEADER_BYTES])
+    vendor = (pcie[_VENDOR_HIGH] << 8) | pcie[_VENDOR_LOW]
+    if (pcie[_FORMAT] != FORMAT_4DW_WITH_DATA or pcie[_MESSAGE_CODE] != MESSAGE_CODE_VDM_TYPE_1
+            or pcie[_VDM_CODE] != MCTP_VDM_CODE or vendor != DMTF_VENDOR_ID):
+        raise ValueError(
+            f"Not an MCTP over PCIe VDM packet: format {pcie[_FORMAT]:#x}, message code {pcie[_MESSAGE_CODE]:#x}, "
+            f"vendor ID {vendor:#06x}"
+        )
+    transport = _TRANSPORT_LAYOUT.decoder(view[offset + PCIE_HEADER_BYTES:offset + PACKET_HEADER_BYTES])
+    if transport[_VERSION] != MCTP_HEADER_VERSION:
+        raise ValueError(f"Unknown MCTP header version: {transport[_VERSION]}")
+    length = ((pcie[_LENGTH_HIGH] << 8) | pcie[_LENGTH_LOW]) or MAX_LENGTH_DWORDS
+    start = offset + PACKET_HEADER_BYTES
+    stop = start + length * DWORD_BYTES
+    if stop > len(view):
+        raise ValueError(f"MCTP packet of {length} DWords cut short at {len(view) - start} bytes")
+    return MCTPPacket(
+        pcie[_TYPE] & 0x7,
+        _routing_id(pcie, _REQUESTER),
+        _routing_id(pcie, _TARGET),
+        transport[_DESTINATION],
+        transport[_SOURCE],
+        transport[_TAG],
+        transport[_TAG_OWNER],
+        transport[_SEQUENCE],
+        transport[_SOM],
+        transport[_EOM],
+        view[start:stop - pcie[_PAD]]
+    )
+
+
+def encode_packet(payload: bytes, destination: int, source: int, tag: int, tag_owner: int = 1, sequence: int = 0,
+                  som: int = 1, eom: int = 1, routing: int = 0, requester: int = 0, target: int = 0) -> bytes:
+    """
+    Brief:
+        Builds an MCTP over PCIe VDM TLP around payload, padded to a whole number of DWords. The inverse of
+        decode_packet
+    """
+    pad = -len(payload) % DWORD_BYTES
+    length = (len(payload) + pad) // DWORD_BYTES
+    if not 0 < length <= MAX_LENGTH_DWORDS:
+        raise ValueError(f"An MCTP packet carries 1 - {MAX_LENGTH_DWORDS} DWords of payload, was {length}")
+    if routing not in MESSAGE_ROUTING:
+        raise ValueError(f"Unknown message routing: {routing}")
+    pcie = [0] * len(_PCIE_LAYOUT)
+    pcie[_FORMAT] = FORMAT_4DW_WITH_DATA
+    pcie[_TYPE] = 0b10000 | routing
+    pcie[_LENGTH_HIGH] = (length >> 8) & 0x3
+    pcie[_LENGTH_LOW] = length & 0xFF
+    for parts, routing_id in ((_REQUESTER, requester), (_TARGET, target)):
+        for part, value in zip(parts, (routing_id >> 8, (routing_id >> 3) & 0x1F, routing_id & 0x7)):
+            pcie[part] = value
+    pcie[_VDM_CODE] = MCTP_VDM_CODE
+    pcie[_PAD] = pad
+    pcie[_MESSAGE_CODE] = MESSAGE_CODE_VDM_TYPE_1
+    pcie[_VENDOR_HIGH] = DMTF_VENDOR_ID >> 8
+    pcie[_VENDOR_LOW] = DMTF_VENDOR_ID & 0xFF
+    transport = [0] * len(_TRANSPORT_LAYOUT)
+    transport[_VERSION] = MCTP_HEADER_VERSION
+    transport[_DESTINATION] = destination
+    transport[_SOURCE] = source
+    transport[_TAG] = tag
+    transport[_TAG_OWNER] = tag_owner
+    transport[_SEQUENCE] = sequence
+    transport[_SOM] = som
+    transport[_EOM] = eom
+    return _PCIE_LAYOUT.encoder(pcie) + _TRANSPORT_LAYOUT.encoder(transport) + bytes(payload) + bytes(pad)
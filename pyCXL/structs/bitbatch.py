@@ -0,0 +1,254 @@
+"""
+Columnar decoding of many records at once with NumPy.
+
+Decoding a capture one BitStruct at a time creates a BitField object for every field of every record. For offline
+analysis decode_batch instead takes a buffer of N back to back records and returns one NumPy column per field:
+
+    columns = decode_batch(capture, FlitStruct(bitstructs=[...], name="H0").layout)
+    columns["Flit Header.Slot 0"]       # -> uint8 array of length N
+
+The buffer is viewed as an (N, record bytes) uint8 array without copying and every field is rebuilt with vectorized
+shifts and masks over the byte columns it touches. Fields up to 64 bits wide come back in the smallest unsigned dtype
+that holds them, wider fields (e.g. the 128 bit DATA or 96 bit MAC) come back as fixed width byte columns holding the
+big endian bytes of the value.
+
+encode_batch is the inverse, packing column arrays into one contiguous buffer of N records exactly as bytes(BitStruct)
+would pack each of them.
+
+NumPy is an optional dependency of pyCXL and is only needed by this module.
+"""
+# Python imports
+import numpy as np
+
+# Package imports
+from pyCXL.structs.bitcodecs import BITS_IN_A_BYTE, bytes_needed
+
+MAX_INTEGER_FIELD_BITS = 64
+
+
+def field_dtype(size: int) -> np.dtype:
+    """
+    Brief:
+        The dtype decode_batch uses for a field of size bits
+
+    Returns:
+        the smallest unsigned integer dtype holding the field, or a void dtype of the field's bytes for fields wider
+        than 64 bits
+    """
+    if size <= 8:
+        return np.dtype(np.uint8)
+    if size <= 16:
+        return np.dtype(np.uint16)
+    if size <= 32:
+        return np.dtype(np.uint32)
+    if size <= MAX_INTEGER_FIELD_BITS:
+        return np.dtype(np.uint64)
+    return np.dtype((np.void, bytes_needed(size)))
+
+
+def as_records(buffer, byte_size: int, stride: int = None, offset: int = 0) -> np.ndarray:
+    """
+    Brief:
+        Views a buffer as an (N, byte_size) uint8 array without copying
+
+    Params:
+        buffer:     bytes, bytearray, memoryview or anything else supporting the buffer protocol
+        byte_size:  bytes in one record
+        stride:     bytes from the start of one record to the start of the next, byte_size if not given. A stride
+                    larger than byte_size picks one record out of a larger one, e.g. slot 2 of every 66 byte flit
+                    with stride=66, offset=32
+        offset:     byte offset of the first record within the buffer
+
+    Returns:
+        a read only (N, byte_size) uint8 array
+    """
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    stride = byte_size if stride is None else stride
+    if stride < byte_size:
+        raise ValueError(f"Stride of {stride} bytes is smaller than the {byte_size} byte record")
+    available = len(data) - offset
+    if stride == byte_size and available % byte_size:
+        raise ValueError(f"Buffer does not hold a whole number of {byte_size} byte records")
+    count = 0 if available < byte_size else (available - byte_size) // stride + 1
+    return np.lib.stride_tricks.as_strided(
+        data[offset:], shape=(count, byte_size), strides=(stride, 1), writeable=False
+    )
+
+
+def _gather(records: np.ndarray, pad: int, segments, lo: int, width: int, dtype) -> np.ndarray:
+    """
+    Brief:
+        Rebuilds bits lo to lo + width of a field from the byte columns of records
+
+    Params:
+        records:    (N, byte_size) uint8 array
+        pad:        unused trailing bits of the record's final byte
+        segments:   the field's (source shift, width, destination shift) runs from the layout
+        lo:         first bit of the field to rebuild
+        width:      number of bits to rebuild, at most 64
+        dtype:      integer dtype of the result
+    """
+    last_byte = records.shape[1] - 1
+    out = np.zeros(records.shape[0], dtype=dtype)
+    for src, seg_width, dst in segments:
+        start = max(lo, dst)
+        stop = min(lo + width, dst + seg_width)
+        # position of the run in the record's integer value and in the result
+        bit = src + pad + start - dst
+        out_bit = start - lo
+        remaining = stop - start
+        while remaining > 0:
+            byte_idx, bit_idx = divmod(bit, BITS_IN_A_BYTE)
+            take = min(BITS_IN_A_BYTE - bit_idx, remaining)
+            column = records[:, last_byte - byte_idx]
+            if bit_idx:
+                column = column >> bit_idx
+            if take < BITS_IN_A_BYTE:
+                column = column & ((1 << take) - 1)
+            column = column.astype(dtype)
+            if out_bit:
+                column <<= out_bit
+            out |= column
+            bit += take
+            out_bit += take
+            remaining -= take
+    return out
+
+
+def _wide_column(records: np.ndarray, pad: int, segments, size: int) -> np.ndarray:
+    """
+    Brief:
+        Decodes a field wider than 64 bits into a fixed width byte column
+    """
+    nbytes = bytes_needed(size)
+    dtype = np.dtype((np.void, nbytes))
+    if len(segments) == 1 and size % BITS_IN_A_BYTE == 0 and (segments[0][0] + pad) % BITS_IN_A_BYTE == 0:
+        # byte aligned fields are a plain slice of the record
+        stop = records.shape[1] - (segments[0][0] + pad) // BITS_IN_A_BYTE
+        column = np.ascontiguousarray(records[:, stop - nbytes:stop])
+    else:
+        column = np.empty((records.shape[0], nbytes), dtype=np.uint8)
+        for idx in range(nbytes):
+            lo = idx * BITS_IN_A_BYTE
+            column[:, nbytes - 1 - idx] = _gather(
+                records, pad, segments, lo, min(BITS_IN_A_BYTE, size - lo), np.uint8
+            )
+    return column.view(dtype).reshape(records.shape[0])
+
+
+def decode_batch(buffer, layout, stride: int = None, offset: int = 0, fields=None) -> dict:
+    """
+    Brief:
+        Decodes N back to back records into one NumPy column per field
+
+    Params:
+        buffer:     bytes, bytearray, memoryview or uint8 array holding the records
+        layout:     a BitLayout or CollectionLayout, or a BitStruct/BitCollection whose layout to use
+        stride:     bytes between the starts of consecutive records, see as_records
+        offset:     byte offset of the first record
+        fields:     keys of the fields to decode, every field if not given
+
+    Returns:
+        a dict from the layout's unique field keys to arrays of length N, see field_dtype for the column dtypes
+    """
+    layout = getattr(layout, "layout", layout)
+    records = as_records(buffer, layout.byte_size, stride=stride, offset=offset)
+    wanted = None if fields is None else set(fields)
+    if wanted is not None and not wanted.issubset(layout.keys):
+        raise ValueError(f"Unknown fields for {layout.name}: {sorted(wanted.difference(layout.keys))}")
+
+    columns = {}
+    for key, size, segments in zip(layout.keys, layout.sizes, layout.segments):
+        if wanted is not None and key not in wanted:
+            continue
+        if size > MAX_INTEGER_FIELD_BITS:
+            columns[key] = _wide_column(records, layout.pad, segments, size)
+        else:
+            columns[key] = _gather(records, layout.pad, segments, 0, size, field_dtype(size))
+    return columns
+
+
+def _field_bytes(column, size: int, count: int) -> np.ndarray:
+    """
+    Brief:
+        Normalizes a column of a field wider than 64 bits to an (N, field bytes) uint8 array
+    """
+    nbytes = bytes_needed(size)
+    column = np.asarray(column)
+    if column.dtype.kind == "V":
+        column = column.view(np.uint8).reshape(-1, nbytes)
+    if column.shape != (count, nbytes):
+        raise ValueError(f"Column of a {size} bit field must be {nbytes} byte values")
+    return column.astype(np.uint8, copy=False)
+
+
+def _scatter(records: np.ndarray, segments, bits):
+    """
+    Brief:
+        ORs a field into the byte columns of records
+
+    Params:
+        records:    (N, byte_size) uint8 array to fill
+        segments:   the field's (source shift, width, destination shift) runs from the layout
+        bits:       callable(lo, width) -> uint8 array holding bits lo to lo + width of the field
+    """
+    last_byte = records.shape[1] - 1
+    for src, width, dst in segments:
+        bit = src
+        value_bit = dst
+        remaining = width
+        while remaining > 0:
+            byte_idx, bit_idx = divmod(bit, BITS_IN_A_BYTE)
+            take = min(BITS_IN_A_BYTE - bit_idx, remaining)
+            chunk = bits(value_bit, take)
+            if bit_idx:
+                chunk = chunk << np.uint8(bit_idx)
+            records[:, last_byte - byte_idx] |= chunk
+            bit += take
+            value_bit += take
+            remaining -= take
+
+
+def encode_batch(columns: dict, layout, count: int = None) -> bytes:
+    """
+    Brief:
+        Packs column arrays into N back to back records without creating any BitStructs
+
+    Params:
+        columns:    a dict from the layout's unique field keys to arrays of length N. Fields up to 64 bits take integer
+                    arrays, wider fields take void arrays or (N, field bytes) uint8 arrays as returned by decode_batch.
+                    Fields left out, such as reserved fields, are encoded as 0
+        layout:     a BitLayout or CollectionLayout, or a BitStruct/BitCollection whose layout to use
+        count:      number of records, taken from the columns if not given
+
+    Returns:
+        N * byte_size bytes, each record packed as bytes(BitStruct) would pack it
+    """
+    layout = getattr(layout, "layout", layout)
+    unknown = set(columns).difference(layout.keys)
+    if unknown:
+        raise ValueError(f"Unknown fields for {layout.name}: {sorted(unknown)}")
+    if count is None:
+        if not columns:
+            raise ValueError("Cannot infer the number of records without any columns")
+        count = len(next(iter(columns.values())))
+
+    records = np.zeros((count, layout.byte_size), dtype=np.uint8)
+    for key, size, segments in zip(layout.keys, layout.sizes, layout.segments):
+        if key not in columns:
+            continue
+        if size > MAX_INTEGER_FIELD_BITS:
+            value_bytes = _field_bytes(columns[key], size, count)
+            whole_field = ((0, size, 0),)
+
+            def bits(lo, width, value_bytes=value_bytes, whole_field=whole_field):
+                return _gather(value_bytes, 0, whole_field, lo, width, np.uint8)
+        else:
+            values = np.asarray(columns[key]).astype(np.uint64, copy=False)
+            if values.shape != (count,):
+                raise ValueError(f"Column {key} holds {len(values)} values, expected {count}")
+
+            def bits(lo, width, values=values):
+                return ((values >> np.uint64(lo)) & np.uint64((1 << width) - 1)).astype(np.uint8)
+        _scatter(records, segments, bits)
+    return records.tobytes()
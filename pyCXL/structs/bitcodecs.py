@@ -0,0 +1,41 @@
+"""
+Integer based encoding and decoding of bit fields.
+
+Every value handled here is the integer form of a struct's bit string: the first bit of the bit string is the most
+significant bit of the integer. Nothing in this module builds strings of '0' and '1' characters, all of the work is
+done with shifts and masks over the integers produced by int.from_bytes.
+"""
+BITS_IN_A_BYTE = 8
+
+
+def bytes_needed(size: int) -> int:
+    """
+    Brief:
+        The number of whole bytes required to hold size bits
+    """
+    return (size + BITS_IN_A_BYTE - 1) // BITS_IN_A_BYTE
+
+
+def big_endian_to_packed(value: int, size: int) -> int:
+    """
+    Brief:
+        Converts the bit string of a big endian struct into an integer where the fields are packed upwards from bit 0.
+
+        The bit string is read in byte sized chunks. The chunks are reversed so that the first chunk becomes the least
+        significant byte and a trailing partial chunk becomes the most significant bits. The first field of a big
+        endian struct then lives at bit 0 of the result, the second field directly above it and so on.
+    """
+    whole_bytes, partial = divmod(size, BITS_IN_A_BYTE)
+    swapped = int.from_bytes((value >> partial).to_bytes(whole_bytes, 'big'), 'little')
+    return ((value & ((1 << partial) - 1)) << (whole_bytes * BITS_IN_A_BYTE)) | swapped
+
+
+def packed_to_big_endian(packed: int, size: int) -> int:
+    """
+    Brief:
+        The inverse of big_endian_to_packed
+    """
+    whole_bytes, partial = divmod(size, BITS_IN_A_BYTE)
+    low_bits = whole_bytes * BITS_IN_A_BYTE
+    swapped = int.from_bytes((packed & ((1 << low_bits) - 1)).to_bytes(whole_bytes, 'little'), 'big')
+    return (swapped << partial) | (packed >> low_bits)
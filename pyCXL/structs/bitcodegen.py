@@ -0,0 +1,183 @@
+"""
+Generated decode and encode functions for compiled layouts.
+
+The table driven codecs in bitlayouts loop over a list of (shift, mask) pairs. For layouts which are decoded millions
+of times, such as the 128 bit slot formats, this module writes a straight line Python function for the layout with
+every shift and mask folded in as a constant, compiles it and caches it:
+
+    decode = decoder_for(M2SHeader().layout)
+    decode(buf, offset)     # -> tuple of field values
+    print(decode.source)
+
+Generated functions are opt-in. Calling specialize(layout) installs them as the layout's decoder and encoder so that
+every struct sharing the layout uses them from then on.
+"""
+# Python imports
+import linecache
+import re
+
+# Package imports
+from pyCXL.structs.bitlayouts import BitLayout, CollectionLayout
+
+_DECODERS = {}
+_ENCODERS = {}
+
+
+def _function_name(prefix: str, layout) -> str:
+    return prefix + re.sub(r"\W+", "_", layout.name).strip("_")
+
+
+def _compile(name: str, source: str, layout):
+    """
+    Brief:
+        Compiles generated source and registers it with linecache so that inspect.getsource and tracebacks can show
+        the generated code.
+    """
+    filename = f"<pyCXL.bitcodegen {name} {id(layout):x}>"
+    namespace = {}
+    exec(compile(source, filename, "exec"), namespace)
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    function = namespace[name]
+    function.source = source
+    function.layout = layout
+    return function
+
+
+def _extract(value_name: str, segments, pad: int) -> str:
+    """
+    Brief:
+        The expression rebuilding one field from the integer read out of the buffer
+    """
+    terms = []
+    for src, width, dst in segments:
+        term = value_name
+        shift = src + pad
+        if shift:
+            term = f"({term} >> {shift})"
+        term = f"({term} & {hex((1 << width) - 1)})"
+        if dst:
+            term = f"({term} << {dst})"
+        terms.append(term)
+    return " | ".join(terms)
+
+
+def _insert(value_name: str, segments) -> str:
+    """
+    Brief:
+        The expression placing one field value into the bit string integer
+    """
+    terms = []
+    for src, width, dst in segments:
+        term = value_name
+        if dst:
+            term = f"({term} >> {dst})"
+        term = f"({term} & {hex((1 << width) - 1)})"
+        if src:
+            term = f"({term} << {src})"
+        terms.append(term)
+    return " | ".join(terms)
+
+
+def generate_decoder_source(layout) -> tuple[str, str]:
+    """
+    Brief:
+        Writes the source of a decode function for a BitLayout or CollectionLayout
+
+    Returns:
+        (function name, source)
+    """
+    name = _function_name("decode_", layout)
+    lines = [
+        f"def {name}(buf, offset=0, _from_bytes=int.from_bytes):",
+        f"    v = _from_bytes(buf[offset:offset + {layout.byte_size}], 'big')",
+        "    return (",
+    ]
+    for segments in layout.segments:
+        lines.append(f"        {_extract('v', segments, layout.pad)},")
+    lines.append("    )")
+    return name, "\n".join(lines) + "\n"
+
+
+def generate_encoder_source(layout) -> tuple[str, str]:
+    """
+    Brief:
+        Writes the source of an encode function for a BitLayout or CollectionLayout
+
+    Returns:
+        (function name, source)
+    """
+    name = _function_name("encode_", layout)
+    args = [f"f{idx}" for idx in range(len(layout.segments))]
+    lines = [f"def {name}(values):"]
+    if not args:
+        lines.append(f"    return bytes({layout.byte_size})")
+        return name, "\n".join(lines) + "\n"
+    if len(args) == 1:
+        lines.append(f"    {args[0]}, = values")
+    else:
+        lines.append(f"    {', '.join(args)} = values")
+    lines.append("    return (")
+    for idx, (arg, segments) in enumerate(zip(args, layout.segments)):
+        joiner = "" if idx == 0 else "| "
+        lines.append(f"        {joiner}{_insert(arg, segments)}")
+    lines.append(f"    ).to_bytes({layout.byte_size}, 'big')")
+    return name, "\n".join(lines) + "\n"
+
+
+def decoder_for(layout):
+    """
+    Brief:
+        The generated decode function for a layout, compiled on first use and cached after that
+
+    Params:
+        layout: a BitLayout or CollectionLayout
+    """
+    decoder = _DECODERS.get(layout)
+    if decoder is None:
+        if not isinstance(layout, (BitLayout, CollectionLayout)):
+            raise TypeError(f"Cannot generate a decoder for {type(layout).__name__}")
+        decoder = _DECODERS[layout] = _compile(*generate_decoder_source(layout), layout)
+    return decoder
+
+
+def encoder_for(layout):
+    """
+    Brief:
+        The generated encode function for a layout, compiled on first use and cached after that
+    """
+    encoder = _ENCODERS.get(layout)
+    if encoder is None:
+        if not isinstance(layout, (BitLayout, CollectionLayout)):
+            raise TypeError(f"Cannot generate an encoder for {type(layout).__name__}")
+        encoder = _ENCODERS[layout] = _compile(*generate_encoder_source(layout), layout)
+    return encoder
+
+
+def specialize(layout):
+    """
+    Brief:
+        Installs the generated functions as the layout's decoder and encoder. Every struct or collection sharing the
+        layout uses them from then on. Collections also specialize the layouts of their structs.
+
+    Returns:
+        the layout, for chaining
+    """
+    if isinstance(layout, CollectionLayout):
+        for struct_layout in layout.layouts:
+            specialize(struct_layout)
+    layout.decoder = decoder_for(layout)
+    layout.encoder = encoder_for(layout)
+    return layout
+
+
+def unspecialize(layout):
+    """
+    Brief:
+        Returns a layout to the table driven codecs
+    """
+    if isinstance(layout, CollectionLayout):
+        for struct_layout in layout.layouts:
+            unspecialize(struct_layout)
+    layout.decoder = layout.unpack_bytes
+    layout.encoder = layout.pack_bytes
+    return layout
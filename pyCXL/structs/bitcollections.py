@@ -2,8 +2,11 @@
 import operator
 
 # Package imports
-from pyCXL.structs.biterator import Biterator
+from pyCXL.structs.bitcodecs import bytes_needed
+from pyCXL.structs.bitfields import LazySource
+from pyCXL.structs.bitlayouts import CollectionLayout
 from pyCXL.structs.bitstructs import BitStruct
+from pyCXL.structs.bitviews import StructView
 
 
 class BitCollection:
@@ -14,7 +17,8 @@ class BitCollection:
     def __init__(self, bitstructs: list[BitStruct], name: str):
         self.__structs = bitstructs
         self.__name = name
-        self.__size = sum([struct.size for struct in self.structs])
+        self.__layout = self.compile_layout(bitstructs, name)
+        self.__lazy = None
         self.__idx = 0
 
     def __iter__(self):
@@ -35,16 +39,10 @@ class BitCollection:
         return retStr
 
     def __int__(self):
-        binstr = self.to_bin()
-        return int(binstr, 2)
+        return self.to_int()
 
     def __bytes__(self):
-        intVal = int(self)
-        bytes_needed, rem = divmod(self.size, 8)
-        if rem:
-            bytes_needed += 1
-        # int.to_bytes requires a byteorder param
-        return intVal.to_bytes(bytes_needed, byteorder='big')
+        return self.__layout.encoder([field.value for struct in self.structs for field in struct.fields])
 
     def __index__(self):
         """
@@ -77,12 +75,20 @@ class BitCollection:
 
     @property
     def size(self):
-        return self.__size
+        return self.__layout.size
 
     @size.setter
     def size(self, new_value):
         raise AttributeError("Cannot modify BitCollection's size")
 
+    @property
+    def layout(self):
+        return self.__layout
+
+    @layout.setter
+    def layout(self, new_value):
+        raise AttributeError("Cannot modify BitCollection's layout")
+
     @property
     def idx(self):
         return self.__idx
@@ -91,11 +97,33 @@ class BitCollection:
     def idx(self, new_value):
         raise AttributeError("Cannot modify BitCollection's index")
 
+    @classmethod
+    def compile_layout(cls, bitstructs: list[BitStruct], name: str) -> CollectionLayout:
+        """
+        Struct layouts are already shared, so a collection layout is keyed by the identity of its struct layouts
+        """
+        signature = (name, tuple([struct.layout for struct in bitstructs]))
+        layouts = cls.__dict__.get("_layouts")
+        if layouts is None:
+            layouts = {}
+            cls._layouts = layouts
+        layout = layouts.get(signature)
+        if layout is None:
+            layout = CollectionLayout(name=name, layouts=signature[1])
+            layouts[signature] = layout
+        return layout
+
     def to_bin(self):
-        binstr = ""
+        return format(int(self), f"0{self.size}b")
+
+    def to_int(self):
+        """
+        The integer value of the collection's bit string. Each struct encodes itself with its own endianness.
+        """
+        value = 0
         for struct in self.structs:
-            binstr += struct.to_bin()
-        return binstr
+            value = (value << struct.size) | struct.to_int()
+        return value
 
     def to_dict(self):
         """
@@ -110,6 +138,18 @@ class BitCollection:
             ]
         }
 
+    def view(self, buffer, offset: int = 0) -> StructView:
+        """
+        A zero copy view of this collection's layout over buffer, see bitviews.StructView
+        """
+        return StructView(self.__layout, buffer, offset)
+
+    def from_int(self, value: int):
+        """
+        Populates every struct from the integer value of the collection's bit string
+        """
+        self._assign(self.__layout.unpack(value))
+
     def from_bin(self, binstring: str):
         """
         Because this is a collection of bit structs it does make sense that someone
@@ -121,22 +161,45 @@ class BitCollection:
         if len(binstring) < self.size:
             raise ValueError("Not enough bins to fill the BitCollection")
 
-        for struct in self.structs:
-            struct.from_bin(binstring[:struct.size])
-            binstring = binstring[struct.size:]
+        self.from_int(int(binstring[:self.size], 2))
 
-    def from_bytes(self, bytestring: bytes):
-        if len(bytestring) < self.size // 8:
-            raise ValueError("Not enough bytes to fill the BitCollection")
+    def from_bytes(self, bytestring: bytes, lazy: bool = False):
+        """
+        Populates every struct from a bytearray
 
-        data = Biterator(bytestring)
-        available_bins = next(data)
+        With lazy=True only the raw bit string is stored. Each field is decoded the first time its value is read and
+        cached after that, so filtering on a few fields only pays for those fields.
+        """
+        if len(bytestring) < bytes_needed(self.size):
+            raise ValueError("Not enough bytes to fill the BitCollection")
 
+        if lazy:
+            source = self.__lazy
+            if source is None:
+                source = self.__bind_lazy()
+            source.value = int.from_bytes(bytestring[:self.__layout.byte_size], 'big') >> self.__layout.pad
+            source.stamp += 1
+            return
+
+        self._assign(self.__layout.decoder(bytestring))
+
+    def __bind_lazy(self) -> LazySource:
+        source = LazySource()
+        fields = [field for struct in self.structs for field in struct.fields]
+        for field, segments in zip(fields, self.__layout.segments):
+            field._lazy = source
+            field._stamp = source.stamp
+            field._segments = segments
+        self.__lazy = source
+        return source
+
+    def _assign(self, values):
+        # values arrive flattened across every struct in the collection
+        idx = 0
         for struct in self.structs:
-            while len(available_bins) < struct.size:
-                available_bins += next(data)
-            struct.from_bin(available_bins[:struct.size])
-            available_bins = available_bins[struct.size:]
+            count = len(struct.fields)
+            struct._assign(values[idx:idx + count])
+            idx += count
 
 
 class FlitStruct(BitCollection):
@@ -1,15 +1,98 @@
 # Python imports
 import operator
+from types import MappingProxyType
+
+
+class LazySource:
+    """
+    Brief:
+        The raw bit string integer shared by the lazily decoded fields of a BitCollection. Bumping the stamp marks every
+        field bound to the source as stale, so repopulating a lazy collection costs the same however many fields it has.
+    """
+    __slots__ = ("value", "stamp")
+
+    def __init__(self):
+        self.value = 0
+        self.stamp = 0
+
+
+class FieldSpec:
+    """
+    Brief:
+        The immutable description of a BitField (name, size, enums and rsvd), shared by every field created with the
+        same description. A decoded flit only holds the values of its fields, see FieldSpec.intern.
+    """
+    __slots__ = ("__name", "__size", "__enums", "__rsvd")
+
+    _specs = {}
+
+    def __init__(self, size: int, name: str, enums: dict = None, rsvd: bool = False):
+        self.__size = size
+        self.__name = name
+        self.__enums = MappingProxyType(dict(enums)) if enums is not None else None
+        self.__rsvd = rsvd
+
+    def __repr__(self):
+        return f"<FieldSpec {self.__name}: {self.__size} bits>"
+
+    @classmethod
+    def intern(cls, size: int, name: str, enums: dict = None, rsvd: bool = False):
+        """
+        Brief:
+            The shared FieldSpec for a field description, created the first time the description is seen
+        """
+        key = (name, size, rsvd, tuple(enums.items()) if enums is not None else None)
+        spec = cls._specs.get(key)
+        if spec is None:
+            spec = cls._specs[key] = cls(size=size, name=name, enums=enums, rsvd=rsvd)
+        return spec
+
+    @property
+    def size(self):
+        return self.__size
+
+    @property
+    def name(self):
+        return self.__name
+
+    @property
+    def enums(self):
+        return self.__enums
+
+    @property
+    def rsvd(self):
+        return self.__rsvd
 
 
 class BitField:
+    """
+    Brief:
+        A named value of a fixed number of bits. The name, size, enums and rsvd flag live in a shared FieldSpec, each
+        instance only holds its value.
+    """
+    __slots__ = ("_spec", "_value", "_lazy", "_stamp", "_segments")
 
     def __init__(self, size: int, name: str, value: int = 0, enums: dict = None, rsvd: bool = False):
-        self.__size     = size
-        self.__name     = name
-        self.__enums    = enums
-        self.__rsvd     = rsvd
+        self._spec      = FieldSpec.intern(size=size, name=name, enums=enums, rsvd=rsvd)
         self._value     = value
+        # set when the field is bound to a lazy BitCollection, see BitCollection.from_bytes
+        self._lazy      = None
+        self._stamp     = 0
+        self._segments  = None
+
+    @classmethod
+    def from_spec(cls, spec: FieldSpec, value: int = 0):
+        """
+        Brief:
+            Creates a field from an existing FieldSpec without looking it up again
+        """
+        field = cls.__new__(cls)
+        field._spec = spec
+        field._value = value
+        field._lazy = None
+        field._stamp = 0
+        field._segments = None
+        return field
 
     def __int__(self):
         return self.value
@@ -47,7 +130,7 @@ class BitField:
 
     @property
     def size(self):
-        return self.__size
+        return self._spec.size
 
     @size.setter
     def size(self, new_size):
@@ -55,7 +138,7 @@ class BitField:
 
     @property
     def name(self):
-        return self.__name
+        return self._spec.name
 
     @name.setter
     def name(self, new_name):
@@ -63,17 +146,35 @@ class BitField:
 
     @property
     def value(self):
+        lazy = self._lazy
+        if lazy is not None and self._stamp != lazy.stamp:
+            # decoded on first access after the collection was repopulated, then cached until the next time
+            source = lazy.value
+            value = 0
+            for shift, width, dst in self._segments:
+                value |= ((source >> shift) & ((1 << width) - 1)) << dst
+            self._value = value
+            self._stamp = lazy.stamp
         return self._value
 
     @value.setter
     def value(self, new_value):
-        if len(bin(new_value)[2:]) > self.size:
+        if new_value.bit_length() > self.size:
             raise ValueError(f"{new_value} is too large for the field size: {self.size} bits")
+        self._set(new_value)
+
+    def _set(self, new_value: int):
+        """
+        Brief:
+            Stores an already validated value, overriding any pending lazy decode
+        """
         self._value = new_value
+        if self._lazy is not None:
+            self._stamp = self._lazy.stamp
 
     @property
     def enums(self):
-        return self.__enums
+        return self._spec.enums
 
     @enums.setter
     def enums(self, new_enums):
@@ -81,12 +182,20 @@ class BitField:
 
     @property
     def rsvd(self):
-        return self.__rsvd
+        return self._spec.rsvd
 
     @rsvd.setter
     def rsvd(self, new_rsvd):
         raise AttributeError("rsvd field cannot be modified")
 
+    @property
+    def spec(self):
+        return self._spec
+
+    @spec.setter
+    def spec(self, new_spec):
+        raise AttributeError("spec field cannot be modified")
+
     def to_dict(self):
         return {self.name: self.value}
 
@@ -94,7 +203,4 @@ class BitField:
         """
         __bin__ cannot be overloaded in the same way as other methods. Treat this function as if you could.
         """
-        binStr = bin(self.value)[2:]
-        while len(binStr) < self.size:
-            binStr = '0' + binStr
-        return binStr
\ No newline at end of file
+        return format(self.value, f"0{self.size}b")
\ No newline at end of file
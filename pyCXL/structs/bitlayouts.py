@@ -0,0 +1,311 @@
+"""
+Compiled layouts for BitStructs and BitCollections.
+
+A layout is everything about a struct that does not change between instances: field names, sizes, where each field
+sits in the struct's bit string and how to get it back out. Layouts are compiled once and cached on the struct class
+(see BitStruct.compile_layout) so that encoding and decoding is a fixed sequence of shifts and masks.
+
+Positions are always expressed against the integer value of a bit string, bit 0 being the last bit of the string.
+"""
+# Package imports
+from pyCXL.structs.bitcodecs import (
+    BITS_IN_A_BYTE,
+    bytes_needed,
+    big_endian_to_packed,
+    packed_to_big_endian
+)
+
+
+def unique_keys(names) -> tuple[str, ...]:
+    """
+    Brief:
+        Makes a list of names safe to use as dictionary keys. Names which appear more than once are suffixed with
+        their occurrence, e.g. two "Rsvd" fields become "Rsvd[0]" and "Rsvd[1]".
+    """
+    counts = {}
+    for name in names:
+        counts[name] = counts.get(name, 0) + 1
+    seen = {}
+    keys = []
+    for name in names:
+        if counts[name] == 1:
+            keys.append(name)
+            continue
+        occurrence = seen.get(name, 0)
+        seen[name] = occurrence + 1
+        keys.append(f"{name}[{occurrence}]")
+    return tuple(keys)
+
+
+def _big_endian_source_bit(bit: int, size: int) -> int:
+    """
+    Brief:
+        Maps a bit of a big endian struct's packed integer back to the bit of the struct's bit string it came from
+    """
+    whole_bytes, partial = divmod(size, BITS_IN_A_BYTE)
+    low_bits = whole_bytes * BITS_IN_A_BYTE
+    if bit >= low_bits:
+        return bit - low_bits
+    byte_idx, bit_idx = divmod(bit, BITS_IN_A_BYTE)
+    return partial + (whole_bytes - 1 - byte_idx) * BITS_IN_A_BYTE + bit_idx
+
+
+def _restore_codecs(layout, specialized: bool):
+    """
+    Brief:
+        Puts back a pickled layout's codecs. Generated functions cannot be pickled, so a layout which was specialized
+        compiles them again, the structs of a collection having restored their own already
+    """
+    if specialized:
+        # bitcodegen imports this module
+        from pyCXL.structs.bitcodegen import decoder_for, encoder_for
+        layout.decoder = decoder_for(layout)
+        layout.encoder = encoder_for(layout)
+
+
+class BitLayout:
+    """
+    Brief:
+        The compiled shape of a BitStruct
+
+    Attributes:
+        name:       name of the struct
+        names:      field names in declaration order
+        keys:       field names made unique, suitable for dictionary keys
+        sizes:      field sizes in bits
+        rsvd:       whether each field is reserved
+        size:       total size of the struct in bits
+        big_endian: fields are stored using BigEndianBitStruct ordering
+        byte_size:  bytes needed to hold the struct
+        pad:        unused trailing bits of the final byte
+        shifts:     shift of each field in the decode integer (the bit string itself, or for big endian structs the
+                    byte swapped integer produced by big_endian_to_packed)
+        masks:      mask of each field after shifting
+        segments:   for each field, the (source shift, width, destination shift) runs which rebuild the field value
+                    directly from the bit string integer. Little endian fields are always a single run, big endian
+                    fields are split wherever the byte swap breaks them up.
+        decoder:    callable(data, offset=0) -> tuple used by structs to decode bytes. unpack_bytes unless replaced
+                    by a generated function, see bitcodegen.specialize
+        encoder:    callable(values) -> bytes used by structs to encode bytes. pack_bytes unless replaced
+    """
+    __slots__ = (
+        "name", "names", "keys", "sizes", "rsvd", "size", "big_endian", "byte_size", "pad",
+        "shifts", "masks", "segments", "decoder", "encoder", "_ops"
+    )
+
+    def __init__(self, name: str, names, sizes, rsvd=None, big_endian: bool = False):
+        self.name = name
+        self.names = tuple(names)
+        self.keys = unique_keys(self.names)
+        self.sizes = tuple(sizes)
+        self.rsvd = tuple(rsvd) if rsvd is not None else (False,) * len(self.sizes)
+        self.size = sum(self.sizes)
+        self.big_endian = big_endian
+        self.byte_size = bytes_needed(self.size)
+        self.pad = self.byte_size * BITS_IN_A_BYTE - self.size
+
+        shifts = []
+        segments = []
+        offset = 0
+        for size in self.sizes:
+            if big_endian:
+                shifts.append(offset)
+                segments.append(self._big_endian_segments(offset, size))
+            else:
+                shift = self.size - offset - size
+                shifts.append(shift)
+                segments.append(((shift, size, 0),))
+            offset += size
+        self.shifts = tuple(shifts)
+        self.masks = tuple((1 << size) - 1 for size in self.sizes)
+        self.segments = tuple(segments)
+        self._ops = tuple(zip(self.shifts, self.masks))
+        self.decoder = self.unpack_bytes
+        self.encoder = self.pack_bytes
+
+    def __len__(self):
+        return len(self.sizes)
+
+    def __repr__(self):
+        return f"<BitLayout {self.name}: {self.size} bits, {len(self)} fields>"
+
+    def __reduce__(self):
+        # rebuilt from its definition, keeping only whether the codecs were generated
+        specialized = self.decoder != self.unpack_bytes
+        return BitLayout, (self.name, self.names, self.sizes, self.rsvd, self.big_endian), specialized
+
+    def __setstate__(self, specialized: bool):
+        _restore_codecs(self, specialized)
+
+    def _big_endian_segments(self, offset: int, size: int):
+        runs = []
+        for dst in range(size):
+            src = _big_endian_source_bit(offset + dst, self.size)
+            if runs and runs[-1][0] + runs[-1][1] == src:
+                runs[-1][1] += 1
+            else:
+                runs.append([src, 1, dst])
+        return tuple(tuple(run) for run in runs)
+
+    def unpack(self, value: int) -> tuple[int, ...]:
+        """
+        Brief:
+            Splits the integer value of the struct's bit string into field values
+        """
+        if self.big_endian:
+            value = big_endian_to_packed(value, self.size)
+        return tuple([(value >> shift) & mask for shift, mask in self._ops])
+
+    def pack(self, values) -> int:
+        """
+        Brief:
+            Builds the integer value of the struct's bit string from field values
+        """
+        packed = 0
+        for value, (shift, mask) in zip(values, self._ops):
+            packed |= (value & mask) << shift
+        if self.big_endian:
+            packed = packed_to_big_endian(packed, self.size)
+        return packed
+
+    def unpack_bytes(self, data: bytes, offset: int = 0) -> tuple[int, ...]:
+        """
+        Brief:
+            Decodes field values from data starting at byte offset
+        """
+        return self.unpack(int.from_bytes(data[offset:offset + self.byte_size], 'big') >> self.pad)
+
+    def pack_bytes(self, values) -> bytes:
+        """
+        Brief:
+            Encodes field values into bytes the same way bytes(BitStruct) does
+        """
+        return self.pack(values).to_bytes(self.byte_size, 'big')
+
+
+class CollectionLayout:
+    """
+    Brief:
+        The compiled shape of a BitCollection: the layout of each struct and where that struct sits in the
+        collection's bit string
+
+    Attributes:
+        name:           name of the collection
+        layouts:        BitLayout of each struct in order
+        size:           total size in bits
+        byte_size:      bytes needed to hold the collection
+        pad:            unused trailing bits of the final byte
+        struct_shifts:  shift of each struct within the collection's bit string integer
+        struct_masks:   mask of each struct after shifting
+        fields:         (struct index, field index) of every field in the collection, flattened in order
+        keys:           unique "struct.field" name of every flattened field
+        sizes:          size of every flattened field
+        rsvd:           whether every flattened field is reserved
+        segments:       (source shift, width, destination shift) runs of every flattened field relative to the
+                        collection's bit string integer
+        decoder:        callable(data, offset=0) -> flattened tuple, unpack_bytes unless specialized
+        encoder:        callable(flattened values) -> bytes, pack_bytes unless specialized
+    """
+    __slots__ = (
+        "name", "layouts", "size", "byte_size", "pad", "struct_shifts", "struct_masks",
+        "fields", "keys", "sizes", "rsvd", "segments", "decoder", "encoder", "_flat_ops"
+    )
+
+    def __init__(self, name: str, layouts):
+        self.name = name
+        self.layouts = tuple(layouts)
+        self.size = sum(layout.size for layout in self.layouts)
+        self.byte_size = bytes_needed(self.size)
+        self.pad = self.byte_size * BITS_IN_A_BYTE - self.size
+
+        struct_shifts = []
+        remaining = self.size
+        for layout in self.layouts:
+            remaining -= layout.size
+            struct_shifts.append(remaining)
+        self.struct_shifts = tuple(struct_shifts)
+        self.struct_masks = tuple((1 << layout.size) - 1 for layout in self.layouts)
+
+        fields = []
+        qualified = []
+        sizes = []
+        rsvd = []
+        segments = []
+        struct_keys = unique_keys([layout.name for layout in self.layouts])
+        for struct_idx, (layout, struct_shift) in enumerate(zip(self.layouts, self.struct_shifts)):
+            for field_idx, field_key in enumerate(layout.keys):
+                fields.append((struct_idx, field_idx))
+                qualified.append(f"{struct_keys[struct_idx]}.{field_key}")
+                sizes.append(layout.sizes[field_idx])
+                rsvd.append(layout.rsvd[field_idx])
+                segments.append(tuple(
+                    (src + struct_shift, width, dst) for src, width, dst in layout.segments[field_idx]
+                ))
+        self.fields = tuple(fields)
+        self.keys = tuple(qualified)
+        self.sizes = tuple(sizes)
+        self.rsvd = tuple(rsvd)
+        self.segments = tuple(segments)
+
+        # without big endian structs every field is a single run and the whole collection decodes in one pass
+        if any(layout.big_endian for layout in self.layouts):
+            self._flat_ops = None
+        else:
+            self._flat_ops = tuple(
+                (segment[0][0], (1 << size) - 1) for segment, size in zip(self.segments, self.sizes)
+            )
+        self.decoder = self.unpack_bytes
+        self.encoder = self.pack_bytes
+
+    def __len__(self):
+        return len(self.layouts)
+
+    def __repr__(self):
+        return f"<CollectionLayout {self.name}: {self.size} bits, {len(self)} structs>"
+
+    def __reduce__(self):
+        specialized = self.decoder != self.unpack_bytes
+        return CollectionLayout, (self.name, self.layouts), specialized
+
+    def __setstate__(self, specialized: bool):
+        _restore_codecs(self, specialized)
+
+    def split(self, value: int) -> tuple[int, ...]:
+        """
+        Brief:
+            Splits the integer value of the collection's bit string into the bit string integer of each struct
+        """
+        return tuple([
+            (value >> shift) & mask for shift, mask in zip(self.struct_shifts, self.struct_masks)
+        ])
+
+    def unpack(self, value: int) -> tuple[int, ...]:
+        """
+        Brief:
+            Decodes every field of every struct, flattened in order
+        """
+        if self._flat_ops is not None:
+            return tuple([(value >> shift) & mask for shift, mask in self._flat_ops])
+        values = []
+        for layout, struct_value in zip(self.layouts, self.split(value)):
+            values.extend(layout.unpack(struct_value))
+        return tuple(values)
+
+    def pack(self, values) -> int:
+        """
+        Brief:
+            Encodes a flattened sequence of field values into the collection's bit string integer
+        """
+        packed = 0
+        idx = 0
+        for layout in self.layouts:
+            count = len(layout)
+            packed = (packed << layout.size) | layout.pack(values[idx:idx + count])
+            idx += count
+        return packed
+
+    def unpack_bytes(self, data: bytes, offset: int = 0) -> tuple[int, ...]:
+        return self.unpack(int.from_bytes(data[offset:offset + self.byte_size], 'big') >> self.pad)
+
+    def pack_bytes(self, values) -> bytes:
+        return self.pack(values).to_bytes(self.byte_size, 'big')
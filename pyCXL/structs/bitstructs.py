@@ -1,20 +1,23 @@
 # Python imports
 import operator
-from math import ceil
 
 # Package imports
-from pyCXL.structs.biterator import Biterator
+from pyCXL.structs.bitcodecs import (
+    BITS_IN_A_BYTE,
+    bytes_needed
+)
 from pyCXL.structs.bitfields import BitField
-
-BITS_IN_A_BYTE = 8
+from pyCXL.structs.bitlayouts import BitLayout
+from pyCXL.structs.bitviews import StructView
 
 
 class BitStruct:
+    _big_endian = False
 
     def __init__(self, bitfields: list[BitField], name: str):
         self.__fields = bitfields
         self.__name = name
-        self.__size = sum([field.size for field in bitfields])
+        self.__layout = self.compile_layout(bitfields, name)
         self.__idx = 0
 
     def __str__(self):
@@ -33,8 +36,7 @@ class BitStruct:
         return retStr
 
     def __int__(self):
-        binstr = self.to_bin()
-        return int(binstr, 2)
+        return self.to_int()
 
     def __index__(self):
         """
@@ -47,11 +49,7 @@ class BitStruct:
         """
         Creates a bytearray of the appropriate size. Unclear what this might be used for.
         """
-        intVal = int(self)
-        bytes_needed, rem = divmod(self.size, 8)
-        if rem:
-            bytes_needed += 1
-        return intVal.to_bytes(bytes_needed, 'big')
+        return self.__layout.encoder([field.value for field in self.fields])
 
     def __iter__(self):
         self.__idx = 0
@@ -85,12 +83,20 @@ class BitStruct:
 
     @property
     def size(self):
-        return self.__size
+        return self.__layout.size
 
     @size.setter
     def size(self, new_val):
         raise AttributeError("Cannot modify BitStruct's size")
 
+    @property
+    def layout(self):
+        return self.__layout
+
+    @layout.setter
+    def layout(self, new_val):
+        raise AttributeError("Cannot modify BitStruct's layout")
+
     @property
     def idx(self):
         return self.__idx
@@ -100,17 +106,53 @@ class BitStruct:
         raise AttributeError("Cannot modify BitStruct's index")
 
     def to_bin(self):
-        retStr = ""
-        for field in self.fields:
-            binStr = bin(field.value)[2:]
-            while len(binStr) < field.size:
-                binStr = '0' + binStr
-            retStr += binStr
-        return retStr
+        return format(int(self), f"0{self.size}b")
+
+    @classmethod
+    def compile_layout(cls, bitfields: list[BitField], name: str) -> BitLayout:
+        """
+        Layouts are compiled once per class and field signature and shared by every instance after that. FieldSpecs are
+        interned so the signature compares them by identity.
+        """
+        signature = (name, tuple([field.spec for field in bitfields]))
+        layouts = cls.__dict__.get("_layouts")
+        if layouts is None:
+            layouts = {}
+            cls._layouts = layouts
+        layout = layouts.get(signature)
+        if layout is None:
+            layout = BitLayout(
+                name=name,
+                names=[field.name for field in bitfields],
+                sizes=[field.size for field in bitfields],
+                rsvd=[field.rsvd for field in bitfields],
+                big_endian=cls._big_endian
+            )
+            layouts[signature] = layout
+        return layout
+
+    def to_int(self):
+        """
+        The integer value of the struct's bit string
+        """
+        return self.__layout.pack([field.value for field in self.fields])
 
     def to_dict(self):
         return {self.name: {field.name: field.value for field in self}}
 
+    def view(self, buffer, offset: int = 0) -> StructView:
+        """
+        A zero copy view of this struct's layout over buffer, see bitviews.StructView
+        """
+        return StructView(self.__layout, buffer, offset)
+
+    def from_int(self, value: int):
+        """
+        Populates the bit struct from the integer value of its bit string. The integer fully defines the order of the
+        bits so no endianness is required.
+        """
+        self._assign(self.__layout.unpack(value))
+
     def from_bin(self, bitstring: str = ""):
         """
         This class is meant to represent a struct of bit fields. It requires bits to populate.
@@ -123,10 +165,10 @@ class BitStruct:
         if bitstring.startswith("0b"):
             bitstring = bitstring[2:]
 
-        for field in self.fields:
-            int_val = int(bitstring[:field.size], 2)
-            field.value = int_val
-            bitstring = bitstring[field.size:]
+        if len(bitstring) < self.size:
+            raise ValueError("Not enough bins to fill the BitStruct")
+
+        self.from_int(int(bitstring[:self.size], 2))
 
     def from_bytes(self, bytestring: bytes):
         """
@@ -138,24 +180,18 @@ class BitStruct:
             )
 
         # there should only be 1 byte worth of data
-        data = Biterator(bytestring)
-        available_bins = next(data)
+        if not bytestring:
+            raise ValueError("Not enough bytes to fill the BitStruct")
 
-        for field in self.fields:
-            field.value = int(available_bins[:field.size], 2)
-            available_bins = available_bins[field.size:]
+        self._assign(self.layout.decoder(bytestring))
 
+    def _assign(self, values):
+        # values produced by the codecs are already masked to their field size
+        for field, value in zip(self.fields, values):
+            field._set(value)
 
-class LittleEndianBitStruct(BitStruct):
 
-    def to_bin(self):
-        retStr = ""
-        for field in self.fields:
-            binStr = bin(field.value)[2:]
-            while len(binStr) < field.size:
-                binStr = '0' + binStr
-            retStr += binStr
-        return retStr
+class LittleEndianBitStruct(BitStruct):
 
     def from_bin(self, bitstring: str = ""):
         """
@@ -167,59 +203,25 @@ class LittleEndianBitStruct(BitStruct):
         if len(bitstring) < self.size:
             raise ValueError("Not enough bins to fill the BitStruct")
 
-        for field in self.fields:
-            field.value = int(bitstring[:field.size], 2)
-            bitstring = bitstring[field.size:]
+        self.from_int(int(bitstring[:self.size], 2))
 
     def from_bytes(self, bytestring: bytes):
         """
         Populates the bit struct from a bytearray
         """
-        if len(bytestring) < ceil(self.size / BITS_IN_A_BYTE):
+        if len(bytestring) < bytes_needed(self.size):
             raise ValueError("Not enough bytes to fill the BitStruct")
 
-        data = Biterator(bytestring)
-        available_bins = next(data)
-
-        for field in self.fields:
-            while len(available_bins) < field.size:
-                available_bins += next(data)
-            field.value = int(available_bins[:field.size], 2)
-            available_bins = available_bins[field.size:]
+        self._assign(self.layout.decoder(bytestring))
 
 
 class BigEndianBitStruct(BitStruct):
+    """
+    The bit string of a big endian struct is read in byte sized chunks in reverse order, and the fields are read in
+    reverse order from that. See bitcodecs.big_endian_to_packed for the details.
+    """
 
-    def to_bin(self):
-        """
-        This is where I learned to hate big endian. Here's a puzzle for you:
-            Given 3 random integers and three random number of bits *at least* large enough to represent those numbers,
-            produce a stream of bits which equals those values in big endian.
-
-        For example:
-            integer:  20  number of bits: 7
-            integer:  85  number of bits: 13
-            integer:  255 number of bits: 9
-
-        See if you can do that more efficiently than what I have below, then see if you can do it more efficiently than
-        little endian above.
-        """
-        bitvals = []
-        for field in self.fields:
-            bitstr = bin(field.value)[2:]
-            while len(bitstr) < field.size:
-                bitstr = '0' + bitstr
-            bitvals.append(bitstr)
-        retstr = ""
-        line = ""
-        for val in bitvals:
-            for eachbit in val[::-1]:
-                line = eachbit + line
-                if len(line) == 8:
-                    retstr += line
-                    line = ""
-        retstr += line
-        return retstr
+    _big_endian = True
 
     def from_bin(self, bitstring: str = ""):
         """
@@ -231,43 +233,13 @@ class BigEndianBitStruct(BitStruct):
         if len(bitstring) < self.size:
             raise ValueError("Not enough bins to fill the BitStruct")
 
-        bitstring = bitstring[:self.size]
-
-        # reverse the order of the binary in byte sized chucks
-        be_order = "".join(
-                reversed([bitstring[i:i + BITS_IN_A_BYTE] for i in range(0, len(bitstring), BITS_IN_A_BYTE)])
-        )
-
-        bit_idx = 0
-        available_bins = be_order[bit_idx:bit_idx + BITS_IN_A_BYTE]
-
-        for field in reversed(self.fields):
-            while len(available_bins) < field.size:
-                bit_idx += BITS_IN_A_BYTE
-                available_bins += be_order[bit_idx:bit_idx + BITS_IN_A_BYTE]
-            field.value = int(available_bins[:field.size], 2)
-            available_bins = available_bins[field.size:]
+        self.from_int(int(bitstring[:self.size], 2))
 
     def from_bytes(self, bytestring: bytes):
         """
         Populates the bit struct from a bytearray
         """
-        if len(bytestring) < ceil(self.size / BITS_IN_A_BYTE):
+        if len(bytestring) < bytes_needed(self.size):
             raise ValueError("Not enough bytes to fill the BitStruct")
 
-        bytestring = bytestring[:ceil(self.size / BITS_IN_A_BYTE)]
-        bytestring = bytestring[::-1]
-
-        trim = (len(bytestring) * 8) % self.size
-
-        data = Biterator(bytestring)
-        available_bins = next(data)
-
-        if trim:
-            available_bins = available_bins[:len(available_bins) - trim]
-
-        for field in reversed(self.fields):
-            while len(available_bins) < field.size:
-                available_bins += next(data)
-            field.value = int(available_bins[:field.size], 2)
-            available_bins = available_bins[field.size:]
+        self._assign(self.layout.decoder(bytestring))
@@ -0,0 +1,205 @@
+"""
+Zero copy views of BitStructs and BitCollections over a shared buffer.
+
+A StructView is bound to a buffer and an offset. Reading a field decodes only the bytes holding that field straight out
+of the buffer, and writing a field patches those bytes in place. Nothing is copied into BitFields, so one view can walk a
+whole capture by rebinding it from offset to offset:
+
+    view = FlitStruct(bitstructs=[...], name="H0").view(capture)
+    for offset in range(0, len(capture), 16):
+        view.rebind(offset)
+        if view["Flit Header.Slot 0"] == 4:
+            view["M2S Header.Poison"] = 1      # written straight into capture
+
+Fields are addressed by the layout's unique keys (see BitLayout.keys and CollectionLayout.keys) or by index. Views read
+and write the same bits from_bytes reads.
+"""
+# Package imports
+from pyCXL.structs.bitcodecs import BITS_IN_A_BYTE
+
+_WINDOWS = {}
+
+
+class FieldWindow:
+    """
+    Brief:
+        Where one field of a layout sits in the layout's bytes
+
+    Attributes:
+        start:      index of the first byte holding the field
+        stop:       index after the last byte holding the field
+        size:       field size in bits
+        segments:   (source shift, width, destination shift) runs relative to the integer value of bytes start to stop
+    """
+    __slots__ = ("start", "stop", "size", "segments")
+
+    def __init__(self, start: int, stop: int, size: int, segments):
+        self.start = start
+        self.stop = stop
+        self.size = size
+        self.segments = segments
+
+    def read(self, buffer, offset: int) -> int:
+        window = int.from_bytes(buffer[offset + self.start:offset + self.stop], 'big')
+        value = 0
+        for shift, width, dst in self.segments:
+            value |= ((window >> shift) & ((1 << width) - 1)) << dst
+        return value
+
+    def write(self, buffer, offset: int, value: int):
+        start = offset + self.start
+        stop = offset + self.stop
+        window = int.from_bytes(buffer[start:stop], 'big')
+        for shift, width, dst in self.segments:
+            mask = (1 << width) - 1
+            window = (window & ~(mask << shift)) | (((value >> dst) & mask) << shift)
+        buffer[start:stop] = window.to_bytes(stop - start, 'big')
+
+
+def field_windows(layout) -> tuple[FieldWindow, ...]:
+    """
+    Brief:
+        The FieldWindow of every field of a BitLayout or CollectionLayout, computed once per layout
+    """
+    windows = _WINDOWS.get(layout)
+    if windows is None:
+        windows = []
+        for size, segments in zip(layout.sizes, layout.segments):
+            # bit positions within the integer value of the layout's bytes
+            lo = min(src for src, _, _ in segments) + layout.pad
+            hi = max(src + width for src, width, _ in segments) + layout.pad
+            base = (lo // BITS_IN_A_BYTE) * BITS_IN_A_BYTE
+            windows.append(FieldWindow(
+                start=layout.byte_size - 1 - (hi - 1) // BITS_IN_A_BYTE,
+                stop=layout.byte_size - lo // BITS_IN_A_BYTE,
+                size=size,
+                segments=tuple((src + layout.pad - base, width, dst) for src, width, dst in segments)
+            ))
+        windows = _WINDOWS[layout] = tuple(windows)
+    return windows
+
+
+class StructView:
+    """
+    Brief:
+        A BitStruct or BitCollection bound to a buffer instead of holding its own values
+
+    Params:
+        layout: a BitLayout or CollectionLayout, or a BitStruct/BitCollection whose layout to use
+        buffer: bytes, bytearray, memoryview, mmap or anything else supporting the buffer protocol. Writing fields
+                requires a writable buffer
+        offset: byte offset of the struct within the buffer
+    """
+    __slots__ = ("__layout", "__windows", "__index", "__buffer", "__offset")
+
+    def __init__(self, layout, buffer, offset: int = 0):
+        self.__layout = getattr(layout, "layout", layout)
+        self.__windows = field_windows(self.__layout)
+        self.__index = {key: idx for idx, key in enumerate(self.__layout.keys)}
+        self.__buffer = None
+        self.__offset = 0
+        self.bind(buffer, offset)
+
+    def __repr__(self):
+        return f"<StructView {self.__layout.name} @ {self.__offset}>"
+
+    def __len__(self):
+        return len(self.__windows)
+
+    def __iter__(self):
+        return iter(self.__layout.keys)
+
+    def __contains__(self, key):
+        return key in self.__index
+
+    def __getitem__(self, item):
+        return self.__window(item).read(self.__buffer, self.__offset)
+
+    def __setitem__(self, item, value: int):
+        window = self.__window(item)
+        if self.__buffer.readonly:
+            raise TypeError("Cannot modify a StructView of a read only buffer")
+        if value < 0 or value.bit_length() > window.size:
+            raise ValueError(f"{value} is too large for the field size: {window.size} bits")
+        window.write(self.__buffer, self.__offset, value)
+
+    def __int__(self):
+        return self.__layout.pack(self.values())
+
+    def __bytes__(self):
+        return bytes(self.__buffer[self.__offset:self.__offset + self.__layout.byte_size])
+
+    @property
+    def layout(self):
+        return self.__layout
+
+    @layout.setter
+    def layout(self, new_value):
+        raise AttributeError("Cannot modify StructView's layout")
+
+    @property
+    def buffer(self):
+        return self.__buffer
+
+    @buffer.setter
+    def buffer(self, new_value):
+        raise AttributeError("Cannot modify StructView's buffer, use bind")
+
+    @property
+    def offset(self):
+        return self.__offset
+
+    @offset.setter
+    def offset(self, new_value):
+        raise AttributeError("Cannot modify StructView's offset, use rebind")
+
+    def __window(self, item) -> FieldWindow:
+        if isinstance(item, str):
+            try:
+                item = self.__index[item]
+            except KeyError:
+                raise KeyError(f"{self.__layout.name} has no field {item}") from None
+        return self.__windows[item]
+
+    def bind(self, buffer, offset: int = 0):
+        """
+        Brief:
+            Binds the view to a new buffer
+
+        Returns:
+            the view, for chaining
+        """
+        view = memoryview(buffer)
+        if view.ndim != 1 or view.itemsize != 1:
+            view = view.cast('B')
+        self.__buffer = view
+        return self.rebind(offset)
+
+    def rebind(self, offset: int):
+        """
+        Brief:
+            Moves the view to another offset of the same buffer
+
+        Returns:
+            the view, for chaining
+        """
+        if offset < 0 or offset + self.__layout.byte_size > len(self.__buffer):
+            raise ValueError("Not enough bytes to fill the StructView")
+        self.__offset = offset
+        return self
+
+    def keys(self) -> tuple[str, ...]:
+        return self.__layout.keys
+
+    def values(self) -> tuple[int, ...]:
+        """
+        Brief:
+            Decodes every field at once using the layout's decoder
+        """
+        return self.__layout.decoder(self.__buffer, self.__offset)
+
+    def items(self):
+        return zip(self.__layout.keys, self.values())
+
+    def to_dict(self) -> dict:
+        return dict(self.items())
@@ -0,0 +1,182 @@
+"""
+CRC-16 of 528 bit CXL.cache/CXL.mem protocol flits.
+
+The last 16 bits of a protocol flit are a CRC over its 512 bits of slot data, using the CXL link layer polynomial
+0x1F053. The CRC is computed most significant bit first over the 64 data bytes in wire order, starting from
+CRC_SEED, and stored big endian in the last 2 bytes of the flit.
+
+    crc16(flit[:64])                    # -> int
+    check_flit(flit)                    # -> bool
+    append_crc(data)                    # -> the 64 data bytes followed by their CRC
+    encode_flit(header, g1, g2, g3)     # -> 4 FlitStructs encoded as a whole flit, CRC included
+    verify_flits(capture)               # -> indices of the flits whose CRC does not match
+
+crc16 uses slice by 8 lookup tables, handling 8 bytes per step with 8 table lookups. verify_flits checks a whole
+buffer of flits at once with NumPy when it is installed, one table lookup per data byte across every flit.
+"""
+# Python imports
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, verify_flits falls back to checking one flit at a time
+    np = None
+
+if np is not None:
+    from pyCXL.structs.bitbatch import as_records
+
+CRC_POLYNOMIAL = 0x1F053
+CRC_SEED = 0xFFFF
+CRC_BITS = 16
+CRC_BYTES = CRC_BITS // 8
+FLIT_DATA_BYTES = 64
+FLIT_BYTES = FLIT_DATA_BYTES + CRC_BYTES
+SLOT_BYTES = 16
+GENERIC_SLOTS = FLIT_DATA_BYTES // SLOT_BYTES - 1
+
+_CRC_MASK = (1 << CRC_BITS) - 1
+_SLICES = 8
+
+
+def _byte_table(polynomial: int) -> array:
+    """
+    Brief:
+        CRC of every single byte value shifted through the register from a zero CRC
+    """
+    low = polynomial & _CRC_MASK
+    table = array("H")
+    for byte in range(256):
+        crc = byte << (CRC_BITS - 8)
+        for _ in range(8):
+            crc = ((crc << 1) ^ low if crc & 0x8000 else crc << 1) & _CRC_MASK
+        table.append(crc)
+    return table
+
+
+def crc_tables(polynomial: int = CRC_POLYNOMIAL, slices: int = _SLICES) -> tuple:
+    """
+    Brief:
+        The slice by N lookup tables of a polynomial. tables[k][byte] is the CRC of byte followed by k zero bytes.
+    """
+    tables = [_byte_table(polynomial)]
+    first = tables[0]
+    for _ in range(1, slices):
+        previous = tables[-1]
+        tables.append(array("H", [((crc << 8) & _CRC_MASK) ^ first[crc >> 8] for crc in previous]))
+    return tuple(tables)
+
+
+CRC_TABLES = crc_tables()
+
+
+def crc16(data, crc: int = CRC_SEED) -> int:
+    """
+    Brief:
+        CRC-16 of a bytes-like object, continuing from crc
+
+    Params:
+        data:   bytes, bytearray or memoryview
+        crc:    the CRC of the preceding data, CRC_SEED to start a new CRC
+    """
+    t0, t1, t2, t3, t4, t5, t6, t7 = CRC_TABLES
+    length = len(data)
+    whole = length - length % _SLICES
+    for idx in range(0, whole, _SLICES):
+        d0, d1, d2, d3, d4, d5, d6, d7 = data[idx:idx + _SLICES]
+        crc ^= (d0 << 8) | d1
+        crc = (t7[crc >> 8] ^ t6[crc & 0xFF] ^ t5[d2] ^ t4[d3] ^ t3[d4] ^ t2[d5] ^ t1[d6] ^ t0[d7])
+    for byte in data[whole:]:
+        crc = ((crc << 8) & _CRC_MASK) ^ t0[(crc >> 8) ^ byte]
+    return crc
+
+
+def flit_crc(flit, offset: int = 0) -> int:
+    """
+    Brief:
+        The CRC of the 64 data bytes of the flit at offset
+    """
+    if len(flit) - offset < FLIT_DATA_BYTES:
+        raise ValueError("Not enough bytes to fill the flit")
+    return crc16(memoryview(flit)[offset:offset + FLIT_DATA_BYTES])
+
+
+def append_crc(data) -> bytes:
+    """
+    Brief:
+        The 64 data bytes of a flit followed by their CRC
+    """
+    if len(data) != FLIT_DATA_BYTES:
+        raise ValueError(f"A flit holds {FLIT_DATA_BYTES} data bytes, was {len(data)}")
+    return bytes(data) + crc16(data).to_bytes(CRC_BYTES, 'big')
+
+
+def encode_flit(header, *generic) -> bytes:
+    """
+    Brief:
+        Encodes a header slot and 3 generic slots as one 66 byte flit, their CRC included
+
+    Params:
+        header:     the header slot, a FlitStruct or its 16 bytes
+        generic:    the 3 generic slots, FlitStructs or their 16 bytes each
+    """
+    if len(generic) != GENERIC_SLOTS:
+        raise ValueError(f"A flit is a header slot and {GENERIC_SLOTS} generic slots, was given {len(generic)}")
+    slots = [bytes(slot) for slot in (header, *generic)]
+    if any(len(slot) != SLOT_BYTES for slot in slots):
+        raise ValueError(f"Flit slots are {SLOT_BYTES} bytes, were {[len(slot) for slot in slots]}")
+    return append_crc(b"".join(slots))
+
+
+def check_flit(flit, offset: int = 0) -> bool:
+    """
+    Brief:
+        Whether the CRC stored in the flit at offset matches its data
+    """
+    if len(flit) - offset < FLIT_BYTES:
+        raise ValueError("Not enough bytes to fill the flit")
+    stored = int.from_bytes(flit[offset + FLIT_DATA_BYTES:offset + FLIT_BYTES], 'big')
+    return flit_crc(flit, offset) == stored
+
+
+def verify_flit(flit, offset: int = 0):
+    """
+    Brief:
+        Raises ValueError if the CRC stored in the flit at offset does not match its data
+    """
+    if len(flit) - offset < FLIT_BYTES:
+        raise ValueError("Not enough bytes to fill the flit")
+    expected = flit_crc(flit, offset)
+    stored = int.from_bytes(flit[offset + FLIT_DATA_BYTES:offset + FLIT_BYTES], 'big')
+    if stored != expected:
+        raise ValueError(f"Flit CRC mismatch: expected {expected:#06x}, was {stored:#06x}")
+
+
+def verify_flits(buffer, stride: int = FLIT_BYTES, offset: int = 0) -> list[int]:
+    """
+    Brief:
+        Checks the CRC of every flit in a buffer of back to back flits
+
+    Params:
+        buffer: bytes, bytearray, memoryview or mmap holding the flits
+        stride: bytes between the starts of consecutive flits, e.g. a larger stride for captures with per flit metadata
+        offset: byte offset of the first flit
+
+    Returns:
+        the indices of the flits whose stored CRC does not match their data, in ascending order
+    """
+    if np is None:
+        available = len(buffer) - offset
+        if stride < FLIT_BYTES:
+            raise ValueError(f"Stride of {stride} bytes is smaller than the {FLIT_BYTES} byte record")
+        if stride == FLIT_BYTES and available % stride:
+            raise ValueError(f"Buffer does not hold a whole number of {stride} byte records")
+        count = 0 if available < FLIT_BYTES else (available - FLIT_BYTES) // stride + 1
+        return [idx for idx in range(count) if not check_flit(buffer, offset + idx * stride)]
+
+    records = as_records(buffer, FLIT_BYTES, stride=stride, offset=offset)
+    table = np.frombuffer(CRC_TABLES[0], dtype=np.uint16)
+    crcs = np.full(len(records), CRC_SEED, dtype=np.uint16)
+    for idx in range(FLIT_DATA_BYTES):
+        crcs = (crcs << 8) ^ table[(crcs >> 8) ^ records[:, idx]]
+    stored = (records[:, FLIT_DATA_BYTES].astype(np.uint16) << 8) | records[:, FLIT_DATA_BYTES + 1]
+    return np.flatnonzero(crcs != stored).tolist()
@@ -0,0 +1,263 @@
+"""
+Decoding of whole 528 bit CXL.cache/CXL.mem protocol flits.
+
+A protocol flit is four 16 byte slots followed by a 16 bit CRC. Slot 0 is a header slot (H0 - H6) and starts with the
+FlitHeader, slots 1 to 3 are generic slots (G0 - G6). The "Slot 0" to "Slot 3" fields of the FlitHeader name the format
+of each slot.
+
+Every slot format is compiled once at import into a SlotFormat holding the shifts and masks of its fields for each
+position in the flit, and the SlotFormats are placed into dispatch tables indexed by direction and the 3 bit slot code.
+Parsing a flit is a single int.from_bytes followed by four table lookups.
+"""
+# Package imports
+from pyCXL.structs import H2D_M2S_formats, D2H_S2M_formats
+from pyCXL.structs.bitcollections import FlitStruct
+from pyCXL.structs.flitsubstructures import FlitHeader
+
+SLOT_BITS = 128
+SLOTS_PER_FLIT = 4
+CRC_BITS = 16
+FLIT_BITS = SLOT_BITS * SLOTS_PER_FLIT + CRC_BITS
+FLIT_BYTES = FLIT_BITS // 8
+
+# directions double as the index into the dispatch tables
+HOST_TO_DEVICE = 0      # H2D CXL.cache and M2S CXL.mem
+DEVICE_TO_HOST = 1      # D2H CXL.cache and S2M CXL.mem
+
+DIRECTIONS = {
+    HOST_TO_DEVICE: "H2D/M2S",
+    DEVICE_TO_HOST: "D2H/S2M"
+}
+
+_SLOT_CODE_MASK = 0x7
+
+
+def _header_shift(field_name: str) -> int:
+    layout = FlitHeader().layout
+    return FLIT_BITS - layout.size + layout.shifts[layout.names.index(field_name)]
+
+
+# shifts of the FlitHeader fields within the integer value of a whole flit
+TYPE_SHIFT = _header_shift("Type")
+SLOT_SHIFTS = tuple(_header_shift(f"Slot {slot}") for slot in range(SLOTS_PER_FLIT))
+
+
+def slot_shift(position: int) -> int:
+    """
+    Brief:
+        The shift of the slot at position (0 - 3) within the integer value of a whole flit
+    """
+    return FLIT_BITS - SLOT_BITS * (position + 1)
+
+
+class SlotFormat:
+    """
+    Brief:
+        One compiled slot format
+
+    Attributes:
+        name:           slot format name, e.g. "H0" or "G3"
+        code:           the 3 bit code used in the FlitHeader
+        direction:      HOST_TO_DEVICE or DEVICE_TO_HOST
+        header:         True for header (H) slots
+        slot_format:    the list of struct factories from the *_formats module
+        layout:         CollectionLayout of the slot
+        keys:           unique "struct.field" names of the decoded values
+        size:           total width of the slot in bits
+        offsets:        bit offset of every field from the start of the slot, in the order of keys
+        ops:            per slot position, the (shift, mask) of every field within the whole flit integer
+    """
+    __slots__ = ("name", "code", "direction", "header", "slot_format", "layout", "keys", "size", "offsets", "ops")
+
+    def __init__(self, name: str, code: int, direction: int, header: bool, slot_format: list):
+        self.name = name
+        self.code = code
+        self.direction = direction
+        self.header = header
+        self.slot_format = slot_format
+        self.layout = self.build().layout
+        self.keys = self.layout.keys
+        self.size = self.layout.size
+        self.offsets = tuple(
+            self.size - segments[0][0] - size for segments, size in zip(self.layout.segments, self.layout.sizes)
+        )
+
+        # slot formats are built from BitStructs without big endian ordering, so every field is a single run of bits
+        ops = []
+        for position in range(SLOTS_PER_FLIT):
+            base = slot_shift(position)
+            ops.append(tuple(
+                (base + segments[0][0], (1 << size) - 1)
+                for segments, size in zip(self.layout.segments, self.layout.sizes)
+            ))
+        self.ops = tuple(ops)
+
+    def __repr__(self):
+        return f"<SlotFormat {DIRECTIONS[self.direction]} {self.name}>"
+
+    def build(self) -> FlitStruct:
+        """
+        Brief:
+            Creates a new FlitStruct for the slot format
+        """
+        return FlitStruct(
+            bitstructs=[struct() for struct in self.slot_format],
+            name=f"{DIRECTIONS[self.direction]} {self.name}"
+        )
+
+    def decode(self, value: int, position: int) -> tuple[int, ...]:
+        """
+        Brief:
+            Decodes this slot format's fields from the integer value of a whole flit
+        """
+        return tuple([(value >> shift) & mask for shift, mask in self.ops[position]])
+
+
+def _compile_table(direction: int, prefix: str, slot_formats: list) -> tuple:
+    return tuple(
+        None if slot_format is None else SlotFormat(
+            name=f"{prefix}{code}", code=code, direction=direction, header=prefix == "H", slot_format=slot_format
+        )
+        for code, slot_format in enumerate(slot_formats)
+    )
+
+
+# indexed [direction][slot code]
+H_SLOT_TABLE = (
+    _compile_table(HOST_TO_DEVICE, "H", H2D_M2S_formats.H_slot_formats),
+    _compile_table(DEVICE_TO_HOST, "H", D2H_S2M_formats.H_slot_formats),
+)
+G_SLOT_TABLE = (
+    _compile_table(HOST_TO_DEVICE, "G", H2D_M2S_formats.G_slot_formats),
+    _compile_table(DEVICE_TO_HOST, "G", D2H_S2M_formats.G_slot_formats),
+)
+
+
+class ParsedSlots:
+    """
+    Brief:
+        Field lookup for classes holding a flit's 4 (SlotFormat, field values) pairs in a slots attribute
+    """
+    __slots__ = ()
+
+    def __contains__(self, key: str) -> bool:
+        return any(key in slot_format.keys for slot_format, _ in self.slots)
+
+    def values(self, key: str) -> list[int]:
+        """
+        Brief:
+            Every value of a field across the 4 slots. A flit may carry the same struct in more than one slot.
+        """
+        found = []
+        for slot_format, values in self.slots:
+            keys = slot_format.keys
+            if key in keys:
+                found.append(values[keys.index(key)])
+        return found
+
+    def get(self, key: str, default=None):
+        """
+        Brief:
+            The value of a field in the first slot holding it
+        """
+        for slot_format, values in self.slots:
+            keys = slot_format.keys
+            if key in keys:
+                return values[keys.index(key)]
+        return default
+
+
+class FlitParser:
+    """
+    Brief:
+        Parses 528 bit protocol flits travelling in one direction
+
+    Params:
+        direction: HOST_TO_DEVICE or DEVICE_TO_HOST
+    """
+
+    def __init__(self, direction: int):
+        if direction not in DIRECTIONS:
+            raise ValueError(f"Unknown flit direction: {direction}")
+        self.__direction = direction
+        self.__h_slots = H_SLOT_TABLE[direction]
+        self.__g_slots = G_SLOT_TABLE[direction]
+
+    @property
+    def direction(self):
+        return self.__direction
+
+    @direction.setter
+    def direction(self, new_value):
+        raise AttributeError("Cannot modify FlitParser's direction")
+
+    def slot_formats(self, flit: bytes, offset: int = 0):
+        """
+        Brief:
+            Looks up the SlotFormat of each slot without decoding any fields
+
+        Returns:
+            a tuple of 4 SlotFormats, or None for control flits
+        """
+        return self._lookup(self._read(flit, offset))
+
+    def parse(self, flit: bytes, offset: int = 0):
+        """
+        Brief:
+            Decodes every slot of a protocol flit in one pass
+
+        Params:
+            flit:   a buffer holding at least 66 bytes from offset
+            offset: byte offset of the flit within the buffer
+
+        Returns:
+            a tuple of 4 (SlotFormat, field values) pairs, or None for control flits
+        """
+        return self._decode(self._read(flit, offset))
+
+    def _decode(self, value: int):
+        formats = self._lookup(value)
+        if formats is None:
+            return None
+        h_slot, g_slot1, g_slot2, g_slot3 = formats
+        return (
+            (h_slot, tuple([(value >> shift) & mask for shift, mask in h_slot.ops[0]])),
+            (g_slot1, tuple([(value >> shift) & mask for shift, mask in g_slot1.ops[1]])),
+            (g_slot2, tuple([(value >> shift) & mask for shift, mask in g_slot2.ops[2]])),
+            (g_slot3, tuple([(value >> shift) & mask for shift, mask in g_slot3.ops[3]])),
+        )
+
+    def parse_structs(self, flit: bytes, offset: int = 0):
+        """
+        Brief:
+            Decodes a protocol flit into a FlitStruct per slot
+
+        Returns:
+            a list of 4 FlitStructs, or None for control flits
+        """
+        parsed = self.parse(flit, offset)
+        if parsed is None:
+            return None
+        structs = []
+        for slot_format, values in parsed:
+            slot = slot_format.build()
+            slot._assign(values)
+            structs.append(slot)
+        return structs
+
+    @staticmethod
+    def _read(flit: bytes, offset: int) -> int:
+        if len(flit) - offset < FLIT_BYTES:
+            raise ValueError("Not enough bytes to fill the flit")
+        return int.from_bytes(flit[offset:offset + FLIT_BYTES], 'big')
+
+    def _lookup(self, value: int):
+        if (value >> TYPE_SHIFT) & 1:
+            return None
+        h_slot = self.__h_slots[(value >> SLOT_SHIFTS[0]) & _SLOT_CODE_MASK]
+        g_slot1 = self.__g_slots[(value >> SLOT_SHIFTS[1]) & _SLOT_CODE_MASK]
+        g_slot2 = self.__g_slots[(value >> SLOT_SHIFTS[2]) & _SLOT_CODE_MASK]
+        g_slot3 = self.__g_slots[(value >> SLOT_SHIFTS[3]) & _SLOT_CODE_MASK]
+        if h_slot is None or g_slot1 is None or g_slot2 is None or g_slot3 is None:
+            raise ValueError(f"Reserved slot format in {DIRECTIONS[self.__direction]} flit header")
+        return h_slot, g_slot1, g_slot2, g_slot3
@@ -21,10 +21,9 @@ From CXL 2.0:
     or deadlocks may occur. They may be blocked temporarily for link layer credits, but
     must not require any other transaction to complete to free the credits.
 """
-from bitstructs import (
-    BitField,
-    BitStruct
-)
+from pyCXL.structs.bitfields import BitField
+from pyCXL.structs.bitstructs import BitStruct
+
 # used as the struct name
 FLIT_HEAD       = "Flit Header"
 
@@ -44,16 +43,44 @@ S2M_DRS         = "S2M_DRS"
 
 DEVLOAD         = "Devload"
 
+RSVD            = "RSVD"
+DATA            = "DATA"
+BYTE_ENABLE     = "ByteEnable"
+MAC_SLOT        = "MAC"
+
+# enums are shared by every field using them rather than rebuilt per field
+FLIT_TYPE_ENUMS = {
+    0: "Protocol",
+    1: "Control"
+}
+
+CHUNK_VALID_ENUMS = {
+    0: "Lower 32B",
+    1: "Upper 32B"
+}
+
+POISON_ENUMS = {
+    1: "Data is corrupted"
+}
+
+RSP_PRE_ENUMS = {
+    0: "Host Cache Miss to Local CPU socket memory",
+    1: "Host Cache Hit",
+    2: "Host Cache Miss to Remote CPU socket memory",
+}
+
+GO_ERR_ENUMS = {
+    1: "Data is result of an error condition"
+}
+
 
 # ============================== Meta Fields ==============================
 class FlitType(BitField):
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(
-            size=1, name="Type", enums={
-                0: "Protocol",
-                1: "Control"
-            }
+            size=1, name="Type", enums=FLIT_TYPE_ENUMS
         )
 
 
@@ -61,6 +88,7 @@ class RsvdField(BitField):
     """
     Rsvd fields of a given size
     """
+    __slots__ = ()
 
     def __init__(self, size:int):
         super().__init__(
@@ -69,31 +97,29 @@ class RsvdField(BitField):
 
 
 class ChunkValid(BitField):
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(
             size=1,
             name="Chunk Valid",
-            enums={
-                0: "Lower 32B",
-                1: "Upper 32B"
-            }
+            enums=CHUNK_VALID_ENUMS
         )
 
 
 class Poison(BitField):
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(
             size=1,
             name="Poison",
-            enums={
-                    1: "Data is corrupted"
-                }
+            enums=POISON_ENUMS
         )
 
 
 class LogicalDeviceIdentifier(BitField):
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(size=4, name="Logical Device Identifier")
@@ -115,8 +141,9 @@ class FlitHeader(BitStruct):
                 BitField(size=3, name="Slot 1"),
                 BitField(size=3, name="Slot 2"),
                 BitField(size=3, name="Slot 3"),
-                RsvdField(size=1),
-                BitField(size=8, name="Response Credit"),
+                RsvdField(size=3),
+                BitField(size=4, name="Response Credit"),
+                BitField(size=4, name="Request Credit"),
                 BitField(size=4, name="Data Credit")
             ],
             name=FLIT_HEAD
@@ -132,7 +159,8 @@ class H2DRequest(BitStruct):
                 BitField(size=1,    name="Valid"),
                 BitField(size=3,    name="OpCode"),
                 BitField(size=46,   name="Address"),
-                RsvdField(size=1)
+                BitField(size=12,   name="Unique Queue ID"),
+                RsvdField(size=2)
             ],
             name=H2D_REQ
         )
@@ -147,12 +175,9 @@ class H2DResponse(BitStruct):
                 BitField(size=1,    name="Valid"),
                 BitField(size=4,    name="OpCode"),
                 BitField(size=12,   name="Response Data"),
-                BitField(size=1,    name="RSP_PRE", enums={
-                    0: "Host Cache Miss to Local CPU socket memory",
-                    1: "Host Cache Hit",
-                    2: "Host Cache Miss to Remote CPU socket memory",
-                }),
-                BitField(size=12,   name="Command Queue ID")
+                BitField(size=2,    name="RSP_PRE", enums=RSP_PRE_ENUMS),
+                BitField(size=12,   name="Command Queue ID"),
+                RsvdField(size=1)
             ],
             name=H2D_RESP
         )
@@ -168,9 +193,7 @@ class H2DDataHeader(BitStruct):
                 BitField(size=12,   name="Command Queue ID"),
                 ChunkValid(),
                 Poison(),
-                BitField(size=1,    name="GO-Err", enums={
-                    1: "Data is result of an error condition"
-                }),
+                BitField(size=1,    name="GO-Err", enums=GO_ERR_ENUMS),
                 RsvdField(size=8)
             ],
             name=H2D_HEAD
@@ -305,25 +328,86 @@ class S2MNDR_MinusDevload(BitStruct):
         )
 
 
-def S2M_NDR_devload_array_fields():
-    return [
-        ("Devload",         2)
-    ]
+class S2MNDR_Devload(BitStruct):
+    # the Devload field of an S2MNDR_MinusDevload, placed after both NDRs in the slot
 
+    def __init__(self):
+        super().__init__(
+            bitfields=[
+                BitField(size=2,    name="Devload")
+            ],
+            name=DEVLOAD
+        )
 
-# yellow in the spec
-def S2M_DRS_fields():
-    return [
-        ("Valid",           1),
-        ("MemOp",           3),
-        ("MetaField",       2),
-        ("MetaValue",       2),
-        ("Tag",            16),
-        ("Poison",          1),
-        ("LogicalDeviceID", 4),
-        ("DevLoad",         2),
-        ("RSVD",            9)
-    ]
+
+class S2MDRS(BitStruct):
+    # yellow in the spec
+
+    def __init__(self):
+        super().__init__(
+            bitfields=[
+                BitField(size=1,    name="Valid"),
+                BitField(size=3,    name="MemOpcode"),
+                BitField(size=2,    name="MetaField"),
+                BitField(size=2,    name="MetaValue"),
+                BitField(size=16,   name="Tag"),
+                Poison(),
+                LogicalDeviceIdentifier(),
+                BitField(size=2,    name="Devload"),
+                RsvdField(size=9)
+            ],
+            name=S2M_DRS
+        )
+
+
+class RsvdStruct(BitStruct):
+    """
+    Reserved bits padding out a slot format
+    """
+
+    def __init__(self, size: int):
+        super().__init__(
+            bitfields=[
+                RsvdField(size=size)
+            ],
+            name=RSVD
+        )
+
+
+class Data(BitStruct):
+    # a 16 byte chunk of a 64 byte cacheline
+
+    def __init__(self):
+        super().__init__(
+            bitfields=[
+                BitField(size=128,  name="Data")
+            ],
+            name=DATA
+        )
+
+
+class ByteEnable(BitStruct):
+
+    def __init__(self):
+        super().__init__(
+            bitfields=[
+                BitField(size=64,   name="Byte Enable"),
+                RsvdField(size=64)
+            ],
+            name=BYTE_ENABLE
+        )
+
+
+class MAC(BitStruct):
+    # IDE message authentication code
+
+    def __init__(self):
+        super().__init__(
+            bitfields=[
+                BitField(size=96,   name="MAC")
+            ],
+            name=MAC_SLOT
+        )
 
 
 # light blue in spec
@@ -0,0 +1,375 @@
+"""
+Struct of arrays storage for many decoded records of one layout.
+
+A list of BitCollections spends hundreds of bytes of Python objects on every field of every flit. A FlitTable instead
+holds one array per field, NumPy arrays when NumPy is installed and array.array columns otherwise:
+
+    table = FlitTable.from_bytes(capture, G_SLOT_TABLE[HOST_TO_DEVICE][4].layout)
+    len(table)                                  # number of records
+    table["M2S Request.MemOpcode"]              # a whole column
+    table[10]["M2S Request.Address"]            # one value, read from the column on access
+    reads = table[table["M2S Request.MemOpcode"] == 0]      # boolean mask filtering (NumPy)
+    reads = table[table.where("M2S Request.MemOpcode", 0)]  # the same with either backend
+    reads = table.filter(lambda row: row["M2S Request.MemOpcode"] == 0)
+
+Fields wider than 64 bits are stored as fixed width byte columns with NumPy (see bitbatch.field_dtype) and as lists of
+ints without it. Row accessors always return ints.
+"""
+# Python imports
+from array import array
+from itertools import compress
+
+# Package imports
+from pyCXL.structs.bitcodecs import bytes_needed
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, tables fall back to array.array columns
+    np = None
+
+if np is not None:
+    from pyCXL.structs.bitbatch import decode_batch, encode_batch, field_dtype
+
+NUMPY = "numpy"
+ARRAY = "array"
+
+_TYPECODES = "BHILQ"
+
+
+def _typecode(size: int):
+    """
+    Brief:
+        The smallest unsigned array.array typecode holding size bits, None for fields wider than 64 bits
+    """
+    for typecode in _TYPECODES:
+        if array(typecode).itemsize * 8 >= size:
+            return typecode
+    return None
+
+
+def _columns(layout, count: int = 0) -> list:
+    """
+    Brief:
+        A column per field of the layout for the array backend to be filled in place: array.array columns of count
+        zeroes, lists for fields wider than 64 bits
+    """
+    columns = []
+    for size in layout.sizes:
+        typecode = _typecode(size)
+        if typecode is None:
+            columns.append([0] * count)
+        else:
+            columns.append(array(typecode, bytes(array(typecode).itemsize * count)))
+    return columns
+
+
+def _default_backend(backend):
+    if backend is None:
+        return NUMPY if np is not None else ARRAY
+    if backend == NUMPY and np is None:
+        raise ImportError("The numpy FlitTable backend requires NumPy")
+    if backend not in (NUMPY, ARRAY):
+        raise ValueError(f"Unknown FlitTable backend: {backend}")
+    return backend
+
+
+class FlitRow:
+    """
+    Brief:
+        One record of a FlitTable. Values are read from the table's columns on access, nothing is copied.
+    """
+    __slots__ = ("__table", "__index")
+
+    def __init__(self, table, index: int):
+        self.__table = table
+        self.__index = index
+
+    def __repr__(self):
+        return f"<FlitRow {self.__table.layout.name}[{self.__index}]>"
+
+    def __getitem__(self, key: str) -> int:
+        return self.__table._value(key, self.__index)
+
+    def __iter__(self):
+        return iter(self.__table.keys)
+
+    def __len__(self):
+        return len(self.__table.keys)
+
+    @property
+    def index(self):
+        return self.__index
+
+    @index.setter
+    def index(self, new_value):
+        raise AttributeError("Cannot modify FlitRow's index")
+
+    def keys(self) -> tuple[str, ...]:
+        return self.__table.keys
+
+    def values(self) -> tuple[int, ...]:
+        return tuple([self.__table._value(key, self.__index) for key in self.__table.keys])
+
+    def to_dict(self) -> dict:
+        return dict(zip(self.__table.keys, self.values()))
+
+    def populate(self, collection):
+        """
+        Brief:
+            Fills a BitStruct or BitCollection of the table's layout with this row's values
+        """
+        if collection.layout is not self.__table.layout:
+            raise ValueError(f"{collection.name} does not use the {self.__table.layout.name} layout")
+        collection._assign(self.values())
+        return collection
+
+
+class FlitTable:
+    """
+    Brief:
+        Many records of one layout stored as one array per field
+
+    Params:
+        layout:     a BitLayout or CollectionLayout, or a BitStruct/BitCollection whose layout to use
+        columns:    a dict from every one of the layout's keys to a column of equal length
+        backend:    "numpy" or "array". Chosen from the installed packages if not given
+    """
+
+    def __init__(self, layout, columns: dict, backend: str = None):
+        self.__layout = getattr(layout, "layout", layout)
+        self.__backend = _default_backend(backend)
+        missing = set(self.__layout.keys).difference(columns)
+        if missing:
+            raise ValueError(f"Missing columns for {self.__layout.name}: {sorted(missing)}")
+        self.__columns = {key: self.__column(key, size, columns[key])
+                          for key, size in zip(self.__layout.keys, self.__layout.sizes)}
+        lengths = {len(column) for column in self.__columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("FlitTable columns must all be the same length")
+        self.__length = lengths.pop() if lengths else 0
+
+    def __column(self, key: str, size: int, values):
+        if self.__backend == NUMPY:
+            dtype = field_dtype(size)
+            if dtype.kind == "V" and not (isinstance(values, np.ndarray) and values.dtype == dtype):
+                # wide fields given as ints are converted to their big endian bytes
+                nbytes = bytes_needed(size)
+                return np.frombuffer(b"".join(int(value).to_bytes(nbytes, 'big') for value in values), dtype=dtype)
+            return np.asarray(values, dtype=dtype)
+        typecode = _typecode(size)
+        if typecode is None:
+            if np is not None and isinstance(values, np.ndarray) and values.dtype.kind == "V":
+                return [int.from_bytes(value.tobytes(), 'big') for value in values]
+            return list(values)
+        if isinstance(values, array) and values.typecode == typecode:
+            return values
+        return array(typecode, [int(value) for value in values])
+
+    def __len__(self):
+        return self.__length
+
+    def __repr__(self):
+        return f"<FlitTable {self.__layout.name}: {self.__length} rows, {self.__backend}>"
+
+    def __iter__(self):
+        for index in range(self.__length):
+            yield FlitRow(self, index)
+
+    def __getitem__(self, item):
+        """
+        Brief:
+            table["key"] is a column, table[i] a FlitRow, table[a:b] and table[mask] new tables
+        """
+        if isinstance(item, str):
+            return self.__columns[item]
+        if isinstance(item, slice):
+            return self.__derive({key: column[item] for key, column in self.__columns.items()})
+        if isinstance(item, int) or (np is not None and isinstance(item, np.integer)):
+            index = int(item)
+            if index < 0:
+                index += self.__length
+            if not 0 <= index < self.__length:
+                raise IndexError("FlitTable index out of range")
+            return FlitRow(self, index)
+        return self.mask(item)
+
+    @property
+    def layout(self):
+        return self.__layout
+
+    @layout.setter
+    def layout(self, new_value):
+        raise AttributeError("Cannot modify FlitTable's layout")
+
+    @property
+    def backend(self):
+        return self.__backend
+
+    @backend.setter
+    def backend(self, new_value):
+        raise AttributeError("Cannot modify FlitTable's backend")
+
+    @property
+    def keys(self) -> tuple[str, ...]:
+        return self.__layout.keys
+
+    @keys.setter
+    def keys(self, new_value):
+        raise AttributeError("Cannot modify FlitTable's keys")
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Brief:
+            Bytes held by the columns' values
+        """
+        total = 0
+        for column in self.__columns.values():
+            if isinstance(column, list):
+                total += sum(bytes_needed(max(value.bit_length(), 1)) for value in column)
+            elif isinstance(column, array):
+                total += column.itemsize * len(column)
+            else:
+                total += column.nbytes
+        return total
+
+    def __derive(self, columns: dict):
+        return FlitTable(self.__layout, columns, backend=self.__backend)
+
+    def _value(self, key: str, index: int) -> int:
+        value = self.__columns[key][index]
+        if np is not None and isinstance(value, np.void):
+            return int.from_bytes(value.tobytes(), 'big')
+        return int(value)
+
+    @classmethod
+    def from_bytes(cls, buffer, layout, stride: int = None, offset: int = 0, backend: str = None):
+        """
+        Brief:
+            Decodes N back to back records into a table
+
+        Params:
+            buffer:     bytes, bytearray, memoryview or mmap holding the records
+            layout:     a BitLayout or CollectionLayout, or a BitStruct/BitCollection whose layout to use
+            stride:     bytes between the starts of consecutive records, the layout's size if not given
+            offset:     byte offset of the first record
+            backend:    "numpy" or "array"
+        """
+        layout = getattr(layout, "layout", layout)
+        backend = _default_backend(backend)
+        if backend == NUMPY:
+            return cls(layout, decode_batch(buffer, layout, stride=stride, offset=offset), backend=backend)
+
+        stride = layout.byte_size if stride is None else stride
+        available = len(buffer) - offset
+        if stride == layout.byte_size and available % stride:
+            raise ValueError(f"Buffer does not hold a whole number of {stride} byte records")
+        count = 0 if available < layout.byte_size else (available - layout.byte_size) // stride + 1
+        decoder = layout.decoder
+        # each record is decoded straight into its row of every column
+        columns = _columns(layout, count)
+        for idx in range(count):
+            for column, value in zip(columns, decoder(buffer, offset + idx * stride)):
+                column[idx] = value
+        return cls(layout, dict(zip(layout.keys, columns)), backend=backend)
+
+    @classmethod
+    def from_rows(cls, layout, rows, backend: str = None):
+        """
+        Brief:
+            Builds a table from an iterable of field value tuples, BitCollections or BitStructs of the layout
+        """
+        layout = getattr(layout, "layout", layout)
+        columns = _columns(layout)
+        for row in rows:
+            if hasattr(row, "structs"):
+                row = [field.value for struct in row.structs for field in struct.fields]
+            elif hasattr(row, "fields"):
+                row = [field.value for field in row.fields]
+            for column, value in zip(columns, row):
+                column.append(value)
+        return cls(layout, dict(zip(layout.keys, columns)), backend=backend)
+
+    @classmethod
+    def concat(cls, tables):
+        """
+        Brief:
+            Joins tables of the same layout end to end
+        """
+        tables = list(tables)
+        if not tables:
+            raise ValueError("Cannot concatenate an empty list of FlitTables")
+        layout = tables[0].layout
+        backend = tables[0].backend
+        if any(table.layout is not layout for table in tables):
+            raise ValueError("Cannot concatenate FlitTables of different layouts")
+        columns = {}
+        for key in layout.keys:
+            parts = [table[key] for table in tables]
+            if backend == NUMPY and all(table.backend == NUMPY for table in tables):
+                columns[key] = np.concatenate(parts)
+            else:
+                columns[key] = [value for part in parts for value in part]
+        return cls(layout, columns, backend=backend)
+
+    def column(self, key: str):
+        return self.__columns[key]
+
+    def mask(self, mask):
+        """
+        Brief:
+            A new table holding the rows where mask is true
+
+        Params:
+            mask: a sequence of booleans, one per row, e.g. table["Valid"] == 1 with NumPy
+        """
+        if len(mask) != self.__length:
+            raise ValueError(f"Mask of {len(mask)} values does not match the {self.__length} rows of the FlitTable")
+        if self.__backend == NUMPY:
+            mask = np.asarray(mask, dtype=bool)
+            return self.__derive({key: column[mask] for key, column in self.__columns.items()})
+        mask = [bool(value) for value in mask]
+        return self.__derive({key: list(compress(column, mask)) for key, column in self.__columns.items()})
+
+    def where(self, key: str, *values):
+        """
+        Brief:
+            Scans one column for rows equal to any of values
+
+        Returns:
+            a boolean mask usable with mask() or table[...], a NumPy array with the numpy backend
+        """
+        column = self.__columns[key]
+        if self.__backend == NUMPY and column.dtype.kind != "V":
+            if len(values) == 1:
+                return column == values[0]
+            return np.isin(column, values)
+        wanted = set(values)
+        return [self._value(key, index) in wanted for index in range(self.__length)]
+
+    def filter(self, predicate):
+        """
+        Brief:
+            A new table holding the rows for which predicate(FlitRow) is true
+        """
+        return self.mask([bool(predicate(row)) for row in self])
+
+    def to_dict(self) -> dict:
+        """
+        Brief:
+            Exports the table as a dict from field keys to lists of ints
+        """
+        return {key: [self._value(key, index) for index in range(self.__length)] for key in self.keys}
+
+    def to_rows(self) -> list[dict]:
+        return [row.to_dict() for row in self]
+
+    def __bytes__(self):
+        """
+        Brief:
+            Encodes every row back to back, each packed as bytes(BitStruct) would pack it
+        """
+        if self.__backend == NUMPY:
+            return encode_batch(self.__columns, self.__layout, count=self.__length)
+        encoder = self.__layout.encoder
+        return b"".join(encoder(row.values()) for row in self)
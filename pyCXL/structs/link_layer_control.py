@@ -53,4 +53,16 @@ IDE_Link_Layer_Control = [
 
 IDE_RSVD_Link_Layer_Control_Payload = [
     ["Payload",         [[("Bytes",             8)]] * 11]
-]
\ No newline at end of file
+]
+
+# every link layer control format by name, see slotregistry.CONTROL_LAYOUTS
+Link_Layer_Control_formats = {
+    "LLCRD":                LLCRD_Link_Layer_Control,
+    "LLCRD Ack Payload":    LLCRD_Link_Layer_Control_ACK_Payload,
+    "RETRY":                RETRY_Link_Layer_Control,
+    "RETRY Req Payload":    RETRY_Request_Link_Layer_Control_Payload,
+    "RETRY Ack Payload":    RETRY_ACK_Link_Layer_Control_Payload,
+    "IDE":                  IDE_Link_Layer_Control,
+    "IDE Rsvd Payload":     IDE_RSVD_Link_Layer_Control_Payload,
+    "Rsvd Payload":         Link_Layer_Control_RSVD_Payload,
+}
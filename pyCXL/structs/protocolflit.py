@@ -0,0 +1,204 @@
+"""
+The whole 528 bit CXL.cache/CXL.mem protocol flit as one object.
+
+    flit = ProtocolFlit.from_bytes(capture[i * 66:(i + 1) * 66], HOST_TO_DEVICE)
+    flit.slot_formats                   # ("H4", "G4", "G0", "G0")
+    flit.get("M2S Request.Address")     # first slot carrying the field
+    flit.crc_valid                      # stored CRC matches the 64 data bytes
+    flit[1]                             # slot 1 as a FlitStruct, built on first access
+
+A ProtocolFlit is decoded with one int.from_bytes over all 66 bytes. The FlitHeader's Slot 0 - Slot 3 codes pick the
+SlotFormat of each slot and every field of every slot is shifted and masked out of that one integer, so decoding a flit
+costs the same as FlitParser.parse rather than four FlitStruct.from_bytes calls. FlitStructs are only built for the
+slots that are asked for.
+"""
+# Package imports
+from pyCXL.structs.bitcollections import FlitStruct
+from pyCXL.structs.flitcrc import CRC_BITS, CRC_BYTES, crc16
+from pyCXL.structs.flitparser import (
+    DIRECTIONS,
+    FLIT_BYTES,
+    HOST_TO_DEVICE,
+    SLOTS_PER_FLIT,
+    FlitParser,
+    ParsedSlots
+)
+from pyCXL.structs.slotregistry import slot_format_named
+
+_CRC_MASK = (1 << CRC_BITS) - 1
+_PARSERS = {direction: FlitParser(direction) for direction in DIRECTIONS}
+
+
+class ProtocolFlit(ParsedSlots):
+    """
+    Brief:
+        A protocol flit: a header slot, three generic slots and the CRC
+
+    Params:
+        slots:      the 4 (SlotFormat, field values) pairs of the flit, as returned by FlitParser.parse
+        crc:        the CRC carried by the flit. Computed from the slots if not given
+    """
+    __slots__ = ("__slots", "__crc", "__structs", "__data")
+
+    def __init__(self, slots, crc: int = None):
+        slots = tuple(slots)
+        if len(slots) != SLOTS_PER_FLIT:
+            raise ValueError(f"A protocol flit holds {SLOTS_PER_FLIT} slots, was {len(slots)}")
+        if not slots[0][0].header or any(slot_format.header for slot_format, _ in slots[1:]):
+            raise ValueError("A protocol flit is a header slot followed by 3 generic slots")
+        if len({slot_format.direction for slot_format, _ in slots}) != 1:
+            raise ValueError("Every slot of a protocol flit must travel in the same direction")
+        self.__slots = slots
+        self.__structs = [None] * SLOTS_PER_FLIT
+        self.__data = None
+        self.__crc = self.expected_crc if crc is None else crc
+
+    def __repr__(self):
+        return f"<ProtocolFlit {DIRECTIONS[self.direction]} {' '.join(self.slot_formats)}>"
+
+    def __len__(self):
+        return SLOTS_PER_FLIT
+
+    def __getitem__(self, position: int) -> FlitStruct:
+        """
+        Brief:
+            The slot at position as a FlitStruct. Built on first access and cached, changes to it are not written
+            back to the flit, see from_structs.
+        """
+        struct = self.__structs[position]
+        if struct is None:
+            slot_format, values = self.__slots[position]
+            struct = slot_format.build()
+            struct._assign(values)
+            self.__structs[position] = struct
+        return struct
+
+    def __iter__(self):
+        for position in range(SLOTS_PER_FLIT):
+            yield self[position]
+
+    def __eq__(self, other):
+        if not isinstance(other, ProtocolFlit):
+            return NotImplemented
+        return self.__slots == other.slots and self.__crc == other.crc
+
+    def __hash__(self):
+        return hash((self.__slots, self.__crc))
+
+    def __bytes__(self):
+        return self.data + self.__crc.to_bytes(CRC_BYTES, 'big')
+
+    @property
+    def slots(self):
+        return self.__slots
+
+    @slots.setter
+    def slots(self, new_value):
+        raise AttributeError("Cannot modify ProtocolFlit's slots")
+
+    @property
+    def direction(self):
+        return self.__slots[0][0].direction
+
+    @direction.setter
+    def direction(self, new_value):
+        raise AttributeError("Cannot modify ProtocolFlit's direction")
+
+    @property
+    def slot_formats(self) -> tuple[str, ...]:
+        return tuple(slot_format.name for slot_format, _ in self.__slots)
+
+    @slot_formats.setter
+    def slot_formats(self, new_value):
+        raise AttributeError("Cannot modify ProtocolFlit's slot formats")
+
+    @property
+    def header(self) -> FlitStruct:
+        return self[0]
+
+    @header.setter
+    def header(self, new_value):
+        raise AttributeError("Cannot modify ProtocolFlit's header")
+
+    @property
+    def crc(self) -> int:
+        return self.__crc
+
+    @crc.setter
+    def crc(self, new_value):
+        raise AttributeError("Cannot modify ProtocolFlit's crc")
+
+    @property
+    def data(self) -> bytes:
+        """
+        Brief:
+            The 64 bytes of slot data the CRC covers
+        """
+        if self.__data is None:
+            self.__data = b"".join(slot_format.layout.encoder(values) for slot_format, values in self.__slots)
+        return self.__data
+
+    @property
+    def expected_crc(self) -> int:
+        return crc16(self.data)
+
+    @property
+    def crc_valid(self) -> bool:
+        return self.__crc == self.expected_crc
+
+    @classmethod
+    def from_bytes(cls, flit: bytes, direction: int = HOST_TO_DEVICE, offset: int = 0, check_crc: bool = False):
+        """
+        Brief:
+            Decodes a 66 byte protocol flit in a single pass
+
+        Params:
+            flit:       a buffer holding at least 66 bytes from offset
+            direction:  HOST_TO_DEVICE or DEVICE_TO_HOST
+            offset:     byte offset of the flit within the buffer
+            check_crc:  raise a ValueError if the stored CRC does not match the flit's data
+        """
+        parser = _PARSERS.get(direction)
+        if parser is None:
+            raise ValueError(f"Unknown flit direction: {direction}")
+        value = parser._read(flit, offset)
+        slots = parser._decode(value)
+        if slots is None:
+            raise ValueError("Control flits are not protocol flits")
+        protocol_flit = cls(slots, crc=value & _CRC_MASK)
+        if check_crc:
+            # the data bytes are the flit's own, no need to encode the slots again
+            protocol_flit.__data = bytes(flit[offset:offset + FLIT_BYTES - CRC_BYTES])
+            expected = protocol_flit.expected_crc
+            if expected != protocol_flit.crc:
+                raise ValueError(f"Flit CRC mismatch: expected {expected:#06x}, was {protocol_flit.crc:#06x}")
+        return protocol_flit
+
+    @classmethod
+    def from_structs(cls, structs, crc: int = None):
+        """
+        Brief:
+            Builds a flit from a header FlitStruct and 3 generic FlitStructs created by SlotFormat.build
+
+        Params:
+            structs:    the 4 FlitStructs in slot order. The header's Slot 0 - Slot 3 fields must name their formats
+            crc:        the CRC to carry, computed from the slots if not given
+        """
+        structs = list(structs)
+        slots = []
+        for struct in structs:
+            slot_format = slot_format_named(struct.name)
+            if struct.layout is not slot_format.layout:
+                raise ValueError(f"{struct.name} is not a slot format")
+            slots.append((slot_format, tuple(field.value for sub in struct.structs for field in sub.fields)))
+        protocol_flit = cls(slots, crc=crc)
+        codes = tuple(protocol_flit.values(f"Flit Header.Slot {position}")[0] for position in range(SLOTS_PER_FLIT))
+        if codes != tuple(slot_format.code for slot_format, _ in protocol_flit.slots):
+            raise ValueError(f"Flit header slot codes {codes} do not match the slot formats {protocol_flit.slot_formats}")
+        return protocol_flit
+
+    def to_dict(self):
+        return {
+            "Protocol Flit": [self[position].to_dict() for position in range(SLOTS_PER_FLIT)],
+            "CRC": self.__crc
+        }
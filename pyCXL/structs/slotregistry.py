@@ -0,0 +1,87 @@
+"""
+One place to look up every slot and link layer control format.
+
+    slot_format(HOST_TO_DEVICE, GENERIC, 4)         # SlotFormat of H2D/M2S G4, a tuple index
+    slot_format_named("D2H/S2M H3")                 # by FlitStruct name, a dict lookup
+    SLOT_FORMATS[(DEVICE_TO_HOST, HEADER, 3)]       # the registry itself
+    CONTROL_LAYOUTS["RETRY Ack Payload"]            # BitLayout of a link layer control format
+
+Everything is compiled once at import from the H_slot_formats/G_slot_formats lists of H2D_M2S_formats and
+D2H_S2M_formats and from link_layer_control.Link_Layer_Control_formats. Each SlotFormat carries its total width
+(size), field names (keys) and field bit offsets (offsets) precomputed, so nothing walks the format modules at runtime.
+"""
+# Package imports
+from pyCXL.structs.bitlayouts import BitLayout
+from pyCXL.structs.flitparser import DIRECTIONS, G_SLOT_TABLE, H_SLOT_TABLE, SlotFormat
+from pyCXL.structs.link_layer_control import Link_Layer_Control_formats
+
+HEADER = "H"
+GENERIC = "G"
+
+_TABLES = {HEADER: H_SLOT_TABLE, GENERIC: G_SLOT_TABLE}
+
+# (direction, HEADER or GENERIC, slot code) -> SlotFormat, reserved codes are left out
+SLOT_FORMATS = {
+    (direction, kind, code): compiled
+    for kind, table in _TABLES.items()
+    for direction in DIRECTIONS
+    for code, compiled in enumerate(table[direction])
+    if compiled is not None
+}
+
+_BY_NAME = {f"{DIRECTIONS[compiled.direction]} {compiled.name}": compiled for compiled in SLOT_FORMATS.values()}
+
+
+def slot_format(direction: int, kind: str, code: int) -> SlotFormat:
+    """
+    Brief:
+        The SlotFormat for a direction, HEADER or GENERIC and the 3 bit code used in the FlitHeader
+
+    Params:
+        direction:  HOST_TO_DEVICE or DEVICE_TO_HOST
+        kind:       HEADER ("H") or GENERIC ("G")
+        code:       slot code, 0 - 7
+    """
+    table = _TABLES.get(kind)
+    if table is None:
+        raise ValueError(f"Unknown slot kind: {kind}")
+    if direction not in DIRECTIONS:
+        raise ValueError(f"Unknown flit direction: {direction}")
+    compiled = table[direction][code] if 0 <= code < len(table[direction]) else None
+    if compiled is None:
+        raise ValueError(f"Reserved slot format: {DIRECTIONS[direction]} {kind}{code}")
+    return compiled
+
+
+def slot_format_named(name: str) -> SlotFormat:
+    """
+    Brief:
+        The SlotFormat of a FlitStruct name built by SlotFormat.build, e.g. "H2D/M2S G4"
+    """
+    compiled = _BY_NAME.get(name)
+    if compiled is None:
+        raise ValueError(f"Unknown slot format: {name}")
+    return compiled
+
+
+def compile_control_format(name: str, control_format: list) -> BitLayout:
+    """
+    Brief:
+        Compiles a link layer control format, a list of [struct name, [[(field name, size), ...], ...]] entries, into
+        one BitLayout whose keys are "struct.field"
+    """
+    names = []
+    sizes = []
+    for struct_name, groups in control_format:
+        for group in groups:
+            for field_name, size in group:
+                names.append(f"{struct_name}.{field_name}")
+                sizes.append(size)
+    rsvd = [name.split(".")[-1].upper().startswith("RSVD") for name in names]
+    return BitLayout(name=name, names=names, sizes=sizes, rsvd=rsvd)
+
+
+CONTROL_LAYOUTS = {
+    name: compile_control_format(name, control_format)
+    for name, control_format in Link_Layer_Control_formats.items()
+}
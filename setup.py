@@ -13,6 +13,7 @@ setup(
     description=DESCRIPTION,
     packages=find_packages(),
     install_requires=[],
+    extras_require={"numpy": ["numpy"]},
     keywords=['python', 'CXL', 'Protocol'],
     classifiers=[
         "Intended Audience :: Developers",
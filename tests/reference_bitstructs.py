@@ -0,0 +1,138 @@
+"""
+The original string based encoding and decoding of BitStructs.
+
+The package now does all of its bit handling with integers (see pyCXL.structs.bitcodecs). These functions are kept as
+the reference the integer codecs are tested against and should not be used outside of the tests.
+"""
+# Python imports
+from math import ceil
+
+# Package imports
+from pyCXL.structs.biterator import Biterator
+from pyCXL.structs.bitstructs import BigEndianBitStruct, BITS_IN_A_BYTE
+
+
+def reference_to_bin(bitstruct):
+    if isinstance(bitstruct, BigEndianBitStruct):
+        return _big_endian_to_bin(bitstruct)
+    retStr = ""
+    for field in bitstruct.fields:
+        binStr = bin(field.value)[2:]
+        while len(binStr) < field.size:
+            binStr = '0' + binStr
+        retStr += binStr
+    return retStr
+
+
+def reference_from_bin(bitstruct, bitstring: str):
+    """
+    Returns the field values the string implementation decodes from bitstring
+    """
+    if bitstring.startswith("0b"):
+        bitstring = bitstring[2:]
+
+    if isinstance(bitstruct, BigEndianBitStruct):
+        return _big_endian_from_bin(bitstruct, bitstring)
+
+    values = []
+    for field in bitstruct.fields:
+        values.append(int(bitstring[:field.size], 2))
+        bitstring = bitstring[field.size:]
+    return values
+
+
+def reference_from_bytes(bitstruct, bytestring: bytes):
+    """
+    Returns the field values the string implementation decodes from bytestring
+    """
+    if isinstance(bitstruct, BigEndianBitStruct):
+        return _big_endian_from_bytes(bitstruct, bytestring)
+
+    data = Biterator(bytestring)
+    available_bins = next(data)
+
+    values = []
+    for field in bitstruct.fields:
+        while len(available_bins) < field.size:
+            available_bins += next(data)
+        values.append(int(available_bins[:field.size], 2))
+        available_bins = available_bins[field.size:]
+    return values
+
+
+def reference_bytes(bitstruct):
+    return int(reference_to_bin(bitstruct), 2).to_bytes(ceil(bitstruct.size / BITS_IN_A_BYTE), 'big')
+
+
+def _big_endian_to_bin(bitstruct):
+    """
+    This is where I learned to hate big endian. Here's a puzzle for you:
+        Given 3 random integers and three random number of bits *at least* large enough to represent those numbers,
+        produce a stream of bits which equals those values in big endian.
+
+    For example:
+        integer:  20  number of bits: 7
+        integer:  85  number of bits: 13
+        integer:  255 number of bits: 9
+
+    See if you can do that more efficiently than what I have below, then see if you can do it more efficiently than
+    little endian above.
+    """
+    bitvals = []
+    for field in bitstruct.fields:
+        bitstr = bin(field.value)[2:]
+        while len(bitstr) < field.size:
+            bitstr = '0' + bitstr
+        bitvals.append(bitstr)
+    retstr = ""
+    line = ""
+    for val in bitvals:
+        for eachbit in val[::-1]:
+            line = eachbit + line
+            if len(line) == 8:
+                retstr += line
+                line = ""
+    retstr += line
+    return retstr
+
+
+def _big_endian_from_bin(bitstruct, bitstring):
+    bitstring = bitstring[:bitstruct.size]
+
+    # reverse the order of the binary in byte sized chucks
+    be_order = "".join(
+            reversed([bitstring[i:i + BITS_IN_A_BYTE] for i in range(0, len(bitstring), BITS_IN_A_BYTE)])
+    )
+
+    bit_idx = 0
+    available_bins = be_order[bit_idx:bit_idx + BITS_IN_A_BYTE]
+
+    values = []
+    for field in reversed(bitstruct.fields):
+        while len(available_bins) < field.size:
+            bit_idx += BITS_IN_A_BYTE
+            available_bins += be_order[bit_idx:bit_idx + BITS_IN_A_BYTE]
+        values.append(int(available_bins[:field.size], 2))
+        available_bins = available_bins[field.size:]
+    return values[::-1]
+
+
+def _big_endian_from_bytes(bitstruct, bytestring):
+    bytestring = bytestring[:ceil(bitstruct.size / BITS_IN_A_BYTE)]
+    bytestring = bytestring[::-1]
+
+    trim = (len(bytestring) * 8) % bitstruct.size
+
+    data = Biterator(bytestring)
+    available_bins = next(data)
+
+    if trim:
+        available_bins = available_bins[:len(available_bins) - trim]
+
+    values = []
+    for field in reversed(bitstruct.fields):
+        while len(available_bins) < field.size:
+            available_bins += next(data)
+        values.append(int(available_bins[:field.size], 2))
+        available_bins = available_bins[field.size:]
+    return values[::-1]
@@ -0,0 +1,75 @@
+# Package imports
+from pyCXL.analysis.analyzer import FlitAnalyzer
+from pyCXL.structs import flitsubstructures as subs
+from pyCXL.structs.flitparser import DEVICE_TO_HOST, HOST_TO_DEVICE
+from pyCXL.structs.slotregistry import GENERIC, HEADER, slot_format
+from tests.test_utils import make_flit, make_slots
+
+TX = HOST_TO_DEVICE
+RX = DEVICE_TO_HOST
+
+
+class TagCounter(FlitAnalyzer):
+    """
+    Counts the valid S2M DRS messages of each Tag
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.planned = []
+        self.tags = {}
+
+    def _plan_message(self, struct_name, fields):
+        self.planned.append(struct_name)
+        return (fields["Tag"],) if struct_name == subs.S2M_DRS else None
+
+    def process(self, slots, timestamp=None):
+        found = []
+        for slot_format, values in slots or ():
+            for valid, tag in self._plan(slot_format):
+                if values[valid]:
+                    self.tags[values[tag]] = self.tags.get(values[tag], 0) + 1
+                    found.append(values[tag])
+        return found
+
+
+# ============================= Plan Tests =============================
+def test_FlitAnalyzer_plans_once_per_slot_format():
+    analyzer = TagCounter()
+    # S2M G6 holds 3 S2M_DRS
+    drs = slot_format(RX, GENERIC, 6)
+    plan = analyzer._plan(drs)
+    assert analyzer.planned == [subs.S2M_DRS] * 3
+    assert plan == tuple(
+        (drs.keys.index(f"S2M_DRS[{idx}].Valid"), drs.keys.index(f"S2M_DRS[{idx}].Tag")) for idx in range(3)
+    )
+    assert analyzer._plan(drs) is plan
+    assert analyzer.planned == [subs.S2M_DRS] * 3
+    # the Flit Header has no Valid field and is never offered
+    analyzer._plan(slot_format(TX, HEADER, 0))
+    assert subs.FLIT_HEAD not in analyzer.planned
+
+
+def test_FlitAnalyzer_drives_streams():
+    analyzer = TagCounter()
+    fields = {
+        (2, "S2M_DRS[0].Valid"): 1, (2, "S2M_DRS[0].Tag"): 7, (3, "S2M_DRS[2].Valid"): 1, (3, "S2M_DRS[2].Tag"): 9
+    }
+    flit = make_flit(RX, 3, (0, 6, 6), fields)
+    assert analyzer.process_flit(RX, b"\x00" + flit, offset=1) == [7, 9]
+    assert analyzer.process(make_slots(RX, 3, (0, 6, 6), fields)) == [7, 9]
+    assert list(analyzer.run([(0, RX, flit), (1, TX, make_flit(TX, 0)), (2, RX, flit)])) == [7, 9, 7, 9]
+    assert analyzer.tags == {7: 4, 9: 4}
+
+
+def test_FlitAnalyzer_requires_its_hooks():
+    class PlanOnly(FlitAnalyzer):
+        def _plan_message(self, struct_name, fields):
+            return None
+
+    for analyzer in (FlitAnalyzer, PlanOnly):
+        try:
+            analyzer()
+            assert False
+        except TypeError:
+            pass
@@ -0,0 +1,200 @@
+# External Dependencies
+import pytest
+
+np = pytest.importorskip("numpy")
+
+# Python Imports
+import random
+
+# Package imports
+from tests.test_utils import THIRTY_BIT_STRUCT, bigNON_BYTE_ALIGNED_27BIT_STRUCT
+from pyCXL.structs.bitbatch import as_records, decode_batch, encode_batch, field_dtype
+from pyCXL.structs.bitcollections import BitCollection
+from pyCXL.structs.bitlayouts import BitLayout, CollectionLayout
+from pyCXL.structs.flitsubstructures import FlitHeader
+from pyCXL.structs.flitparser import FLIT_BYTES, G_SLOT_TABLE, H_SLOT_TABLE, HOST_TO_DEVICE, DEVICE_TO_HOST
+
+
+def random_layout(rng, big_endian, max_size=70):
+    sizes = [rng.randint(1, max_size) for _ in range(rng.randint(1, 8))]
+    return BitLayout(name="Random Layout", names=[f"F{idx}" for idx in range(len(sizes))], sizes=sizes,
+                     big_endian=big_endian)
+
+
+def as_int(value):
+    if isinstance(value, np.void):
+        return int.from_bytes(value.tobytes(), 'big')
+    return int(value)
+
+
+def assert_matches_layout(columns, layout, data, count, stride=None, offset=0):
+    stride = layout.byte_size if stride is None else stride
+    assert list(columns) == list(layout.keys)
+    for record in range(count):
+        expected = layout.unpack_bytes(data, offset + record * stride)
+        assert tuple(as_int(columns[key][record]) for key in layout.keys) == expected
+
+
+# ============================= decode_batch Tests =============================
+@pytest.mark.parametrize("big_endian", [False, True])
+def test_decode_batch_matches_unpack_bytes(big_endian):
+    rng = random.Random(5)
+    for _ in range(50):
+        layout = random_layout(rng, big_endian)
+        count = rng.randint(0, 20)
+        data = bytes(rng.getrandbits(8) for _ in range(layout.byte_size * count))
+        assert_matches_layout(decode_batch(data, layout), layout, data, count)
+
+
+def test_decode_batch_of_collections():
+    rng = random.Random(6)
+    for _ in range(25):
+        layout = CollectionLayout(
+            name="Random Collection",
+            layouts=[random_layout(rng, rng.random() < 0.5) for _ in range(rng.randint(1, 4))]
+        )
+        data = bytes(rng.getrandbits(8) for _ in range(layout.byte_size * 10))
+        assert_matches_layout(decode_batch(memoryview(data), layout), layout, data, 10)
+
+
+@pytest.mark.parametrize("direction", [HOST_TO_DEVICE, DEVICE_TO_HOST])
+def test_decode_batch_of_slot_formats(direction):
+    rng = random.Random(direction)
+    for slot_format in H_SLOT_TABLE[direction] + G_SLOT_TABLE[direction]:
+        if slot_format is None:
+            continue
+        data = bytearray(rng.getrandbits(8) for _ in range(16 * 32))
+        assert_matches_layout(decode_batch(data, slot_format.layout), slot_format.layout, data, 32)
+
+
+def test_decode_batch_column_dtypes():
+    layout = BitLayout(name="Widths", names=["A", "B", "C", "D", "E"], sizes=[3, 16, 17, 64, 96])
+    columns = decode_batch(bytes(layout.byte_size * 4), layout)
+    assert columns["A"].dtype == np.uint8
+    assert columns["B"].dtype == np.uint16
+    assert columns["C"].dtype == np.uint32
+    assert columns["D"].dtype == np.uint64
+    assert columns["E"].dtype == np.dtype((np.void, 12))
+    assert all(len(column) == 4 for column in columns.values())
+    assert field_dtype(65) == np.dtype((np.void, 9))
+
+
+def test_decode_batch_accepts_structs_and_collections():
+    collection = BitCollection(bitstructs=[THIRTY_BIT_STRUCT(), bigNON_BYTE_ALIGNED_27BIT_STRUCT()], name="MIXED")
+    data = bytes(range(collection.layout.byte_size * 3))
+    assert_matches_layout(decode_batch(data, collection), collection.layout, data, 3)
+
+
+def test_decode_batch_selected_fields():
+    layout = H_SLOT_TABLE[HOST_TO_DEVICE][0].layout
+    data = bytes(range(16)) * 2
+    columns = decode_batch(data, layout, fields=["Flit Header.Slot 0", "Flit Header.Type"])
+    assert set(columns) == {"Flit Header.Slot 0", "Flit Header.Type"}
+    try:
+        decode_batch(data, layout, fields=["Not A Field"])
+        assert False
+    except ValueError as err:
+        assert str(err) == "Unknown fields for H2D/M2S H0: ['Not A Field']"
+
+
+def test_decode_batch_strided_slots_of_flits():
+    rng = random.Random(7)
+    data = bytes(rng.getrandbits(8) for _ in range(FLIT_BYTES * 8))
+    layout = G_SLOT_TABLE[DEVICE_TO_HOST][4].layout
+    for position in range(1, 4):
+        columns = decode_batch(data, layout, stride=FLIT_BYTES, offset=16 * position)
+        assert_matches_layout(columns, layout, data, 8, stride=FLIT_BYTES, offset=16 * position)
+
+
+# ============================= as_records Tests =============================
+def test_as_records_is_a_view():
+    data = bytearray(range(32))
+    records = as_records(data, 16)
+    assert records.shape == (2, 16)
+    assert not records.flags.writeable
+    data[17] = 0xFF
+    assert records[1, 1] == 0xFF
+
+
+def test_as_records_rejects_partial_records():
+    try:
+        as_records(bytes(17), 16)
+        assert False
+    except ValueError as err:
+        assert str(err) == "Buffer does not hold a whole number of 16 byte records"
+    try:
+        as_records(bytes(32), 16, stride=8)
+        assert False
+    except ValueError as err:
+        assert str(err) == "Stride of 8 bytes is smaller than the 16 byte record"
+
+
+# ============================= encode_batch Tests =============================
+def random_columns(rng, layout, count):
+    values = [[rng.getrandbits(size) for size in layout.sizes] for _ in range(count)]
+    columns = {}
+    for idx, (key, size) in enumerate(zip(layout.keys, layout.sizes)):
+        if size > 64:
+            nbytes = (size + 7) // 8
+            columns[key] = np.frombuffer(
+                b"".join(row[idx].to_bytes(nbytes, 'big') for row in values), dtype=np.dtype((np.void, nbytes))
+            )
+        else:
+            columns[key] = np.array([row[idx] for row in values], dtype=np.uint64)
+    return values, columns
+
+
+@pytest.mark.parametrize("big_endian", [False, True])
+def test_encode_batch_matches_pack_bytes(big_endian):
+    rng = random.Random(8)
+    for _ in range(50):
+        layout = random_layout(rng, big_endian)
+        values, columns = random_columns(rng, layout, rng.randint(1, 10))
+        assert encode_batch(columns, layout) == b"".join(layout.pack_bytes(row) for row in values)
+
+
+@pytest.mark.parametrize("direction", [HOST_TO_DEVICE, DEVICE_TO_HOST])
+def test_encode_batch_round_trips_slot_formats(direction):
+    rng = random.Random(9)
+    for slot_format in H_SLOT_TABLE[direction] + G_SLOT_TABLE[direction]:
+        if slot_format is None:
+            continue
+        data = bytes(rng.getrandbits(8) for _ in range(16 * 16))
+        assert encode_batch(decode_batch(data, slot_format.layout), slot_format.layout) == data
+
+
+def test_encode_batch_of_collections():
+    rng = random.Random(10)
+    collection = BitCollection(bitstructs=[THIRTY_BIT_STRUCT(), bigNON_BYTE_ALIGNED_27BIT_STRUCT()], name="MIXED")
+    values, columns = random_columns(rng, collection.layout, 5)
+    assert encode_batch(columns, collection) == b"".join(collection.layout.pack_bytes(row) for row in values)
+
+
+def test_encode_batch_defaults_missing_fields_to_zero():
+    layout = FlitHeader().layout
+    data = encode_batch({"Slot 0": [1, 2, 3, 7], "Type": np.array([1, 0, 1, 0], dtype=np.uint8)}, layout)
+    assert len(data) == 16
+    columns = decode_batch(data, layout)
+    assert list(columns["Slot 0"]) == [1, 2, 3, 7]
+    assert list(columns["Type"]) == [1, 0, 1, 0]
+    assert not columns["Slot 1"].any()
+    assert encode_batch({}, layout, count=3) == bytes(12)
+
+
+def test_encode_batch_masks_values_to_field_size():
+    layout = FlitHeader().layout
+    assert encode_batch({"Slot 0": [0xFF]}, layout) == encode_batch({"Slot 0": [0x7]}, layout)
+
+
+def test_encode_batch_rejects_bad_columns():
+    layout = G_SLOT_TABLE[HOST_TO_DEVICE][0].layout
+    try:
+        encode_batch({"Bad": [1]}, layout)
+        assert False
+    except ValueError as err:
+        assert str(err) == "Unknown fields for H2D/M2S G0: ['Bad']"
+    try:
+        encode_batch({layout.keys[0]: np.zeros((2, 4), dtype=np.uint8)}, layout)
+        assert False
+    except ValueError as err:
+        assert str(err) == "Column of a 128 bit field must be 16 byte values"
@@ -0,0 +1,127 @@
+# External Dependencies
+import pytest
+
+# Python Imports
+import random
+
+# Package imports
+from tests.test_utils import (
+    CHECKERBOARD_BYTES,
+    CHECKERBOARD_BITS
+)
+from tests.reference_bitstructs import (
+    reference_to_bin,
+    reference_from_bin,
+    reference_from_bytes,
+    reference_bytes
+)
+from pyCXL.structs.bitcodecs import (
+    bytes_needed,
+    big_endian_to_packed,
+    packed_to_big_endian
+)
+from pyCXL.structs.bitfields import BitField
+from pyCXL.structs.bitlayouts import BitLayout
+from pyCXL.structs.bitstructs import BitStruct, LittleEndianBitStruct, BigEndianBitStruct
+
+
+def random_struct(rng, struct_type, max_fields=8, max_size=70):
+    bitfields = [
+        BitField(size=rng.randint(1, max_size), name=f"Field {idx}") for idx in range(rng.randint(1, max_fields))
+    ]
+    return struct_type(bitfields=bitfields, name="Random Struct")
+
+
+# ============================= Codec Function Tests =============================
+@pytest.mark.parametrize(
+    "size, expected", [
+        (1, 1), (7, 1), (8, 1), (9, 2), (27, 4), (128, 16), (528, 66)
+    ]
+)
+def test_bytes_needed(size, expected):
+    assert bytes_needed(size) == expected
+
+
+@pytest.mark.parametrize(
+    "size, expected", [
+        (4,  0xA),
+        (8,  0xAA),
+        (12, 0xAA5),
+        (27, 0xAA55AA55 >> 5),
+        (128, int.from_bytes(b"\xAA\x55" * 8, 'big'))
+    ]
+)
+def test_unpack_bytes_reads_leading_bits(size, expected):
+    layout = BitLayout(name="Leading", names=["Field"], sizes=[size])
+    assert layout.unpack_bytes(CHECKERBOARD_BYTES()) == (expected,)
+
+
+@pytest.mark.parametrize(
+    "values, sizes, expected", [
+        ((2, 5),            (2, 3),         0b10101),
+        ((10, 10, 85),      (4, 4, 8),      0xAA55),
+        ((1, 0, 1),         (1, 20, 1),     (1 << 21) | 1)
+    ]
+)
+def test_pack_and_unpack_fields(values, sizes, expected):
+    layout = BitLayout(name="Fields", names=[f"F{idx}" for idx in range(len(sizes))], sizes=sizes)
+    assert layout.pack(values) == expected
+    assert layout.unpack(expected) == values
+
+
+@pytest.mark.parametrize("size", [1, 3, 8, 9, 16, 27, 70, 128])
+def test_big_endian_order_round_trips(size):
+    rng = random.Random(size)
+    for _ in range(50):
+        value = rng.getrandbits(size)
+        assert packed_to_big_endian(big_endian_to_packed(value, size), size) == value
+
+
+def test_big_endian_fields_round_trip():
+    sizes = (10, 2, 2, 1, 1)
+    values = (517, 3, 0, 1, 1)
+    layout = BitLayout(name="Fields", names=[f"F{idx}" for idx in range(len(sizes))], sizes=sizes, big_endian=True)
+    assert layout.unpack(layout.pack(values)) == values
+
+
+# ============================= Reference Equivalence Tests =============================
+@pytest.mark.parametrize("struct_type", [LittleEndianBitStruct, BigEndianBitStruct])
+def test_integer_codecs_match_string_reference(struct_type):
+    rng = random.Random(0xC0DE)
+    for _ in range(200):
+        bitstruct = random_struct(rng, struct_type)
+        nbytes = bytes_needed(bitstruct.size)
+        data = bytes(rng.getrandbits(8) for _ in range(nbytes + rng.randint(0, 3)))
+
+        bitstruct.from_bytes(data)
+        assert [field.value for field in bitstruct] == reference_from_bytes(bitstruct, data)
+        assert bitstruct.to_bin() == reference_to_bin(bitstruct)
+        assert bytes(bitstruct) == reference_bytes(bitstruct)
+
+        bitstring = "0b" + "".join(rng.choice("01") for _ in range(bitstruct.size + rng.randint(0, 9)))
+        bitstruct.from_bin(bitstring)
+        assert [field.value for field in bitstruct] == reference_from_bin(bitstruct, bitstring)
+        assert bitstruct.to_bin() == reference_to_bin(bitstruct)
+
+
+def test_integer_codecs_match_string_reference_for_tiny_structs():
+    rng = random.Random(8)
+    for _ in range(100):
+        bitstruct = random_struct(rng, BitStruct, max_fields=3, max_size=2)
+        data = bytes([rng.getrandbits(8)])
+        bitstruct.from_bytes(data)
+        assert [field.value for field in bitstruct] == reference_from_bytes(bitstruct, data)
+        assert bitstruct.to_bin() == reference_to_bin(bitstruct)
+
+
+@pytest.mark.parametrize("struct_type", [LittleEndianBitStruct, BigEndianBitStruct])
+def test_integer_codecs_match_string_reference_on_checkerboard(struct_type):
+    bitstruct = struct_type(
+        bitfields=[BitField(size=size, name=f"Field {size}") for size in (10, 2, 2, 1, 1, 46, 3)],
+        name="Checkerboard"
+    )
+    bitstruct.from_bytes(CHECKERBOARD_BYTES())
+    assert [field.value for field in bitstruct] == reference_from_bytes(bitstruct, CHECKERBOARD_BYTES())
+    bitstruct.from_bin(CHECKERBOARD_BITS())
+    assert [field.value for field in bitstruct] == reference_from_bin(bitstruct, CHECKERBOARD_BITS())
+    assert bitstruct.to_bin() == reference_to_bin(bitstruct)
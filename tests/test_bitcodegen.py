@@ -0,0 +1,145 @@
+# External Dependencies
+import pytest
+
+# Python Imports
+import inspect
+import pickle
+import random
+
+# Package imports
+from tests.test_utils import (
+    CHECKERBOARD_BYTES,
+    EIGHT_BIT_STRUCT,
+    FORTY_BIT_STRUCT,
+    THIRTY_BIT_STRUCT,
+    bigNON_BYTE_ALIGNED_27BIT_STRUCT,
+    lilOVERLAPPING_BOUNDARY_STRUCT
+)
+from pyCXL.structs.bitcodegen import (
+    decoder_for,
+    encoder_for,
+    specialize,
+    unspecialize
+)
+from pyCXL.structs.bitlayouts import BitLayout, CollectionLayout
+from pyCXL.structs.bitcollections import BitCollection, FlitStruct
+from pyCXL.structs.flitparser import H_SLOT_TABLE
+from pyCXL.structs.flitsubstructures import M2SHeader
+
+
+def random_layout(rng, big_endian):
+    sizes = [rng.randint(1, 50) for _ in range(rng.randint(1, 8))]
+    return BitLayout(name="Random Layout", names=[f"F{idx}" for idx in range(len(sizes))], sizes=sizes,
+                     big_endian=big_endian)
+
+
+# ============================= Generated Function Tests =============================
+@pytest.mark.parametrize("big_endian", [False, True])
+def test_generated_functions_match_table_driven_codecs(big_endian):
+    rng = random.Random(3)
+    for _ in range(100):
+        layout = random_layout(rng, big_endian)
+        data = bytes(rng.getrandbits(8) for _ in range(layout.byte_size + 2))
+        values = layout.unpack_bytes(data, 1)
+        assert decoder_for(layout)(data, 1) == values
+        assert encoder_for(layout)(values) == layout.pack_bytes(values)
+
+
+def test_generated_collection_functions_match_table_driven_codecs():
+    rng = random.Random(4)
+    for _ in range(25):
+        layout = CollectionLayout(
+            name="Random Collection",
+            layouts=[random_layout(rng, rng.random() < 0.5) for _ in range(rng.randint(1, 4))]
+        )
+        data = bytes(rng.getrandbits(8) for _ in range(layout.byte_size))
+        values = layout.unpack_bytes(data)
+        assert decoder_for(layout)(data) == values
+        assert encoder_for(layout)(values) == layout.pack_bytes(values)
+
+
+def test_generated_functions_are_cached_and_named():
+    layout = M2SHeader().layout
+    decoder = decoder_for(layout)
+    assert decoder is decoder_for(layout)
+    assert decoder.__name__ == "decode_M2S_Header"
+    assert encoder_for(layout).__name__ == "encode_M2S_Header"
+    assert decoder.layout is layout
+
+
+def test_generated_source_is_viewable():
+    decoder = decoder_for(M2SHeader().layout)
+    assert inspect.getsource(decoder) == decoder.source
+    assert "for " not in decoder.source
+    # constants are folded into the function rather than looked up
+    assert "0x3fffffffffff" in decoder.source
+
+
+# ============================= Specialization Tests =============================
+def test_specialize_installs_generated_functions_on_structs():
+    struct = lilOVERLAPPING_BOUNDARY_STRUCT()
+    layout = specialize(struct.layout)
+    try:
+        assert layout.decoder is decoder_for(layout)
+        struct.from_bytes(CHECKERBOARD_BYTES())
+        specialized = [field.value for field in struct]
+        specialized_bytes = bytes(struct)
+    finally:
+        unspecialize(layout)
+    assert layout.decoder == layout.unpack_bytes
+
+    struct.from_bytes(CHECKERBOARD_BYTES())
+    assert [field.value for field in struct] == specialized
+    assert bytes(struct) == specialized_bytes
+
+
+def test_specialize_collection_specializes_structs():
+    collection = BitCollection(bitstructs=[THIRTY_BIT_STRUCT(), bigNON_BYTE_ALIGNED_27BIT_STRUCT()], name="MIXED")
+    specialize(collection.layout)
+    try:
+        for struct_layout in collection.layout.layouts:
+            assert struct_layout.decoder is decoder_for(struct_layout)
+        collection.from_bytes(CHECKERBOARD_BYTES())
+        specialized = bytes(collection)
+    finally:
+        unspecialize(collection.layout)
+    collection.from_bytes(CHECKERBOARD_BYTES())
+    assert bytes(collection) == specialized
+
+
+def test_specialized_flitstruct_round_trips():
+    flit = FlitStruct(bitstructs=[EIGHT_BIT_STRUCT(), FORTY_BIT_STRUCT(), FORTY_BIT_STRUCT(), FORTY_BIT_STRUCT()],
+                      name="TEST FLIT")
+    specialize(flit.layout)
+    try:
+        flit.from_bytes(CHECKERBOARD_BYTES())
+        assert bytes(flit) == bytes(CHECKERBOARD_BYTES())
+    finally:
+        unspecialize(flit.layout)
+
+
+def test_specialized_layouts_pickle():
+    layout = specialize(H_SLOT_TABLE[0][0].layout)
+    try:
+        loaded = pickle.loads(pickle.dumps(layout))
+    finally:
+        unspecialize(layout)
+    assert loaded is not layout and loaded.keys == layout.keys
+    assert loaded.decoder is decoder_for(loaded) and loaded.encoder is encoder_for(loaded)
+    for struct_layout in loaded.layouts:
+        assert struct_layout.decoder is decoder_for(struct_layout)
+    data = bytes(CHECKERBOARD_BYTES())
+    assert loaded.decoder(data) == layout.unpack_bytes(data)
+    assert loaded.encoder(loaded.decoder(data)) == layout.pack_bytes(layout.unpack_bytes(data))
+    # table driven layouts stay table driven
+    loaded = pickle.loads(pickle.dumps(layout))
+    assert loaded.decoder == loaded.unpack_bytes and loaded.encoder == loaded.pack_bytes
+    assert all(struct_layout.decoder == struct_layout.unpack_bytes for struct_layout in loaded.layouts)
+
+
+def test_decoder_for_rejects_non_layouts():
+    try:
+        decoder_for(M2SHeader())
+        assert False
+    except TypeError as err:
+        assert str(err) == "Cannot generate a decoder for M2SHeader"
@@ -1,6 +1,9 @@
 # External Dependencies
 import pytest
 
+# Python Imports
+import random
+
 # Package imports
 from tests.test_utils import (
     CHECKERBOARD_BYTES,
@@ -10,7 +13,8 @@ from tests.test_utils import (
     FIFTEEN_BIT_STRUCT,
     TWENTY_BIT_STRUCT,
     THIRTY_BIT_STRUCT,
-    FORTY_BIT_STRUCT
+    FORTY_BIT_STRUCT,
+    bigNON_BYTE_ALIGNED_27BIT_STRUCT
 )
 from pyCXL.structs.bitcollections import BitCollection
 
@@ -259,7 +263,7 @@ def test_BitCollection_iterates(bitstructs, expected):
                 TWENTY_BIT_STRUCT(),
                 THIRTY_BIT_STRUCT(),
                 THIRTY_BIT_STRUCT(),
-            ], CHECKERBOARD_BITS,
+            ], CHECKERBOARD_BITS(),
             (
                 # 8 bits
                 2, 1, 10,
@@ -283,7 +287,7 @@ def test_BitCollection_iterates(bitstructs, expected):
                 FORTY_BIT_STRUCT(),
                 FORTY_BIT_STRUCT(),
                 FORTY_BIT_STRUCT(),
-            ], CHECKERBOARD_BITS,
+            ], CHECKERBOARD_BITS(),
             (
                 # 8 bits
                 2, 1, 10,
@@ -331,7 +335,7 @@ def test_BitCollection_from_binary_valid_assignment(bitstructs, bindata, expecte
                 TWENTY_BIT_STRUCT(),
                 THIRTY_BIT_STRUCT(),
                 THIRTY_BIT_STRUCT(),
-            ], CHECKERBOARD_BYTES,
+            ], CHECKERBOARD_BYTES(),
             (
                 # 8 bits
                 2, 1, 10,
@@ -355,7 +359,7 @@ def test_BitCollection_from_binary_valid_assignment(bitstructs, bindata, expecte
                 FORTY_BIT_STRUCT(),
                 FORTY_BIT_STRUCT(),
                 FORTY_BIT_STRUCT(),
-            ], CHECKERBOARD_BYTES,
+            ], CHECKERBOARD_BYTES(),
             (
                 # 8 bits
                 2, 1, 10,
@@ -400,7 +404,7 @@ def test_BitCollection_from_bytes_valid_assignment(bitstructs, bytedata, expecte
                 EIGHT_BIT_STRUCT(),
                 TEN_BIT_STRUCT(),
             ],
-            CHECKERBOARD_BYTES,
+            CHECKERBOARD_BYTES(),
             174422,
             "0x2a956"
         ),
@@ -411,7 +415,7 @@ def test_BitCollection_from_bytes_valid_assignment(bitstructs, bytedata, expecte
                 FORTY_BIT_STRUCT(),
                 EIGHT_BIT_STRUCT()
             ],
-            CHECKERBOARD_BYTES,
+            CHECKERBOARD_BYTES(),
             47944936110839210,
             "0xaa55aa55aa55aa"
         ),
@@ -422,7 +426,7 @@ def test_BitCollection_from_bytes_valid_assignment(bitstructs, bytedata, expecte
                 FORTY_BIT_STRUCT(),
                 THIRTY_BIT_STRUCT()
             ],
-            CHECKERBOARD_BYTES,
+            CHECKERBOARD_BYTES(),
             863699185612310821477349097564821,
             "0x2a956a956a956a956a956a956a95"
         )
@@ -447,7 +451,7 @@ def test_BitCollection_converts_to_int_hex(bitstructs, test_data, expected_int,
                 EIGHT_BIT_STRUCT(),
                 TEN_BIT_STRUCT(),
             ],
-            CHECKERBOARD_BYTES,
+            CHECKERBOARD_BYTES(),
             b"\x02\xA9\x56"
         ),
         (
@@ -457,7 +461,7 @@ def test_BitCollection_converts_to_int_hex(bitstructs, test_data, expected_int,
                 FORTY_BIT_STRUCT(),
                 EIGHT_BIT_STRUCT()
             ],
-            CHECKERBOARD_BYTES,
+            CHECKERBOARD_BYTES(),
             b"\xAA\x55\xAA\x55\xAA\x55\xAA"
         ),
         (
@@ -467,7 +471,7 @@ def test_BitCollection_converts_to_int_hex(bitstructs, test_data, expected_int,
                 FORTY_BIT_STRUCT(),
                 THIRTY_BIT_STRUCT()
             ],
-            CHECKERBOARD_BYTES,
+            CHECKERBOARD_BYTES(),
             b"\x2A\x95\x6A\x95\x6A\x95\x6A\x95\x6A\x95\x6A\x95\x6A\x95"
         )
     ]
@@ -489,7 +493,7 @@ def test_BitCollection_converts_to_bytes(bitstructs, test_data, expected_bytes):
                 EIGHT_BIT_STRUCT(),
                 TEN_BIT_STRUCT(),
             ],
-            CHECKERBOARD_BYTES,
+            CHECKERBOARD_BYTES(),
             (
                 # 8 bit
                 2, 1, 10,
@@ -504,7 +508,7 @@ def test_BitCollection_converts_to_bytes(bitstructs, test_data, expected_bytes):
                 FORTY_BIT_STRUCT(),
                 EIGHT_BIT_STRUCT()
             ],
-            CHECKERBOARD_BYTES,
+            CHECKERBOARD_BYTES(),
             (
                 # 8 bit
                 2, 1, 10,
@@ -521,7 +525,7 @@ def test_BitCollection_converts_to_bytes(bitstructs, test_data, expected_bytes):
                 FORTY_BIT_STRUCT(),
                 THIRTY_BIT_STRUCT()
             ],
-            CHECKERBOARD_BYTES,
+            CHECKERBOARD_BYTES(),
             (
                 # 40 bit
                 85, 1370, 21165, 10,
@@ -567,7 +571,7 @@ def test_BitCollection_converts_to_str(bitstructs, test_data, expected_str):
                 TWENTY_BIT_STRUCT(),
                 THIRTY_BIT_STRUCT(),
                 THIRTY_BIT_STRUCT(),
-            ], CHECKERBOARD_BYTES,
+            ], CHECKERBOARD_BYTES(),
             (
                 # 8 bits
                 2, 1, 10,
@@ -592,7 +596,7 @@ def test_BitCollection_converts_to_str(bitstructs, test_data, expected_str):
                 FORTY_BIT_STRUCT(),
                 FORTY_BIT_STRUCT(),
                 FORTY_BIT_STRUCT(),
-            ], CHECKERBOARD_BYTES,
+            ], CHECKERBOARD_BYTES(),
             (
                 # 8 bits
                 2, 1, 10,
@@ -638,4 +642,57 @@ def test_BitCollection_to_dict(bitstructs, bytedata, expected):
         # each field has the expected value
         for field in testBitCollection[i]:
             assert field.value == testDict[testBitCollection.name][i][testBitCollection[i].name][
-                field.name]
\ No newline at end of file
+                field.name]
+
+# ============================= Lazy Decoding Tests =============================
+def lazy_test_collection():
+    return BitCollection(
+        bitstructs=[THIRTY_BIT_STRUCT(), bigNON_BYTE_ALIGNED_27BIT_STRUCT(), FORTY_BIT_STRUCT()], name="LAZY"
+    )
+
+
+def test_BitCollection_lazy_from_bytes_matches_eager():
+    rng = random.Random(13)
+    eager = lazy_test_collection()
+    lazy = lazy_test_collection()
+    for _ in range(20):
+        data = bytes(rng.getrandbits(8) for _ in range(eager.layout.byte_size))
+        eager.from_bytes(data)
+        lazy.from_bytes(data, lazy=True)
+        assert lazy.to_dict() == eager.to_dict()
+        assert bytes(lazy) == bytes(eager)
+
+
+def test_BitCollection_lazy_fields_decode_on_access():
+    collection = lazy_test_collection()
+    field = collection[0][0]
+    collection.from_bytes(bytes(collection.layout.byte_size), lazy=True)
+    collection.from_bytes(b"\xFF" * collection.layout.byte_size, lazy=True)
+    # nothing is decoded until the value is read
+    assert field._value == 0
+    assert field.value == (1 << field.size) - 1
+    assert field._value == field.value
+
+
+def test_BitCollection_lazy_values_can_be_overridden():
+    collection = lazy_test_collection()
+    collection.from_bytes(b"\xFF" * collection.layout.byte_size, lazy=True)
+    field = collection[1][0]
+    field.value = 0
+    assert field.value == 0
+    # the next populate replaces overridden values
+    collection.from_bytes(b"\xFF" * collection.layout.byte_size, lazy=True)
+    assert field.value == (1 << field.size) - 1
+    collection.from_bytes(bytes(collection.layout.byte_size))
+    assert field.value == 0
+    collection[2].from_int(1)
+    assert collection[2][-1].value == 1
+
+
+def test_BitCollection_lazy_from_bytes_requires_enough_bytes():
+    collection = lazy_test_collection()
+    try:
+        collection.from_bytes(bytes(collection.layout.byte_size - 1), lazy=True)
+        assert False
+    except ValueError as err:
+        assert str(err) == "Not enough bytes to fill the BitCollection"
@@ -11,7 +11,7 @@ from pyCXL.structs.biterator import Biterator
 # ============================= Biterator Tests =============================
 @pytest.mark.parametrize(
     "bytedata, expected_iterations, expected_output", [
-        (CHECKERBOARD_BYTES, 16, CHECKERBOARD_BITS[2:]),
+        (CHECKERBOARD_BYTES(), 16, CHECKERBOARD_BITS()[2:]),
         (bytearray(b""), 0, "")
     ]
 )
@@ -2,7 +2,8 @@
 import pytest
 
 # Package Imports
-from pyCXL.structs.bitfields import BitField
+from pyCXL.structs.bitfields import BitField, FieldSpec
+from pyCXL.structs.flitsubstructures import FlitHeader, Poison, H2DResponse
 
 # ============================= BitField Tests =============================
 @pytest.mark.parametrize(
@@ -185,4 +186,52 @@ def test_BitField_throws_invalid_assignment(bitfield, setval):
     try:
         bitfield.enums = setval
     except AttributeError as err:
-        assert str(err) == "enums field cannot be modified"
\ No newline at end of file
+        assert str(err) == "enums field cannot be modified"
+
+
+# ============================= FieldSpec Tests =============================
+def test_BitField_shares_interned_specs():
+    first = BitField(size=4, name="Shared", enums={1: "one"})
+    second = BitField(size=4, name="Shared", enums={1: "one"}, value=3)
+    assert first.spec is second.spec
+    assert BitField(size=5, name="Shared").spec is not first.spec
+    assert BitField(size=4, name="Shared", rsvd=True).spec is not first.spec
+    assert first.value == 0 and second.value == 3
+
+
+def test_BitField_instances_only_hold_values():
+    field = Poison()
+    assert not hasattr(field, "__dict__")
+    assert not hasattr(BitField(size=1, name="Plain"), "__dict__")
+    assert Poison().spec is field.spec
+    headers = [FlitHeader(), FlitHeader()]
+    assert all(a.spec is b.spec for a, b in zip(*headers))
+
+
+def test_FieldSpec_is_immutable():
+    spec = H2DResponse()[3].spec
+    assert spec.name == "RSP_PRE"
+    assert spec.enums[1] == "Host Cache Hit"
+    try:
+        spec.enums[3] = "Something"
+        assert False
+    except TypeError:
+        pass
+    try:
+        spec.size = 3
+        assert False
+    except AttributeError:
+        pass
+
+
+def test_BitField_from_spec():
+    spec = FieldSpec.intern(size=3, name="From Spec")
+    field = BitField.from_spec(spec, value=5)
+    assert field.spec is spec
+    assert field.value == 5
+    assert field.to_bin() == "101"
+    try:
+        field.spec = None
+        assert False
+    except AttributeError as err:
+        assert str(err) == "spec field cannot be modified"
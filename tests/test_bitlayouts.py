@@ -0,0 +1,143 @@
+# External Dependencies
+import pytest
+
+# Python Imports
+import random
+
+# Package imports
+from tests.test_utils import (
+    CHECKERBOARD_BYTES,
+    lilNON_BYTE_ALIGNED_27BIT_STRUCT,
+    bigNON_BYTE_ALIGNED_27BIT_STRUCT,
+    bigOVERLAPPING_BOUNDARY_STRUCT,
+    EIGHT_BIT_STRUCT,
+    FORTY_BIT_STRUCT,
+    THIRTY_BIT_STRUCT
+)
+from pyCXL.structs.bitfields import BitField
+from pyCXL.structs.bitlayouts import BitLayout, CollectionLayout, unique_keys
+from pyCXL.structs.bitstructs import BigEndianBitStruct
+from pyCXL.structs.bitcollections import BitCollection, FlitStruct
+from pyCXL.structs.flitsubstructures import FlitHeader, M2SHeader, H2DRequest
+
+
+def rebuild_from_segments(value, segments):
+    field = 0
+    for src, width, dst in segments:
+        field |= ((value >> src) & ((1 << width) - 1)) << dst
+    return field
+
+
+# ============================= BitLayout Tests =============================
+@pytest.mark.parametrize(
+    "names, expected", [
+        (("A", "B", "C"),               ("A", "B", "C")),
+        (("Rsvd", "A", "Rsvd"),         ("Rsvd[0]", "A", "Rsvd[1]")),
+        (("A", "A", "A"),               ("A[0]", "A[1]", "A[2]")),
+    ]
+)
+def test_unique_keys(names, expected):
+    assert unique_keys(names) == expected
+
+
+@pytest.mark.parametrize("struct_type", [FlitHeader, M2SHeader, H2DRequest])
+def test_layout_is_compiled_once_per_class(struct_type):
+    first = struct_type()
+    second = struct_type()
+    assert first.layout is second.layout
+    assert len(struct_type.__dict__["_layouts"]) == 1
+    assert first.size == sum(field.size for field in first)
+
+
+def test_layout_is_immutable_through_struct():
+    try:
+        FlitHeader().layout = None
+        assert False
+    except AttributeError as err:
+        assert str(err) == "Cannot modify BitStruct's layout"
+
+
+def test_layout_precomputes_shifts_and_masks():
+    layout = M2SHeader().layout
+    assert layout.size == 87
+    assert layout.byte_size == 11
+    assert layout.pad == 1
+    assert layout.shifts[0] == 86
+    assert layout.masks[6] == (1 << 46) - 1
+    assert layout.keys[-1] == "Rsvd"
+
+
+@pytest.mark.parametrize(
+    "bitstruct", [
+        lilNON_BYTE_ALIGNED_27BIT_STRUCT(),
+        bigNON_BYTE_ALIGNED_27BIT_STRUCT(),
+        bigOVERLAPPING_BOUNDARY_STRUCT()
+    ]
+)
+def test_layout_matches_struct(bitstruct):
+    bitstruct.from_bytes(CHECKERBOARD_BYTES())
+    layout = bitstruct.layout
+    values = tuple(field.value for field in bitstruct)
+    assert layout.unpack_bytes(CHECKERBOARD_BYTES()) == values
+    assert layout.pack(values) == int(bitstruct)
+    assert layout.pack_bytes(values) == bytes(bitstruct)
+
+
+@pytest.mark.parametrize("big_endian", [False, True])
+def test_segments_rebuild_fields_from_bit_string(big_endian):
+    rng = random.Random(27)
+    for _ in range(50):
+        sizes = [rng.randint(1, 40) for _ in range(rng.randint(1, 6))]
+        layout = BitLayout(name="Random", names=[str(idx) for idx in range(len(sizes))], sizes=sizes,
+                           big_endian=big_endian)
+        value = rng.getrandbits(layout.size)
+        expected = layout.unpack(value)
+        for idx, segments in enumerate(layout.segments):
+            assert rebuild_from_segments(value, segments) == expected[idx]
+
+
+def test_big_endian_fields_are_split_into_runs():
+    layout = BigEndianBitStruct(
+        bitfields=[BitField(size=4, name="Low"), BitField(size=12, name="Straddles")],
+        name="Split"
+    ).layout
+    assert len(layout.segments[0]) == 1
+    assert len(layout.segments[1]) == 2
+
+
+# ============================= CollectionLayout Tests =============================
+def test_collection_layout_is_compiled_once():
+    first = BitCollection(bitstructs=[EIGHT_BIT_STRUCT(), FORTY_BIT_STRUCT()], name="TEST")
+    second = BitCollection(bitstructs=[EIGHT_BIT_STRUCT(), FORTY_BIT_STRUCT()], name="TEST")
+    assert first.layout is second.layout
+    assert isinstance(first.layout, CollectionLayout)
+
+
+def test_collection_layout_flattens_fields():
+    collection = FlitStruct(
+        bitstructs=[EIGHT_BIT_STRUCT(), FORTY_BIT_STRUCT(), FORTY_BIT_STRUCT(), FORTY_BIT_STRUCT()],
+        name="TEST FLIT"
+    )
+    layout = collection.layout
+    assert layout.size == 128
+    assert layout.keys[3] == "40 bits[0].Mango"
+    assert layout.fields[3] == (1, 0)
+
+    collection.from_bytes(CHECKERBOARD_BYTES())
+    expected = tuple(field.value for struct in collection for field in struct)
+    assert layout.unpack_bytes(CHECKERBOARD_BYTES()) == expected
+    assert layout.pack_bytes(expected) == bytes(collection)
+
+
+def test_collection_layout_with_big_endian_struct():
+    collection = BitCollection(
+        bitstructs=[THIRTY_BIT_STRUCT(), bigNON_BYTE_ALIGNED_27BIT_STRUCT()],
+        name="MIXED"
+    )
+    collection.from_bytes(CHECKERBOARD_BYTES())
+    layout = collection.layout
+    expected = tuple(field.value for struct in collection for field in struct)
+    assert layout.unpack_bytes(CHECKERBOARD_BYTES()) == expected
+    value = int.from_bytes(CHECKERBOARD_BYTES()[:layout.byte_size], 'big') >> layout.pad
+    for idx, segments in enumerate(layout.segments):
+        assert rebuild_from_segments(value, segments) == expected[idx]
@@ -0,0 +1,148 @@
+# External Dependencies
+import pytest
+
+# Python Imports
+import random
+
+# Package imports
+from tests.test_utils import (
+    CHECKERBOARD_BYTES,
+    THIRTY_BIT_STRUCT,
+    bigNON_BYTE_ALIGNED_27BIT_STRUCT,
+    lilOVERLAPPING_BOUNDARY_STRUCT
+)
+from pyCXL.structs.bitcollections import BitCollection
+from pyCXL.structs.bitlayouts import BitLayout, CollectionLayout
+from pyCXL.structs.bitviews import StructView, field_windows
+from pyCXL.structs.flitparser import G_SLOT_TABLE, H_SLOT_TABLE, HOST_TO_DEVICE
+
+
+def random_layout(rng, big_endian):
+    sizes = [rng.randint(1, 70) for _ in range(rng.randint(1, 8))]
+    return BitLayout(name="Random Layout", names=[f"F{idx}" for idx in range(len(sizes))], sizes=sizes,
+                     big_endian=big_endian)
+
+
+# ============================= Read Tests =============================
+@pytest.mark.parametrize("big_endian", [False, True])
+def test_view_reads_match_unpack_bytes(big_endian):
+    rng = random.Random(11)
+    for _ in range(50):
+        layout = random_layout(rng, big_endian)
+        data = bytes(rng.getrandbits(8) for _ in range(layout.byte_size * 4))
+        view = StructView(layout, data)
+        for offset in range(0, len(data), layout.byte_size):
+            view.rebind(offset)
+            expected = layout.unpack_bytes(data, offset)
+            assert tuple(view[idx] for idx in range(len(view))) == expected
+            assert tuple(view[key] for key in view) == expected
+            assert view.values() == expected
+
+
+def test_view_of_collection_matches_from_bytes():
+    collection = BitCollection(bitstructs=[THIRTY_BIT_STRUCT(), bigNON_BYTE_ALIGNED_27BIT_STRUCT()], name="MIXED")
+    collection.from_bytes(CHECKERBOARD_BYTES())
+    view = collection.view(bytes(CHECKERBOARD_BYTES()))
+    assert [view[idx] for idx in range(len(view))] == [
+        field.value for struct in collection for field in struct.fields
+    ]
+
+
+def test_struct_view_method():
+    struct = lilOVERLAPPING_BOUNDARY_STRUCT()
+    struct.from_bytes(CHECKERBOARD_BYTES())
+    view = struct.view(CHECKERBOARD_BYTES())
+    assert view.layout is struct.layout
+    assert list(view.values()) == [field.value for field in struct]
+    assert view.to_dict() == {field.name: field.value for field in struct}
+
+
+# ============================= Write Tests =============================
+@pytest.mark.parametrize("big_endian", [False, True])
+def test_view_writes_only_touch_their_field(big_endian):
+    rng = random.Random(12)
+    for _ in range(50):
+        layout = random_layout(rng, big_endian)
+        data = bytearray(rng.getrandbits(8) for _ in range(layout.byte_size + 3))
+        view = StructView(layout, data, 1)
+        before = list(layout.unpack_bytes(data, 1))
+        idx = rng.randrange(len(layout))
+        new_value = rng.getrandbits(layout.sizes[idx])
+        view[idx] = new_value
+        before[idx] = new_value
+        assert layout.unpack_bytes(data, 1) == tuple(before)
+        assert view[idx] == new_value
+
+
+def test_view_writes_flits_in_place():
+    slot_format = H_SLOT_TABLE[HOST_TO_DEVICE][0]
+    capture = bytearray(16 * 3)
+    view = StructView(slot_format.layout, memoryview(capture))
+    for offset in (0, 16, 32):
+        view.rebind(offset)
+        view["Flit Header.Slot 0"] = offset // 16
+        view["H2D Request.Address"] = 0xDEADBEEF
+    columns = [slot_format.layout.unpack_bytes(capture, offset) for offset in (0, 16, 32)]
+    slot_idx = slot_format.keys.index("Flit Header.Slot 0")
+    assert [values[slot_idx] for values in columns] == [0, 1, 2]
+    assert bytes(view) == bytes(capture[32:])
+
+
+def test_view_rejects_bad_writes():
+    view = StructView(G_SLOT_TABLE[HOST_TO_DEVICE][1].layout, bytes(16))
+    try:
+        view[0] = 1
+        assert False
+    except TypeError as err:
+        assert str(err) == "Cannot modify a StructView of a read only buffer"
+
+    view = StructView(G_SLOT_TABLE[HOST_TO_DEVICE][1].layout, bytearray(16))
+    size = view.layout.sizes[0]
+    try:
+        view[0] = 1 << size
+        assert False
+    except ValueError as err:
+        assert str(err) == f"{1 << size} is too large for the field size: {size} bits"
+
+
+# ============================= Binding Tests =============================
+def test_view_rebind_bounds():
+    layout = G_SLOT_TABLE[HOST_TO_DEVICE][1].layout
+    view = StructView(layout, bytes(40))
+    assert view.rebind(24) is view
+    assert view.offset == 24
+    try:
+        view.rebind(25)
+        assert False
+    except ValueError as err:
+        assert str(err) == "Not enough bytes to fill the StructView"
+    assert view.offset == 24
+
+
+def test_view_unknown_field():
+    view = StructView(G_SLOT_TABLE[HOST_TO_DEVICE][1].layout, bytes(16))
+    try:
+        view["Nope"]
+        assert False
+    except KeyError as err:
+        assert err.args[0] == "H2D/M2S G1 has no field Nope"
+
+
+def test_view_properties_throw_on_reassignment():
+    view = StructView(G_SLOT_TABLE[HOST_TO_DEVICE][1].layout, bytes(16))
+    for prop in ("layout", "buffer", "offset"):
+        try:
+            setattr(view, prop, None)
+            assert False
+        except AttributeError as err:
+            assert str(err).startswith(f"Cannot modify StructView's {prop}")
+
+
+def test_field_windows_are_cached_and_minimal():
+    layout = CollectionLayout(name="Pair", layouts=[
+        BitLayout(name="A", names=["X", "Y"], sizes=[4, 12]),
+        BitLayout(name="B", names=["Z"], sizes=[16])
+    ])
+    windows = field_windows(layout)
+    assert windows is field_windows(layout)
+    assert [(window.start, window.stop) for window in windows] == [(0, 1), (0, 2), (2, 4)]
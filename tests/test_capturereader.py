@@ -0,0 +1,126 @@
+# Package imports
+from pyCXL.capture.capturereader import CaptureReader, SLOT_BYTES
+from pyCXL.structs.flitparser import FLIT_BYTES, G_SLOT_TABLE, HOST_TO_DEVICE
+from tests.test_utils import capture_file
+
+REQ_SLOT = G_SLOT_TABLE[HOST_TO_DEVICE][4]
+
+
+# ============================= Random Access Tests =============================
+def test_CaptureReader_random_access(capture_file):
+    path, data = capture_file(SLOT_BYTES, 100, seed=15)
+    with CaptureReader(path) as reader:
+        assert len(reader) == 100
+        assert reader.read(0) == data[:16]
+        assert reader.read(-1) == data[-16:]
+        assert bytes(reader[42]) == data[42 * 16:43 * 16]
+        assert bytes(reader[10:12]) == data[160:192]
+        assert b"".join(bytes(record) for record in reader) == data
+        try:
+            reader[100]
+            assert False
+        except IndexError as err:
+            assert str(err) == "CaptureReader index out of range"
+    assert reader.closed
+
+
+def test_CaptureReader_populates_existing_structs(capture_file):
+    path, data = capture_file(SLOT_BYTES, 100, seed=15)
+    flit = REQ_SLOT.build()
+    with CaptureReader(path) as reader:
+        record = reader[7]
+        flit.from_bytes(record)
+        record.release()
+    assert flit.layout.unpack_bytes(data, 7 * 16) == tuple(
+        field.value for struct in flit for field in struct.fields
+    )
+
+
+def test_CaptureReader_views(capture_file):
+    path, data = capture_file(SLOT_BYTES, 100, seed=15)
+    with CaptureReader(path, layout=REQ_SLOT.layout) as reader:
+        view = reader.view(3)
+        assert view.values() == REQ_SLOT.layout.unpack_bytes(data, 48)
+        view.rebind(reader.offset_of(99))
+        assert view.values() == REQ_SLOT.layout.unpack_bytes(data, 99 * 16)
+        del view
+
+
+def test_CaptureReader_writable_views_modify_the_file(capture_file):
+    path, data = capture_file(SLOT_BYTES, 100, seed=15)
+    with CaptureReader(path, layout=REQ_SLOT.layout, writable=True) as reader:
+        view = reader.view(5)
+        view["M2S Request.Tag"] = 0xBEEF
+        del view
+    with CaptureReader(path, layout=REQ_SLOT.layout) as reader:
+        view = reader.view(5)
+        assert view["M2S Request.Tag"] == 0xBEEF
+        del view
+        assert reader.read(4) == data[64:80]
+
+
+# ============================= Batch Decode Tests =============================
+def test_CaptureReader_tables(capture_file):
+    path, data = capture_file(SLOT_BYTES, 100, seed=15)
+    with CaptureReader(path, layout=REQ_SLOT) as reader:
+        table = reader.table(10, 20)
+        assert len(table) == 10
+        assert bytes(table) == data[160:320]
+        assert bytes(reader.table(95)) == data[95 * 16:]
+        assert len(reader.table(50, 40)) == 0
+        chunks = list(reader.tables(30))
+        assert [len(chunk) for chunk in chunks] == [30, 30, 30, 10]
+        assert b"".join(bytes(chunk) for chunk in chunks) == data
+
+
+def test_CaptureReader_tables_of_slots_within_flits(capture_file):
+    path, data = capture_file(FLIT_BYTES, 20, seed=16)
+    with CaptureReader(path, record_bytes=FLIT_BYTES) as reader:
+        assert len(reader) == 20
+        for position in range(1, 4):
+            table = reader.table(layout=REQ_SLOT.layout, offset=16 * position)
+            assert [row.values() for row in table] == [
+                REQ_SLOT.layout.unpack_bytes(data, flit * FLIT_BYTES + 16 * position) for flit in range(20)
+            ]
+        try:
+            reader.table(layout=REQ_SLOT.layout, offset=60)
+            assert False
+        except ValueError as err:
+            assert str(err) == "H2D/M2S G4 does not fit in a 66 byte record at offset 60"
+
+
+# ============================= Error Tests =============================
+def test_CaptureReader_partial_records(tmp_path):
+    path = tmp_path / "partial.bin"
+    path.write_bytes(bytes(40))
+    try:
+        CaptureReader(path)
+        assert False
+    except ValueError as err:
+        assert str(err) == "Capture does not hold a whole number of 16 byte records"
+    with CaptureReader(path, strict=False) as reader:
+        assert len(reader) == 2
+
+
+def test_CaptureReader_empty_capture(tmp_path):
+    path = tmp_path / "empty.bin"
+    path.write_bytes(b"")
+    with CaptureReader(path, layout=REQ_SLOT.layout) as reader:
+        assert len(reader) == 0
+        assert list(reader) == []
+        assert len(reader.table()) == 0
+
+
+def test_CaptureReader_requires_a_layout(capture_file):
+    path, _ = capture_file(SLOT_BYTES, 100, seed=15)
+    with CaptureReader(path) as reader:
+        try:
+            reader.view(0)
+            assert False
+        except ValueError as err:
+            assert str(err) == "A layout is required, pass one here or to the CaptureReader"
+        try:
+            reader.record_bytes = 4
+            assert False
+        except AttributeError as err:
+            assert str(err) == "Cannot modify CaptureReader's record_bytes"
@@ -0,0 +1,186 @@
+# External Dependencies
+import pytest
+
+# Python Imports
+import random
+
+# Package imports
+from pyCXL.analysis.coherence import (
+    BAD_REQUEST,
+    BAD_SNOOP_RESPONSE,
+    CLEAN_EVICT,
+    DIRTY_EVICT,
+    DISALLOWED_SNOOP_RESPONSE,
+    GO,
+    GO_ERR,
+    GO_ERROR,
+    GO_WRITE_PULL,
+    RD_OWN,
+    RD_SHARED,
+    RSP_I_FWD_M,
+    RSP_I_HIT_I,
+    RSP_S_FWD_M,
+    RSP_S_HIT_SE,
+    SNP_DATA,
+    SNP_INV,
+    UNMATCHED_RESPONSE,
+    WRITE_PULL,
+    AddressTable,
+    CoherenceTracker
+)
+from pyCXL.capture.trace import TraceReader, TraceWriter
+from pyCXL.structs.flitparser import DEVICE_TO_HOST, HOST_TO_DEVICE
+from tests.test_utils import make_slots, to_bytes
+
+TX = HOST_TO_DEVICE
+RX = DEVICE_TO_HOST
+
+# Response Data of a GO granting each state
+GO_I, GO_S, GO_E, GO_M = 0b0011, 0b0001, 0b0010, 0b0110
+
+
+def request(opcode, cqid, address):
+    # D2H H1: D2H_Data_Header, D2H_Request
+    return make_slots(RX, 1, fields={
+        "D2H_Request.Valid": 1, "D2H_Request.Opcode": opcode, "D2H_Request.Command Queue ID": cqid,
+        "D2H_Request.Address": address
+    })
+
+
+def response(opcode, cqid, data=0):
+    # H2D H0: H2D Request, H2D Response
+    return make_slots(TX, 0, fields={
+        "H2D Response.Valid": 1, "H2D Response.OpCode": opcode, "H2D Response.Command Queue ID": cqid,
+        "H2D Response.Response Data": data
+    })
+
+
+def snoop(opcode, uqid, address):
+    return make_slots(TX, 0, fields={
+        "H2D Request.Valid": 1, "H2D Request.OpCode": opcode, "H2D Request.Unique Queue ID": uqid,
+        "H2D Request.Address": address
+    })
+
+
+def snoop_response(opcode, uqid):
+    # D2H H2: D2H_Response after 4 D2H_Data_Headers
+    return make_slots(RX, 2, fields={
+        "D2H_Response.Valid": 1, "D2H_Response.Opcode": opcode, "D2H_Response.Unique Queue ID": uqid
+    })
+
+
+# ============================= AddressTable Tests =============================
+@pytest.mark.parametrize("capacity", [1, 3, 1 << 10])
+def test_AddressTable_insert_and_grow(capacity):
+    table = AddressTable(capacity)
+    lines = random.sample(range(1 << 46), 3000) + [0, (1 << 46) - 1]
+    for line in lines:
+        slot = table.insert(line)
+        table.counts[slot] += 1
+        assert table.insert(line) == slot
+    assert len(table) == len(set(lines))
+    assert table.capacity >= len(table) / 0.7
+    for line in lines:
+        slot = table.find(line)
+        assert slot >= 0 and table.line(slot) == line and table.counts[slot] >= 1
+    assert table.find(1 << 47) == -1 and (1 << 47) not in table
+    assert sorted(line for line, _, _ in table.items()) == sorted(set(lines))
+    try:
+        AddressTable(0)
+        assert False
+    except ValueError:
+        pass
+
+
+# ============================= State Machine Tests =============================
+def test_CoherenceTracker_requests():
+    tracker = CoherenceTracker()
+    assert tracker.state(0x40) is None
+    assert tracker.process(request(RD_SHARED, 1, 0x40), 0) == []
+    assert tracker.state(0x40) is None
+    assert tracker.process(response(GO, 1, GO_S), 1) == []
+    assert tracker.state(0x40) == "S"
+    tracker.process(request(RD_OWN, 2, 0x40), 2)
+    # WritePull leaves the state alone
+    tracker.process(response(WRITE_PULL, 2), 3)
+    assert tracker.state(0x40) == "S"
+    tracker.process(response(GO, 2, GO_M), 4)
+    assert tracker.state(0x40) == "M"
+    tracker.process(request(DIRTY_EVICT, 3, 0x40), 5)
+    tracker.process(response(GO_WRITE_PULL, 3), 6)
+    assert tracker.state(0x40) == "I"
+    assert tracker.census() == {None: 0, "I": 1, "S": 0, "E": 0, "M": 0}
+    stats = tracker.stats
+    assert (stats["requests"], stats["responses"]) == (3, 4)
+
+
+def test_CoherenceTracker_request_violations():
+    tracker = CoherenceTracker()
+    tracker.process(request(RD_OWN, 1, 0x80), 0)
+    tracker.process(response(GO, 1, GO_E), 1)
+    violations = tracker.process(request(RD_SHARED, 2, 0x80), 2)
+    violations += tracker.process(request(DIRTY_EVICT, 3, 0x80), 3)
+    assert [(violation.kind, violation.state, violation.opcode) for violation in violations] == [
+        (BAD_REQUEST, "E", RD_SHARED), (BAD_REQUEST, "E", DIRTY_EVICT)
+    ]
+    # a clean evict of an E line is fine
+    assert tracker.process(request(CLEAN_EVICT, 4, 0x80), 4) == []
+    violations = tracker.process(response(GO, 4, GO_ERROR), 5)
+    violations += tracker.process(response(GO, 9, GO_S), 6)
+    assert [violation.kind for violation in violations] == [GO_ERR, UNMATCHED_RESPONSE]
+    assert violations[1].address is None
+    assert tracker.stats[BAD_REQUEST] == 2 and tracker.stats[UNMATCHED_RESPONSE] == 1
+
+
+def test_CoherenceTracker_snoops():
+    tracker = CoherenceTracker()
+    tracker.process(request(RD_OWN, 1, 0x100), 0)
+    tracker.process(response(GO, 1, GO_M), 1)
+    tracker.process(snoop(SNP_DATA, 7, 0x100), 2)
+    assert tracker.process(snoop_response(RSP_S_FWD_M, 7), 3) == []
+    assert tracker.state(0x100) == "S"
+    # the line is S, a forward of M is wrong
+    tracker.process(snoop(SNP_DATA, 8, 0x100), 4)
+    violations = tracker.process(snoop_response(RSP_I_FWD_M, 8), 5)
+    assert [(violation.kind, violation.address, violation.state) for violation in violations] == [
+        (BAD_SNOOP_RESPONSE, 0x100, "S")
+    ]
+    assert tracker.state(0x100) == "I"
+    # SnpInv must leave the line invalid
+    tracker.process(request(RD_SHARED, 2, 0x140), 6)
+    tracker.process(response(GO, 2, GO_S), 7)
+    tracker.process(snoop(SNP_INV, 9, 0x140), 8)
+    violations = tracker.process(snoop_response(RSP_S_HIT_SE, 9), 9)
+    assert [violation.kind for violation in violations] == [DISALLOWED_SNOOP_RESPONSE]
+    # snoops of lines never seen have nothing to check against
+    tracker.process(snoop(SNP_INV, 10, 0x999), 10)
+    assert tracker.process(snoop_response(RSP_I_HIT_I, 10), 11) == []
+    assert tracker.state(0x999) == "I"
+
+
+def test_CoherenceTracker_hot_lines():
+    tracker = CoherenceTracker(capacity=4)
+    for cqid, address in enumerate([0x1, 0x2, 0x2, 0x3, 0x2, 0x3] + list(range(0x100, 0x140))):
+        tracker.process(request(RD_SHARED, cqid, address))
+    assert tracker.hot(2) == [(0x2, 3), (0x3, 2)]
+    assert len(tracker) == 3 + 0x40
+    try:
+        tracker.table = None
+        assert False
+    except AttributeError:
+        pass
+
+
+# ============================= Trace Tests =============================
+def test_CoherenceTracker_run(tmp_path):
+    path = tmp_path / "link.pcxl"
+    with TraceWriter(path) as writer:
+        writer.write(to_bytes(request(RD_OWN, 3, 0x200)), 10, RX)
+        writer.write(to_bytes(response(GO, 3, GO_E)), 20, TX)
+        writer.write(to_bytes(request(RD_SHARED, 4, 0x200)), 30, RX)
+    tracker = CoherenceTracker()
+    with TraceReader(path) as trace:
+        violations = list(tracker.run(trace.flits()))
+    assert [(violation.kind, violation.timestamp) for violation in violations] == [(BAD_REQUEST, 30)]
+    assert tracker.process_flit(TX, to_bytes(response(GO, 4, GO_S)), timestamp=40) == []
+    assert tracker.state(0x200) == "S"
@@ -0,0 +1,174 @@
+# Python Imports
+import time
+
+# Package imports
+from pyCXL.analysis.correlator import (
+    DEVICE_REQUESTS,
+    HOST_SNOOPS,
+    KINDS,
+    MEM_REQUESTS,
+    TransactionCorrelator,
+    transaction_key
+)
+from pyCXL.capture.trace import TraceReader, TraceWriter
+from pyCXL.structs.flitparser import DEVICE_TO_HOST, HOST_TO_DEVICE
+from tests.test_utils import make_slots, to_bytes
+
+TX = HOST_TO_DEVICE
+RX = DEVICE_TO_HOST
+
+
+def d2h_request(cqid, address=0):
+    # D2H H1: D2H_Data_Header, D2H_Request
+    return make_slots(RX, 1, fields={
+        (0, "D2H_Request.Valid"): 1, (0, "D2H_Request.Command Queue ID"): cqid, (0, "D2H_Request.Address"): address
+    })
+
+
+def h2d_response(cqid, opcode=0):
+    # H2D H0: H2D Request, H2D Response
+    return make_slots(TX, 0, fields={
+        (0, "H2D Response.Valid"): 1, (0, "H2D Response.Command Queue ID"): cqid, (0, "H2D Response.OpCode"): opcode
+    })
+
+
+def h2d_data(cqid):
+    # H2D H2: H2D Data_Header, H2D Request
+    return make_slots(TX, 2, fields={(0, "H2D Data_Header.Valid"): 1, (0, "H2D Data_Header.Command Queue ID"): cqid})
+
+
+def m2s_request(tag, ldid=0):
+    # M2S H5: M2S Request
+    return make_slots(TX, 5, fields={
+        (0, "M2S Request.Valid"): 1, (0, "M2S Request.Tag"): tag, (0, "M2S Request.Logical Device Identifier"): ldid
+    })
+
+
+def s2m_drs(tag, ldid=0):
+    # S2M G6: 3 S2M_DRS, the first used
+    return make_slots(RX, 3, (6, 0, 0), fields={
+        (1, "S2M_DRS[0].Valid"): 1, (1, "S2M_DRS[0].Tag"): tag, (1, "S2M_DRS[0].Logical Device Identifier"): ldid
+    })
+
+
+# ============================= Matching Tests =============================
+def test_transaction_key():
+    keys = {transaction_key(kind, ident, ldid) for kind in KINDS for ident in (0, 0xFFFF) for ldid in (0, 0xF)}
+    assert len(keys) == len(KINDS) * 4
+
+
+def test_TransactionCorrelator_device_requests():
+    correlator = TransactionCorrelator()
+    assert correlator.process(d2h_request(0x12, address=0xABC), 10) == []
+    assert len(correlator) == 1
+    # an unrelated CQID does not match
+    assert correlator.process(h2d_response(0x13), 12) == []
+    records = correlator.process(h2d_response(0x12, opcode=0x4), 15)
+    assert len(records) == 1
+    record = records[0]
+    assert (record.kind, record.ident, record.address, record.issued, record.completed) == (
+        DEVICE_REQUESTS, 0x12, 0xABC, 10, 15
+    )
+    assert record.latency == 5 and record.response == 0x4
+    # the data following the GO is counted on the same transaction, not emitted again
+    assert correlator.process(h2d_data(0x12), 18) == []
+    assert record.completions == 2
+    assert correlator.stats == {
+        "requests": 1, "matched": 1, "completions": 3, "unmatched": 1, "timed out": 0, "reused": 0
+    }
+
+
+def test_TransactionCorrelator_mem_requests_by_ldid():
+    correlator = TransactionCorrelator()
+    correlator.process(m2s_request(0x100, ldid=1), 0)
+    correlator.process(m2s_request(0x100, ldid=2), 1)
+    assert len(correlator) == 2
+    records = correlator.process(s2m_drs(0x100, ldid=2), 7)
+    assert [(record.kind, record.ldid, record.latency) for record in records] == [(MEM_REQUESTS, 2, 6)]
+    records = correlator.process(s2m_drs(0x100, ldid=1), 9)
+    assert [(record.ldid, record.latency) for record in records] == [(1, 9)]
+
+
+def test_TransactionCorrelator_host_snoops():
+    correlator = TransactionCorrelator()
+    # H2D H0: H2D Request
+    correlator.process(make_slots(TX, 0, fields={
+        (0, "H2D Request.Valid"): 1, (0, "H2D Request.Unique Queue ID"): 0x7, (0, "H2D Request.Address"): 0x40
+    }), 3)
+    # D2H H2: D2H_Response after 4 D2H_Data_Headers
+    records = correlator.process(make_slots(RX, 2, fields={
+        (0, "D2H_Response.Valid"): 1, (0, "D2H_Response.Unique Queue ID"): 0x7
+    }), 4)
+    assert [(record.kind, record.address, record.latency) for record in records] == [(HOST_SNOOPS, 0x40, 1)]
+
+
+# ============================= Eviction Tests =============================
+def test_TransactionCorrelator_timeout():
+    correlator = TransactionCorrelator(timeout=100)
+    correlator.process(d2h_request(1), 0)
+    correlator.process(d2h_request(2), 50)
+    correlator.process(h2d_response(2), 60)
+    # request 1 times out, the completed request 2 is dropped silently once stale
+    records = correlator.process([], 120)
+    assert [(record.ident, record.completed, record.latency) for record in records] == [(1, None, None)]
+    assert len(correlator) == 1
+    assert correlator.process([], 151) == []
+    assert len(correlator) == 0
+    # the late completion matches nothing
+    assert correlator.process(h2d_response(1), 152) == []
+    stats = correlator.stats
+    assert stats["timed out"] == 1 and stats["unmatched"] == 1
+
+
+def test_TransactionCorrelator_reuse_and_flush():
+    correlator = TransactionCorrelator()
+    correlator.process(d2h_request(5), 0)
+    correlator.process(d2h_request(5), 1)
+    assert correlator.stats["reused"] == 1
+    assert len(correlator) == 1
+    correlator.process(d2h_request(6), 2)
+    records = correlator.flush()
+    assert [(record.ident, record.issued) for record in records] == [(5, 1), (6, 2)]
+    assert len(correlator) == 0 and correlator.outstanding() == []
+
+
+def test_TransactionCorrelator_memory_bounded():
+    correlator = TransactionCorrelator(timeout=1000)
+    for timestamp in range(20000):
+        correlator.process(d2h_request(timestamp & 0xFFF), timestamp)
+    assert len(correlator) <= 1001
+
+
+def test_TransactionCorrelator_throughput():
+    correlator = TransactionCorrelator(timeout=1 << 20)
+    requests = [d2h_request(cqid) for cqid in range(0x1000)]
+    responses = [h2d_response(cqid) for cqid in range(0x1000)]
+    start = time.perf_counter()
+    matched = 0
+    for timestamp in range(0x1000):
+        correlator.process(requests[timestamp], timestamp)
+        matched += len(correlator.process(responses[timestamp], timestamp))
+    assert matched == 0x1000
+    assert time.perf_counter() - start < 5
+
+
+# ============================= Trace Tests =============================
+def test_TransactionCorrelator_run_and_attributes(tmp_path):
+    path = tmp_path / "link.pcxl"
+    with TraceWriter(path) as writer:
+        writer.write(to_bytes(m2s_request(0x33, ldid=3)), 100, TX)
+        writer.write(to_bytes(s2m_drs(0x33, ldid=3)), 140, RX)
+        writer.write(to_bytes(d2h_request(0x1)), 150, RX)
+    correlator = TransactionCorrelator(timeout=1000)
+    with TraceReader(path) as trace:
+        records = list(correlator.run(trace.flits()))
+    assert [(record.kind, record.ident, record.ldid, record.latency) for record in records] == [
+        (MEM_REQUESTS, 0x33, 3, 40)
+    ]
+    assert [record.ident for record in correlator.outstanding()] == [0x33, 0x1]
+    assert correlator.process_flit(TX, to_bytes(h2d_response(0x1)), timestamp=160)[0].latency == 10
+    try:
+        correlator.timeout = 5
+        assert False
+    except AttributeError:
+        pass
@@ -0,0 +1,146 @@
+# External Dependencies
+import pytest
+
+# Python Imports
+import random
+
+# Package imports
+from pyCXL.analysis.credits import (
+    CACHE_DATA,
+    CACHE_REQUEST,
+    CACHE_RESPONSE,
+    CHANNELS,
+    CREDIT_FIELDS,
+    CREDIT_SHIFTS,
+    MEM_DATA,
+    MEM_REQUEST,
+    CreditTracker,
+    decode_credit
+)
+from pyCXL.analysis.retry import LLCTRL_LLCRD, LLCTRL_RETRY, LLCTRL_SHIFT, TYPE_SHIFT
+from pyCXL.capture.trace import TraceReader, TraceWriter
+from pyCXL.structs.flitparser import DEVICE_TO_HOST, FLIT_BYTES, HOST_TO_DEVICE, FlitParser
+from tests.test_utils import make_flit
+
+TX = HOST_TO_DEVICE
+RX = DEVICE_TO_HOST
+
+
+def credits(response=0, request=0, data=0):
+    return dict(zip(CREDIT_FIELDS, (response, request, data)))
+
+
+def llcrd(response=0, request=0, data=0, llctrl=LLCTRL_LLCRD):
+    head = (1 << TYPE_SHIFT) | (llctrl << LLCTRL_SHIFT)
+    for shift, code in zip(CREDIT_SHIFTS, (response, request, data)):
+        head |= code << shift
+    return head.to_bytes(16, 'big') + bytes(FLIT_BYTES - 16)
+
+
+# ============================= Encoding Tests =============================
+def test_decode_credit():
+    assert decode_credit(0) == (False, 0)
+    assert decode_credit(0x3) == (False, 4)
+    assert decode_credit(0x7) == (False, 64)
+    assert decode_credit(0xD) == (True, 16)
+
+
+# ============================= Tracker Tests =============================
+def test_CreditTracker_spends_and_returns():
+    tracker = CreditTracker(TX)
+    # H2D/M2S H0 carries an H2D Request and an H2D Response, G1 four H2D Responses
+    tracker.process_flit(RX, make_flit(RX, 1, [0, 0, 0], credits(response=0x3, request=0x2, data=0x9)))
+    assert tracker.balances[CACHE_RESPONSE] == 4
+    assert tracker.balances[CACHE_REQUEST] == 2
+    assert tracker.balances[MEM_DATA] == 1
+    tracker.process_flit(TX, make_flit(TX, 0, [1, 0, 0], valid=1))
+    assert tracker.balances[CACHE_REQUEST] == 1
+    assert tracker.balances[CACHE_RESPONSE] == -1
+    assert tracker.spent[CACHE_RESPONSE] == 5 and tracker.returned[CACHE_RESPONSE] == 4
+    # invalid messages and credits in the modelled direction change nothing
+    assert not tracker.process_flit(TX, make_flit(TX, 0, [1, 0, 0], credits(response=0x7), valid=0))
+    assert tracker.balances[CACHE_RESPONSE] == -1
+
+
+def test_CreditTracker_matches_decoded_slots():
+    raw = CreditTracker(TX)
+    decoded = CreditTracker(TX)
+    parsers = {TX: FlitParser(TX), RX: FlitParser(RX)}
+    rng = random.Random(4)
+    for _ in range(50):
+        direction = rng.choice([TX, RX])
+        flit = make_flit(direction, rng.choice([0, 1, 2, 3, 4, 5]), [rng.choice([0, 1, 2, 3, 4, 5]) for _ in range(3)],
+                         credits(*[rng.getrandbits(4) for _ in range(3)]), valid=rng.getrandbits(1))
+        raw.process_flit(direction, flit)
+        decoded.process(parsers[direction].parse(flit))
+    assert raw.balances == decoded.balances
+    assert raw.series() == decoded.series()
+
+
+def test_CreditTracker_llcrd_credits():
+    tracker = CreditTracker(TX)
+    tracker.process_flit(RX, llcrd(response=0x1, data=0xB))
+    tracker.process_flit(RX, llcrd(response=0x7, llctrl=LLCTRL_RETRY))
+    tracker.process_flit(TX, llcrd(response=0x7))
+    assert tracker.balances[CACHE_RESPONSE] == 1
+    assert tracker.balances[MEM_DATA] == 4
+    assert len(tracker.series()["timestamp"]) == 1
+
+
+def test_CreditTracker_starvation_windows():
+    tracker = CreditTracker(TX, initial={CACHE_REQUEST: 2})
+    send_request = make_flit(TX, 2, [0, 0, 0], valid=1)     # H2 holds an H2D Request and an H2D Data_Header
+    tracker.process_flit(TX, send_request, timestamp=10)
+    assert tracker.windows[0].channel == CACHE_DATA
+    tracker.process_flit(TX, send_request, timestamp=20)
+    tracker.process_flit(TX, make_flit(TX, 0, [0, 0, 0]), timestamp=30)
+    tracker.process_flit(RX, make_flit(RX, 0, [0, 0, 0], credits(request=0x2)), timestamp=40)
+    windows = {window.channel: window for window in tracker.windows}
+    assert set(windows) == {CACHE_DATA, CACHE_REQUEST}
+    request = windows[CACHE_REQUEST]
+    assert (request.start, request.stop, request.flits, request.lowest) == (20, 40, 2, 0)
+    assert windows[CACHE_DATA].stop is None and windows[CACHE_DATA].lowest == -2
+
+    series = tracker.series()
+    assert list(series["timestamp"]) == [10, 20, 40]
+    assert list(series[CACHE_REQUEST]) == [1, 0, 2]
+    assert set(series) == {"timestamp", *CHANNELS}
+
+
+def test_CreditTracker_columns_and_traces(tmp_path):
+    tracker = CreditTracker(TX)
+    columns = {CREDIT_FIELDS[0]: [0x1, 0, 0x9], CREDIT_FIELDS[1]: [0, 0x2, 0], CREDIT_FIELDS[2]: [0, 0, 0]}
+    assert tracker.process_columns(RX, columns, timestamps=[5, 6, 7]) == 3
+    assert tracker.balances[CACHE_RESPONSE] == 1 and tracker.balances["mem response"] == 1
+    assert list(tracker.series()["timestamp"]) == [5, 6, 7]
+    try:
+        tracker.process_columns(TX, columns)
+        assert False
+    except ValueError:
+        pass
+
+    path = tmp_path / "link.pcxl"
+    with TraceWriter(path, flits_per_block=2) as writer:
+        writer.write(make_flit(RX, 4, [5, 5, 5], credits(request=0xA)), 100, RX)
+        for timestamp in range(101, 104):
+            writer.write(make_flit(TX, 5, [4, 0, 0], valid=1), timestamp, TX)
+    tracker = CreditTracker(TX)
+    with TraceReader(path) as trace:
+        windows = list(tracker.run(trace.flits()))
+    assert tracker.balances[MEM_REQUEST] == 2 - 6
+    # G4 also carries an H2D Data_Header
+    assert [window.channel for window in windows] == [CACHE_DATA, MEM_REQUEST]
+    assert windows[0].start == windows[1].start == 101
+
+
+def test_CreditTracker_bad_arguments():
+    try:
+        CreditTracker(3)
+        assert False
+    except ValueError:
+        pass
+    try:
+        CreditTracker(TX, initial={"bogus": 1})
+        assert False
+    except ValueError as err:
+        assert str(err) == "Unknown credit channels: ['bogus']"
@@ -0,0 +1,141 @@
+# External Dependencies
+import pytest
+
+# Python Imports
+import random
+
+# Package imports
+import pyCXL.structs.flitcrc as flitcrc
+from pyCXL.structs.bitcollections import FlitStruct
+from pyCXL.structs.flitcrc import (
+    CRC_SEED,
+    FLIT_BYTES,
+    append_crc,
+    check_flit,
+    crc16,
+    crc_tables,
+    encode_flit,
+    flit_crc,
+    verify_flit,
+    verify_flits
+)
+from tests.test_utils import EIGHT_BIT_STRUCT, FORTY_BIT_STRUCT
+
+
+def bitwise_crc16(data, crc=CRC_SEED):
+    for byte in data:
+        for bit in range(7, -1, -1):
+            feedback = ((crc >> 15) ^ (byte >> bit)) & 1
+            crc = (crc << 1) & 0xFFFF
+            if feedback:
+                crc ^= 0xF053
+    return crc
+
+
+def make_flits(count, seed=31):
+    rng = random.Random(seed)
+    return b"".join(append_crc(bytes(rng.getrandbits(8) for _ in range(64))) for _ in range(count))
+
+
+# ============================= CRC Tests =============================
+@pytest.mark.parametrize("length", [0, 1, 2, 7, 8, 9, 15, 16, 63, 64, 100])
+def test_crc16_matches_bitwise_reference(length):
+    rng = random.Random(length)
+    data = bytes(rng.getrandbits(8) for _ in range(length))
+    assert crc16(data) == bitwise_crc16(data)
+    assert crc16(bytearray(data)) == crc16(memoryview(data)) == crc16(data)
+
+
+def test_crc16_continues():
+    data = bytes(range(64))
+    assert crc16(data[20:], crc16(data[:20])) == crc16(data)
+
+
+def test_crc_tables():
+    tables = crc_tables()
+    assert len(tables) == 8
+    assert tables[0][0] == 0 and tables[0][1] == 0xF053
+    for byte in [0, 1, 0x80, 0xFF]:
+        assert tables[3][byte] == bitwise_crc16(bytes([byte, 0, 0, 0]), crc=0)
+
+
+def test_append_and_check():
+    data = bytes(range(64))
+    flit = append_crc(data)
+    assert len(flit) == FLIT_BYTES
+    assert flit_crc(flit) == int.from_bytes(flit[64:], 'big')
+    assert check_flit(flit)
+    verify_flit(flit)
+    assert check_flit(b"\x00" * 3 + flit, offset=3)
+    for bit in [0, 100, 511, 520]:
+        corrupt = bytearray(flit)
+        corrupt[bit // 8] ^= 0x80 >> (bit % 8)
+        assert not check_flit(corrupt)
+        try:
+            verify_flit(corrupt)
+            assert False
+        except ValueError as err:
+            assert "Flit CRC mismatch" in str(err)
+    try:
+        append_crc(data[:10])
+        assert False
+    except ValueError:
+        pass
+    try:
+        check_flit(flit[:65])
+        assert False
+    except ValueError:
+        pass
+
+
+def make_slot(data):
+    slot = FlitStruct(bitstructs=[EIGHT_BIT_STRUCT(), FORTY_BIT_STRUCT(), FORTY_BIT_STRUCT(), FORTY_BIT_STRUCT()],
+                      name="TEST FLITSTRUCT")
+    slot.from_bytes(data)
+    return slot
+
+
+def test_encode_flit_of_flitstructs():
+    data = bytes(range(64))
+    slots = [make_slot(data[idx * 16:(idx + 1) * 16]) for idx in range(4)]
+    flit = encode_flit(*slots)
+    assert flit == append_crc(data)
+    assert encode_flit(data[:16], *slots[1:]) == flit
+    verify_flit(flit)
+    assert bytes(make_slot(flit)) == data[:16]
+    # a flit is always a header slot and exactly 3 generic slots
+    for count in (0, 2, 4):
+        try:
+            encode_flit(slots[0], *[slots[1]] * count)
+            assert False
+        except ValueError as err:
+            assert f"was given {count}" in str(err)
+    try:
+        encode_flit(data[:15], *slots[1:])
+        assert False
+    except ValueError:
+        pass
+
+
+# ============================= Batch Tests =============================
+@pytest.mark.parametrize("numpy", [True, False])
+def test_verify_flits(monkeypatch, numpy):
+    if not numpy:
+        monkeypatch.setattr(flitcrc, "np", None)
+    elif flitcrc.np is None:
+        pytest.skip("NumPy is not installed")
+    flits = bytearray(make_flits(50))
+    assert verify_flits(flits) == []
+    for idx in [0, 17, 49]:
+        flits[idx * FLIT_BYTES + idx] ^= 1
+    assert verify_flits(flits) == [0, 17, 49]
+    assert verify_flits(b"") == []
+
+    # flits within larger records
+    records = b"".join(b"\xAA" * 6 + flits[idx * FLIT_BYTES:(idx + 1) * FLIT_BYTES] for idx in range(50))
+    assert verify_flits(records, stride=72, offset=6) == [0, 17, 49]
+    try:
+        verify_flits(flits[:-1])
+        assert False
+    except ValueError:
+        pass
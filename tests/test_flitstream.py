@@ -0,0 +1,142 @@
+# External Dependencies
+import pytest
+
+# Python Imports
+import asyncio
+import random
+
+# Package imports
+from pyCXL.capture.flitstream import FlitStreamReader
+from pyCXL.structs.flitparser import FLIT_BYTES, HOST_TO_DEVICE, FlitParser
+from tests.test_utils import make_flit
+
+
+def random_flit(rng, control=False):
+    h_code = rng.choice([0, 1, 2, 3, 4, 5, 6])
+    g_codes = [rng.choice([0, 1, 2, 3, 4, 5]) for _ in range(3)]
+    return make_flit(HOST_TO_DEVICE, h_code, g_codes, rng=rng, control=control)
+
+
+def make_stream(seed, count=40):
+    rng = random.Random(seed)
+    return b"".join(random_flit(rng, control=idx % 8 == 7) for idx in range(count))
+
+
+def expected_flits(stream):
+    parser = FlitParser(HOST_TO_DEVICE)
+    parsed = [(idx, parser.parse(stream, idx * FLIT_BYTES)) for idx in range(len(stream) // FLIT_BYTES)]
+    return [(idx, slots) for idx, slots in parsed if slots is not None]
+
+
+async def collect(reader, **kwargs):
+    return [flit async for flit in FlitStreamReader(reader, **kwargs)]
+
+
+def feed(stream, pieces):
+    reader = asyncio.StreamReader()
+    start = 0
+    for size in pieces:
+        reader.feed_data(stream[start:start + size])
+        start += size
+    reader.feed_data(stream[start:])
+    reader.feed_eof()
+    return reader
+
+
+# ============================= Reassembly Tests =============================
+@pytest.mark.parametrize("read_bytes", [1, 7, 65, 66, 67, 200, 4096])
+def test_FlitStreamReader_reassembles_across_chunks(read_bytes):
+    stream = make_stream(1)
+
+    async def run():
+        return await collect(feed(stream, []), read_bytes=read_bytes)
+
+    flits = asyncio.run(run())
+    assert [(flit.index, flit.slots) for flit in flits] == expected_flits(stream)
+
+
+def test_FlitStreamReader_control_flits_and_structs():
+    stream = make_stream(2, count=16)
+
+    async def run():
+        everything = await collect(feed(stream, [5, 100]), skip_control=False)
+        structs = await collect(feed(stream, [5, 100]), structs=True)
+        return everything, structs
+
+    everything, structs = asyncio.run(run())
+    assert [flit.index for flit in everything] == list(range(16))
+    assert everything[7].slots == () and everything[15].slots == ()
+    assert len(structs) == 14
+    expected = FlitParser(HOST_TO_DEVICE).parse_structs(stream)
+    assert [slot.to_dict() for slot in structs[0]] == [slot.to_dict() for slot in expected]
+
+
+def test_FlitStreamReader_partial_flit():
+    stream = make_stream(3, count=4)
+
+    async def run(strict):
+        return await collect(feed(stream[:-10], []), strict=strict)
+
+    try:
+        asyncio.run(run(True))
+        assert False
+    except ValueError as err:
+        assert str(err) == "Stream ended with a partial 66 byte record"
+    assert len(asyncio.run(run(False))) == 3
+
+
+def test_FlitStreamReader_reads_on_demand():
+    stream = make_stream(4, count=100)
+
+    async def run():
+        flits = FlitStreamReader(feed(stream, []), read_bytes=FLIT_BYTES * 4)
+        async for _ in flits:
+            break
+        return flits
+
+    flits = asyncio.run(run())
+    assert flits.bytes_read == FLIT_BYTES * 4
+    assert flits.index == 1
+    try:
+        flits.index = 0
+        assert False
+    except AttributeError:
+        pass
+
+
+# ============================= Socket Tests =============================
+def test_FlitStreamReader_concurrent_links():
+    streams = [make_stream(10 + link, count=300) for link in range(3)]
+
+    async def send(stream, writer):
+        rng = random.Random(len(stream))
+        start = 0
+        while start < len(stream):
+            size = rng.randint(1, 500)
+            writer.write(stream[start:start + size])
+            await writer.drain()
+            start += size
+        writer.close()
+        await writer.wait_closed()
+
+    async def run():
+        servers = []
+        for stream in streams:
+            servers.append(await asyncio.start_server(
+                lambda reader, writer, stream=stream: send(stream, writer), "127.0.0.1", 0))
+        readers = []
+        for server in servers:
+            port = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port, limit=FLIT_BYTES * 8)
+            readers.append((reader, writer))
+        results = await asyncio.gather(*[collect(reader, read_bytes=FLIT_BYTES * 8) for reader, _ in readers])
+        for _, writer in readers:
+            writer.close()
+        for server in servers:
+            server.close()
+            await server.wait_closed()
+        return results
+
+    results = asyncio.run(run())
+    for flits, stream in zip(results, streams):
+        assert [(flit.index, flit.slots) for flit in flits] == expected_flits(stream)
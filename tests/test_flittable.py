@@ -0,0 +1,150 @@
+# External Dependencies
+import pytest
+
+# Python Imports
+import random
+
+# Package imports
+from pyCXL.structs.flitparser import G_SLOT_TABLE, H_SLOT_TABLE, HOST_TO_DEVICE, DEVICE_TO_HOST
+from pyCXL.structs.flittable import ARRAY, NUMPY, FlitTable, np
+
+BACKENDS = [ARRAY] + ([NUMPY] if np is not None else [])
+
+# G0 carries the 128 bit DATA field, G4 is M2S Req + H2D Data Header
+DATA_SLOT = G_SLOT_TABLE[HOST_TO_DEVICE][0]
+REQ_SLOT = G_SLOT_TABLE[HOST_TO_DEVICE][4]
+
+
+def random_capture(slot_format, count, seed=14):
+    rng = random.Random(seed)
+    return bytes(rng.getrandbits(8) for _ in range(slot_format.layout.byte_size * count))
+
+
+def expected_rows(slot_format, data):
+    layout = slot_format.layout
+    return [layout.unpack_bytes(data, offset) for offset in range(0, len(data), layout.byte_size)]
+
+
+# ============================= Construction Tests =============================
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("slot_format", [DATA_SLOT, REQ_SLOT, H_SLOT_TABLE[DEVICE_TO_HOST][6]])
+def test_FlitTable_from_bytes_matches_unpack_bytes(backend, slot_format):
+    data = random_capture(slot_format, 25)
+    table = FlitTable.from_bytes(data, slot_format.layout, backend=backend)
+    assert len(table) == 25
+    assert table.backend == backend
+    assert [row.values() for row in table] == expected_rows(slot_format, data)
+    assert bytes(table) == data
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_FlitTable_from_rows(backend):
+    data = random_capture(REQ_SLOT, 5)
+    structs = []
+    for offset in range(0, len(data), 16):
+        struct = REQ_SLOT.build()
+        struct.from_bytes(data[offset:offset + 16])
+        structs.append(struct)
+    table = FlitTable.from_rows(REQ_SLOT.layout, structs, backend=backend)
+    assert bytes(table) == data
+    assert FlitTable.from_rows(REQ_SLOT.layout, [row.values() for row in table], backend=backend).to_dict() == \
+        table.to_dict()
+
+
+def test_FlitTable_array_backend_uses_typed_arrays():
+    table = FlitTable.from_bytes(random_capture(DATA_SLOT, 3), DATA_SLOT.layout, backend=ARRAY)
+    data_key = DATA_SLOT.keys[-1]
+    assert isinstance(table[data_key], list)
+    small = [key for key, size in zip(table.keys, DATA_SLOT.layout.sizes) if size <= 8]
+    assert all(table[key].typecode == "B" for key in small)
+    rows = FlitTable.from_rows(DATA_SLOT.layout, [row.values() for row in table], backend=ARRAY)
+    assert isinstance(rows[data_key], list) and all(rows[key].typecode == "B" for key in small)
+    assert rows.to_dict() == table.to_dict()
+
+
+@pytest.mark.skipif(np is None, reason="requires NumPy")
+def test_FlitTable_numpy_backend_column_dtypes():
+    table = FlitTable.from_bytes(random_capture(REQ_SLOT, 3), REQ_SLOT.layout)
+    assert table["M2S Request.Valid"].dtype == np.uint8
+    assert table["M2S Request.Address"].dtype == np.uint64
+    assert table.nbytes < 3 * 16 * 4
+
+
+# ============================= Access Tests =============================
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_FlitTable_rows_slices_and_masks(backend):
+    data = random_capture(REQ_SLOT, 40)
+    rows = expected_rows(REQ_SLOT, data)
+    table = FlitTable.from_bytes(data, REQ_SLOT.layout, backend=backend)
+
+    assert table[-1].values() == rows[-1]
+    assert table[3]["M2S Request.Tag"] == rows[3][REQ_SLOT.keys.index("M2S Request.Tag")]
+    assert [row.values() for row in table[10:20]] == rows[10:20]
+
+    opcode_idx = REQ_SLOT.keys.index("M2S Request.MemOpcode")
+    wanted = rows[0][opcode_idx]
+    matching = table[table.where("M2S Request.MemOpcode", wanted)]
+    assert [row.values() for row in matching] == [row for row in rows if row[opcode_idx] == wanted]
+    assert len(table.filter(lambda row: row["M2S Request.MemOpcode"] == wanted)) == len(matching)
+    both = table.where("M2S Request.MemOpcode", wanted, (wanted + 1) % 16)
+    assert sum(bool(value) for value in both) == sum(row[opcode_idx] in (wanted, (wanted + 1) % 16) for row in rows)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_FlitTable_exports(backend):
+    data = random_capture(DATA_SLOT, 4)
+    table = FlitTable.from_bytes(data, DATA_SLOT.layout, backend=backend)
+    exported = table.to_dict()
+    assert list(exported) == list(DATA_SLOT.keys)
+    assert all(isinstance(value, int) for column in exported.values() for value in column)
+    assert table.to_rows()[2] == dict(zip(DATA_SLOT.keys, expected_rows(DATA_SLOT, data)[2]))
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_FlitTable_concat(backend):
+    data = random_capture(REQ_SLOT, 10)
+    first = FlitTable.from_bytes(data[:64], REQ_SLOT.layout, backend=backend)
+    second = FlitTable.from_bytes(data[64:], REQ_SLOT.layout, backend=backend)
+    assert bytes(FlitTable.concat([first, second])) == data
+
+
+def test_FlitTable_row_populates_collections():
+    data = random_capture(REQ_SLOT, 2)
+    table = FlitTable.from_bytes(data, REQ_SLOT.layout)
+    struct = table[1].populate(REQ_SLOT.build())
+    assert bytes(struct) == data[16:]
+    try:
+        table[0].populate(DATA_SLOT.build())
+        assert False
+    except ValueError as err:
+        assert str(err) == "H2D/M2S G0 does not use the H2D/M2S G4 layout"
+
+
+# ============================= Error Tests =============================
+def test_FlitTable_errors():
+    table = FlitTable.from_bytes(random_capture(REQ_SLOT, 2), REQ_SLOT.layout, backend=ARRAY)
+    try:
+        table[2]
+        assert False
+    except IndexError as err:
+        assert str(err) == "FlitTable index out of range"
+    try:
+        table.mask([True])
+        assert False
+    except ValueError as err:
+        assert str(err) == "Mask of 1 values does not match the 2 rows of the FlitTable"
+    try:
+        FlitTable(REQ_SLOT.layout, {})
+        assert False
+    except ValueError as err:
+        assert str(err).startswith("Missing columns for H2D/M2S G4")
+    try:
+        FlitTable.from_bytes(b"", REQ_SLOT.layout, backend="pandas")
+        assert False
+    except ValueError as err:
+        assert str(err) == "Unknown FlitTable backend: pandas"
+    try:
+        table.layout = None
+        assert False
+    except AttributeError as err:
+        assert str(err) == "Cannot modify FlitTable's layout"
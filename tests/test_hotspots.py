@@ -0,0 +1,139 @@
+# External Dependencies
+import pytest
+
+# Python Imports
+import pickle
+import random
+from collections import Counter
+
+# Package imports
+from pyCXL.analysis.hotspots import CountMinSketch, HotAddressProfiler
+from pyCXL.capture.trace import TraceReader, TraceWriter
+from pyCXL.structs import flitsubstructures as subs
+from pyCXL.structs.flitparser import DEVICE_TO_HOST, HOST_TO_DEVICE
+from tests.test_utils import make_slots, to_bytes
+
+TX = HOST_TO_DEVICE
+RX = DEVICE_TO_HOST
+
+
+def skewed(count, seed=1):
+    """
+    count cachelines, half of them 0x10, 0x20 or 0x30 in the ratio 4:2:1 and the rest spread over 2 ** 40 lines
+    """
+    generator = random.Random(seed)
+    return [generator.choice((0x10, 0x10, 0x10, 0x10, 0x20, 0x20, 0x30)) if generator.random() < 0.5
+            else generator.randrange(1 << 40) for _ in range(count)]
+
+
+# ============================= Sketch Tests =============================
+def test_CountMinSketch_never_under_counts():
+    items = skewed(5000)
+    sketch = CountMinSketch(width=256, depth=4)
+    for item in items:
+        sketch.add(item)
+    assert len(sketch) == len(items)
+    for item, count in Counter(items).items():
+        assert sketch.estimate(item) >= count
+    # the error is bounded by 2 / width of everything counted with high probability
+    assert sketch.estimate(0x10) <= Counter(items)[0x10] + 2 * len(items) // 256
+    assert sketch.width == 256 and CountMinSketch(width=200).width == 256
+
+
+def test_CountMinSketch_merge():
+    items = skewed(2000)
+    whole = CountMinSketch(width=128, depth=3, seed=7)
+    halves = [CountMinSketch(width=128, depth=3, seed=7), CountMinSketch(width=128, depth=3, seed=7)]
+    for idx, item in enumerate(items):
+        whole.add(item)
+        halves[idx % 2].add(item)
+    merged = pickle.loads(pickle.dumps(halves[0]))
+    merged.merge(pickle.loads(pickle.dumps(halves[1])))
+    assert merged == whole and len(merged) == len(whole)
+    try:
+        merged.merge(CountMinSketch(width=128, depth=3, seed=8))
+        assert False
+    except ValueError:
+        pass
+    try:
+        CountMinSketch(depth=0)
+        assert False
+    except ValueError:
+        pass
+
+
+# ============================= Profiler Tests =============================
+@pytest.mark.parametrize("k", [1, 3, 8])
+def test_HotAddressProfiler_top(k):
+    items = skewed(5000)
+    profiler = HotAddressProfiler(k=k, width=1024)
+    for item in items:
+        profiler.add(item)
+    top = profiler.top()
+    assert len(top) == k
+    assert [line for line, _ in top[:min(k, 3)]] == [0x10, 0x20, 0x30][:k]
+    counts = Counter(items)
+    assert all(estimate >= counts[line] for line, estimate in top)
+    assert profiler.top(1) == top[:1]
+
+
+def test_HotAddressProfiler_merge():
+    items = skewed(4000)
+    profilers = [HotAddressProfiler(k=3, width=512), HotAddressProfiler(k=3, width=512)]
+    for idx, item in enumerate(items):
+        profilers[idx % 2].add(item)
+    merged = pickle.loads(pickle.dumps(profilers[0]))
+    merged.merge(pickle.loads(pickle.dumps(profilers[1])))
+    assert [line for line, _ in merged.top()] == [0x10, 0x20, 0x30]
+    assert len(merged) == len(items)
+    try:
+        merged.k = 4
+        assert False
+    except AttributeError:
+        pass
+
+
+def test_HotAddressProfiler_requests():
+    profiler = HotAddressProfiler(k=4)
+    # D2H H1 D2H_Request, H2D H0 H2D Request, M2S H5 M2S Request and H4 M2S Header
+    flits = [
+        make_slots(RX, 1, fields={"D2H_Request.Valid": 1, "D2H_Request.Address": 0x100}),
+        make_slots(TX, 0, fields={"H2D Request.Valid": 1, "H2D Request.Address": 0x100}),
+        make_slots(TX, 5, fields={"M2S Request.Valid": 1, "M2S Request.Address": 0x200 << 1 | 1}),
+        make_slots(TX, 4, fields={"M2S Header.Valid": 1, "M2S Header.Address": 0x200}),
+        make_slots(TX, 4, fields={"M2S Header.Valid": 1, "M2S Header.Address": 0x200}),
+        # not valid, not counted
+        make_slots(TX, 4, fields={"M2S Header.Address": 0x300}),
+    ]
+    assert [profiler.process(slots) for slots in flits] == [1, 1, 1, 1, 1, 0]
+    assert profiler.top() == [(0x200, 3), (0x100, 2)]
+    assert profiler.process(None) == 0
+
+    mem_only = HotAddressProfiler(structs=(subs.M2S_REQ, subs.M2S_HEAD))
+    for slots in flits:
+        mem_only.process(slots)
+    assert mem_only.top() == [(0x200, 3)]
+    try:
+        HotAddressProfiler(structs=(subs.S2M_NDR,))
+        assert False
+    except ValueError:
+        pass
+    try:
+        HotAddressProfiler(k=0)
+        assert False
+    except ValueError:
+        pass
+
+
+def test_HotAddressProfiler_run(tmp_path):
+    path = tmp_path / "link.pcxl"
+    with TraceWriter(path) as writer:
+        for timestamp, line in enumerate([0x40, 0x40, 0x80]):
+            flit = to_bytes(make_slots(RX, 1, fields={"D2H_Request.Valid": 1, "D2H_Request.Address": line}))
+            writer.write(flit, timestamp, RX)
+    profiler = HotAddressProfiler(k=2)
+    with TraceReader(path) as trace:
+        assert profiler.run(trace.flits()) == [(0x40, 2), (0x80, 1)]
+    flit = to_bytes(make_slots(RX, 1, fields={"D2H_Request.Valid": 1, "D2H_Request.Address": 0x80}))
+    assert profiler.process_flit(RX, flit)
+    assert profiler.top() == [(0x40, 2), (0x80, 2)]
@@ -0,0 +1,143 @@
+# External Dependencies
+import pytest
+
+# Python Imports
+import pickle
+import random
+
+# Package imports
+from pyCXL.analysis import latency
+from pyCXL.analysis.correlator import DEVICE_REQUESTS, MEM_REQUESTS, Transaction
+from pyCXL.analysis.latency import LatencyHistogram, LatencyProfile
+
+
+def transaction(kind, opcode, ldid, latency_value):
+    record = Transaction(kind, 0, ldid, opcode, 0, 100)
+    if latency_value is not None:
+        record.completed = 100 + latency_value
+    return record
+
+
+# ============================= Histogram Tests =============================
+@pytest.mark.parametrize("precision", [1, 4, 8])
+def test_LatencyHistogram_buckets(precision):
+    histogram = LatencyHistogram(precision=precision, max_bits=24)
+    generator = random.Random(precision)
+    previous = -1
+    for value in sorted(list(range(2048)) + [generator.randrange(1 << 24) for _ in range(200)]):
+        index = histogram.bucket_index(value)
+        low, high = histogram.bucket_range(index)
+        assert low <= value <= high
+        # buckets are no wider than 1 / 2 ** (precision - 1) of their values
+        assert high - low < max(1, low >> (precision - 1)) or high == low
+        assert index >= previous
+        previous = index
+    assert histogram.bucket_index((1 << 24) - 1) == len(histogram.counts) - 1
+
+
+def test_LatencyHistogram_percentiles():
+    histogram = LatencyHistogram()
+    for value in range(1, 1001):
+        histogram.record(value)
+    assert len(histogram) == 1000
+    assert (histogram.min, histogram.max, histogram.mean) == (1, 1000, 500.5)
+    for percentile in (50, 99, 99.9):
+        exact = percentile * 10
+        assert exact <= histogram.percentile(percentile) <= exact * (1 + 1 / 128)
+    assert histogram.percentile(100) == 1000
+    assert histogram.percentiles((99.9, 50)) == {99.9: histogram.percentile(99.9), 50: histogram.percentile(50)}
+    assert LatencyHistogram().percentile(50) is None
+    try:
+        histogram.percentile(101)
+        assert False
+    except ValueError:
+        pass
+    try:
+        histogram.record(-1)
+        assert False
+    except ValueError:
+        pass
+
+
+def test_LatencyHistogram_overflow():
+    histogram = LatencyHistogram(precision=4, max_bits=8)
+    histogram.record(1 << 20)
+    assert histogram.counts[-1] == 1
+    assert histogram.percentile(50) == 1 << 20
+
+
+def test_LatencyHistogram_record_values():
+    values = [random.randrange(1 << 30) for _ in range(5000)] + [0, 1, 255, 256]
+    single = LatencyHistogram()
+    for value in values:
+        single.record(value)
+    batch = LatencyHistogram()
+    batch.record_values(values)
+    assert batch == single
+    assert (batch.min, batch.max, len(batch)) == (single.min, single.max, len(single))
+
+
+def test_LatencyHistogram_record_values_without_numpy(monkeypatch):
+    monkeypatch.setattr(latency, "np", None)
+    histogram = LatencyHistogram()
+    histogram.record_values([3, 300, 30000])
+    assert len(histogram) == 3 and histogram.max == 30000
+
+
+def test_LatencyHistogram_merge():
+    values = [random.randrange(1 << 20) for _ in range(1000)]
+    whole = LatencyHistogram()
+    shards = [LatencyHistogram(), LatencyHistogram()]
+    for idx, value in enumerate(values):
+        whole.record(value)
+        shards[idx % 2].record(value)
+    # shards built in other processes travel pickled
+    merged = pickle.loads(pickle.dumps(shards[0])) + pickle.loads(pickle.dumps(shards[1]))
+    assert merged == whole
+    assert merged.percentiles() == whole.percentiles()
+    assert (merged.min, merged.max, merged.mean) == (whole.min, whole.max, whole.mean)
+    try:
+        whole += LatencyHistogram(precision=4)
+        assert False
+    except ValueError:
+        pass
+    try:
+        whole.precision = 4
+        assert False
+    except AttributeError:
+        pass
+
+
+# ============================= Profile Tests =============================
+def test_LatencyProfile_groups():
+    profile = LatencyProfile()
+    profile.run([
+        transaction(MEM_REQUESTS, 0x1, 0, 10),
+        transaction(MEM_REQUESTS, 0x1, 1, 20),
+        transaction(MEM_REQUESTS, 0x2, 1, 30),
+        transaction(DEVICE_REQUESTS, 0x1, 0, 40),
+        transaction(DEVICE_REQUESTS, 0x1, 0, None),
+    ])
+    assert len(profile) == 4 and profile.timed_out == 1
+    assert len(profile.histograms) == 4
+    assert profile.histogram(MEM_REQUESTS).max == 30
+    assert profile.histogram(ldid=1).min == 20
+    assert profile.histogram(opcode=0x1).percentile(100) == 40
+    assert profile.percentiles((50,), by=("ldid",)) == {(0,): {50: 10}, (1,): {50: 20}}
+    assert set(profile.percentiles(by=("kind", "opcode"))) == {
+        (MEM_REQUESTS, 0x1), (MEM_REQUESTS, 0x2), (DEVICE_REQUESTS, 0x1)
+    }
+    try:
+        profile.percentiles(by=("address",))
+        assert False
+    except ValueError:
+        pass
+
+
+def test_LatencyProfile_merge():
+    first = LatencyProfile().run([transaction(MEM_REQUESTS, 0x1, 0, 10), transaction(MEM_REQUESTS, 0x1, 0, None)])
+    second = LatencyProfile().run([transaction(MEM_REQUESTS, 0x1, 0, 50), transaction(MEM_REQUESTS, 0x3, 2, 7)])
+    first += pickle.loads(pickle.dumps(second))
+    assert len(first) == 3 and first.timed_out == 1
+    assert first.histogram(MEM_REQUESTS, 0x1, 0).max == 50
+    assert first.histogram(ldid=2).max == 7
@@ -0,0 +1,186 @@
+# External Dependencies
+import pytest
+
+# Python Imports
+import random
+
+# Package imports
+from pyCXL.analysis.mctp import (
+    NO_START,
+    NOT_MCTP,
+    OUT_OF_SEQUENCE,
+    RESTARTED,
+    TIMED_OUT,
+    TOO_LONG,
+    MCTPReassembler
+)
+from pyCXL.structs.MCTP import (
+    CXL_FM_API,
+    MCTP_CONTROL,
+    CCIMessageHeader,
+    MCTPTransportHeader,
+    PCIeVDMHeader,
+    decode_packet,
+    encode_packet
+)
+
+# an MCTP control message from endpoint 9 to 8 over a packet routed by ID, as it appears on the wire
+WIRE_PACKET = bytes.fromhex("72000002" "1234207f" "abcd1ab4" "010809ab" "0868656c" "6c6f0000")
+
+
+def split(source, destination, tag, message, unit, tag_owner=1, first_sequence=0):
+    """
+    The TLPs carrying message in packets of unit bytes
+    """
+    chunks = [message[start:start + unit] for start in range(0, len(message), unit)]
+    return [
+        encode_packet(
+            chunk, destination, source, tag, tag_owner=tag_owner, sequence=(first_sequence + idx) % 4,
+            som=int(idx == 0), eom=int(idx == len(chunks) - 1)
+        )
+        for idx, chunk in enumerate(chunks)
+    ]
+
+
+# ============================= Packet Tests =============================
+def test_PCIeVDMHeader_fields():
+    header = PCIeVDMHeader()
+    header.from_bytes(WIRE_PACKET[:12])
+    fields = header.to_dict()["PCIe VDM Header"]
+    assert (fields["Format"], fields["Type"]) == (0b011, 0b10010)
+    assert (fields["Length High"], fields["Length Low"], fields["Pad Length"]) == (0, 2, 2)
+    assert (fields["Requester Bus"], fields["Requester Device"], fields["Requester Function"]) == (0x12, 0x6, 0x4)
+    assert (fields["Vendor ID High"], fields["Vendor ID Low"], fields["Message Code"]) == (0x1A, 0xB4, 0x7F)
+    assert bytes(header) == WIRE_PACKET[:12]
+
+    transport = MCTPTransportHeader()
+    transport.from_bytes(WIRE_PACKET[12:16])
+    fields = transport.to_dict()["MCTP Transport Header"]
+    assert fields == {
+        "Header Version": 1, "Rsvd": 0, "Destination Endpoint ID": 8, "Source Endpoint ID": 9, "Message Tag": 3,
+        "Tag Owner": 1, "Packet Sequence": 2, "End Of Message": 0, "Start Of Message": 1
+    }
+
+
+def test_decode_packet():
+    packet = decode_packet(b"\xff" * 3 + WIRE_PACKET, offset=3)
+    assert (packet.routing, packet.requester, packet.target) == (2, 0x1234, 0xABCD)
+    assert (packet.source, packet.destination, packet.tag, packet.tag_owner) == (9, 8, 3, 1)
+    assert (packet.sequence, packet.som, packet.eom) == (2, 1, 0)
+    assert bytes(packet.payload) == b"\x08hello"
+    assert encode_packet(
+        b"\x08hello", 8, 9, 3, sequence=2, som=1, eom=0, routing=2, requester=0x1234, target=0xABCD
+    ) == WIRE_PACKET
+
+
+@pytest.mark.parametrize("tlp", [
+    WIRE_PACKET[:15],
+    WIRE_PACKET[:-4],
+    bytes([0x30]) + WIRE_PACKET[1:],
+    WIRE_PACKET[:7] + b"\x7e" + WIRE_PACKET[8:],
+    WIRE_PACKET[:10] + b"\x00\x00" + WIRE_PACKET[12:],
+    WIRE_PACKET[:12] + b"\x02" + WIRE_PACKET[13:],
+])
+def test_decode_packet_rejects(tlp):
+    try:
+        decode_packet(tlp)
+        assert False
+    except ValueError:
+        pass
+
+
+def test_encode_packet_bad_arguments():
+    for payload, routing in ((b"", 0), (bytes(4097), 0), (b"\x00", 1)):
+        try:
+            encode_packet(payload, 8, 9, 0, routing=routing)
+            assert False
+        except ValueError:
+            pass
+    # 1024 DWords are sent as a Length of 0
+    assert len(decode_packet(encode_packet(bytes(4096), 8, 9, 0)).payload) == 4096
+
+
+# ============================= Reassembly Tests =============================
+@pytest.mark.parametrize("first_sequence", [0, 3])
+def test_MCTPReassembler_interleaved(first_sequence):
+    generator = random.Random(first_sequence)
+    messages = {
+        (9, 1): bytes([CXL_FM_API]) + bytes(generator.getrandbits(8) for _ in range(300)),
+        (9, 2): bytes([MCTP_CONTROL]) + b"short",
+        (10, 1): bytes([CXL_FM_API]) + bytes(generator.getrandbits(8) for _ in range(1000)),
+    }
+    streams = [split(source, 8, tag, message, 64, first_sequence=first_sequence)
+               for (source, tag), message in messages.items()]
+    tlps = []
+    while any(streams):
+        stream = generator.choice([stream for stream in streams if stream])
+        tlps.append(stream.pop(0))
+    reassembler = MCTPReassembler()
+    found = {(message.source, message.tag): message for message in reassembler.run(enumerate(tlps))}
+    assert {key: message.data for key, message in found.items()} == messages
+    assert found[(10, 1)].packets == 16 and found[(9, 2)].packets == 1
+    assert found[(9, 2)].message_type == MCTP_CONTROL and found[(9, 2)].body == b"short"
+    assert len(reassembler) == 0
+    assert reassembler.stats["messages"] == 3 and reassembler.stats["packets"] == len(tlps)
+
+
+def test_MCTPReassembler_cci_header():
+    cci = CCIMessageHeader()
+    cci.from_bytes(bytes(12))
+    values = [field.value for field in cci.fields]
+    keys = cci.layout.keys
+    for key, value in (("Message Category", 1), ("Message Tag", 0x5A), ("Command Opcode", 0x5100),
+                       ("Message Payload Length", 4), ("Return Code", 0x0002)):
+        values[keys.index(key)] = value
+    body = cci.layout.encoder(values) + b"\x01\x02\x03\x04"
+    # the opcode is little endian on the wire
+    assert body[3:5] == b"\x00\x51"
+    reassembler = MCTPReassembler()
+    message = None
+    for tlp in split(9, 8, 0, bytes([CXL_FM_API]) + body, 8):
+        message = reassembler.process(tlp) or message
+    header = message.cci_header().to_dict()["CXL CCI Message Header"]
+    assert (header["Message Category"], header["Command Opcode"], header["Return Code"]) == (1, 0x5100, 2)
+    assert message.header().to_dict()["MCTP Message Header"]["Message Type"] == CXL_FM_API
+    try:
+        reassembler.process(encode_packet(b"\x00abc", 8, 9, 1)).cci_header()
+        assert False
+    except ValueError:
+        pass
+
+
+def test_MCTPReassembler_drops():
+    reassembler = MCTPReassembler(max_message_bytes=100, timeout=50)
+    first, second, third = split(9, 8, 0, bytes(12), 4)
+    # a continuation with nothing started
+    assert reassembler.process(second, 0) is None
+    # a lost packet
+    reassembler.process(first, 1)
+    assert reassembler.process(third, 2) is None
+    # a restart, then the restarted message completes
+    reassembler.process(first, 3)
+    reassembler.process(first, 4)
+    reassembler.process(second, 5)
+    assert reassembler.process(third, 6).data == bytes(12)
+    # too long
+    for tlp in split(9, 8, 1, bytes(200), 64)[:2]:
+        reassembler.process(tlp, 7)
+    # left unfinished, then timed out by a later packet
+    reassembler.process(first, 10)
+    assert len(reassembler) == 1
+    reassembler.process(b"not an MCTP packet", 100)
+    assert len(reassembler) == 0
+    stats = reassembler.stats
+    assert {kind: stats[kind] for kind in (NO_START, OUT_OF_SEQUENCE, RESTARTED, TOO_LONG, TIMED_OUT, NOT_MCTP)} == {
+        NO_START: 1, OUT_OF_SEQUENCE: 1, RESTARTED: 1, TOO_LONG: 1, TIMED_OUT: 1, NOT_MCTP: 1
+    }
+    try:
+        MCTPReassembler(strict=True).process(b"not an MCTP packet")
+        assert False
+    except ValueError:
+        pass
+    try:
+        reassembler.timeout = 1
+        assert False
+    except AttributeError:
+        pass
@@ -0,0 +1,87 @@
+# External Dependencies
+import pytest
+
+# Python Imports
+from multiprocessing import get_context
+
+# Package imports
+from pyCXL.capture.parallel import parallel_decode, shard_ranges
+from pyCXL.structs.bitcodegen import specialize, unspecialize
+from pyCXL.structs.flitparser import FLIT_BYTES, G_SLOT_TABLE, H_SLOT_TABLE, HOST_TO_DEVICE
+from pyCXL.structs.flittable import FlitTable
+from tests.test_utils import capture_file
+
+np = pytest.importorskip("numpy")
+
+REQ_SLOT = G_SLOT_TABLE[HOST_TO_DEVICE][4]
+DATA_SLOT = G_SLOT_TABLE[HOST_TO_DEVICE][0]
+
+
+# ============================= Sharding Tests =============================
+def test_shard_ranges():
+    assert shard_ranges(10, 3) == [(0, 4), (4, 7), (7, 10)]
+    assert shard_ranges(2, 8) == [(0, 1), (1, 2)]
+    assert shard_ranges(0, 4) == []
+    for count, shards in [(503, 8), (1000, 7), (5, 5)]:
+        ranges = shard_ranges(count, shards)
+        assert ranges[0][0] == 0 and ranges[-1][1] == count
+        assert all(prev[1] == nxt[0] for prev, nxt in zip(ranges, ranges[1:]))
+
+
+# ============================= Decode Tests =============================
+@pytest.mark.parametrize("slot, layout", [(0, H_SLOT_TABLE[HOST_TO_DEVICE][0].layout), (1, REQ_SLOT.layout),
+                                          (3, DATA_SLOT.layout)])
+def test_parallel_decode_matches_serial(capture_file, slot, layout):
+    path, data = capture_file(FLIT_BYTES, 503, seed=21)
+    table = parallel_decode(path, layout, workers=3, record_bytes=FLIT_BYTES, offset=slot * 16, shards=7)
+    expected = FlitTable.from_bytes(data, layout, stride=FLIT_BYTES, offset=slot * 16)
+    assert len(table) == 503
+    assert table.to_dict() == expected.to_dict()
+
+
+def test_parallel_decode_slot_capture(capture_file):
+    path, data = capture_file(16, 64, seed=22)
+    table = parallel_decode(path, REQ_SLOT.build(), workers=2)
+    assert table.to_dict() == FlitTable.from_bytes(data, REQ_SLOT.layout).to_dict()
+
+
+@pytest.mark.parametrize("method", ["spawn", "forkserver"])
+def test_parallel_decode_specialized_layout(capture_file, method):
+    path, data = capture_file(FLIT_BYTES, 503, seed=21)
+    layout = specialize(REQ_SLOT.layout)
+    try:
+        table = parallel_decode(path, layout, workers=2, record_bytes=FLIT_BYTES, offset=16,
+                                mp_context=get_context(method))
+    finally:
+        unspecialize(layout)
+    assert table.to_dict() == FlitTable.from_bytes(data, layout, stride=FLIT_BYTES, offset=16).to_dict()
+
+
+def test_parallel_decode_partial_and_empty(tmp_path, capture_file):
+    path, data = capture_file(FLIT_BYTES, 503, seed=21)
+    partial = tmp_path / "partial.bin"
+    partial.write_bytes(data[:FLIT_BYTES * 3 + 5])
+    try:
+        parallel_decode(partial, REQ_SLOT.layout, workers=2, record_bytes=FLIT_BYTES)
+        assert False
+    except ValueError:
+        pass
+    assert len(parallel_decode(partial, REQ_SLOT.layout, workers=2, record_bytes=FLIT_BYTES, strict=False)) == 3
+
+    empty = tmp_path / "empty.bin"
+    empty.write_bytes(b"")
+    assert len(parallel_decode(empty, REQ_SLOT.layout, workers=2)) == 0
+
+
+def test_parallel_decode_bad_arguments(capture_file):
+    path, _ = capture_file(FLIT_BYTES, 503, seed=21)
+    try:
+        parallel_decode(path, REQ_SLOT.layout, record_bytes=FLIT_BYTES, offset=60)
+        assert False
+    except ValueError:
+        pass
+    try:
+        parallel_decode(path, REQ_SLOT.layout, workers=0, record_bytes=FLIT_BYTES)
+        assert False
+    except ValueError:
+        pass
@@ -0,0 +1,149 @@
+# External Dependencies
+import pytest
+
+# Python Imports
+import io
+import random
+
+# Package imports
+from pyCXL.capture.capturereader import CaptureReader
+from pyCXL.capture.pipeline import (
+    DecodedFlit,
+    Pipeline,
+    chunk_map,
+    filter as filter_stage,
+    parse_flits,
+    project,
+    read_slots,
+    where,
+    with_slot_format
+)
+from pyCXL.structs.flitparser import FLIT_BYTES, HOST_TO_DEVICE, FlitParser
+from tests.test_utils import make_flit
+
+
+@pytest.fixture
+def stream():
+    rng = random.Random(19)
+    flits = []
+    for idx in range(50):
+        h_code = rng.choice([0, 1, 2, 3, 4, 5, 6])
+        g_codes = [rng.choice([0, 1, 2, 3, 4, 5]) for _ in range(3)]
+        flits.append(make_flit(HOST_TO_DEVICE, h_code, g_codes, rng=rng, control=idx % 10 == 9))
+    return b"".join(flits)
+
+
+class TrickleStream(io.RawIOBase):
+    """
+    A pipe which returns at most 7 bytes per read
+    """
+
+    def __init__(self, data):
+        self.data = data
+        self.pos = 0
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        size = 7 if size < 0 else min(size, 7)
+        chunk = self.data[self.pos:self.pos + size]
+        self.pos += len(chunk)
+        return chunk
+
+
+# ============================= Source Tests =============================
+@pytest.mark.parametrize("chunk_flits", [1, 4, 64])
+def test_read_slots_chunks_whole_records(tmp_path, stream, chunk_flits):
+    path = tmp_path / "stream.bin"
+    path.write_bytes(stream)
+    chunks = list(read_slots(path, chunk_flits=chunk_flits).chunks())
+    assert b"".join(chunks) == stream
+    assert all(len(chunk) % FLIT_BYTES == 0 and len(chunk) <= FLIT_BYTES * chunk_flits for chunk in chunks)
+
+
+def test_read_slots_from_short_reads(stream):
+    chunks = list(read_slots(TrickleStream(stream), chunk_flits=3).chunks())
+    assert b"".join(chunks) == stream
+    assert all(len(chunk) % FLIT_BYTES == 0 for chunk in chunks)
+
+
+def test_read_slots_from_capture_reader(tmp_path, stream):
+    path = tmp_path / "stream.bin"
+    path.write_bytes(stream)
+    with CaptureReader(path, record_bytes=FLIT_BYTES) as reader:
+        assert [flit.index for flit in read_slots(reader, chunk_flits=8) | parse_flits()] == [
+            idx for idx in range(50) if idx % 10 != 9
+        ]
+
+
+def test_read_slots_partial_records(stream):
+    try:
+        list(read_slots(io.BytesIO(stream[:-1])).chunks())
+        assert False
+    except ValueError as err:
+        assert str(err) == "Stream ended with a partial 66 byte record"
+    assert len(b"".join(read_slots(io.BytesIO(stream[:-1]), strict=False).chunks())) == 49 * FLIT_BYTES
+
+
+# ============================= Stage Tests =============================
+def test_parse_flits_matches_flitparser(stream):
+    parser = FlitParser(HOST_TO_DEVICE)
+    decoded = list(read_slots(io.BytesIO(stream), chunk_flits=7) | parse_flits(HOST_TO_DEVICE))
+    expected = [
+        (idx, parser.parse(stream, idx * FLIT_BYTES)) for idx in range(50)
+        if parser.parse(stream, idx * FLIT_BYTES) is not None
+    ]
+    assert [(flit.index, flit.slots) for flit in decoded] == expected
+    everything = list(read_slots(io.BytesIO(stream)) | parse_flits(skip_control=False))
+    assert len(everything) == 50
+    assert everything[9].slots == ()
+
+
+def test_filter_where_and_project(stream):
+    key = "M2S Request.MemOpcode"
+    decoded = list(read_slots(io.BytesIO(stream)) | parse_flits())
+    opcode = next(flit.get(key) for flit in decoded if key in flit)
+    expected = [flit.index for flit in decoded if opcode in flit.values(key)]
+
+    pipeline = read_slots(io.BytesIO(stream), chunk_flits=5) | parse_flits() | where(key, opcode) | \
+        project([key, "Flit Header.Slot 0"])
+    rows = list(pipeline)
+    assert [row["index"] for row in rows] == expected
+    assert all(row[key] is not None for row in rows)
+
+    h4 = list(read_slots(io.BytesIO(stream)) | parse_flits() | with_slot_format("H4"))
+    assert [flit.index for flit in h4] == [flit.index for flit in decoded if flit.slot_formats[0] == "H4"]
+
+    odd = list(read_slots(io.BytesIO(stream)) | parse_flits() | filter_stage(lambda flit: flit.index % 2))
+    assert all(flit.index % 2 for flit in odd)
+
+
+def test_chunk_map_sees_whole_chunks(stream):
+    pipeline = read_slots(io.BytesIO(stream), chunk_flits=16) | parse_flits(skip_control=False) | chunk_map(len)
+    sizes = list(pipeline.chunks())
+    assert sizes == [16, 16, 16, 2]
+
+
+def test_pipeline_composition():
+    pipeline = read_slots(io.BytesIO(b"")) | parse_flits() | project([])
+    assert isinstance(pipeline, Pipeline)
+    assert repr(pipeline) == "<Pipeline parse_flits | project>"
+    assert list(pipeline) == []
+    # without stages the source's chunks are yielded whole
+    assert list(Pipeline([b"ab", b"cd"])) == [b"ab", b"cd"]
+    assert list(read_slots(io.BytesIO(bytes(range(32))), record_bytes=16, chunk_flits=1)) == [
+        bytes(range(16)), bytes(range(16, 32))
+    ]
+    try:
+        read_slots(io.BytesIO(b"")) | (lambda chunks: chunks)
+        assert False
+    except TypeError:
+        pass
+
+
+def test_decoded_flit_missing_fields():
+    flit = DecodedFlit(3, ())
+    assert flit.get("Anything", 7) == 7
+    assert flit.values("Anything") == []
+    assert "Anything" not in flit
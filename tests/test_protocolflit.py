@@ -0,0 +1,113 @@
+# External Dependencies
+import pytest
+
+# Python Imports
+import random
+
+# Package imports
+from pyCXL.structs.flitcrc import check_flit
+from pyCXL.structs.flitparser import (
+    DEVICE_TO_HOST,
+    FLIT_BYTES,
+    G_SLOT_TABLE,
+    H_SLOT_TABLE,
+    HOST_TO_DEVICE,
+    FlitParser
+)
+from pyCXL.structs.protocolflit import ProtocolFlit
+from tests.test_utils import make_flit
+
+
+def valid_codes(table, direction):
+    return [code for code, slot_format in enumerate(table[direction]) if slot_format is not None]
+
+
+# ============================= Decode Tests =============================
+@pytest.mark.parametrize("direction", [HOST_TO_DEVICE, DEVICE_TO_HOST])
+def test_ProtocolFlit_matches_FlitParser(direction):
+    rng = random.Random(17 + direction)
+    parser = FlitParser(direction)
+    h_codes = valid_codes(H_SLOT_TABLE, direction)
+    g_codes = valid_codes(G_SLOT_TABLE, direction)
+    for _ in range(30):
+        data = make_flit(direction, rng.choice(h_codes), [rng.choice(g_codes) for _ in range(3)], rng=rng, crc=True)
+        flit = ProtocolFlit.from_bytes(data, direction, check_crc=True)
+        assert flit.slots == parser.parse(data)
+        assert flit.direction == direction
+        assert flit.crc == int.from_bytes(data[64:], 'big')
+        assert flit.crc_valid
+        assert bytes(flit) == data
+        structs = parser.parse_structs(data)
+        assert [struct.to_dict() for struct in flit] == [struct.to_dict() for struct in structs]
+
+
+def test_ProtocolFlit_fields():
+    rng = random.Random(3)
+    data = make_flit(HOST_TO_DEVICE, 4, [4, 0, 4], rng=rng, crc=True)
+    flit = ProtocolFlit.from_bytes(b"\xFF" * 5 + data, offset=5)
+    assert flit.slot_formats == ("H4", "G4", "G0", "G4")
+    assert "M2S Request.Address" in flit
+    assert "Not A Field" not in flit
+    assert flit.get("Not A Field", 9) == 9
+    assert len(flit.values("M2S Request.Address")) == 2
+    assert flit.get("M2S Request.Address") == flit.values("M2S Request.Address")[0]
+    assert flit.header is flit[0]
+    assert flit.header.name == "H2D/M2S H4"
+    assert flit.to_dict()["CRC"] == flit.crc
+    assert repr(flit) == "<ProtocolFlit H2D/M2S H4 G4 G0 G4>"
+    try:
+        flit.crc = 0
+        assert False
+    except AttributeError:
+        pass
+
+
+def test_ProtocolFlit_crc():
+    rng = random.Random(4)
+    data = bytearray(make_flit(HOST_TO_DEVICE, 0, [0, 0, 0], rng=rng, crc=True))
+    data[50] ^= 0x01
+    flit = ProtocolFlit.from_bytes(data)
+    assert not flit.crc_valid
+    assert not check_flit(data)
+    try:
+        ProtocolFlit.from_bytes(data, check_crc=True)
+        assert False
+    except ValueError as err:
+        assert "Flit CRC mismatch" in str(err)
+
+
+def test_ProtocolFlit_rejects_control_flits():
+    rng = random.Random(5)
+    data = make_flit(HOST_TO_DEVICE, 0, [0, 0, 0], control=True, rng=rng, crc=True)
+    try:
+        ProtocolFlit.from_bytes(data)
+        assert False
+    except ValueError as err:
+        assert str(err) == "Control flits are not protocol flits"
+    try:
+        ProtocolFlit.from_bytes(data[:FLIT_BYTES - 1])
+        assert False
+    except ValueError:
+        pass
+
+
+# ============================= Encode Tests =============================
+def test_ProtocolFlit_from_structs():
+    rng = random.Random(6)
+    data = make_flit(HOST_TO_DEVICE, 1, [3, 5, 0], rng=rng, crc=True)
+    structs = FlitParser(HOST_TO_DEVICE).parse_structs(data)
+    flit = ProtocolFlit.from_structs(structs)
+    assert bytes(flit) == data
+    assert flit == ProtocolFlit.from_bytes(data)
+
+    structs[1], structs[2] = structs[2], structs[1]
+    try:
+        ProtocolFlit.from_structs(structs)
+        assert False
+    except ValueError as err:
+        assert "do not match the slot formats" in str(err)
+    try:
+        ProtocolFlit.from_structs(structs[1:] + structs[:1])
+        assert False
+    except ValueError as err:
+        assert "header slot followed by 3 generic slots" in str(err)
@@ -0,0 +1,239 @@
+# External Dependencies
+import pytest
+
+# Python Imports
+import random
+
+# Package imports
+from pyCXL.analysis.retry import (
+    ACK_FLITS,
+    ACK_FREE_SHIFT,
+    ACK_SHIFT,
+    ACK_WRPTR_SHIFT,
+    INVALID_RETRY,
+    LLCTRL_LLCRD,
+    LLCTRL_RETRY,
+    LLCTRL_SHIFT,
+    MISSED_ACK,
+    OVERFLOW,
+    REPLAY,
+    REPLAY_MISMATCH,
+    REQ_SEQUENCE_SHIFT,
+    RETRY_ACK,
+    RETRY_ACK_MISMATCH,
+    RETRY_REQ,
+    RETRY_STORM,
+    SPURIOUS_ACK,
+    SUBTYPE_SHIFT,
+    TYPE_SHIFT,
+    RetryBuffer,
+    RetrySimulator
+)
+from pyCXL.capture.trace import TraceReader, TraceWriter
+from pyCXL.structs.flitparser import DEVICE_TO_HOST, FLIT_BYTES, HOST_TO_DEVICE
+
+TX = HOST_TO_DEVICE
+RX = DEVICE_TO_HOST
+
+
+def protocol_flit(rng, ack=False):
+    head = rng.getrandbits(128) & ~(1 << TYPE_SHIFT) & ~(1 << ACK_SHIFT)
+    head |= int(ack) << ACK_SHIFT
+    return head.to_bytes(16, 'big') + bytes(rng.getrandbits(8) for _ in range(FLIT_BYTES - 16))
+
+
+def control_flit(llctrl, subtype=0, fields=0):
+    head = (1 << TYPE_SHIFT) | (llctrl << LLCTRL_SHIFT) | (subtype << SUBTYPE_SHIFT) | fields
+    return head.to_bytes(16, 'big') + bytes(FLIT_BYTES - 16)
+
+
+def retry_req(sequence):
+    return control_flit(LLCTRL_RETRY, RETRY_REQ, sequence << REQ_SEQUENCE_SHIFT)
+
+
+def retry_ack(wrptr, free):
+    return control_flit(LLCTRL_RETRY, RETRY_ACK, (wrptr << ACK_WRPTR_SHIFT) | (free << ACK_FREE_SHIFT))
+
+
+def llcrd_ack():
+    return control_flit(LLCTRL_LLCRD, fields=1 << ACK_SHIFT)
+
+
+def kinds(events):
+    return [event.kind for event in events]
+
+
+# ============================= RetryBuffer Tests =============================
+def test_RetryBuffer_ring():
+    rng = random.Random(1)
+    buffer = RetryBuffer(4)
+    flits = [protocol_flit(rng) for _ in range(6)]
+    for sequence, flit in enumerate(flits[:4]):
+        assert buffer.push(flit) == sequence
+    assert len(buffer) == 4 and buffer.free == 0 and buffer.oldest == 0
+    assert buffer.release(2) == 2
+    assert buffer.oldest == 2 and not buffer.holds(1) and buffer.holds(3)
+    buffer.push(flits[4])
+    buffer.push(flits[5])
+    assert buffer.get(4) == flits[4] and buffer.get(5) == flits[5] and buffer.get(2) == flits[2]
+    assert buffer.outstanding_from(3) == 3
+    assert buffer.release(10) == 4
+    try:
+        buffer.get(5)
+        assert False
+    except ValueError as err:
+        assert str(err) == "Sequence number 5 is not in the retry buffer"
+    try:
+        RetryBuffer(256)
+        assert False
+    except ValueError:
+        pass
+
+
+@pytest.mark.parametrize("entries", [16, 100, 255])
+def test_RetryBuffer_sequence_numbers_wrap(entries):
+    rng = random.Random(entries)
+    buffer = RetryBuffer(entries)
+    flits = {}
+    for _ in range(700):
+        flit = protocol_flit(rng)
+        flits[buffer.push(flit)] = flit
+        buffer.release(rng.choice([0, 1, 2]) if buffer.free else 2)
+        for sequence in range(buffer.oldest, buffer.oldest + len(buffer)):
+            assert buffer.get(sequence % 256) == flits[sequence % 256]
+    assert buffer.wrptr == 700 % 256
+
+
+# ============================= Simulator Tests =============================
+def test_RetrySimulator_acks():
+    rng = random.Random(3)
+    simulator = RetrySimulator(TX, entries=32)
+    for _ in range(20):
+        simulator.process(TX, protocol_flit(rng))
+    simulator.process(RX, protocol_flit(rng, ack=True))
+    simulator.process(RX, llcrd_ack())
+    assert len(simulator.buffer) == 20 - 2 * ACK_FLITS
+    assert simulator.events == []
+    simulator.process(RX, protocol_flit(rng, ack=True))
+    assert kinds(simulator.events) == [SPURIOUS_ACK]
+    assert simulator.events[0].count == ACK_FLITS - 4
+    assert simulator.stats["acked"] == 20
+    # Ack bits in the modelled direction acknowledge the other side's flits and are ignored
+    simulator.process(TX, protocol_flit(rng, ack=True))
+    assert len(simulator.buffer) == 1
+
+
+def test_RetrySimulator_replay():
+    rng = random.Random(4)
+    simulator = RetrySimulator(TX, entries=64)
+    sent = [protocol_flit(rng) for _ in range(12)]
+    for flit in sent:
+        simulator.process(TX, flit)
+    assert simulator.process(RX, retry_req(5)) == 1
+    event = simulator.events[-1]
+    assert (event.kind, event.sequence, event.count) == (REPLAY, 5, 7)
+    assert len(simulator.buffer) == 7 and simulator.replaying
+
+    simulator.process(TX, retry_ack(12, 64 - 7))
+    for flit in sent[5:]:
+        simulator.process(TX, flit)
+    assert not simulator.replaying
+    simulator.process(TX, protocol_flit(rng))
+    assert kinds(simulator.events) == [REPLAY]
+    assert simulator.stats["replayed"] == 7
+    assert simulator.buffer.wrptr == 13
+
+
+def test_RetrySimulator_replay_problems():
+    rng = random.Random(5)
+    simulator = RetrySimulator(TX, entries=64)
+    sent = [protocol_flit(rng) for _ in range(10)]
+    for flit in sent:
+        simulator.process(TX, flit)
+    simulator.process(RX, retry_req(8))
+    simulator.process(TX, retry_ack(3, 0))
+    simulator.process(TX, sent[8])
+    simulator.process(TX, protocol_flit(rng))
+    assert kinds(simulator.events) == [REPLAY, RETRY_ACK_MISMATCH, REPLAY_MISMATCH]
+    assert simulator.events[-1].sequence == 9
+
+    # sequence 2 was implicitly acknowledged by the first RETRY.Req
+    simulator.process(RX, retry_req(2))
+    assert simulator.events[-1].kind == INVALID_RETRY
+    # asking for the next sequence number replays nothing
+    simulator.process(RX, retry_req(simulator.buffer.wrptr))
+    assert simulator.events[-1].kind == INVALID_RETRY and len(simulator.buffer) == 0
+
+
+def test_RetrySimulator_ack_before_replay():
+    rng = random.Random(6)
+    simulator = RetrySimulator(TX, entries=64)
+    sent = [protocol_flit(rng) for _ in range(16)]
+    for flit in sent:
+        simulator.process(TX, flit)
+    simulator.process(RX, retry_req(0))
+    # the Ack frees sequence numbers 0 to 7, which can no longer be replayed
+    simulator.process(RX, protocol_flit(rng, ack=True))
+    assert simulator.process(TX, sent[0]) == 1
+    event = simulator.events[-1]
+    assert (event.kind, event.sequence, event.count) == (REPLAY_MISMATCH, 0, 16)
+    assert not simulator.replaying
+    assert simulator.stats["replayed"] == 0 and simulator.buffer.wrptr == 17
+
+
+def test_RetrySimulator_missed_acks_and_overflow():
+    rng = random.Random(6)
+    simulator = RetrySimulator(TX, entries=8, ack_timeout=6)
+    for _ in range(10):
+        simulator.process(TX, protocol_flit(rng))
+    assert kinds(simulator.events) == [MISSED_ACK, OVERFLOW, OVERFLOW]
+    assert simulator.events[0].index == 5
+    assert simulator.buffer.oldest == 2
+    simulator.process(RX, protocol_flit(rng, ack=True))
+    for _ in range(6):
+        simulator.process(TX, protocol_flit(rng))
+    assert kinds(simulator.events)[-1] == MISSED_ACK
+
+
+def test_RetrySimulator_retry_storm():
+    rng = random.Random(7)
+    simulator = RetrySimulator(TX, entries=64, storm_retries=3, storm_window=20)
+    for _ in range(5):
+        for _ in range(2):
+            simulator.process(TX, protocol_flit(rng))
+        simulator.process(RX, retry_req(simulator.buffer.wrptr))
+    assert kinds(simulator.events) == [RETRY_STORM]
+    assert simulator.events[0].count == 3
+    assert simulator.stats["retry requests"] == 5
+
+    # the storm ends after a quiet stretch and the next burst is flagged again
+    for _ in range(30):
+        simulator.process(TX, protocol_flit(rng))
+    simulator.process(RX, retry_req(simulator.buffer.wrptr))
+    assert kinds(simulator.events) == [RETRY_STORM]
+    simulator.process(RX, retry_req(simulator.buffer.wrptr))
+    simulator.process(RX, retry_req(simulator.buffer.wrptr))
+    assert kinds(simulator.events) == [RETRY_STORM, RETRY_STORM]
+
+
+def test_RetrySimulator_runs_over_traces(tmp_path):
+    rng = random.Random(8)
+    path = tmp_path / "link.pcxl"
+    sent = [protocol_flit(rng) for _ in range(6)]
+    with TraceWriter(path, flits_per_block=4) as writer:
+        for timestamp, flit in enumerate(sent):
+            writer.write(flit, timestamp, TX)
+        writer.write(retry_req(3), 6, RX)
+        for timestamp, flit in enumerate(sent[3:], start=7):
+            writer.write(flit, timestamp, TX)
+    simulator = RetrySimulator(TX)
+    with TraceReader(path) as trace:
+        events = simulator.run(trace.flits())
+    assert kinds(events) == [REPLAY]
+    assert events[0].timestamp == 6 and events[0].index == 6
+    assert simulator.stats == {"transmitted": 9, "received": 1, "acked": 3, "retry requests": 1, "replayed": 3}
+    try:
+        RetrySimulator(5)
+        assert False
+    except ValueError:
+        pass
@@ -0,0 +1,426 @@
+# External Dependencies
+import pytest
+
+# Python Imports
+import importlib
+import random
+import re
+from functools import partial
+
+# Package Imports
+from pyCXL.structs.bitcollections import FlitStruct
+from pyCXL.structs.bitfields import BitField
+from pyCXL.structs.bitstructs import BitStruct
+from pyCXL.structs.flitparser import (
+    FlitParser,
+    HOST_TO_DEVICE,
+    DEVICE_TO_HOST,
+    H_SLOT_TABLE,
+    G_SLOT_TABLE,
+    FLIT_BYTES,
+    SlotFormat
+)
+from pyCXL.structs.flitsubstructures import FlitHeader
+from tests.test_utils import make_slots, to_bytes
+
+SLOT_FORMAT_IMPORT_PREFIX = r"pyCXL.structs."
+
+
+def random_flit(direction, h_code, g_codes, rng, control=False):
+    """
+    A random protocol flit with the requested slot formats, returned with its SlotFormats and expected field values
+    """
+    slots = make_slots(direction, h_code, g_codes, rng=rng, control=control)
+    return to_bytes(slots), [slot for slot, _ in slots], [values for _, values in slots]
+
+
+@pytest.mark.parametrize(
+    "slot_format_source", [
+        "H2D_M2S", "D2H_S2M"
+    ]
+)
+def test_CXL_cache_slot_formats_are_16_bytes(slot_format_source):
+    """
+    Tests if slot format structs are 16 bytes
+    """
+    module = importlib.import_module(SLOT_FORMAT_IMPORT_PREFIX + slot_format_source + "_formats")
+    for prefix, slot_formats in (("H", module.H_slot_formats), ("G", module.G_slot_formats)):
+        for code, slot_format in enumerate(slot_formats):
+            if slot_format is None:
+                continue
+            flit_struct = FlitStruct(bitstructs=[struct() for struct in slot_format], name=f"{prefix}{code}")
+            assert flit_struct.size == 128
+
+
+@pytest.mark.parametrize(
+    "slot_format_source", [
+        "H2D_M2S", "D2H_S2M"
+    ]
+)
+def test_header_slot_formats_start_with_flit_header(slot_format_source):
+    module = importlib.import_module(SLOT_FORMAT_IMPORT_PREFIX + slot_format_source + "_formats")
+    for slot_format in module.H_slot_formats:
+        if slot_format is not None:
+            assert slot_format[0] is FlitHeader
+    for slot_format in module.G_slot_formats:
+        if slot_format is not None:
+            assert slot_format[0] is not FlitHeader
+
+
+def test_flit_header_is_32_bits():
+    assert FlitHeader().size == 32
+
+
+# ============================= Dispatch Table Tests =============================
+@pytest.mark.parametrize("direction", [HOST_TO_DEVICE, DEVICE_TO_HOST])
+def test_dispatch_tables_are_indexed_by_slot_code(direction):
+    assert len(H_SLOT_TABLE[direction]) == 8
+    assert len(G_SLOT_TABLE[direction]) == 8
+    for code, slot_format in enumerate(H_SLOT_TABLE[direction]):
+        if slot_format is not None:
+            assert slot_format.name == f"H{code}"
+            assert slot_format.code == code
+            assert slot_format.header
+    for code, slot_format in enumerate(G_SLOT_TABLE[direction]):
+        if slot_format is not None:
+            assert slot_format.name == f"G{code}"
+            assert not slot_format.header
+
+
+def test_reserved_slot_codes():
+    assert H_SLOT_TABLE[HOST_TO_DEVICE][7] is None
+    assert G_SLOT_TABLE[HOST_TO_DEVICE][6] is None
+    assert G_SLOT_TABLE[DEVICE_TO_HOST][6] is not None
+    assert G_SLOT_TABLE[DEVICE_TO_HOST][7] is None
+
+
+# ============================= FlitParser Tests =============================
+@pytest.mark.parametrize("direction", [HOST_TO_DEVICE, DEVICE_TO_HOST])
+def test_flitparser_decodes_every_slot_format(direction):
+    rng = random.Random(direction)
+    parser = FlitParser(direction)
+    g_codes = [code for code, slot in enumerate(G_SLOT_TABLE[direction]) if slot is not None]
+    for h_code, h_slot in enumerate(H_SLOT_TABLE[direction]):
+        if h_slot is None:
+            continue
+        for _ in range(10):
+            codes = [rng.choice(g_codes) for _ in range(3)]
+            flit, slots, expected = random_flit(direction, h_code, codes, rng)
+            parsed = parser.parse(flit)
+            assert [slot_format for slot_format, _ in parsed] == slots
+            assert [values for _, values in parsed] == expected
+
+
+def test_flitparser_decodes_at_offset():
+    rng = random.Random(1)
+    parser = FlitParser(HOST_TO_DEVICE)
+    first, _, _ = random_flit(HOST_TO_DEVICE, 0, [1, 2, 3], rng)
+    second, slots, expected = random_flit(HOST_TO_DEVICE, 4, [4, 5, 0], rng)
+    parsed = parser.parse(first + second, FLIT_BYTES)
+    assert [values for _, values in parsed] == expected
+    assert parser.slot_formats(first + second, FLIT_BYTES) == tuple(slots)
+
+
+def test_flitparser_builds_flitstructs():
+    rng = random.Random(2)
+    parser = FlitParser(DEVICE_TO_HOST)
+    flit, slots, expected = random_flit(DEVICE_TO_HOST, 3, [6, 4, 0], rng)
+    structs = parser.parse_structs(flit)
+    assert len(structs) == 4
+    assert structs[0].name == "D2H/S2M H3"
+    assert [field.value for field in structs[0][0] if field.name.startswith("Slot")] == [3, 6, 4, 0]
+    for struct, values, slot_format in zip(structs, expected, slots):
+        assert bytes(struct) == slot_format.layout.pack_bytes(values)
+    assert b"".join(bytes(struct) for struct in structs) == flit[:64]
+
+
+def test_flitparser_skips_control_flits():
+    rng = random.Random(3)
+    parser = FlitParser(HOST_TO_DEVICE)
+    flit, _, _ = random_flit(HOST_TO_DEVICE, 0, [0, 0, 0], rng, control=True)
+    assert parser.parse(flit) is None
+    assert parser.parse_structs(flit) is None
+
+
+def test_flitparser_rejects_reserved_slot_formats():
+    rng = random.Random(4)
+    parser = FlitParser(HOST_TO_DEVICE)
+    flit, _, _ = random_flit(HOST_TO_DEVICE, 0, [0, 0, 0], rng)
+    # rewrite Slot 3 to the reserved G7 encoding
+    header = int.from_bytes(flit[:4], 'big') | (0x7 << (32 - 17))
+    flit = header.to_bytes(4, 'big') + flit[4:]
+    try:
+        parser.parse(flit)
+        assert False
+    except ValueError as err:
+        assert str(err) == "Reserved slot format in H2D/M2S flit header"
+
+
+def test_flitparser_requires_whole_flit():
+    try:
+        FlitParser(DEVICE_TO_HOST).parse(b"\x00" * 64)
+        assert False
+    except ValueError as err:
+        assert str(err) == "Not enough bytes to fill the flit"
+
+
+def test_flitparser_properties_throw_on_reassignment():
+    parser = FlitParser(HOST_TO_DEVICE)
+    try:
+        parser.direction = DEVICE_TO_HOST
+        assert False
+    except AttributeError as err:
+        assert str(err) == "Cannot modify FlitParser's direction"
+    try:
+        FlitParser(7)
+        assert False
+    except ValueError as err:
+        assert str(err) == "Unknown flit direction: 7"
+
+
+# ============================= SlotFormat Struct Tests =============================
+CHECKERBOARD_BITS = bytearray(b"\xAA\x55"*8)
+"""
+CHECKERBOARD_BITS should look like this in a bit map, repeated 4 times:
+
+    1 0 1 0  1 0 1 0
+    0 1 0 1  0 1 0 1
+    1 0 1 0  1 0 1 0
+    0 1 0 1  0 1 0 1
+"""
+
+FRUIT_STRUCTS = [
+    ["struct0", [[
+                ("Apples",          4),
+                ("Bananas",         4),
+                ("Carrots",         8),
+                ("Durian",          16),
+            ]]
+     ],
+    ["struct1", [[
+                ("Elderberries",    16),
+                ("Fig",             8),
+                ("Grapefruit",      4),
+                ("Honeydew",        4)
+            ]]
+     ],
+    ["struct2", [[
+                ("Jackfruit",       4),
+                ("Kumquat",         16),
+                ("Lemon",           4),
+                ("Mango",           8)
+            ]]
+     ],
+    ["struct3", [[
+                ("Nectarine",       8),
+                ("Olives",          4),
+                ("Papaya",          16),
+                ("Quince",          4)
+            ]]
+     ],
+]
+
+
+def fruit_struct(name, fields):
+    return BitStruct(
+        bitfields=[BitField(size=size, name=field, rsvd=field == "RSVD") for field, size in fields],
+        name=name
+    )
+
+
+def fruit_slot_format(structs):
+    """
+    A generic SlotFormat built from [struct name, [[(field name, size), ...], ...]] definitions
+    """
+    factories = [partial(fruit_struct, name, fields) for name, groups in structs for fields in groups]
+    return SlotFormat(name="G0", code=0, direction=HOST_TO_DEVICE, header=False, slot_format=factories)
+
+
+def decoded(slot_format, data):
+    """
+    The field values of data keyed by slot_format.keys, checking the FlitStruct and the flit decode agree
+    """
+    slot = slot_format.build()
+    slot.from_bytes(data)
+    values = tuple(field.value for struct in slot for field in struct)
+    # the same slot carried in position 2 of a whole flit
+    flit = int.from_bytes(bytes(32) + bytes(data) + bytes(18), 'big')
+    assert slot_format.decode(flit, 2) == values
+    return dict(zip(slot_format.keys, values))
+
+
+def test_flitparser_init_as_zeros():
+    slot = fruit_slot_format(FRUIT_STRUCTS).build()
+    assert [struct.name for struct in slot] == ["struct0", "struct1", "struct2", "struct3"]
+    assert all(field.value == 0 for struct in slot for field in struct)
+
+
+def test_flitparser_init_as_zeros_converts_to_other_types():
+    slot = fruit_slot_format(FRUIT_STRUCTS).build()
+    assert int(slot)         == 0
+    assert hex(slot)         == '0x0'
+    assert bytes(slot)       == b"\x00" * 16
+
+
+def test_byte_aligned_is_addressible_slot_format():
+    values = decoded(fruit_slot_format(FRUIT_STRUCTS), CHECKERBOARD_BITS)
+    assert values == {
+        "struct0.Apples": 10, "struct0.Bananas": 10, "struct0.Carrots": 85, "struct0.Durian": 43605,
+        "struct1.Elderberries": 43605, "struct1.Fig": 170, "struct1.Grapefruit": 5, "struct1.Honeydew": 5,
+        "struct2.Jackfruit": 10, "struct2.Kumquat": 42330, "struct2.Lemon": 10, "struct2.Mango": 85,
+        "struct3.Nectarine": 170, "struct3.Olives": 5, "struct3.Papaya": 23205, "struct3.Quince": 5,
+    }
+
+
+def test_non_byte_aligned_is_addressible_slot_format():
+    slot_format = fruit_slot_format([
+        ["struct0", [[("Apples", 1), ("Bananas", 2), ("Carrots", 3), ("Durian", 4)]]],
+        ["struct1", [[("Elderberries", 5), ("Fig", 6), ("Grapefruit", 7), ("Honeydew", 8)]]],
+        ["struct2", [[("Jackfruit", 9), ("Kumquat", 10), ("Lemon", 11), ("Mango", 12)]]],
+        ["struct3", [[("Nectarine", 13), ("Olives", 14), ("Papaya", 15), ("Quince", 8)]]],
+    ])
+    values = decoded(slot_format, CHECKERBOARD_BITS)
+    assert values == {
+        "struct0.Apples": 1, "struct0.Bananas": 1, "struct0.Carrots": 2, "struct0.Durian": 9,
+        "struct1.Elderberries": 10, "struct1.Fig": 53, "struct1.Grapefruit": 37, "struct1.Honeydew": 90,
+        "struct2.Jackfruit": 330, "struct2.Kumquat": 725, "struct2.Lemon": 342, "struct2.Mango": 2709,
+        "struct3.Nectarine": 3410, "struct3.Olives": 11092, "struct3.Papaya": 21930, "struct3.Quince": 85,
+    }
+
+
+def test_non_byte_aligned_sequential_duplicate_structs_are_addressible_slot_format():
+    slot_format = fruit_slot_format([
+        ["struct0", [[("Apples", 11), ("Bananas", 23), ("Carrots", 3), ("Durian", 6)]] * 2],
+        ["struct1", [[("Elderberries", 15), ("Fig", 2), ("Grapefruit", 1), ("Honeydew", 3)]] * 2],
+    ])
+    values = decoded(slot_format, CHECKERBOARD_BITS)
+    assert values == {
+        "struct0[0].Apples": 1362, "struct0[0].Bananas": 5679446, "struct0[0].Carrots": 5, "struct0[0].Durian": 18,
+        "struct0[1].Apples": 1386, "struct0[1].Bananas": 4896074, "struct0[1].Carrots": 5, "struct0[1].Durian": 42,
+        "struct1[0].Elderberries": 19125, "struct1[0].Fig": 1, "struct1[0].Grapefruit": 0, "struct1[0].Honeydew": 2,
+        "struct1[1].Elderberries": 22185, "struct1[1].Fig": 1, "struct1[1].Grapefruit": 0, "struct1[1].Honeydew": 5,
+    }
+
+
+def test_byte_aligned_non_sequential_duplicate_structs_are_addressible_slot_format():
+    struct0 = ["struct0", [[("Apples", 11), ("Bananas", 23), ("Carrots", 3), ("Durian", 6)]]]
+    struct1 = ["struct1", [[("Elderberries", 15), ("Fig", 2), ("Grapefruit", 1), ("Honeydew", 3)]]]
+    values = decoded(fruit_slot_format([struct0, struct1, struct0, struct1]), CHECKERBOARD_BITS)
+    for idx in range(2):
+        assert values[f"struct0[{idx}].Apples"] == 1362
+        assert values[f"struct0[{idx}].Bananas"] == 5679446
+        assert values[f"struct0[{idx}].Carrots"] == 5
+        assert values[f"struct0[{idx}].Durian"] == 18
+
+        assert values[f"struct1[{idx}].Elderberries"] == 22185
+        assert values[f"struct1[{idx}].Fig"] == 1
+        assert values[f"struct1[{idx}].Grapefruit"] == 0
+        assert values[f"struct1[{idx}].Honeydew"] == 5
+
+
+def test_non_byte_aligned_non_sequential_duplicate_structs_are_addressible_slot_format():
+    struct0 = ["struct0", [[("Apples", 7), ("Bananas", 7), ("Carrots", 7), ("Durian", 7)]]]
+    struct1 = ["struct1", [[("Elderberries", 1), ("Fig", 45), ("Grapefruit", 18), ("Honeydew", 8)]]]
+    values = decoded(fruit_slot_format([struct0, struct1, struct0]), CHECKERBOARD_BITS)
+    assert values == {
+        "struct0[0].Apples": 85, "struct0[0].Bananas": 21, "struct0[0].Carrots": 53, "struct0[0].Durian": 37,
+        "struct1.Elderberries": 0, "struct1.Fig": 24916559222441, "struct1.Grapefruit": 88741, "struct1.Honeydew": 90,
+        "struct0[1].Apples": 82, "struct0[1].Bananas": 86, "struct0[1].Carrots": 84, "struct0[1].Durian": 85,
+    }
+
+
+def test_slot_format_parse_values():
+    slot = fruit_slot_format(FRUIT_STRUCTS).build()
+    slot.from_bytes(CHECKERBOARD_BITS)
+
+    text = str(slot)
+
+    for field, value in (
+        ("Apples", 10), ("Bananas", 10), ("Carrots", 85), ("Durian", 43605),
+        ("Elderberries", 43605), ("Fig", 170), ("Grapefruit", 5), ("Honeydew", 5),
+        ("Jackfruit", 10), ("Kumquat", 42330), ("Lemon", 10), ("Mango", 85),
+        ("Nectarine", 170), ("Olives", 5), ("Papaya", 23205), ("Quince", 5),
+    ):
+        assert len(re.findall(rf"{field}:\s*{value}\n", text)) == 1
+
+
+def test_slot_format_parse_values_excludes_RSVD_fields():
+    slot_format = fruit_slot_format([
+        FRUIT_STRUCTS[0],
+        ["RSVD", [[("RSVD", 32)]]],
+        FRUIT_STRUCTS[2],
+        ["RSVD", [[("RSVD", 32)]]],
+    ])
+    slot = slot_format.build()
+    slot.from_bytes(CHECKERBOARD_BITS)
+
+    text = str(slot)
+
+    for field, value in (
+        ("Apples", 10), ("Bananas", 10), ("Carrots", 85), ("Durian", 43605),
+        ("Jackfruit", 10), ("Kumquat", 42330), ("Lemon", 10), ("Mango", 85),
+    ):
+        assert len(re.findall(rf"{field}:\s*{value}\n", text)) == 1
+
+    # RSVD fields are not printed, only the name of their struct
+    assert re.findall(r"RSVD:.*", text) == ["RSVD:", "RSVD:"]
+
+    # RSVD is still addressible
+    values = decoded(slot_format, CHECKERBOARD_BITS)
+    assert values["RSVD[0].RSVD"] == 2857740885
+    assert values["RSVD[1].RSVD"] == 2857740885
+
+
+def test_slot_format_converts_to_int():
+    slot = fruit_slot_format(FRUIT_STRUCTS).build()
+    slot.from_bytes(CHECKERBOARD_BITS)
+
+    data_as_int = int(CHECKERBOARD_BITS.hex(), 16)
+
+    assert int(slot) == data_as_int
+    assert hex(slot) == hex(data_as_int)
+    assert bytes(slot) == CHECKERBOARD_BITS
+
+
+def test_flitparser_can_output_from_valid_assignment():
+    slot = fruit_slot_format(FRUIT_STRUCTS).build()
+
+    # Apples = 0, Bananas = 1, ..., Quince = 15
+    for value, field in enumerate(field for struct in slot for field in struct):
+        field.value = value
+
+    expected_bin  = '0000'              # apples
+    expected_bin += '0001'              # bananas
+    expected_bin += '00000010'          # carrots
+    expected_bin += '0000000000000011'  # durians
+
+    expected_bin += '0000000000000100'  # elderberries
+    expected_bin += '00000101'          # fig
+    expected_bin += '0110'              # grapefruit
+    expected_bin += '0111'              # honeydew
+
+    expected_bin += '1000'              # jackfruit
+    expected_bin += '0000000000001001'  # kumquat
+    expected_bin += '1010'              # lemon
+    expected_bin += '00001011'          # mango
+
+    expected_bin += '00001100'          # nectarine
+    expected_bin += '1101'              # olives
+    expected_bin += '0000000000001110'  # papaya
+    expected_bin += '1111'              # quince
+
+    assert slot.to_bin() == expected_bin
+    assert bytes(slot) == int(expected_bin, 2).to_bytes(16, 'big')
+
+
+def test_flitparser_raises_valueerror_on_invalid_assignment():
+    slot = fruit_slot_format(FRUIT_STRUCTS).build()
+
+    try:
+        slot[0][0].value = 100
+        assert False
+    except ValueError:
+        pass
+
+    # the field keeps its old value
+    assert slot.to_bin() == "0" * 128
@@ -0,0 +1,79 @@
+# External Dependencies
+import pytest
+
+# Package imports
+from pyCXL.structs import link_layer_control
+from pyCXL.structs.flitparser import DEVICE_TO_HOST, G_SLOT_TABLE, H_SLOT_TABLE, HOST_TO_DEVICE
+from pyCXL.structs.slotregistry import (
+    CONTROL_LAYOUTS,
+    GENERIC,
+    HEADER,
+    SLOT_FORMATS,
+    slot_format,
+    slot_format_named
+)
+
+
+# ============================= Slot Format Tests =============================
+@pytest.mark.parametrize("direction", [HOST_TO_DEVICE, DEVICE_TO_HOST])
+def test_registry_matches_dispatch_tables(direction):
+    for kind, table in ((HEADER, H_SLOT_TABLE), (GENERIC, G_SLOT_TABLE)):
+        for code, compiled in enumerate(table[direction]):
+            if compiled is None:
+                assert (direction, kind, code) not in SLOT_FORMATS
+                continue
+            assert SLOT_FORMATS[(direction, kind, code)] is compiled
+            assert slot_format(direction, kind, code) is compiled
+            assert slot_format_named(compiled.build().name) is compiled
+
+
+def test_slot_formats_are_precomputed():
+    for compiled in SLOT_FORMATS.values():
+        assert compiled.size == 128
+        assert compiled.offsets[0] == 0
+        assert len(compiled.offsets) == len(compiled.keys)
+        ends = [offset + size for offset, size in zip(compiled.offsets, compiled.layout.sizes)]
+        assert list(compiled.offsets[1:]) == ends[:-1]
+        assert ends[-1] == 128
+
+    header = slot_format(HOST_TO_DEVICE, HEADER, 0)
+    assert header.offsets[header.keys.index("Flit Header.Slot 0")] == 5
+    assert header.offsets[header.keys.index("Flit Header.Slot 3")] == 14
+
+
+def test_slot_format_lookup_errors():
+    try:
+        slot_format(HOST_TO_DEVICE, HEADER, 7)
+        assert False
+    except ValueError as err:
+        assert str(err) == "Reserved slot format: H2D/M2S H7"
+    try:
+        slot_format(HOST_TO_DEVICE, "X", 0)
+        assert False
+    except ValueError as err:
+        assert str(err) == "Unknown slot kind: X"
+    try:
+        slot_format(5, GENERIC, 0)
+        assert False
+    except ValueError as err:
+        assert str(err) == "Unknown flit direction: 5"
+    try:
+        slot_format_named("H2D/M2S G7")
+        assert False
+    except ValueError as err:
+        assert str(err) == "Unknown slot format: H2D/M2S G7"
+
+
+# ============================= Link Layer Control Tests =============================
+def test_control_layouts():
+    assert set(CONTROL_LAYOUTS) == set(link_layer_control.Link_Layer_Control_formats)
+    llcrd = CONTROL_LAYOUTS["LLCRD"]
+    assert llcrd.size == 64
+    assert llcrd.keys[:3] == ("Flit Header.Type", "Flit Header.RSVD_0", "Flit Header.Acknowledge")
+    assert llcrd.rsvd[1] and not llcrd.rsvd[0]
+    assert CONTROL_LAYOUTS["RETRY Ack Payload"].size == 64
+    assert CONTROL_LAYOUTS["Rsvd Payload"].keys == tuple(f"Payload.Bytes[{idx}]" for idx in range(8))
+
+    ack = CONTROL_LAYOUTS["RETRY Ack Payload"]
+    values = ack.unpack_bytes(ack.pack_bytes([1, 0, 0, 3, 9, 200, 7, 0x1234, 0]))
+    assert dict(zip(ack.keys, values))["Payload.SequenceNumber"] == 200
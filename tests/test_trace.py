@@ -0,0 +1,178 @@
+# External Dependencies
+import pytest
+
+# Python Imports
+import gc
+import random
+import warnings
+
+# Package imports
+from pyCXL.capture.trace import TraceReader, TraceWriter, slot_codes, FILE_HEADER
+from pyCXL.structs.flitparser import (
+    DEVICE_TO_HOST,
+    FLIT_BYTES,
+    G_SLOT_TABLE,
+    H_SLOT_TABLE,
+    HOST_TO_DEVICE
+)
+from tests.test_utils import make_flit
+
+
+@pytest.fixture
+def flits():
+    """
+    (timestamp, direction, flit) for 50 H2D flits, 20 D2H flits and 30 more H2D flits
+    """
+    rng = random.Random(17)
+    flits = []
+    for idx in range(100):
+        direction = DEVICE_TO_HOST if 50 <= idx < 70 else HOST_TO_DEVICE
+        h_code = 4 if idx in (5, 80) else 0
+        flits.append((idx * 10, direction, make_flit(direction, h_code, [1, 2, 3], rng=rng, control=idx == 60)))
+    return flits
+
+
+def write_trace(path, flits, flits_per_block=16, close=True):
+    writer = TraceWriter(path, flits_per_block=flits_per_block)
+    for timestamp, direction, flit in flits:
+        writer.write(flit, timestamp, direction)
+    if close:
+        writer.close()
+    return writer
+
+
+# ============================= Header Tests =============================
+def test_slot_codes_read_the_flit_header():
+    rng = random.Random(18)
+    assert slot_codes(make_flit(DEVICE_TO_HOST, 3, [4, 5, 6], rng=rng)) == (3, 4, 5, 6)
+    assert slot_codes(make_flit(DEVICE_TO_HOST, 3, [4, 5, 6], rng=rng, control=True)) is None
+    flit = H_SLOT_TABLE[HOST_TO_DEVICE][2].build()
+    flit[0][5].value = 2
+    flit[0][6].value = 4
+    assert slot_codes(bytes(flit) + bytes(FLIT_BYTES - 16)) == (2, 4, 0, 0)
+
+
+# ============================= Round Trip Tests =============================
+def test_trace_round_trips(tmp_path, flits):
+    path = tmp_path / "trace.pcxl"
+    writer = write_trace(path, flits)
+    assert writer.closed
+    with TraceReader(path) as reader:
+        assert reader.indexed
+        assert len(reader) == 100
+        assert reader.flits_per_block == 16
+        read = [(timestamp, direction, bytes(flit)) for timestamp, direction, flit in reader.flits()]
+        assert read == flits
+        # blocks are cut at 16 flits and whenever the direction changes
+        assert [block.count for block in reader.blocks] == [16, 16, 16, 2, 16, 4, 16, 14]
+        assert [block.direction for block in reader.blocks][3:6] == [HOST_TO_DEVICE, DEVICE_TO_HOST, DEVICE_TO_HOST]
+        del read
+
+
+def test_block_footers_summarize_blocks(tmp_path, flits):
+    path = tmp_path / "trace.pcxl"
+    write_trace(path, flits)
+    with TraceReader(path) as reader:
+        first = reader.blocks[0]
+        assert (first.min_timestamp, first.max_timestamp) == (0, 150)
+        assert first.h_codes[4] == 1 and first.h_codes[0] == 15
+        assert first.g_codes[1:4] == (16, 16, 16)
+        assert first.control == 0
+        assert reader.blocks[4].control == 1
+        assert reader.blocks[4].h_codes[0] == 15
+
+
+# ============================= Index Tests =============================
+def test_blocks_in_time_window(tmp_path, flits):
+    path = tmp_path / "trace.pcxl"
+    write_trace(path, flits)
+    with TraceReader(path) as reader:
+        assert [block.index for block in reader.blocks_in(200, 330)] == [1, 2]
+        assert [block.index for block in reader.blocks_in(500, 700, direction=DEVICE_TO_HOST)] == [4, 5]
+        window = [timestamp for timestamp, _, _ in reader.flits(205, 315)]
+        assert window == list(range(210, 320, 10))
+
+
+def test_blocks_with_slot_format(tmp_path, flits):
+    path = tmp_path / "trace.pcxl"
+    write_trace(path, flits)
+    with TraceReader(path) as reader:
+        assert [block.index for block in reader.blocks_with("H4")] == [0, 6]
+        assert [block.index for block in reader.blocks_with(H_SLOT_TABLE[DEVICE_TO_HOST][4])] == []
+        assert len(reader.blocks_with("G3", direction=DEVICE_TO_HOST)) == 2
+        assert reader.blocks[0].uses("H4") and not reader.blocks[1].uses("H4")
+        try:
+            reader.blocks_with("X9")
+            assert False
+        except ValueError as err:
+            assert str(err) == "Unknown slot format: X9"
+
+
+def test_block_tables(tmp_path, flits):
+    path = tmp_path / "trace.pcxl"
+    write_trace(path, flits)
+    layout = G_SLOT_TABLE[HOST_TO_DEVICE][1].layout
+    with TraceReader(path) as reader:
+        table = reader.block_table(2, layout, position=1)
+        assert len(table) == 16
+        assert [row.values() for row in table] == [
+            layout.unpack_bytes(flit, 16) for _, _, flit in flits[32:48]
+        ]
+
+
+def test_unclosed_trace_is_scanned(tmp_path, flits):
+    path = tmp_path / "trace.pcxl"
+    writer = write_trace(path, flits, close=False)
+    writer.flush()
+    with open(path, "ab") as trace:
+        # a block cut short mid write
+        trace.write(b"PCXB" + (16).to_bytes(4, 'little') + bytes(40))
+    with TraceReader(path) as reader:
+        assert not reader.indexed
+        assert len(reader) == 100
+        assert [bytes(flit) for _, _, flit in reader.flits()] == [flit for _, _, flit in flits]
+    writer.close()
+
+
+# ============================= Error Tests =============================
+def test_trace_errors(tmp_path):
+    path = tmp_path / "bad.pcxl"
+    path.write_bytes(b"NOTATRACE" * 10)
+    try:
+        TraceReader(path)
+        assert False
+    except ValueError as err:
+        assert str(err) == "Not a pyCXL trace"
+    writer = TraceWriter(tmp_path / "trace.pcxl")
+    try:
+        writer.write(bytes(64), 0, HOST_TO_DEVICE)
+        assert False
+    except ValueError as err:
+        assert str(err) == "Flits must be 66 bytes, got 64"
+    try:
+        writer.write(bytes(66), 0, 5)
+        assert False
+    except ValueError as err:
+        assert str(err) == "Unknown flit direction: 5"
+    writer.close()
+    with TraceReader(tmp_path / "trace.pcxl") as reader:
+        assert len(reader) == 0
+        assert reader.blocks == ()
+
+
+def test_corrupt_trace_is_closed(tmp_path, flits):
+    path = tmp_path / "trace.pcxl"
+    write_trace(path, flits)
+    data = bytearray(path.read_bytes())
+    # the magic of the first block
+    data[FILE_HEADER.size] ^= 0xFF
+    path.write_bytes(bytes(data))
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        try:
+            TraceReader(path)
+            assert False
+        except ValueError as err:
+            assert str(err).startswith("Corrupt pyCXL trace")
+        gc.collect()
+    assert not [warning for warning in caught if issubclass(warning.category, ResourceWarning)]
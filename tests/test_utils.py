@@ -1,6 +1,14 @@
+# External Dependencies
+import pytest
+
+# Python Imports
+import random
+
 # Package imports
 from pyCXL.structs.bitfields import BitField
 from pyCXL.structs.bitstructs import BitStruct, LittleEndianBitStruct, BigEndianBitStruct
+from pyCXL.structs.flitcrc import append_crc
+from pyCXL.structs.slotregistry import GENERIC, HEADER, slot_format
 
 
 def CHECKERBOARD_BYTES():
@@ -429,3 +437,68 @@ class bigFORTY_BIT_STRUCT(BigEndianBitStruct):
                 BitField(size=5, name="Pear")
             ], name="big 40 bits"
         )
+
+
+# Protocol flits
+def make_slots(direction, h_code, g_codes=(0, 0, 0), fields=None, rng=None, control=False, valid=None):
+    """
+    The decoded (SlotFormat, field values) slots of a protocol flit whose FlitHeader carries the slot codes.
+
+    fields maps header slot keys, or (slot position, key) pairs, to values. Every other field is random bits when rng is
+    given and 0 otherwise, and the Valid field of every message is set to valid when it is not None.
+    """
+    codes = [h_code] + list(g_codes)
+    formats = [slot_format(direction, HEADER, h_code)] + [slot_format(direction, GENERIC, code) for code in g_codes]
+    positioned = {}
+    for key, value in (fields or {}).items():
+        positioned[(0, key) if isinstance(key, str) else key] = value
+    slots = []
+    for position, slot in enumerate(formats):
+        if rng is None:
+            values = [0] * len(slot.keys)
+        else:
+            values = [rng.getrandbits(size) for size in slot.layout.sizes]
+        if valid is not None:
+            for idx, key in enumerate(slot.keys):
+                if key.endswith(".Valid"):
+                    values[idx] = valid
+        if slot.header:
+            values[slot.keys.index("Flit Header.Type")] = int(control)
+            for idx, code in enumerate(codes):
+                values[slot.keys.index(f"Flit Header.Slot {idx}")] = code
+        for (at, key), value in positioned.items():
+            if at == position:
+                values[slot.keys.index(key)] = value
+        slots.append((slot, tuple(values)))
+    return slots
+
+
+def to_bytes(slots, crc=False):
+    """
+    The 66 bytes of a flit holding slots, with its CRC when crc is True and a zero CRC otherwise
+    """
+    data = b"".join(slot.layout.pack_bytes(values) for slot, values in slots)
+    return append_crc(data) if crc else data + b"\x00\x00"
+
+
+def make_flit(direction, h_code, g_codes=(0, 0, 0), fields=None, rng=None, control=False, valid=None, crc=False):
+    """
+    The bytes of a protocol flit, see make_slots
+    """
+    return to_bytes(make_slots(direction, h_code, g_codes, fields, rng, control, valid), crc)
+
+
+# Capture files
+@pytest.fixture
+def capture_file(tmp_path):
+    """
+    Writes count random records of record_bytes bytes to a file under tmp_path, returning (path, data)
+    """
+    def write(record_bytes, count, seed, name="capture.bin"):
+        rng = random.Random(seed)
+        data = bytes(rng.getrandbits(8) for _ in range(record_bytes * count))
+        path = tmp_path / name
+        path.write_bytes(data)
+        return path, data
+
+    return write